@@ -4,17 +4,25 @@ FastAPI dependency injection.
 Provides DB sessions and service instances, JWT auth guard.
 """
 
-from typing import Generator, Optional
+import hashlib
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from db.database import get_db as _get_db
+from db.data_versions import get_data_version
+from db.database import get_async_db as _get_async_db, get_db as _get_db
 from sqlalchemy.orm import Session
 
 from api.auth import decode_token
+from config.constants import DataVersionKey
 from config.settings import is_auth_enabled
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 _bearer = HTTPBearer(auto_error=False)
 
 
@@ -25,11 +33,27 @@ def get_db() -> Generator[Session, None, None]:
     yield from _get_db()
 
 
+async def get_async_db() -> AsyncGenerator["AsyncSession", None]:
+    """
+    Yield an AsyncSession (aiosqlite) for async routes.
+
+    At most FIN_API_DB_CONNECTIONS sessions query at once; further requests
+    wait for a connection on the event loop rather than in the thread pool.
+    """
+    async for db in _get_async_db(pool_size=_api_db_connections()):
+        yield db
+
+
+@lru_cache(maxsize=None)
+def _api_db_connections() -> int:
+    from config.settings import get_settings
+    return get_settings().api_db_connections
+
+
 # ==================== Auth ====================
 
 def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
-    db: Session = Depends(get_db),
 ) -> Optional[str]:
     """
     Return the authenticated username.
@@ -60,6 +84,97 @@ def get_current_user(
 CurrentUser = Depends(get_current_user)
 
 
+# ==================== Conditional GET ====================
+
+def conditional_get(cache_control: str = "private, no-cache"):
+    """
+    Dependency answering If-None-Match with 304 before the route does any work.
+
+    The ETag is derived from the data version (bumped by every sync and
+    edit), the user, the path and query, and the day (for routes relative
+    to today) - so it changes exactly when the response could.
+
+    Args:
+        cache_control: Cache-Control header of the route ("no-cache" makes
+            browsers revalidate, which costs a 304 while nothing changed)
+
+    Usage:
+        @router.get("/stats", dependencies=[ConditionalGet])
+    """
+    def check(
+        request: Request,
+        response: Response,
+        user: Optional[str] = CurrentUser,
+        db: Session = Depends(get_db),
+    ) -> None:
+        version = get_data_version(db, DataVersionKey.DATA)
+        answer_conditional_get(request, response, user, version, cache_control)
+
+    return Depends(check)
+
+
+def async_conditional_get(cache_control: str = "private, no-cache"):
+    """
+    ConditionalGet for async routes.
+
+    Reads the data version on the request's AsyncSession (the one the route
+    uses), so the check queries without a worker thread or a sync connection.
+
+    Usage:
+        @router.get("/stats", dependencies=[AsyncConditionalGet])
+    """
+    async def check(
+        request: Request,
+        response: Response,
+        user: Optional[str] = CurrentUser,
+        db: "AsyncSession" = Depends(get_async_db),
+    ) -> None:
+        version = await db.run_sync(get_data_version, DataVersionKey.DATA)
+        answer_conditional_get(request, response, user, version, cache_control)
+
+    return Depends(check)
+
+
+def answer_conditional_get(
+    request: Request,
+    response: Response,
+    user: Optional[str],
+    version: Optional[int],
+    cache_control: str,
+) -> None:
+    """Set the ETag and Cache-Control headers, or answer 304 if the client's copy is current"""
+    response.headers["Cache-Control"] = cache_control
+    if version is None:
+        return  # data_versions table not migrated - no way to tell changes
+
+    etag = data_etag(version, user, request)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": cache_control},
+        )
+    response.headers["ETag"] = etag
+
+
+def data_etag(version: int, user: Optional[str], request: Request) -> str:
+    """Strong ETag of a read route's response at a data version"""
+    query = sorted(request.query_params.multi_items())
+    key = repr((version, user, request.url.path, query, date.today().isoformat()))
+    return '"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header lists the ETag (or is "*")"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+ConditionalGet = conditional_get()
+AsyncConditionalGet = async_conditional_get()
+
+
 # ==================== Service factories ====================
 
 def get_analytics(db: Session = Depends(get_db)):
@@ -67,6 +182,11 @@ def get_analytics(db: Session = Depends(get_db)):
     return AnalyticsService(session=db)
 
 
+def get_async_analytics(db=Depends(get_async_db)):
+    from services.analytics_service import AsyncAnalyticsService
+    return AsyncAnalyticsService(session=db)
+
+
 def get_budget_service(db: Session = Depends(get_db)):
     from services.budget_service import BudgetService
     return BudgetService(session=db)
@@ -90,3 +210,8 @@ def get_rules_service(db: Session = Depends(get_db)):
 def get_retirement_scenario_service(db: Session = Depends(get_db)):
     from services.retirement_scenario_service import RetirementScenarioService
     return RetirementScenarioService(session=db)
+
+
+def get_sync_runner():
+    from services.sync_job_runner import get_job_runner
+    return get_job_runner()
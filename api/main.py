@@ -7,6 +7,8 @@ Run with:
     uv run uvicorn api.main:app --reload --port 8000
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -24,6 +26,18 @@ from api.routers import (
     tags,
     transactions,
 )
+from api.responses import CompressionMiddleware
+from db.database import dispose_async_engine
+from services.sync_job_runner import shutdown_job_runner
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    # Running sync jobs stop at their next checkpoint; unfinished ones are failed on next start
+    shutdown_job_runner()
+    await dispose_async_engine()
+
 
 app = FastAPI(
     title="Fin REST API",
@@ -31,6 +45,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # ==================== CORS ====================
@@ -55,6 +70,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ==================== Compression ====================
+# GZips responses over 1 KB for clients that accept it (not SSE streams).
+
+app.add_middleware(CompressionMiddleware)
+
 # ==================== Routers ====================
 
 app.include_router(auth_router.router)
@@ -3,7 +3,7 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends
 
-from api.deps import CurrentUser, get_analytics
+from api.deps import ConditionalGet, CurrentUser, get_analytics
 from api.schemas.accounts import AccountResponse, AccountSummary, BalanceSummary
 from services.analytics_service import AnalyticsService
 
@@ -38,7 +38,7 @@ def _account_schema(account) -> AccountResponse:
     )
 
 
-@router.get("", response_model=List[AccountResponse])
+@router.get("", response_model=List[AccountResponse], dependencies=[ConditionalGet])
 def list_accounts(
     active_only: bool = True,
     account_type: Optional[str] = None,
@@ -56,7 +56,7 @@ def list_accounts(
     return [_account_schema(a) for a in accounts]
 
 
-@router.get("/summary", response_model=AccountSummary)
+@router.get("/summary", response_model=AccountSummary, dependencies=[ConditionalGet])
 def account_summary(
     _: str = CurrentUser,
     analytics: AnalyticsService = Depends(get_analytics),
@@ -72,7 +72,7 @@ def account_summary(
     )
 
 
-@router.get("/{account_id}", response_model=AccountResponse)
+@router.get("/{account_id}", response_model=AccountResponse, dependencies=[ConditionalGet])
 def get_account(
     account_id: int,
     _: str = CurrentUser,
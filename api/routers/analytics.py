@@ -2,9 +2,10 @@
 
 from datetime import date
 from typing import List, Optional
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
-from api.deps import CurrentUser, get_analytics
+from api.deps import AsyncConditionalGet, ConditionalGet, CurrentUser, get_analytics, get_async_analytics
+from api.responses import ORJSONResponse
 from api.schemas.analytics import (
     CategoryBreakdownItem,
     CategoryTrendsResponse,
@@ -14,21 +15,21 @@ from api.schemas.analytics import (
     TagBreakdownItem,
     TrendPoint,
 )
-from services.analytics_service import AnalyticsService
+from services.analytics_service import AnalyticsService, AsyncAnalyticsService
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 
-@router.get("/stats", response_model=StatsResponse)
-def overall_stats(
+@router.get("/stats", response_model=StatsResponse, dependencies=[AsyncConditionalGet])
+async def overall_stats(
     _: str = CurrentUser,
-    analytics: AnalyticsService = Depends(get_analytics),
+    analytics: AsyncAnalyticsService = Depends(get_async_analytics),
 ):
-    raw = analytics.get_overall_stats()
+    raw = await analytics.run(AnalyticsService.get_overall_stats)
     return StatsResponse(**raw)
 
 
-@router.get("/monthly", response_model=MonthlySummary)
+@router.get("/monthly", response_model=MonthlySummary, dependencies=[ConditionalGet])
 def monthly_summary(
     year: int,
     month: int,
@@ -39,22 +40,23 @@ def monthly_summary(
     return MonthlySummary(**raw)
 
 
-@router.get("/trends", response_model=List[TrendPoint])
-def monthly_trends(
+@router.get("/trends", response_model=List[TrendPoint], dependencies=[AsyncConditionalGet])
+async def monthly_trends(
     months: int = 6,
     tag: Optional[str] = None,
     card_last4: Optional[str] = None,
     include_current: bool = False,
     _: str = CurrentUser,
-    analytics: AnalyticsService = Depends(get_analytics),
+    analytics: AsyncAnalyticsService = Depends(get_async_analytics),
 ):
-    data = analytics.get_monthly_spending_trends(
+    data = await analytics.run(
+        AnalyticsService.get_monthly_spending_trends,
         months=months, tag=tag, card_last4=card_last4, include_current=include_current
     )
     return [TrendPoint(**d) for d in data]
 
 
-@router.get("/categories", response_model=List[CategoryBreakdownItem])
+@router.get("/categories", response_model=List[CategoryBreakdownItem], dependencies=[ConditionalGet])
 def category_breakdown(
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
@@ -75,18 +77,19 @@ def category_breakdown(
     return items
 
 
-@router.get("/category-trends", response_model=CategoryTrendsResponse)
+@router.get("/category-trends", response_model=CategoryTrendsResponse, dependencies=[ConditionalGet])
 def category_trends(
+    response: Response,
     months: int = 6,
     top_n: int = 5,
     _: str = CurrentUser,
     analytics: AnalyticsService = Depends(get_analytics),
 ):
     raw = analytics.get_category_trends(months=months, top_n=top_n)
-    return CategoryTrendsResponse(**raw)
+    return ORJSONResponse(raw, headers=response.headers)
 
 
-@router.get("/tags", response_model=List[TagBreakdownItem])
+@router.get("/tags", response_model=List[TagBreakdownItem], dependencies=[ConditionalGet])
 def tag_breakdown(
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
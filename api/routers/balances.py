@@ -2,17 +2,17 @@
 
 from datetime import date
 from typing import List, Optional
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
-from api.deps import CurrentUser, get_analytics
+from api.deps import AsyncConditionalGet, ConditionalGet, CurrentUser, get_analytics, get_async_analytics
+from api.responses import ORJSONResponse
 from api.schemas.balances import (
     BalanceResponse,
     LatestBalanceResponse,
     PnLSummaryItem,
-    PortfolioProgressionPoint,
     PortfolioProgressionResponse,
 )
-from services.analytics_service import AnalyticsService
+from services.analytics_service import AnalyticsService, AsyncAnalyticsService
 
 router = APIRouter(prefix="/balances", tags=["balances"])
 
@@ -33,11 +33,15 @@ def _balance_schema(balance) -> BalanceResponse:
     )
 
 
-@router.get("/latest", response_model=List[LatestBalanceResponse])
-def latest_balances(
+@router.get("/latest", response_model=List[LatestBalanceResponse], dependencies=[AsyncConditionalGet])
+async def latest_balances(
     _: str = CurrentUser,
-    analytics: AnalyticsService = Depends(get_analytics),
+    analytics: AsyncAnalyticsService = Depends(get_async_analytics),
 ):
+    return await analytics.run(_latest_balances)
+
+
+def _latest_balances(analytics: AnalyticsService) -> List[LatestBalanceResponse]:
     pairs = analytics.get_latest_balances()
     result = []
     for account, balance in pairs:
@@ -52,35 +56,31 @@ def latest_balances(
     return result
 
 
-@router.get("/progression/by-type", response_model=PortfolioProgressionResponse)
+@router.get("/progression/by-type", response_model=PortfolioProgressionResponse, dependencies=[ConditionalGet])
 def portfolio_by_type(
+    response: Response,
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
     _: str = CurrentUser,
     analytics: AnalyticsService = Depends(get_analytics),
 ):
     points, series_names = analytics.get_portfolio_by_type(from_date=from_date, to_date=to_date)
-    return PortfolioProgressionResponse(
-        points=[PortfolioProgressionPoint(**p) for p in points],
-        series_names=series_names,
-    )
+    return ORJSONResponse({"points": points, "series_names": series_names}, headers=response.headers)
 
 
-@router.get("/progression/by-account", response_model=PortfolioProgressionResponse)
+@router.get("/progression/by-account", response_model=PortfolioProgressionResponse, dependencies=[ConditionalGet])
 def portfolio_by_account(
+    response: Response,
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
     _: str = CurrentUser,
     analytics: AnalyticsService = Depends(get_analytics),
 ):
     points, series_names = analytics.get_portfolio_by_account(from_date=from_date, to_date=to_date)
-    return PortfolioProgressionResponse(
-        points=[PortfolioProgressionPoint(**p) for p in points],
-        series_names=series_names,
-    )
+    return ORJSONResponse({"points": points, "series_names": series_names}, headers=response.headers)
 
 
-@router.get("/pnl-summary", response_model=List[PnLSummaryItem])
+@router.get("/pnl-summary", response_model=List[PnLSummaryItem], dependencies=[ConditionalGet])
 def pnl_summary(
     _: str = CurrentUser,
     analytics: AnalyticsService = Depends(get_analytics),
@@ -101,7 +101,7 @@ def pnl_summary(
     ]
 
 
-@router.get("/history/{account_id}", response_model=List[BalanceResponse])
+@router.get("/history/{account_id}", response_model=List[BalanceResponse], dependencies=[ConditionalGet])
 def balance_history(
     account_id: int,
     from_date: Optional[date] = None,
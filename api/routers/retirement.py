@@ -7,9 +7,9 @@ from typing import Any, Dict, List
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from api.deps import CurrentUser, get_retirement_scenario_service
+from api.responses import ORJSONResponse
 from api.schemas.retirement import (
     Milestone,
-    MonthlyRow,
     ScenarioCreate,
     ScenarioResponse,
     ScenarioUpdate,
@@ -25,12 +25,12 @@ router = APIRouter(prefix="/retirement", tags=["retirement"])
 
 def _build_monthly_rows(
     records: list, config_obj: Any
-) -> List[MonthlyRow]:
-    """Convert MonthRecord list to API MonthlyRow list."""
+) -> List[Dict[str, Any]]:
+    """Convert MonthRecord list to MonthlyRow dicts (unvalidated, see api.responses)."""
     rows = []
     for rec in records:
         rows.append(
-            MonthlyRow(
+            dict(
                 month=rec.month_idx,
                 age=round(rec.age, 2),
                 date=rec.current_date.strftime("%Y-%m"),
@@ -276,13 +276,13 @@ def simulate(
     milestones = _build_milestones(records, config_obj, fire_month)
     summary = _build_summary(records, config_obj, fire_month)
 
-    return SimulationResponse(
-        status=sim_status,
-        summary=summary,
-        monthly=monthly,
-        milestones=milestones,
-        persons=persons,
-    )
+    return ORJSONResponse({
+        "status": sim_status,
+        "summary": summary,
+        "monthly": monthly,
+        "milestones": milestones,
+        "persons": persons,
+    })
 
 
 # ==================== Scenario CRUD ====================
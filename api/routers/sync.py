@@ -1,30 +1,35 @@
 """
 Sync endpoints.
 
-POST /sync/{institution} - start a sync (runs fin-cli sync as subprocess)
+POST /sync/{institution} - start a sync job (runs in-process, see services.sync_job_runner)
 GET  /sync/stream/{job_id} - SSE stream of progress
+GET  /sync/jobs - recent sync jobs
+GET  /sync/jobs/{job_id} - sync job status
+POST /sync/jobs/{job_id}/cancel - cancel a sync job
 GET  /sync/history - sync history
 """
 
 import asyncio
 import json
-import subprocess
-import sys
-import uuid
-from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 
-from api.deps import CurrentUser, get_analytics
-from api.schemas.sync import SyncHistoryResponse, SyncRequest
+from api.deps import CurrentUser, get_analytics, get_sync_runner
+from api.schemas.sync import SyncHistoryResponse, SyncJobResponse, SyncRequest
+from config.constants import SyncJobStatus
 from services.analytics_service import AnalyticsService
+from services.sync_job_runner import FINAL_EVENTS, SyncJobRunner
 
 router = APIRouter(prefix="/sync", tags=["sync"])
 
-# In-memory job registry (ephemeral, per-process)
-_jobs: dict[str, dict] = {}
+# Seconds between checks for new events of a job another API worker runs
+STREAM_POLL_SECONDS = 1.0
+
+# Seconds without events before a keepalive ping
+KEEPALIVE_SECONDS = 15.0
 
 
 @router.get("/history", response_model=list[SyncHistoryResponse])
@@ -39,109 +44,100 @@ def sync_history(
     return [SyncHistoryResponse.model_validate(r) for r in records]
 
 
+@router.get("/jobs", response_model=list[SyncJobResponse])
+def list_sync_jobs(
+    limit: int = 20,
+    _: str = CurrentUser,
+    runner: SyncJobRunner = Depends(get_sync_runner),
+):
+    return [SyncJobResponse(**job) for job in runner.list_jobs(limit=limit)]
+
+
+@router.get("/jobs/{job_id}", response_model=SyncJobResponse)
+def get_sync_job(
+    job_id: str,
+    _: str = CurrentUser,
+    runner: SyncJobRunner = Depends(get_sync_runner),
+):
+    job = runner.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return SyncJobResponse(**job)
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=SyncJobResponse)
+def cancel_sync_job(
+    job_id: str,
+    _: str = CurrentUser,
+    runner: SyncJobRunner = Depends(get_sync_runner),
+):
+    """
+    Cancel a sync job. Pending jobs stop at once; running credit card syncs
+    stop after the month being saved (months already saved are kept).
+    """
+    if runner.cancel(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return SyncJobResponse(**runner.get_job(job_id))
+
+
 @router.post("/{institution}")
 def start_sync(
     institution: str,
     body: SyncRequest = SyncRequest(),
     _: str = CurrentUser,
+    runner: SyncJobRunner = Depends(get_sync_runner),
 ):
     """
     Start a sync job. Returns a job_id for streaming progress via SSE.
-    The actual sync runs as a subprocess calling `fin-cli sync <institution>`.
+    The job starts right away on the API's sync worker pool.
     """
-    job_id = str(uuid.uuid4())
-    _jobs[job_id] = {
-        "institution": institution,
-        "started_at": datetime.utcnow().isoformat(),
-        "status": "pending",
-        "lines": [],
-        "months_back": body.months_back,
-    }
+    try:
+        job_id = runner.submit(institution, months_back=body.months_back, account_index=body.account_index)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     return {"job_id": job_id, "institution": institution}
 
 
 @router.get("/stream/{job_id}")
-async def sync_stream(job_id: str, _: str = CurrentUser):
+async def sync_stream(
+    job_id: str,
+    last_event_id: Optional[str] = Header(None),
+    _: str = CurrentUser,
+    runner: SyncJobRunner = Depends(get_sync_runner),
+):
     """
     SSE stream for sync progress.
-    Starts the subprocess and streams stdout as server-sent events.
-    If the client reconnects, replays cached lines instead of starting a new subprocess.
+    Sends the job's events recorded so far, then each new one the moment it
+    is recorded, until the job finishes. Every event carries its id, so a
+    reconnecting client (Last-Event-ID) only gets what it missed. Jobs run
+    by another API worker are followed through the database instead.
     """
+    after_id = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+
     async def event_generator():
         yield _sse_event("ping", {"message": "connected"})
 
-        job = _jobs.get(job_id)
-        if not job:
+        if await run_in_threadpool(runner.get_job, job_id) is None:
             yield _sse_event("error", {"message": f"Job {job_id} not found"})
             return
 
-        institution = job["institution"]
-
-        # Guard: if subprocess already started (reconnect), replay lines + wait
-        if job["status"] in ("running", "success", "error"):
-            # Replay cached output
-            for line in job["lines"]:
-                yield _sse_event("progress", {"message": line, "institution": institution})
-
-            # If already finished, send final status
-            if job["status"] in ("success", "error"):
-                success = job["status"] == "success"
-                yield _sse_event(
-                    "success" if success else "error",
-                    {"message": "Sync completed" if success else "Sync failed", "institution": institution},
-                )
-                return
-
-            # Still running — tail new lines until done
-            seen = len(job["lines"])
-            while job["status"] == "running":
-                await asyncio.sleep(1)
-                # Send keepalive ping
-                yield _sse_event("ping", {"message": "waiting"})
-                # Send any new lines
-                new_lines = job["lines"][seen:]
-                for line in new_lines:
-                    yield _sse_event("progress", {"message": line, "institution": institution})
-                seen += len(new_lines)
-
-            # Process finished while we were tailing
-            success = job["status"] == "success"
-            yield _sse_event(
-                "success" if success else "error",
-                {"message": "Sync completed" if success else "Sync failed", "institution": institution},
-            )
+        subscription = runner.subscribe(job_id, after_id)
+        if subscription is None:
+            async for event in _poll_events(runner, job_id, after_id):
+                yield event
             return
 
-        # First connection — start the subprocess
-        _jobs[job_id]["status"] = "running"
-
-        cmd = [sys.executable, "-m", "cli.main", "sync", institution]
-        if job.get("months_back") is not None:
-            cmd.extend(["--months-back", str(job["months_back"])])
-
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-            )
-
-            async for raw_line in proc.stdout:
-                line = raw_line.decode("utf-8", errors="replace").rstrip()
-                _jobs[job_id]["lines"].append(line)
-                yield _sse_event("progress", {"message": line, "institution": institution})
-
-            await proc.wait()
-            success = proc.returncode == 0
-            _jobs[job_id]["status"] = "success" if success else "error"
-
-            yield _sse_event(
-                "success" if success else "error",
-                {"message": "Sync completed" if success else "Sync failed", "institution": institution},
-            )
-        except Exception as exc:
-            _jobs[job_id]["status"] = "error"
-            yield _sse_event("error", {"message": str(exc)})
+            while (events := await subscription.next_events(KEEPALIVE_SECONDS)) is not None:
+                if not events:
+                    # Keepalive while the job is between events (login, MFA wait)
+                    yield _sse_event("ping", {"message": "waiting"})
+                for event in events:
+                    yield _sse_event(event["type"], event["data"], event["id"])
+                    if event["type"] in FINAL_EVENTS:
+                        return
+        finally:
+            subscription.close()
 
     return StreamingResponse(
         event_generator(),
@@ -153,6 +149,29 @@ async def sync_stream(job_id: str, _: str = CurrentUser):
     )
 
 
-def _sse_event(event_type: str, data: dict) -> str:
+async def _poll_events(runner: SyncJobRunner, job_id: str, after_id: int):
+    """SSE events of a job not running in this process, read from the database"""
+    idle = 0.0
+    while True:
+        # Status first: a job's final status and final event are committed together
+        finished = (await run_in_threadpool(runner.get_job, job_id))["status"] in SyncJobStatus.finished()
+        events = await run_in_threadpool(runner.events_after, job_id, after_id)
+        for event in events:
+            after_id = event["id"]
+            yield _sse_event(event["type"], event["data"], event["id"])
+            if event["type"] in FINAL_EVENTS:
+                return
+        if finished:
+            return  # Client already had the final event
+
+        idle = 0.0 if events else idle + STREAM_POLL_SECONDS
+        if idle >= KEEPALIVE_SECONDS:
+            idle = 0.0
+            yield _sse_event("ping", {"message": "waiting"})
+        await asyncio.sleep(STREAM_POLL_SECONDS)
+
+
+def _sse_event(event_type: str, data: dict, event_id: Optional[int] = None) -> str:
     payload = json.dumps(data)
-    return f"event: {event_type}\ndata: {payload}\n\n"
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{id_line}event: {event_type}\ndata: {payload}\n\n"
@@ -1,47 +1,62 @@
 """Transaction endpoints."""
 
 from datetime import date
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Dict, List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from api.deps import CurrentUser, get_analytics, get_db, get_tag_service
+from api.deps import AsyncConditionalGet, ConditionalGet, CurrentUser, get_analytics, get_async_analytics, get_db, get_tag_service
+from api.responses import ORJSONResponse
 from api.schemas.common import CountResponse, PaginatedResponse
-from api.schemas.transactions import TransactionResponse, TransactionUpdate
-from services.analytics_service import AnalyticsService
+from api.schemas.transactions import (
+    BulkOperationResult,
+    BulkUpdateRequest,
+    BulkUpdateResponse,
+    TransactionResponse,
+    TransactionUpdate,
+)
+from services.analytics_service import AnalyticsService, AsyncAnalyticsService
 from services.tag_service import TagService
+from services.transaction_export import MEDIA_TYPES, export_chunks
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
 
+def _txn_row(txn) -> Dict[str, Any]:
+    """TransactionResponse fields of a transaction, unvalidated (see api.responses)"""
+    return {
+        "id": txn.id,
+        "account_id": txn.account_id,
+        "transaction_id": txn.transaction_id,
+        "transaction_date": txn.transaction_date,
+        "processed_date": txn.processed_date,
+        "description": txn.description,
+        "original_amount": txn.original_amount,
+        "original_currency": txn.original_currency,
+        "charged_amount": txn.charged_amount,
+        "charged_currency": txn.charged_currency,
+        "transaction_type": txn.transaction_type,
+        "status": txn.status,
+        "raw_category": txn.raw_category,
+        "category": txn.category,
+        "user_category": txn.user_category,
+        "effective_category": txn.effective_category,
+        "memo": txn.memo,
+        "installment_number": txn.installment_number,
+        "installment_total": txn.installment_total,
+        "tags": txn.tags,
+        "created_at": txn.created_at,
+    }
+
+
 def _txn_schema(txn) -> TransactionResponse:
-    return TransactionResponse(
-        id=txn.id,
-        account_id=txn.account_id,
-        transaction_id=txn.transaction_id,
-        transaction_date=txn.transaction_date,
-        processed_date=txn.processed_date,
-        description=txn.description,
-        original_amount=txn.original_amount,
-        original_currency=txn.original_currency,
-        charged_amount=txn.charged_amount,
-        charged_currency=txn.charged_currency,
-        transaction_type=txn.transaction_type,
-        status=txn.status,
-        raw_category=txn.raw_category,
-        category=txn.category,
-        user_category=txn.user_category,
-        effective_category=txn.effective_category,
-        memo=txn.memo,
-        installment_number=txn.installment_number,
-        installment_total=txn.installment_total,
-        tags=txn.tags,
-        created_at=txn.created_at,
-    )
+    return TransactionResponse(**_txn_row(txn))
 
 
-@router.get("", response_model=PaginatedResponse[TransactionResponse])
-def list_transactions(
+@router.get("", response_model=PaginatedResponse[TransactionResponse], dependencies=[AsyncConditionalGet])
+async def list_transactions(
+    response: Response,
     account_id: Optional[int] = None,
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
@@ -53,21 +68,71 @@ def list_transactions(
     limit: int = 50,
     offset: int = 0,
     _: str = CurrentUser,
-    analytics: AnalyticsService = Depends(get_analytics),
+    analytics: AsyncAnalyticsService = Depends(get_async_analytics),
 ):
     limit = min(limit, 200)
-
-    # Get total count
-    total = analytics.get_transaction_count(
+    filters = {
+        "account_id": account_id,
+        "from_date": from_date,
+        "to_date": to_date,
+        "status": status,
+        "institution": institution,
+        "search": search,
+        "category": category,
+        "untagged_only": untagged_only,
+    }
+    total = await analytics.count_transactions(**filters)
+    items = await analytics.get_transaction_rows(limit=limit, offset=offset, **filters)
+
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "page": (offset // limit) + 1 if limit else 1,
+        "page_size": limit,
+        "has_next": (offset + len(items)) < total,
+    }, headers=response.headers)
+
+
+@router.get("/count", response_model=CountResponse, dependencies=[ConditionalGet])
+def transaction_count(
+    account_id: Optional[int] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    status: Optional[str] = None,
+    _: str = CurrentUser,
+    analytics: AnalyticsService = Depends(get_analytics),
+):
+    count = analytics.get_transaction_count(
         account_id=account_id,
         from_date=from_date,
         to_date=to_date,
         status=status,
-        search=search,
-        category=category,
     )
+    return CountResponse(count=count)
+
 
-    txns = analytics.get_transactions(
+@router.get("/export", dependencies=[ConditionalGet], response_class=StreamingResponse)
+def export_transactions(
+    response: Response,
+    format: Literal["csv", "ndjson", "json"] = "ndjson",
+    account_id: Optional[int] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    status: Optional[str] = None,
+    institution: Optional[str] = None,
+    search: Optional[str] = None,
+    category: Optional[str] = None,
+    untagged_only: bool = False,
+    _: str = CurrentUser,
+    analytics: AnalyticsService = Depends(get_analytics),
+):
+    """
+    Stream all matching transactions as CSV, NDJSON or a JSON array.
+
+    Rows are read in batches and sent as they are encoded (gzipped for
+    clients accepting it), so the full history exports in constant memory.
+    """
+    rows = analytics.iter_transaction_rows(
         account_id=account_id,
         from_date=from_date,
         to_date=to_date,
@@ -76,40 +141,39 @@ def list_transactions(
         search=search,
         category=category,
         untagged_only=untagged_only,
-        limit=limit,
-        offset=offset,
     )
-
-    page = (offset // limit) + 1 if limit else 1
-
-    return PaginatedResponse(
-        items=[_txn_schema(t) for t in txns],
-        total=total,
-        page=page,
-        page_size=limit,
-        has_next=(offset + len(txns)) < total,
+    return StreamingResponse(
+        export_chunks(rows, format),
+        media_type=MEDIA_TYPES[format],
+        headers={**response.headers, "Content-Disposition": f'attachment; filename="transactions.{format}"'},
     )
 
 
-@router.get("/count", response_model=CountResponse)
-def transaction_count(
-    account_id: Optional[int] = None,
-    from_date: Optional[date] = None,
-    to_date: Optional[date] = None,
-    status: Optional[str] = None,
+@router.post("/bulk", response_model=BulkUpdateResponse)
+def bulk_update_transactions(
+    body: BulkUpdateRequest,
     _: str = CurrentUser,
-    analytics: AnalyticsService = Depends(get_analytics),
+    tag_service: TagService = Depends(get_tag_service),
 ):
-    count = analytics.get_transaction_count(
-        account_id=account_id,
-        from_date=from_date,
-        to_date=to_date,
-        status=status,
+    """Apply category/memo/tag operations to many transactions in one DB transaction."""
+    try:
+        result = tag_service.bulk_edit_transactions(
+            operations=[op.model_dump() for op in body.operations],
+            transaction_ids=body.ids,
+            filters=body.filter.model_dump(exclude={'all'}) if body.filter else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return BulkUpdateResponse(
+        matched=result["matched"],
+        results=[
+            BulkOperationResult(op=op.op, count=count)
+            for op, count in zip(body.operations, result["counts"], strict=True)
+        ],
     )
-    return CountResponse(count=count)
 
 
-@router.get("/{transaction_id}", response_model=TransactionResponse)
+@router.get("/{transaction_id}", response_model=TransactionResponse, dependencies=[ConditionalGet])
 def get_transaction(
     transaction_id: int,
     _: str = CurrentUser,
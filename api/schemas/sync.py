@@ -15,6 +15,7 @@ class SyncHistoryResponse(BaseModel):
     records_added: int
     records_updated: int
     error_message: Optional[str] = None
+    metrics: Optional[Dict[str, Any]] = None  # {'phases': {name: seconds}, 'counters': {name: n}}
 
     class Config:
         from_attributes = True
@@ -30,3 +31,15 @@ class SyncProgress(BaseModel):
     message: str
     institution: Optional[str] = None
     data: Optional[Dict[str, Any]] = None
+
+
+class SyncJobResponse(BaseModel):
+    id: str
+    institution: str
+    status: str  # "pending" | "running" | "success" | "failed" | "cancelled"
+    options: Dict[str, Any] = {}
+    cancel_requested: bool = False
+    error_message: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
@@ -1,8 +1,8 @@
 """Transaction schemas."""
 
 from datetime import date, datetime
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, model_validator
 
 
 class TransactionResponse(BaseModel):
@@ -48,3 +48,50 @@ class TransactionFilters(BaseModel):
     untagged_only: bool = False
     page: int = 1
     page_size: int = 50
+
+
+class BulkFilter(BaseModel):
+    account_id: Optional[int] = None
+    from_date: Optional[date] = None
+    to_date: Optional[date] = None
+    status: Optional[str] = None
+    institution: Optional[str] = None
+    search: Optional[str] = None
+    category: Optional[str] = None
+    tags: Optional[List[str]] = None
+    untagged_only: bool = False
+    all: bool = False  # Must be set to target every transaction
+
+    @model_validator(mode='after')
+    def not_empty(self):
+        if not self.all and not self.model_dump(exclude={'all'}, exclude_defaults=True):
+            raise ValueError("Empty filter matches every transaction; set a field or all: true")
+        return self
+
+
+class BulkOperation(BaseModel):
+    op: Literal['set_category', 'set_memo', 'add_tags', 'remove_tags']
+    value: Optional[str] = None  # set_category / set_memo ('' or null clears)
+    tags: List[str] = []  # add_tags / remove_tags
+
+
+class BulkUpdateRequest(BaseModel):
+    ids: Optional[List[int]] = Field(None, max_length=10000)
+    filter: Optional[BulkFilter] = None
+    operations: List[BulkOperation] = Field(..., min_length=1)
+
+    @model_validator(mode='after')
+    def one_target(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Give either ids or filter")
+        return self
+
+
+class BulkOperationResult(BaseModel):
+    op: str
+    count: int
+
+
+class BulkUpdateResponse(BaseModel):
+    matched: int
+    results: List[BulkOperationResult]
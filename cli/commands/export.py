@@ -11,8 +11,9 @@ from typing import Optional
 from rich.console import Console
 
 from cli.utils import parse_date_range, get_analytics, spinner
+from services.transaction_export import EXPORT_FORMATS, write_export
 
-app = typer.Typer(help="Export financial data to CSV or JSON")
+app = typer.Typer(help="Export financial data to CSV, JSON or NDJSON")
 console = Console()
 
 
@@ -34,18 +35,40 @@ def export_transactions(
     from_date: Optional[str] = typer.Option(None, "--from", help="Start date (YYYY-MM-DD)"),
     to_date: Optional[str] = typer.Option(None, "--to", help="End date (YYYY-MM-DD)"),
     status: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by status (pending, completed)"),
+    stream: bool = typer.Option(False, "--stream", help="Write rows as they are read (flat memory; gzip if output ends in .gz)"),
 ):
     """
-    Export transactions to CSV or JSON
+    Export transactions to CSV, JSON or NDJSON
+
+    With --stream (implied by ndjson or a .gz output) rows are read in
+    batches and written incrementally, so the full history exports in
+    constant memory.
     """
     try:
         from_date_obj, to_date_obj = parse_date_range(from_date, to_date)
+        format = format.lower()
 
         # Validate format
-        if format.lower() not in ["csv", "json"]:
-            console.print("[red]Invalid format. Use 'csv' or 'json'[/red]")
+        if format not in EXPORT_FORMATS:
+            console.print("[red]Invalid format. Use 'csv', 'json' or 'ndjson'[/red]")
             raise typer.Exit(code=1)
 
+        output_path = Path(output)
+        if stream or format == "ndjson" or output_path.suffix == ".gz":
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with get_analytics() as analytics:
+                with spinner("Exporting transactions..."):
+                    rows = analytics.iter_transaction_rows(
+                        account_id=account_id,
+                        institution=institution,
+                        from_date=from_date_obj,
+                        to_date=to_date_obj,
+                        status=status,
+                    )
+                    count = write_export(rows, output_path, format)
+            console.print(f"[green]Successfully exported {count} transactions to {output}[/green]")
+            return
+
         with get_analytics() as analytics:
             # Fetch transactions
             with spinner("Fetching transactions..."):
@@ -63,10 +86,9 @@ def export_transactions(
                 return
 
             # Export based on format
-            output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            if format.lower() == "csv":
+            if format == "csv":
                 export_transactions_csv(transactions, output_path)
             else:
                 export_transactions_json(transactions, output_path)
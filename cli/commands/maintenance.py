@@ -11,8 +11,10 @@ from rich.table import Table
 from rich import box
 from sqlalchemy import func
 
-from db.database import get_db_path, migrate_tags_schema, migrate_category_normalization_schema, migrate_merchant_mapping_schema, migrate_budget_schema, migrate_retirement_scenario_schema
+from db.database import get_db_path, migrate_tags_schema, migrate_category_normalization_schema, migrate_merchant_mapping_schema, migrate_budget_schema, migrate_retirement_scenario_schema, migrate_data_versions_schema, migrate_sync_watermarks_schema, migrate_sync_jobs_schema, migrate_rules_state_schema
+from db.data_versions import bump_data_version
 from db.models import Account, Transaction, Balance, SyncHistory
+from config.constants import DataVersionKey
 from services.analytics_service import AnalyticsService
 
 app = typer.Typer(help="Database maintenance and verification")
@@ -100,6 +102,7 @@ def cleanup(
             console.print(f"[green]Deleted {old_sync_history:,} old sync history records[/green]")
 
         # Commit changes
+        bump_data_version(analytics.session, DataVersionKey.DATA)
         analytics.session.commit()
 
         # Vacuum database to reclaim space
@@ -335,6 +338,38 @@ def migrate():
         else:
             console.print("  [dim]Already up to date[/dim]")
 
+        # Run data versions migrations
+        console.print("\n[bold]6. Data versions migrations:[/bold]")
+        version_results = migrate_data_versions_schema(db_path)
+        if version_results["created_tables"]:
+            console.print(f"  [green]Created tables:[/green] {', '.join(version_results['created_tables'])}")
+        else:
+            console.print("  [dim]Already up to date[/dim]")
+
+        # Run sync watermarks migrations
+        console.print("\n[bold]7. Sync watermarks migrations:[/bold]")
+        watermark_results = migrate_sync_watermarks_schema(db_path)
+        if watermark_results["created_tables"]:
+            console.print(f"  [green]Created tables:[/green] {', '.join(watermark_results['created_tables'])}")
+        else:
+            console.print("  [dim]Already up to date[/dim]")
+
+        # Run API sync jobs migrations
+        console.print("\n[bold]8. Sync jobs migrations:[/bold]")
+        job_results = migrate_sync_jobs_schema(db_path)
+        if job_results["created_tables"]:
+            console.print(f"  [green]Created tables:[/green] {', '.join(job_results['created_tables'])}")
+        else:
+            console.print("  [dim]Already up to date[/dim]")
+
+        # Run post-sync rules state migrations
+        console.print("\n[bold]9. Rules state migrations:[/bold]")
+        rules_results = migrate_rules_state_schema(db_path)
+        if rules_results["created_tables"]:
+            console.print(f"  [green]Created tables:[/green] {', '.join(rules_results['created_tables'])}")
+        else:
+            console.print("  [dim]Already up to date[/dim]")
+
         console.print("\n[green]Migration complete![/green]")
 
     except Exception as e:
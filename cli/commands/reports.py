@@ -11,6 +11,7 @@ from rich import box
 from typing import Optional, List, Dict, Any
 
 from cli.utils import fix_rtl, parse_date, parse_date_range, get_analytics
+from scrapers.utils.sync_metrics import PHASES
 
 app = typer.Typer(help="Generate reports and analytics")
 console = Console()
@@ -916,10 +917,15 @@ def spending_trends(
 def sync_history(
     limit: int = typer.Option(10, "--limit", "-l", help="Number of records to show"),
     institution: Optional[str] = typer.Option(None, "--institution", "-i", help="Filter by institution"),
-    status: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by status (success, failed, partial)")
+    status: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by status (success, failed, partial)"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show seconds per sync phase and request/query counts")
 ):
     """
     Show synchronization history
+
+    With --verbose, each sync's time is split into phases (browser, login,
+    MFA, fetch, convert, persist, tagging, rules); filter by institution to
+    see which phase got slower over time.
     """
     try:
         with get_analytics() as analytics:
@@ -929,6 +935,8 @@ def sync_history(
                 console.print("[yellow]No sync history found[/yellow]")
                 return
 
+            phases = _recorded_phases(history) if verbose else []
+
             # Create table
             table = Table(title="Synchronization History", show_header=True, header_style="bold cyan", box=box.ROUNDED)
             table.add_column("ID", style="dim", width=6)
@@ -939,6 +947,11 @@ def sync_history(
             table.add_column("Duration", width=12)
             table.add_column("Added", justify="right", width=8)
             table.add_column("Updated", justify="right", width=8)
+            for phase in phases:
+                table.add_column(phase.capitalize(), justify="right")
+            if verbose:
+                table.add_column("Requests", justify="right")
+                table.add_column("Queries", justify="right")
 
             for sync in history:
                 # Status color
@@ -954,7 +967,7 @@ def sync_history(
                     else:
                         duration = f"{duration_seconds / 60:.1f}m"
 
-                table.add_row(
+                row = [
                     str(sync.id),
                     sync.sync_type,
                     sync.institution or "-",
@@ -963,7 +976,14 @@ def sync_history(
                     duration,
                     str(sync.records_added),
                     str(sync.records_updated)
-                )
+                ]
+                if verbose:
+                    metrics = sync.metrics or {}
+                    sync_phases = metrics.get('phases', {})
+                    counters = metrics.get('counters', {})
+                    row += [f"{sync_phases[phase]:.1f}s" if phase in sync_phases else "-" for phase in phases]
+                    row += [str(counters.get('requests', '-')), str(counters.get('queries', '-'))]
+                table.add_row(*row)
 
             console.print(table)
 
@@ -972,5 +992,13 @@ def sync_history(
         raise typer.Exit(code=1)
 
 
+def _recorded_phases(history: List[Any]) -> List[str]:
+    """Phases any of the syncs recorded, in the order a sync runs them"""
+    recorded = set()
+    for sync in history:
+        recorded.update((sync.metrics or {}).get('phases', {}))
+    return [phase for phase in PHASES if phase in recorded] + sorted(recorded - set(PHASES))
+
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -2,33 +2,44 @@
 Sync command for financial data synchronization
 """
 
+import time
 import typer
-from typing import Optional, List
+from contextlib import nullcontext
+from typing import Dict, Optional, List, Tuple
 from rich.console import Console
 
 from db.database import check_database_exists
 from cli.utils import get_db_session, spinner
-from config.settings import load_credentials, select_accounts_to_sync, select_pension_accounts_to_sync
-from services.broker_service import BrokerService
-from services.pension_service import PensionService
+from config.constants import Institution, SyncType
+from services.base_service import BaseSyncService, SyncResult
 from services.credit_card_service import CreditCardService
 from services.rules_service import RulesService, RULES_FILE
+from services.sync_orchestrator import INSTITUTION_NAMES, SyncJob, SyncOrchestrator, browsers_to_warm, build_sync_jobs
+from scrapers.base.driver_pool import driver_pool
+from scrapers.utils.sync_metrics import SyncMetrics
 
 app = typer.Typer(help="Synchronize financial data from institutions")
 console = Console()
 
-
 @app.command("all")
 def sync_all(
     headless: bool = typer.Option(True, "--headless/--visible", help="Run browsers in headless mode"),
     months_back: int = typer.Option(3, "--months-back", help="Months to sync backwards (for credit cards)"),
     months_forward: int = typer.Option(1, "--months-forward", help="Months to sync forward (for credit cards)"),
+    max_parallel: int = typer.Option(3, "--parallel", "-p", help="Accounts scraped at the same time (1 = one by one)"),
+    full: bool = typer.Option(False, "--full", help="Ignore sync watermarks and refetch the whole --months-back range"),
+    browser_pool: int = typer.Option(2, "--browser-pool", help="Warm browsers reused across institutions (0 = launch per scraper)"),
+    browser_max_uses: int = typer.Option(10, "--browser-max-uses", help="Logins per pooled browser before it is restarted"),
 ):
     """
     Sync all financial data sources.
 
+    Institutions (and the accounts within each) are scraped in parallel, and
+    each result is saved as soon as it arrives by a single database writer.
+    Credit cards only fetch from their last sync's watermark unless --full.
     Continues syncing other institutions even if one fails.
     Shows summary of successes/failures at the end.
+    Browsers are pooled and reset between institutions to avoid repeated cold starts.
     """
     console.print("[bold cyan]Starting full synchronization...[/bold cyan]\n")
 
@@ -37,34 +48,37 @@ def sync_all(
         console.print("[bold red]Error: Database not initialized. Run 'fin-cli init' first.[/bold red]")
         raise typer.Exit(1)
 
-    # Define sync operations: (name, function, kwargs)
-    sync_operations = [
-        ("Excellence", sync_excellence, {"headless": headless}),
-        ("Meitav", sync_meitav, {"headless": headless}),
-        ("Migdal", sync_migdal, {"headless": headless, "account": None}),
-        ("Phoenix", sync_phoenix, {"headless": headless, "account": None}),
-        ("CAL", sync_cal, {"headless": headless, "months_back": months_back, "months_forward": months_forward, "account": None}),
-        ("Max", sync_max, {"headless": headless, "months_back": months_back, "months_forward": months_forward, "account": None}),
-        ("Isracard", sync_isracard, {"headless": headless, "months_back": months_back, "months_forward": months_forward, "account": None}),
-    ]
+    # Collect every configured account; an institution that cannot start counts as failed
+    jobs: List[SyncJob] = []
+    config_errors: Dict[str, List[str]] = {}
+    for institution in Institution.all():
+        try:
+            institution_jobs, errors = _build_jobs(
+                institution, None, headless=headless, months_back=months_back, months_forward=months_forward
+            )
+        except typer.Exit:
+            institution_jobs, errors = [], [f"{INSTITUTION_NAMES[institution]} not configured"]
+        jobs.extend(institution_jobs)
+        config_errors[institution] = errors
+
+    pool_context = driver_pool(max_idle=browser_pool, max_uses=browser_max_uses) if browser_pool > 0 else nullcontext()
+    with pool_context as pool:
+        if pool:
+            # Start the browsers the first parallel logins will check out
+            for config, count in browsers_to_warm(jobs, max_parallel):
+                pool.warm_in_background(config, count=count)
+
+        results = _run_sync_jobs(jobs, max_parallel, full)
 
+    # An institution succeeded if any of its accounts did
     succeeded = []
     failed = []
-    skipped = []
-
-    for name, sync_func, kwargs in sync_operations:
-        try:
-            sync_func(**kwargs)
-            succeeded.append(name)
-        except typer.Exit as e:
-            # typer.Exit(1) means failure, Exit(0) or no code means success
-            if e.exit_code != 0:
-                failed.append(name)
-            else:
-                succeeded.append(name)
-        except Exception as e:
-            console.print(f"[red]✗ {name} failed unexpectedly: {e}[/red]")
-            failed.append(name)
+    for institution in Institution.all():
+        outcomes = [result.success for job, result in results if job.institution == institution]
+        if any(outcomes):
+            succeeded.append(INSTITUTION_NAMES[institution])
+        elif outcomes or config_errors[institution]:
+            failed.append(INSTITUTION_NAMES[institution])
 
     # Print summary
     console.print("\n" + "━" * 60)
@@ -85,189 +99,234 @@ def sync_all(
         console.print(f"\n[bold green]✓ Full synchronization complete! ({total}/{total} succeeded)[/bold green]")
 
 
-@app.command("excellence")
-def sync_excellence(
-    headless: bool = typer.Option(True, "--headless/--visible", help="Run browsers in headless mode"),
-):
-    """
-    Sync Excellence broker data
+def _build_jobs(
+    institution: str,
+    account_filters: Optional[List[str]],
+    headless: bool = True,
+    months_back: int = 3,
+    months_forward: int = 1
+) -> Tuple[List[SyncJob], List[str]]:
     """
-    console.print("[bold cyan]Syncing Excellence broker...[/bold cyan]")
+    Build sync jobs for an institution's selected accounts
 
-    # Check database
-    if not check_database_exists():
-        console.print("[bold red]Error: Database not initialized. Run 'fin-cli init' first.[/bold red]")
-        raise typer.Exit(1)
+    Args:
+        institution: Institution identifier
+        account_filters: Account selection filters (ignored for brokers)
+        headless: Headless mode flag
+        months_back, months_forward: Credit card date range
 
-    # Load credentials
-    credentials = load_credentials()
+    Returns:
+        (jobs, errors) - errors lists accounts that cannot be synced
 
-    if not credentials.excellence.username or not credentials.excellence.password:
-        console.print("[bold red]Error: Excellence credentials not configured.[/bold red]")
-        console.print("Run 'fin-cli config' to set up credentials.")
+    Raises:
+        typer.Exit: If credentials are missing or the account selection is invalid
+    """
+    try:
+        jobs, errors = build_sync_jobs(institution, account_filters, headless, months_back, months_forward)
+    except ValueError as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        if institution in Institution.brokers():
+            console.print("Run 'fin-cli config setup' to set up credentials.")
         raise typer.Exit(1)
 
+    for error in errors:
+        # Pension accounts with neither per-account nor global email credentials
+        console.print(f"[bold red]Error: {error}[/bold red]")
+        console.print(f"Configure via: fin-cli config update-account {institution} <index> --email-address <email> --email-password <password>")
+    return jobs, errors
+
+
+def _run_sync_jobs(jobs: List[SyncJob], max_parallel: int, full: bool = False) -> List[Tuple[SyncJob, SyncResult]]:
+    """
+    Scrape jobs in parallel and print each result as it is saved
+
+    Scrapes run on worker threads; this thread owns the database session and
+    saves each finished scrape in its own sync transaction (credit cards are
+    committed month by month while they scrape).
+
+    Args:
+        jobs: Accounts to sync
+        max_parallel: Maximum concurrent scrapes (1 = one at a time)
+        full: Ignore sync watermarks (full range for every account)
+
+    Returns:
+        List of (job, SyncResult) in completion order
+    """
+    results = []
+    if not jobs:
+        return results
+
     with get_db_session() as db:
-        with spinner("Syncing Excellence..."):
-            # Create service and sync
-            service = BrokerService(db)
-            result = service.sync_excellence(
-                username=credentials.excellence.username,
-                password=credentials.excellence.password,
-                headless=headless
-            )
+        orchestrator = SyncOrchestrator(db, max_workers=max_parallel, full=full)
+        saved = orchestrator.run(jobs)
 
-        # Display results
-        if result.success:
-            console.print(f"[green]✓ Success![/green]")
-            console.print(f"  Accounts synced: {result.accounts_synced}")
-            console.print(f"  Balances added: {result.balances_added}")
-        else:
-            console.print(f"[red]✗ Failed: {result.error_message}[/red]")
-            raise typer.Exit(1)
+        for job in jobs:
+            if job.kwargs.get("since"):
+                console.print(f"[dim]  {job.title}: incremental from {job.kwargs['since']} (--full refetches {job.kwargs['months_back']} months)[/dim]")
 
+        while True:
+            # Only one live display at a time: spin while waiting, print outside
+            with spinner(_progress_text(orchestrator.pending)):
+                item = next(saved, None)
+            if item is None:
+                break
 
-@app.command("meitav")
-def sync_meitav(
-    headless: bool = typer.Option(True, "--headless/--visible", help="Run browsers in headless mode"),
-):
+            job, result = item
+            results.append(item)
+            console.print(f"\n[bold cyan][{len(results)}/{len(jobs)}] {job.title}[/bold cyan]")
+            _print_job_result(db, job, result)
+
+    return results
+
+
+def _progress_text(pending: List[SyncJob]) -> str:
+    """Spinner text naming the accounts still running"""
+    names = ", ".join(job.title for job in pending[:3])
+    if len(pending) > 3:
+        names += f" +{len(pending) - 3} more"
+    mfa_note = " (MFA may take a while)" if any(job.sync_type == SyncType.PENSION for job in pending) else ""
+    return f"  Syncing {names}{mfa_note}..."
+
+
+def _print_job_result(db, job: SyncJob, result: SyncResult) -> None:
+    """Print one saved account's result (and apply rules to new card transactions)"""
+    if not result.success:
+        console.print(f"  [red]✗ Failed: {result.error_message}[/red]")
+        return
+
+    console.print(f"  [green]✓ Success![/green]")
+    if job.sync_type == SyncType.BROKER:
+        console.print(f"    Accounts synced: {result.accounts_synced}")
+        console.print(f"    Balances added: {result.balances_added}")
+        if result.balances_updated:
+            console.print(f"    Balances updated: {result.balances_updated}")
+    elif job.sync_type == SyncType.PENSION:
+        console.print(f"    Balances synced: {result.balances_added + result.balances_updated}")
+    else:
+        console.print(f"    Cards synced: {result.cards_synced}")
+        console.print(f"    Transactions added: {result.transactions_added}")
+        console.print(f"    Transactions updated: {result.transactions_updated}")
+        if result.months_failed:
+            console.print(f"  [yellow]  Partial: could not fetch {', '.join(result.months_failed)} (retried next sync)[/yellow]")
+
+        # Report unmapped categories
+        if result.unmapped_categories:
+            unmapped_txns = sum(u['count'] for u in result.unmapped_categories)
+            console.print(f"  [yellow]  Unmapped categories: {len(result.unmapped_categories)} ({unmapped_txns} transactions)[/yellow]")
+
+        _apply_rules_after_sync(db, result)
+
+
+def _print_accounts_summary(results: List[Tuple[SyncJob, SyncResult]], errors: List[str]) -> None:
     """
-    Sync Meitav broker data
+    Print the summary of a multi-account sync
+
+    Args:
+        results: Saved (job, result) pairs
+        errors: Accounts that could not be started
+
+    Raises:
+        typer.Exit: If every account failed
     """
-    console.print("[bold cyan]Syncing Meitav broker...[/bold cyan]")
+    total_accounts = len(results) + len(errors)
+    errors = errors + [f"{job.title}: {result.error_message}" for job, result in results if not result.success]
+    failed = len(errors)
+    succeeded = total_accounts - failed
+
+    console.print("\n" + "━" * 60)
+    console.print("[bold]Summary[/bold]")
+    console.print("━" * 60)
+
+    if succeeded > 0:
+        console.print(f"  [green]✓ Succeeded: {succeeded}/{total_accounts} accounts[/green]")
+    if failed > 0:
+        console.print(f"  [red]✗ Failed: {failed}/{total_accounts} accounts[/red]")
+        for error in errors:
+            console.print(f"    - {error}")
+
+    card_results = [result for job, result in results if job.sync_type == SyncType.CREDIT_CARD]
+    if card_results:
+        successful = [result for result in card_results if result.success]
+        console.print(f"\n  Total cards synced: {sum(r.cards_synced for r in successful)}")
+        console.print(f"  Total transactions added: {sum(r.transactions_added for r in successful)}")
+        console.print(f"  Total transactions updated: {sum(r.transactions_updated for r in successful)}")
+
+        # Suggest reviewing unmapped categories if any
+        total_unmapped_categories = sum(len(r.unmapped_categories or []) for r in successful)
+        if total_unmapped_categories > 0:
+            console.print(f"\n[yellow]  {total_unmapped_categories} unmapped categories detected.[/yellow]")
+            console.print("  [dim]Run 'fin-cli categories unmapped' to review and map them.[/dim]")
+
+    if failed == total_accounts:
+        raise typer.Exit(1)
+
+
+def _sync_single_broker(institution: str, headless: bool) -> None:
+    """Sync one broker and exit with an error if it failed"""
+    console.print(f"[bold cyan]Syncing {INSTITUTION_NAMES[institution]} broker...[/bold cyan]")
 
     # Check database
     if not check_database_exists():
         console.print("[bold red]Error: Database not initialized. Run 'fin-cli init' first.[/bold red]")
         raise typer.Exit(1)
 
-    # Load credentials
-    credentials = load_credentials()
-
-    if not credentials.meitav.username or not credentials.meitav.password:
-        console.print("[bold red]Error: Meitav credentials not configured.[/bold red]")
-        console.print("Run 'fin-cli config setup' to set up credentials.")
+    jobs, _ = _build_jobs(institution, None, headless=headless)
+    results = _run_sync_jobs(jobs, max_parallel=1)
+    if not all(result.success for _, result in results):
         raise typer.Exit(1)
 
-    with get_db_session() as db:
-        with spinner("Syncing Meitav (may take a while)..."):
-            # Create service and sync
-            service = BrokerService(db)
-            result = service.sync_meitav(
-                username=credentials.meitav.username,
-                password=credentials.meitav.password,
-                headless=headless
-            )
 
-        # Display results
-        if result.success:
-            console.print(f"[green]✓ Success![/green]")
-            console.print(f"  Accounts synced: {result.accounts_synced}")
-            console.print(f"  Balances added: {result.balances_added}")
-            if result.balances_updated:
-                console.print(f"  Balances updated: {result.balances_updated}")
-        else:
-            console.print(f"[red]✗ Failed: {result.error_message}[/red]")
-            raise typer.Exit(1)
+@app.command("excellence")
+def sync_excellence(
+    headless: bool = typer.Option(True, "--headless/--visible", help="Run browsers in headless mode"),
+):
+    """
+    Sync Excellence broker data
+    """
+    _sync_single_broker(Institution.EXCELLENCE, headless)
+
+
+@app.command("meitav")
+def sync_meitav(
+    headless: bool = typer.Option(True, "--headless/--visible", help="Run browsers in headless mode"),
+):
+    """
+    Sync Meitav broker data
+    """
+    _sync_single_broker(Institution.MEITAV, headless)
 
 
 def _sync_pension_multi_account(
     institution: str,
-    service_method: str,
     account_filters: Optional[List[str]],
-    headless: bool
+    headless: bool,
+    max_parallel: int
 ):
     """
     Generic multi-account pension sync (DRY - mirrors credit card pattern)
 
+    Logins run in parallel and share one mailbox watcher that hands each MFA
+    code to the right login, so N accounts cost about one MFA wait.
+
     Args:
         institution: 'migdal' or 'phoenix'
-        service_method: 'sync_migdal' or 'sync_phoenix'
         account_filters: Account selection filters
         headless: Headless mode flag
+        max_parallel: Maximum concurrent logins
     """
     inst_upper = institution.upper()
     console.print(f"[bold cyan]Syncing {inst_upper} pension fund...[/bold cyan]\n")
 
-    # Get global email credentials (fallback)
-    credentials = load_credentials()
-    global_email_address = credentials.email.address
-    global_email_password = credentials.email.password
-
-    # Select accounts
-    try:
-        accounts_to_sync = select_pension_accounts_to_sync(institution, account_filters)
-    except ValueError as e:
-        console.print(f"[bold red]Error: {e}[/bold red]")
-        raise typer.Exit(1)
-
-    # Track results
-    total_accounts = len(accounts_to_sync)
-    succeeded, failed = 0, 0
-    errors = []
-
-    with get_db_session() as db:
-        # Sync each account sequentially
-        for current, (idx, account_creds) in enumerate(accounts_to_sync, 1):
-            label = f" ({account_creds.label})" if account_creds.label else ""
-            console.print(f"\n[bold cyan][{current}/{total_accounts}] Account {idx}{label}[/bold cyan]")
-
-            # Use per-account email if set, otherwise fallback to global
-            email_address = account_creds.email_address or global_email_address
-            email_password = account_creds.email_password or global_email_password
-
-            if not email_address or not email_password:
-                console.print("[bold red]Error: Email credentials not configured (neither per-account nor global)[/bold red]")
-                console.print("Configure via: fin-cli config update-account {institution} {idx} --email-address <email> --email-password <password>")
-                failed += 1
-                errors.append(f"Account {idx}{label}: Email credentials missing")
-                continue
-
-            try:
-                with spinner("  Syncing (MFA may take a while)..."):
-                    service = PensionService(db)
-                    # Call the appropriate service method dynamically
-                    result = getattr(service, service_method)(
-                        user_id=account_creds.user_id,
-                        email_address=email_address,  # Per-account or global
-                        email_password=email_password,  # Per-account or global
-                        headless=headless
-                    )
-
-                if result.success:
-                    console.print(f"  [green]✓ Success![/green]")
-                    console.print(f"    Balances synced: {result.balances_added + result.balances_updated}")
-                    succeeded += 1
-                else:
-                    console.print(f"  [red]✗ Failed: {result.error_message}[/red]")
-                    failed += 1
-                    errors.append(f"Account {idx}{label}: {result.error_message}")
-
-            except Exception as e:
-                console.print(f"  [red]✗ Failed: {e}[/red]")
-                failed += 1
-                errors.append(f"Account {idx}{label}: {str(e)}")
-
-        # Print summary
-        console.print("\n" + "━" * 60)
-        console.print("[bold]Summary[/bold]")
-        console.print("━" * 60)
-
-        if succeeded > 0:
-            console.print(f"  [green]✓ Succeeded: {succeeded}/{total_accounts} accounts[/green]")
-        if failed > 0:
-            console.print(f"  [red]✗ Failed: {failed}/{total_accounts} accounts[/red]")
-            for error in errors:
-                console.print(f"    - {error}")
-
-        if failed == total_accounts:
-            raise typer.Exit(1)
+    jobs, errors = _build_jobs(institution, account_filters, headless)
+    results = _run_sync_jobs(jobs, max_parallel)
+    _print_accounts_summary(results, errors)
 
 
 @app.command("migdal")
 def sync_migdal(
     headless: bool = typer.Option(True, "--headless/--visible", help="Run browsers in headless mode"),
     account: Optional[List[str]] = typer.Option(None, "--account", "-a", help="Account index or label (default: all)"),
+    max_parallel: int = typer.Option(3, "--parallel", "-p", help="Accounts logging in at the same time (1 = one by one)"),
 ):
     """
     Sync Migdal pension fund data (supports multiple accounts)
@@ -277,6 +336,7 @@ def sync_migdal(
         fin-cli sync migdal --account 0        # Sync first account only
         fin-cli sync migdal --account personal # Sync account labeled "personal"
         fin-cli sync migdal -a 0 -a 2          # Sync accounts 0 and 2
+        fin-cli sync migdal --parallel 1       # Log in one account at a time
     """
     if not check_database_exists():
         console.print("[bold red]Error: Database not initialized. Run 'fin-cli init' first.[/bold red]")
@@ -285,9 +345,9 @@ def sync_migdal(
     # Call the generic helper function (DRY)
     _sync_pension_multi_account(
         institution='migdal',
-        service_method='sync_migdal',
         account_filters=account,
-        headless=headless
+        headless=headless,
+        max_parallel=max_parallel
     )
 
 
@@ -295,6 +355,7 @@ def sync_migdal(
 def sync_phoenix(
     headless: bool = typer.Option(True, "--headless/--visible", help="Run browsers in headless mode"),
     account: Optional[List[str]] = typer.Option(None, "--account", "-a", help="Account index or label (default: all)"),
+    max_parallel: int = typer.Option(3, "--parallel", "-p", help="Accounts logging in at the same time (1 = one by one)"),
 ):
     """
     Sync Phoenix pension fund data (supports multiple accounts)
@@ -311,29 +372,68 @@ def sync_phoenix(
     # Call the generic helper function (DRY)
     _sync_pension_multi_account(
         institution='phoenix',
-        service_method='sync_phoenix',
         account_filters=account,
-        headless=headless
+        headless=headless,
+        max_parallel=max_parallel
     )
 
 
-def _apply_rules_after_sync(db, transaction_count: int) -> None:
-    """Apply categorization rules after sync if rules file exists"""
+@app.command("pensions")
+def sync_pensions(
+    headless: bool = typer.Option(True, "--headless/--visible", help="Run browsers in headless mode"),
+    max_parallel: int = typer.Option(4, "--parallel", "-p", help="Accounts logging in at the same time (1 = one by one)"),
+):
+    """
+    Sync all Migdal and Phoenix accounts together
+
+    Logins run in parallel and share one MFA mailbox watcher, so the whole
+    pension sync costs about one MFA wait.
+    """
+    if not check_database_exists():
+        console.print("[bold red]Error: Database not initialized. Run 'fin-cli init' first.[/bold red]")
+        raise typer.Exit(1)
+
+    console.print("[bold cyan]Syncing pension funds (Migdal + Phoenix)...[/bold cyan]\n")
+
+    jobs: List[SyncJob] = []
+    errors: List[str] = []
+    for institution in Institution.pensions():
+        try:
+            institution_jobs, institution_errors = _build_jobs(institution, None, headless)
+        except typer.Exit:
+            console.print(f"[yellow]Skipping {institution.upper()}[/yellow]")
+            continue
+        jobs.extend(institution_jobs)
+        errors.extend(institution_errors)
+
+    if not jobs and not errors:
+        console.print("[bold red]Error: No pension accounts configured[/bold red]")
+        raise typer.Exit(1)
+
+    results = _run_sync_jobs(jobs, max_parallel)
+    _print_accounts_summary(results, errors)
+
+
+def _apply_rules_after_sync(db, sync_result: SyncResult) -> None:
+    """Apply categorization rules to a sync's transactions if rules file exists (timed as the sync's "rules" phase)"""
     if not RULES_FILE.exists():
         return
 
-    if transaction_count == 0:
+    if not sync_result.transaction_ids:
         return
 
     try:
-        rules_service = RulesService(session=db)
-        rules = rules_service.get_rules()
+        metrics = SyncMetrics()
+        with metrics.phase("rules"):
+            rules_service = RulesService(session=db)
+            rules = rules_service.get_rules()
 
-        if not rules:
-            return
+            if not rules:
+                return
 
-        # Apply rules only to transactions without user_category
-        result = rules_service.apply_rules(only_uncategorized=True)
+            # Apply rules to the sync's transactions without user_category
+            result = rules_service.apply_rules_after_sync(sync_result.transaction_ids)
+        BaseSyncService(db).add_sync_metrics(sync_result.sync_history_id, metrics)
 
         if result["modified"] > 0:
             console.print(f"  [blue]Rules applied:[/blue] {result['modified']} transactions auto-categorized")
@@ -345,11 +445,12 @@ def _apply_rules_after_sync(db, transaction_count: int) -> None:
 
 def _sync_credit_card_multi_account(
     institution: str,
-    service_method: str,
     account_filters: Optional[List[str]],
     months_back: int,
     months_forward: int,
-    headless: bool
+    headless: bool,
+    max_parallel: int,
+    full: bool
 ):
     """
     Generic multi-account credit card sync (DRY)
@@ -358,96 +459,17 @@ def _sync_credit_card_multi_account(
 
     Args:
         institution: 'cal', 'max', or 'isracard'
-        service_method: 'sync_cal', 'sync_max', or 'sync_isracard'
         account_filters: Account selection filters
         months_back, months_forward, headless: Sync parameters
+        max_parallel: Maximum concurrent scrapes
+        full: Ignore sync watermarks and refetch the whole range
     """
     inst_upper = institution.upper()
     console.print(f"[bold cyan]Syncing {inst_upper} credit card...[/bold cyan]\n")
 
-    # Select accounts
-    try:
-        accounts_to_sync = select_accounts_to_sync(institution, account_filters)
-    except ValueError as e:
-        console.print(f"[bold red]Error: {e}[/bold red]")
-        raise typer.Exit(1)
-
-    # Track results
-    total_accounts = len(accounts_to_sync)
-    succeeded, failed = 0, 0
-    total_cards, total_added, total_updated = 0, 0, 0
-    total_unmapped_categories = 0
-    errors = []
-
-    with get_db_session() as db:
-        # Sync each account sequentially
-        for current, (idx, account_creds) in enumerate(accounts_to_sync, 1):
-            label = f" ({account_creds.label})" if account_creds.label else ""
-            console.print(f"\n[bold cyan][{current}/{total_accounts}] Account {idx}{label}[/bold cyan]")
-
-            try:
-                with spinner("  Syncing..."):
-                    service = CreditCardService(db)
-                    # Call the appropriate service method dynamically
-                    result = getattr(service, service_method)(
-                        username=account_creds.username,
-                        password=account_creds.password,
-                        months_back=months_back,
-                        months_forward=months_forward,
-                        headless=headless
-                    )
-
-                if result.success:
-                    console.print(f"  [green]✓ Success![/green]")
-                    console.print(f"    Cards synced: {result.cards_synced}")
-                    console.print(f"    Transactions added: {result.transactions_added}")
-                    console.print(f"    Transactions updated: {result.transactions_updated}")
-
-                    # Report unmapped categories
-                    if result.unmapped_categories:
-                        unmapped_txns = sum(u['count'] for u in result.unmapped_categories)
-                        console.print(f"  [yellow]  Unmapped categories: {len(result.unmapped_categories)} ({unmapped_txns} transactions)[/yellow]")
-                        total_unmapped_categories += len(result.unmapped_categories)
-
-                    succeeded += 1
-                    total_cards += result.cards_synced
-                    total_added += result.transactions_added
-                    total_updated += result.transactions_updated
-
-                    _apply_rules_after_sync(db, result.transactions_added + result.transactions_updated)
-                else:
-                    console.print(f"  [red]✗ Failed: {result.error_message}[/red]")
-                    failed += 1
-                    errors.append(f"Account {idx}{label}: {result.error_message}")
-
-            except Exception as e:
-                console.print(f"  [red]✗ Failed: {e}[/red]")
-                failed += 1
-                errors.append(f"Account {idx}{label}: {str(e)}")
-
-        # Print summary
-        console.print("\n" + "━" * 60)
-        console.print("[bold]Summary[/bold]")
-        console.print("━" * 60)
-
-        if succeeded > 0:
-            console.print(f"  [green]✓ Succeeded: {succeeded}/{total_accounts} accounts[/green]")
-        if failed > 0:
-            console.print(f"  [red]✗ Failed: {failed}/{total_accounts} accounts[/red]")
-            for error in errors:
-                console.print(f"    - {error}")
-
-        console.print(f"\n  Total cards synced: {total_cards}")
-        console.print(f"  Total transactions added: {total_added}")
-        console.print(f"  Total transactions updated: {total_updated}")
-
-        # Suggest reviewing unmapped categories if any
-        if total_unmapped_categories > 0:
-            console.print(f"\n[yellow]  {total_unmapped_categories} unmapped categories detected.[/yellow]")
-            console.print("  [dim]Run 'fin-cli categories unmapped' to review and map them.[/dim]")
-
-        if failed == total_accounts:
-            raise typer.Exit(1)
+    jobs, _ = _build_jobs(institution, account_filters, headless, months_back, months_forward)
+    results = _run_sync_jobs(jobs, max_parallel, full)
+    _print_accounts_summary(results, [])
 
 
 @app.command("cal")
@@ -456,6 +478,8 @@ def sync_cal(
     months_back: int = typer.Option(3, "--months-back", help="Number of months to fetch backwards"),
     months_forward: int = typer.Option(1, "--months-forward", help="Number of months to fetch forward"),
     account: Optional[List[str]] = typer.Option(None, "--account", "-a", help="Account index or label (default: all)"),
+    max_parallel: int = typer.Option(2, "--parallel", "-p", help="Accounts scraped at the same time (1 = one by one)"),
+    full: bool = typer.Option(False, "--full", help="Ignore sync watermarks and refetch the whole --months-back range"),
 ):
     """
     Sync CAL credit card data (supports multiple accounts)
@@ -465,6 +489,7 @@ def sync_cal(
         fin-cli sync cal --account 0        # Sync first account only
         fin-cli sync cal --account personal # Sync account labeled "personal"
         fin-cli sync cal -a 0 -a 2          # Sync accounts 0 and 2
+        fin-cli sync cal --full             # Refetch all months, ignoring the last sync
     """
     if not check_database_exists():
         console.print("[bold red]Error: Database not initialized. Run 'fin-cli init' first.[/bold red]")
@@ -473,11 +498,12 @@ def sync_cal(
     # Call the generic helper function (DRY - no duplication!)
     _sync_credit_card_multi_account(
         institution='cal',
-        service_method='sync_cal',
         account_filters=account,
         months_back=months_back,
         months_forward=months_forward,
-        headless=headless
+        headless=headless,
+        max_parallel=max_parallel,
+        full=full
     )
 
 
@@ -487,6 +513,8 @@ def sync_max(
     months_back: int = typer.Option(3, "--months-back", help="Number of months to fetch backwards"),
     months_forward: int = typer.Option(1, "--months-forward", help="Number of months to fetch forward"),
     account: Optional[List[str]] = typer.Option(None, "--account", "-a", help="Account index or label (default: all)"),
+    max_parallel: int = typer.Option(2, "--parallel", "-p", help="Accounts scraped at the same time (1 = one by one)"),
+    full: bool = typer.Option(False, "--full", help="Ignore sync watermarks and refetch the whole --months-back range"),
 ):
     """
     Sync Max credit card data (supports multiple accounts)
@@ -503,11 +531,12 @@ def sync_max(
     # Call the generic helper function (DRY - no duplication!)
     _sync_credit_card_multi_account(
         institution='max',
-        service_method='sync_max',
         account_filters=account,
         months_back=months_back,
         months_forward=months_forward,
-        headless=headless
+        headless=headless,
+        max_parallel=max_parallel,
+        full=full
     )
 
 
@@ -517,6 +546,8 @@ def sync_isracard(
     months_back: int = typer.Option(3, "--months-back", help="Number of months to fetch backwards"),
     months_forward: int = typer.Option(1, "--months-forward", help="Number of months to fetch forward"),
     account: Optional[List[str]] = typer.Option(None, "--account", "-a", help="Account index or label (default: all)"),
+    max_parallel: int = typer.Option(2, "--parallel", "-p", help="Accounts scraped at the same time (1 = one by one)"),
+    full: bool = typer.Option(False, "--full", help="Ignore sync watermarks and refetch the whole --months-back range"),
 ):
     """
     Sync Isracard credit card data (supports multiple accounts)
@@ -535,13 +566,68 @@ def sync_isracard(
     # Call the generic helper function (DRY - no duplication!)
     _sync_credit_card_multi_account(
         institution='isracard',
-        service_method='sync_isracard',
         account_filters=account,
         months_back=months_back,
         months_forward=months_forward,
-        headless=headless
+        headless=headless,
+        max_parallel=max_parallel,
+        full=full
     )
 
 
+@app.command("replay")
+def sync_replay(
+    sync_id: int = typer.Argument(..., help="Sync history ID whose landed payloads to replay"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Convert only - do not save to the database"),
+):
+    """
+    Rerun a credit card sync from its landed raw payloads (no browser or login)
+
+    Every credit card sync lands the API responses it received under
+    ~/.fin/landing. Replaying converts them again and saves the result as a
+    new sync - useful after fixing a conversion bug, or to time conversion
+    and persistence on their own.
+
+    Examples:
+        fin-cli sync replay 42             # Re-save sync 42 from its payloads
+        fin-cli sync replay 42 --dry-run   # Only convert and show counts
+    """
+    if not check_database_exists():
+        console.print("[bold red]Error: Database not initialized. Run 'fin-cli init' first.[/bold red]")
+        raise typer.Exit(1)
+
+    with get_db_session() as db:
+        service = CreditCardService(db)
+        started = time.perf_counter()
+        try:
+            institution, outcome = service.replay_fetch(sync_id)
+        except ValueError as e:
+            console.print(f"[bold red]Error: {e}[/bold red]")
+            raise typer.Exit(1)
+        convert_seconds = time.perf_counter() - started
+
+        name = INSTITUTION_NAMES.get(institution, institution)
+        console.print(f"[bold cyan]Replaying {name} sync {sync_id}[/bold cyan]")
+
+        if dry_run:
+            if outcome.error is not None:
+                console.print(f"  [red]✗ Failed: {outcome.error}[/red]")
+                raise typer.Exit(1)
+            transaction_count = sum(len(card.transactions) for card in outcome.data)
+            console.print(f"  Cards: {len(outcome.data)}")
+            console.print(f"  Transactions: {transaction_count}")
+            console.print(f"  [dim]Converted in {convert_seconds:.2f}s[/dim]")
+            return
+
+        result = service.save_replay(institution, outcome)
+        total_seconds = time.perf_counter() - started
+        _print_job_result(db, SyncJob(institution, name), result)
+        if result.sync_history_id:
+            console.print(f"  [dim]Saved as sync {result.sync_history_id}[/dim]")
+        console.print(f"  [dim]Converted in {convert_seconds:.2f}s, {total_seconds:.2f}s total[/dim]")
+        if not result.success:
+            raise typer.Exit(1)
+
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -274,6 +274,7 @@ def format_status(status: str) -> str:
     """
     colors = {
         "success": "green",
+        "partial": "yellow",
         "failed": "red",
         "pending": "yellow",
         "completed": "green",
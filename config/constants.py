@@ -60,9 +60,29 @@ class SyncStatus:
     """Sync operation status constants"""
     IN_PROGRESS = "in_progress"
     SUCCESS = "success"
+    PARTIAL = "partial"  # Saved, but some months could not be fetched
     FAILED = "failed"
 
 
+class SyncJobStatus:
+    """API sync job status constants (see db.models.SyncJobRecord)"""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @classmethod
+    def finished(cls) -> list[str]:
+        return [cls.SUCCESS, cls.FAILED, cls.CANCELLED]
+
+
+class DataVersionKey:
+    """Named data version counters (see db.models.DataVersion)"""
+    CATEGORY_MAPPINGS = "category_mappings"
+    DATA = "data"  # Transactions, balances, tags and categories (analytics cache)
+
+
 class TransactionStatus:
     """Transaction status constants"""
     PENDING = "pending"
@@ -0,0 +1,213 @@
+"""
+Landing store for raw scraper payloads.
+
+Every credit card sync lands the API responses its scraper received, so the
+sync can be replayed later (fin-cli sync replay <sync_id>) without a browser.
+Payloads are gzip-compressed JSON files named by a keyed hash (HMAC-SHA256)
+of their content, so a response that did not change between syncs is stored
+once. Each sync gets a small manifest mapping its requests to payload hashes.
+
+Layout (default ~/.fin/landing):
+    objects/ab/abcdef....enc        one payload per content hash
+    syncs/<sync_id>.enc             manifest: institution, date range, requests
+
+Payloads are full statements, so objects and manifests are encrypted with
+the same Fernet key as the credentials file and written owner-only. Landed
+syncs are kept for LANDING_RETENTION_DAYS (see prune()).
+"""
+
+import gzip
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from config.secure_files import write_private
+from config.settings import CONFIG_DIR, get_encryption_key
+
+logger = logging.getLogger(__name__)
+
+LANDING_DIR = CONFIG_DIR / "landing"
+
+# Days a sync's landed payloads can be replayed
+LANDING_RETENTION_DAYS = 90
+
+
+class LandingStore:
+    """
+    Encrypted, content-addressed store of raw payloads, indexed by sync id.
+
+    Usage:
+        store = LandingStore()
+        store.save(sync_id, 'cal', payload_log.entries, start_date=..., end_date=...)
+        manifest = store.load(sync_id)      # None if nothing was landed
+        manifest['payloads']                # {request key: recorded entry}
+        store.prune()                       # drop syncs past retention
+    """
+
+    def __init__(
+        self,
+        root: Path = LANDING_DIR,
+        key: Optional[bytes] = None,
+        retention_days: int = LANDING_RETENTION_DAYS
+    ):
+        """
+        Args:
+            root: Store directory (default ~/.fin/landing)
+            key: Fernet key (default: the credentials key)
+            retention_days: Age after which prune() removes a sync's payloads
+        """
+        self.root = root
+        self.retention_days = retention_days
+        self._key = key
+        self._fernet: Optional[Fernet] = None
+
+    @property
+    def key(self) -> bytes:
+        if self._key is None:
+            self._key = get_encryption_key()
+        return self._key
+
+    @property
+    def fernet(self) -> Fernet:
+        if self._fernet is None:
+            self._fernet = Fernet(self.key)
+        return self._fernet
+
+    def save(
+        self,
+        sync_id: int,
+        institution: str,
+        entries: Dict[str, Dict[str, Any]],
+        append: bool = False,
+        **context: Any
+    ) -> Dict[str, int]:
+        """
+        Land a sync's recorded payloads.
+
+        Args:
+            sync_id: SyncHistory id the payloads belong to
+            institution: Institution name
+            entries: Recorded entries by request key (see PayloadLog)
+            append: Add to the sync's existing manifest (streamed syncs land
+                each batch as it is saved)
+            **context: JSON-serializable values stored in the manifest
+                (e.g. start_date, end_date, state)
+
+        Returns:
+            Stats: payloads (count), new (objects written), bytes (written)
+        """
+        self._ensure_root()
+        hashes = {}
+        written = 0
+        written_bytes = 0
+        for key, entry in entries.items():
+            content = json.dumps(entry, sort_keys=True, ensure_ascii=False).encode('utf-8')
+            digest = self._digest(content)
+            hashes[key] = digest
+
+            path = self._object_path(digest)
+            if path.exists():
+                os.utime(path)  # Referenced again - keep it out of prune()
+                continue
+            data = self.fernet.encrypt(gzip.compress(content, mtime=0))
+            write_private(path, data)
+            written += 1
+            written_bytes += len(data)
+
+        manifest_path = self._manifest_path(sync_id)
+        manifest = self._read_manifest(manifest_path) if append else None
+        if manifest is None:
+            manifest = {
+                'sync_id': sync_id,
+                'institution': institution,
+                'created_at': datetime.utcnow().isoformat(),
+                'payloads': {},
+            }
+        manifest.update(context)
+        manifest['payloads'].update(hashes)
+        write_private(manifest_path, self.fernet.encrypt(json.dumps(manifest).encode('utf-8')))
+        logger.debug(f"Landed {len(hashes)} payloads for sync {sync_id} ({written} new)")
+        return {'payloads': len(hashes), 'new': written, 'bytes': written_bytes}
+
+    def load(self, sync_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Load a sync's manifest with its payloads resolved.
+
+        Args:
+            sync_id: SyncHistory id
+
+        Returns:
+            Manifest dict whose 'payloads' maps request keys to recorded
+            entries, or None if nothing was landed for the sync
+        """
+        manifest = self._read_manifest(self._manifest_path(sync_id))
+        if manifest is None:
+            return None
+
+        manifest['payloads'] = {
+            key: json.loads(gzip.decompress(self.fernet.decrypt(self._object_path(digest).read_bytes())))
+            for key, digest in manifest['payloads'].items()
+        }
+        return manifest
+
+    def prune(self) -> Dict[str, int]:
+        """
+        Remove syncs landed more than retention_days ago, and payloads no
+        remaining sync references.
+
+        Returns:
+            Stats: syncs (manifests removed), objects (payloads removed)
+        """
+        cutoff = time.time() - self.retention_days * 86400
+        removed_syncs = 0
+        referenced = set()
+        for manifest_path in (self.root / "syncs").glob("*.enc"):
+            if manifest_path.stat().st_mtime < cutoff:
+                manifest_path.unlink(missing_ok=True)
+                removed_syncs += 1
+                continue
+            manifest = self._read_manifest(manifest_path)
+            if manifest is not None:
+                referenced.update(manifest['payloads'].values())
+
+        # Recent objects may belong to a save whose manifest is not written yet
+        removed_objects = 0
+        for object_path in (self.root / "objects").glob("*/*.enc"):
+            if object_path.stem not in referenced and object_path.stat().st_mtime < cutoff:
+                object_path.unlink(missing_ok=True)
+                removed_objects += 1
+
+        if removed_syncs or removed_objects:
+            logger.info(f"Pruned landed payloads: {removed_syncs} syncs, {removed_objects} objects")
+        return {'syncs': removed_syncs, 'objects': removed_objects}
+
+    def _read_manifest(self, path: Path) -> Optional[Dict[str, Any]]:
+        if not path.exists():
+            return None
+        try:
+            return json.loads(self.fernet.decrypt(path.read_bytes()))
+        except (InvalidToken, ValueError) as e:
+            logger.warning(f"Ignoring unreadable landing manifest {path}: {e}")
+            return None
+
+    def _digest(self, content: bytes) -> str:
+        # Keyed, so file names do not let anyone confirm a guessed payload
+        return hmac.new(self.key, content, hashlib.sha256).hexdigest()
+
+    def _ensure_root(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        os.chmod(self.root, 0o700)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.enc"
+
+    def _manifest_path(self, sync_id: int) -> Path:
+        return self.root / "syncs" / f"{sync_id}.enc"
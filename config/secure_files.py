@@ -0,0 +1,73 @@
+"""
+Helpers for private files shared between processes.
+
+The CLI, API workers and sync job threads all read and write files under
+~/.fin. write_private() replaces a file atomically with owner-only
+permissions, and file_lock() serializes read-modify-write cycles across
+threads and processes (advisory fcntl lock on a sidecar .lock file).
+"""
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: thread lock only
+    fcntl = None
+
+# One thread lock per lock file (flock does not exclude threads sharing a process reliably)
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock for a file, across threads and processes.
+
+    Args:
+        path: File being protected (the lock is taken on path + '.lock')
+    """
+    lock_path = Path(f"{path}.lock")
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(str(lock_path), threading.Lock())
+
+    with thread_lock:
+        if fcntl is None:
+            yield
+            return
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+def write_private(path: Path, data: bytes) -> None:
+    """
+    Atomically replace a file with data, readable only by the owner.
+
+    Writes a uniquely named temp file in the same directory and renames it
+    over the target, so readers never see a partial file.
+
+    Args:
+        path: Destination file
+        data: File contents
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
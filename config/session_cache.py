@@ -0,0 +1,135 @@
+"""
+Encrypted cache of scraper login sessions.
+
+Stores post-login state (auth tokens, cookies, card metadata) per institution
+and username so repeat syncs can skip the browser login while the session is
+still valid. Encrypted with the same Fernet key as the credentials file.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from config.secure_files import file_lock, write_private
+from config.settings import CONFIG_DIR, get_encryption_key
+
+logger = logging.getLogger(__name__)
+
+SESSION_CACHE_FILE = CONFIG_DIR / "sessions.enc"
+
+class SessionCache:
+    """
+    Encrypted, expiring key/value store for scraper sessions.
+
+    Every read-modify-write holds a file lock, so the CLI, API workers and
+    sync job threads don't lose each other's entries.
+
+    Usage:
+        cache = SessionCache()
+        key = SessionCache.make_key('cal', username)
+        state = cache.get(key)              # None if missing or expired
+        cache.put(key, scraper_state, timedelta(minutes=30))
+        cache.invalidate(key)
+    """
+
+    def __init__(self, path: Path = SESSION_CACHE_FILE):
+        """
+        Args:
+            path: Cache file location (default ~/.fin/sessions.enc)
+        """
+        self.path = path
+
+    @staticmethod
+    def make_key(institution: str, username: str) -> str:
+        """
+        Build cache key for an institution account.
+
+        The username is hashed so the key never reveals it.
+
+        Args:
+            institution: Institution name (see config.constants.Institution)
+            username: Login username
+
+        Returns:
+            Cache key
+        """
+        digest = hashlib.sha256(username.encode()).hexdigest()[:16]
+        return f"{institution}:{digest}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached session state.
+
+        Args:
+            key: Cache key (see make_key)
+
+        Returns:
+            Session state dict, or None if missing or expired
+        """
+        with file_lock(self.path):
+            entries = self._load()
+            entry = entries.get(key)
+            if not entry:
+                return None
+
+            if datetime.fromisoformat(entry['expires_at']) <= datetime.utcnow():
+                del entries[key]
+                self._save(entries)
+                return None
+
+            return entry['state']
+
+    def put(self, key: str, state: Dict[str, Any], ttl: timedelta) -> None:
+        """
+        Store session state, replacing any previous entry.
+
+        Args:
+            key: Cache key (see make_key)
+            state: JSON-serializable session state
+            ttl: How long the session stays usable
+        """
+        with file_lock(self.path):
+            now = datetime.utcnow()
+            entries = {
+                k: v for k, v in self._load().items()
+                if datetime.fromisoformat(v['expires_at']) > now
+            }
+            entries[key] = {
+                'state': state,
+                'expires_at': (now + ttl).isoformat(),
+            }
+            self._save(entries)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a cached session (e.g. after it failed validation).
+
+        Args:
+            key: Cache key (see make_key)
+        """
+        with file_lock(self.path):
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._save(entries)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read and decrypt all entries (empty if missing or unreadable)."""
+        if not self.path.exists():
+            return {}
+
+        try:
+            fernet = Fernet(get_encryption_key())
+            return json.loads(fernet.decrypt(self.path.read_bytes()).decode())
+        except (InvalidToken, ValueError) as e:
+            logger.warning(f"Ignoring unreadable session cache {self.path}: {e}")
+            return {}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Encrypt and atomically replace all entries (readable only by owner)."""
+        fernet = Fernet(get_encryption_key())
+        write_private(self.path, fernet.encrypt(json.dumps(entries).encode()))
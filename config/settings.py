@@ -86,6 +86,13 @@ class Settings(BaseSettings):
     default_months_back: int = 3
     default_months_forward: int = 1
 
+    # Analytics result cache (see services.analytics_cache)
+    analytics_cache_size: int = 256  # In-memory entries per database, 0 disables
+    analytics_cache_dir: Optional[Path] = None  # Shared with other processes when set
+
+    # API settings
+    api_db_connections: int = 8  # Concurrent database reads of async API routes
+
     class Config:
         env_prefix = "FIN_"
         case_sensitive = False
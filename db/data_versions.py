@@ -0,0 +1,70 @@
+"""
+Data version counters for cross-process cache invalidation.
+
+Each named counter lives in the data_versions table. Writers bump it inside
+the same transaction as the change they make, so the new version becomes
+visible exactly when the data does. Readers compare it to the version of
+their cached copy and reload only when it moved.
+"""
+
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from db.models import DataVersion
+
+logger = logging.getLogger(__name__)
+
+
+def get_data_version(session: Session, name: str) -> Optional[int]:
+    """
+    Read the current value of a version counter.
+
+    Args:
+        session: SQLAlchemy session
+        name: Counter name (see config.constants.DataVersionKey)
+
+    Returns:
+        Current version (0 if never bumped), or None if the data_versions
+        table does not exist yet (run 'fin-cli maintenance migrate')
+    """
+    try:
+        version = session.query(DataVersion.version).filter(DataVersion.name == name).scalar()
+    except OperationalError:
+        logger.debug("data_versions table missing - version tracking disabled")
+        return None
+    return version or 0
+
+
+def bump_data_version(session: Session, name: str) -> Optional[int]:
+    """
+    Increment a version counter.
+
+    Does NOT commit - the bump must be part of the caller's transaction.
+
+    Args:
+        session: SQLAlchemy session
+        name: Counter name (see config.constants.DataVersionKey)
+
+    Returns:
+        New version, or None if the data_versions table does not exist yet
+    """
+    try:
+        updated = session.query(DataVersion).filter(DataVersion.name == name).update(
+            {
+                DataVersion.version: DataVersion.version + 1,
+                DataVersion.updated_at: datetime.utcnow(),
+            },
+            synchronize_session=False
+        )
+        if not updated:
+            session.add(DataVersion(name=name, version=1))
+            session.flush()
+            return 1
+    except OperationalError:
+        logger.debug("data_versions table missing - version bump skipped")
+        return None
+    return get_data_version(session, name)
@@ -3,18 +3,24 @@ Database connection and session management
 """
 
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, AsyncGenerator, Generator
 import logging
 from sqlalchemy import create_engine, event, text, inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from .models import Base
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 logger = logging.getLogger(__name__)
 
 # Database file location - store in user's home directory or project root
 DEFAULT_DB_PATH = Path.home() / ".fin" / "financial_data.db"
 
+# Milliseconds a connection waits for another writer's lock before "database is locked"
+SQLITE_BUSY_TIMEOUT_MS = 30000
+
 
 def get_database_url(db_path: Path = DEFAULT_DB_PATH) -> str:
     """
@@ -36,6 +42,20 @@ def enable_foreign_keys(dbapi_conn, _connection_record):
     cursor.close()
 
 
+def enable_concurrent_writes(dbapi_conn, _connection_record):
+    """
+    Let concurrent sync jobs share the SQLite file
+
+    WAL lets readers run while a job commits, and busy_timeout makes a
+    writer wait for the current one instead of failing with "database is
+    locked". WAL is persistent, so this only switches the file once.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
 def create_database_engine(db_path: Path = DEFAULT_DB_PATH):
     """
     Create SQLAlchemy engine
@@ -56,8 +76,9 @@ def create_database_engine(db_path: Path = DEFAULT_DB_PATH):
         echo=False  # Set to True for SQL debugging
     )
 
-    # Enable foreign keys for SQLite
+    # Enable foreign keys, WAL and busy waiting for SQLite
     event.listen(engine, "connect", enable_foreign_keys)
+    event.listen(engine, "connect", enable_concurrent_writes)
 
     return engine
 
@@ -159,6 +180,112 @@ def get_db(db_path: Path = DEFAULT_DB_PATH) -> Generator[Session, None, None]:
         db.close()
 
 
+# ==================== Async (API read routes) ====================
+# Requires the sqlalchemy[asyncio] and aiosqlite packages, imported on first use
+
+# Connections the async engine opens at most; requests beyond that wait
+# (without holding a thread) until one is free
+DEFAULT_ASYNC_POOL_SIZE = 8
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def get_async_database_url(db_path: Path = DEFAULT_DB_PATH) -> str:
+    """
+    Get SQLite database URL for the aiosqlite driver
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        SQLite aiosqlite connection URL
+    """
+    return f"sqlite+aiosqlite:///{db_path}"
+
+
+def create_async_database_engine(
+    db_path: Path = DEFAULT_DB_PATH,
+    pool_size: int = DEFAULT_ASYNC_POOL_SIZE
+) -> "AsyncEngine":
+    """
+    Create SQLAlchemy asyncio engine
+
+    Args:
+        db_path: Path to SQLite database file
+        pool_size: Maximum concurrent connections (no overflow)
+
+    Returns:
+        SQLAlchemy AsyncEngine instance
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    engine = create_async_engine(
+        get_async_database_url(db_path),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=30,
+        echo=False
+    )
+
+    # Same connection setup as the sync engine
+    event.listen(engine.sync_engine, "connect", enable_foreign_keys)
+    event.listen(engine.sync_engine, "connect", enable_concurrent_writes)
+
+    return engine
+
+
+def get_async_session_factory(
+    db_path: Path = DEFAULT_DB_PATH,
+    pool_size: int = DEFAULT_ASYNC_POOL_SIZE
+) -> "async_sessionmaker[AsyncSession]":
+    """
+    Get or create global async session factory
+
+    Args:
+        db_path: Path to SQLite database file
+        pool_size: Maximum concurrent connections (used when first created)
+    """
+    global _async_engine, _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        _async_engine = create_async_database_engine(db_path, pool_size)
+        _AsyncSessionLocal = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _AsyncSessionLocal
+
+
+async def get_async_db(
+    db_path: Path = DEFAULT_DB_PATH,
+    pool_size: int = DEFAULT_ASYNC_POOL_SIZE
+) -> AsyncGenerator["AsyncSession", None]:
+    """
+    Dependency for getting an async database session (for async FastAPI routes)
+
+    Args:
+        db_path: Path to SQLite database file
+        pool_size: Maximum concurrent connections (used when first created)
+
+    Yields:
+        SQLAlchemy AsyncSession instance
+    """
+    async with get_async_session_factory(db_path, pool_size)() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's connections (API shutdown)"""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _AsyncSessionLocal = None
+
+
 def check_database_exists(db_path: Path = DEFAULT_DB_PATH) -> bool:
     """
     Check if database file exists
@@ -490,4 +617,202 @@ def migrate_retirement_scenario_schema(db_path: Path = DEFAULT_DB_PATH) -> dict:
     else:
         logger.info("Retirement scenario schema already up to date")
 
-    return results
\ No newline at end of file
+    return results
+
+def migrate_data_versions_schema(db_path: Path = DEFAULT_DB_PATH) -> dict:
+    """
+    Migrate database schema to add data version counters.
+    Safe to run multiple times (idempotent).
+
+    Adds:
+    - data_versions table (used to invalidate process-level caches)
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Dict with migration results: {created_tables: []}
+    """
+    engine = get_engine(db_path)
+    results = {"created_tables": []}
+
+    with engine.connect() as conn:
+        inspector = inspect(engine)
+        existing_tables = inspector.get_table_names()
+
+        if 'data_versions' not in existing_tables:
+            conn.execute(text("""
+                CREATE TABLE data_versions (
+                    name VARCHAR(50) PRIMARY KEY,
+                    version INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP
+                )
+            """))
+            results["created_tables"].append("data_versions")
+            logger.info("Created data_versions table")
+
+        conn.commit()
+
+    if results["created_tables"]:
+        logger.info(f"Data versions migration completed: {results}")
+    else:
+        logger.info("Data versions schema already up to date")
+
+    return results
+
+
+def migrate_sync_watermarks_schema(db_path: Path = DEFAULT_DB_PATH) -> dict:
+    """
+    Migrate database schema to add incremental sync watermarks.
+    Safe to run multiple times (idempotent).
+
+    Adds:
+    - sync_watermarks table
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Dict with migration results: {created_tables: []}
+    """
+    engine = get_engine(db_path)
+    results = {"created_tables": []}
+
+    with engine.connect() as conn:
+        inspector = inspect(engine)
+        existing_tables = inspector.get_table_names()
+
+        if 'sync_watermarks' not in existing_tables:
+            conn.execute(text("""
+                CREATE TABLE sync_watermarks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    institution VARCHAR(100) NOT NULL,
+                    login_key VARCHAR(100) NOT NULL,
+                    last_completed_date DATE,
+                    oldest_pending_date DATE,
+                    last_synced_at TIMESTAMP NOT NULL,
+                    updated_at TIMESTAMP,
+                    UNIQUE(institution, login_key)
+                )
+            """))
+            results["created_tables"].append("sync_watermarks")
+            logger.info("Created sync_watermarks table")
+
+        conn.commit()
+
+    if results["created_tables"]:
+        logger.info(f"Sync watermarks migration completed: {results}")
+    else:
+        logger.info("Sync watermarks schema already up to date")
+
+    return results
+
+
+def migrate_sync_jobs_schema(db_path: Path = DEFAULT_DB_PATH) -> dict:
+    """
+    Migrate database schema to add API sync jobs.
+    Safe to run multiple times (idempotent).
+
+    Adds:
+    - sync_jobs table
+    - sync_job_events table
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Dict with migration results: {created_tables: []}
+    """
+    engine = get_engine(db_path)
+    results = {"created_tables": []}
+
+    with engine.connect() as conn:
+        inspector = inspect(engine)
+        existing_tables = inspector.get_table_names()
+
+        if 'sync_jobs' not in existing_tables:
+            conn.execute(text("""
+                CREATE TABLE sync_jobs (
+                    id VARCHAR(36) PRIMARY KEY,
+                    institution VARCHAR(100) NOT NULL,
+                    status VARCHAR(20) NOT NULL,
+                    options TEXT,
+                    cancel_requested BOOLEAN NOT NULL DEFAULT 0,
+                    worker_pid INTEGER,
+                    error_message TEXT,
+                    created_at TIMESTAMP NOT NULL,
+                    started_at TIMESTAMP,
+                    completed_at TIMESTAMP
+                )
+            """))
+            conn.execute(text("CREATE INDEX idx_sync_jobs_status ON sync_jobs(status)"))
+            results["created_tables"].append("sync_jobs")
+            logger.info("Created sync_jobs table")
+
+        if 'sync_job_events' not in existing_tables:
+            conn.execute(text("""
+                CREATE TABLE sync_job_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id VARCHAR(36) NOT NULL,
+                    event_type VARCHAR(20) NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at TIMESTAMP NOT NULL,
+                    FOREIGN KEY (job_id) REFERENCES sync_jobs(id) ON DELETE CASCADE
+                )
+            """))
+            conn.execute(text("CREATE INDEX idx_sync_job_events_job ON sync_job_events(job_id, id)"))
+            results["created_tables"].append("sync_job_events")
+            logger.info("Created sync_job_events table")
+
+        conn.commit()
+
+    if results["created_tables"]:
+        logger.info(f"Sync jobs migration completed: {results}")
+    else:
+        logger.info("Sync jobs schema already up to date")
+
+    return results
+
+
+
+def migrate_rules_state_schema(db_path: Path = DEFAULT_DB_PATH) -> dict:
+    """
+    Migrate database schema to track which rules were applied after syncs.
+    Safe to run multiple times (idempotent).
+
+    Adds:
+    - rules_state table
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Dict with migration results: {created_tables: []}
+    """
+    engine = get_engine(db_path)
+    results = {"created_tables": []}
+
+    with engine.connect() as conn:
+        inspector = inspect(engine)
+        existing_tables = inspector.get_table_names()
+
+        if 'rules_state' not in existing_tables:
+            conn.execute(text("""
+                CREATE TABLE rules_state (
+                    rules_file VARCHAR(500) PRIMARY KEY,
+                    file_hash VARCHAR(64) NOT NULL,
+                    rule_hashes TEXT NOT NULL,
+                    applied_at TIMESTAMP NOT NULL
+                )
+            """))
+            results["created_tables"].append("rules_state")
+            logger.info("Created rules_state table")
+
+        conn.commit()
+
+    if results["created_tables"]:
+        logger.info(f"Rules state migration completed: {results}")
+    else:
+        logger.info("Rules state schema already up to date")
+
+    return results
@@ -2,8 +2,9 @@
 SQLAlchemy ORM models for financial data aggregator
 """
 
+import json
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from sqlalchemy import (
     Column, Integer, String, Text, Float, Date, DateTime, Boolean,
     ForeignKey, Index, UniqueConstraint
@@ -166,6 +167,13 @@ class SyncHistory(Base):
         Index('idx_sync_history_status', 'status'),
     )
 
+    @property
+    def metrics(self) -> Optional[Dict[str, Any]]:
+        """Per-phase seconds and counters recorded by the sync ({'phases': ..., 'counters': ...})"""
+        if not self.sync_metadata:
+            return None
+        return json.loads(self.sync_metadata).get('metrics')
+
     def __repr__(self):
         return f"<SyncHistory(id={self.id}, type={self.sync_type}, status={self.status}, started={self.started_at})>"
 
@@ -316,4 +324,120 @@ class RetirementScenario(Base):
     updated_at = Column(DateTime, onupdate=datetime.utcnow)
 
     def __repr__(self):
-        return f"<RetirementScenario(id={self.id}, name={self.name})>"
\ No newline at end of file
+        return f"<RetirementScenario(id={self.id}, name={self.name})>"
+
+class DataVersion(Base):
+    """
+    Monotonic version counters for invalidating process-level caches.
+
+    One row per named scope (see config.constants.DataVersionKey). Writers bump
+    the counter in the same transaction as the data change; readers in other
+    processes (API workers, Streamlit) compare it to their cached copy.
+    """
+    __tablename__ = "data_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<DataVersion(name={self.name}, version={self.version})>"
+
+
+class SyncWatermark(Base):
+    """
+    Incremental sync position for one institution login.
+
+    Credit card logins can cover several card accounts, so the watermark is
+    kept per login (hashed username, never stored in clear) rather than per
+    card. The next routine sync only fetches from the watermark onwards.
+    """
+    __tablename__ = "sync_watermarks"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    institution = Column(String(100), nullable=False)
+    login_key = Column(String(100), nullable=False)  # SessionCache.make_key() hash
+    last_completed_date = Column(Date, nullable=True)  # Newest completed transaction seen
+    oldest_pending_date = Column(Date, nullable=True)  # Oldest pending transaction in the last sync
+    last_synced_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('institution', 'login_key', name='uq_sync_watermark'),
+    )
+
+    def __repr__(self):
+        return f"<SyncWatermark(institution={self.institution}, completed={self.last_completed_date}, synced={self.last_synced_at})>"
+
+
+class RulesState(Base):
+    """
+    What the categorization rules file looked like when rules were last
+    applied after a sync.
+
+    A changed file hash means the rules were edited; only the rules not in
+    rule_hashes then need a pass over older transactions.
+    """
+    __tablename__ = "rules_state"
+
+    rules_file = Column(String(500), primary_key=True)
+    file_hash = Column(String(64), nullable=False)  # sha256 of the rules file
+    rule_hashes = Column(Text, nullable=False)  # JSON list of per-rule hashes
+    applied_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<RulesState(rules_file={self.rules_file}, applied={self.applied_at})>"
+
+
+class SyncJobRecord(Base):
+    """
+    A sync started through the API (see services.sync_job_runner).
+
+    Jobs are rows rather than process memory so that any API worker can
+    report on them and they survive a restart. worker_pid names the process
+    running the job; a job whose process is gone is marked failed.
+    """
+    __tablename__ = "sync_jobs"
+
+    id = Column(String(36), primary_key=True)  # uuid4
+    institution = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False)  # SyncJobStatus
+    options = Column(Text, nullable=True)  # JSON: months_back, account_index
+    cancel_requested = Column(Boolean, default=False, nullable=False)
+    worker_pid = Column(Integer, nullable=True)
+    error_message = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+    events = relationship("SyncJobEvent", back_populates="job", cascade="all, delete-orphan",
+                          order_by="SyncJobEvent.id")
+
+    __table_args__ = (
+        Index('idx_sync_jobs_status', 'status'),
+    )
+
+    def __repr__(self):
+        return f"<SyncJobRecord(id={self.id}, institution={self.institution}, status={self.status})>"
+
+
+class SyncJobEvent(Base):
+    """
+    One progress event of an API sync job, in order (id is the event sequence).
+    """
+    __tablename__ = "sync_job_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String(36), ForeignKey("sync_jobs.id", ondelete="CASCADE"), nullable=False)
+    event_type = Column(String(20), nullable=False)  # 'progress', 'success', 'error'
+    data = Column(Text, nullable=False)  # JSON: message plus phase, card, month, counts
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    job = relationship("SyncJobRecord", back_populates="events")
+
+    __table_args__ = (
+        Index('idx_sync_job_events_job', 'job_id', 'id'),
+    )
+
+    def __repr__(self):
+        return f"<SyncJobEvent(id={self.id}, job_id={self.job_id}, type={self.event_type})>"
@@ -4,8 +4,11 @@ Shared SQLAlchemy query expressions for transaction queries.
 These expressions provide consistent calculations across all services.
 """
 
-from sqlalchemy import func
-from db.models import Transaction
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import func, select
+from db.models import Account, Tag, Transaction, TransactionTag
 
 
 def effective_amount_expr():
@@ -54,4 +57,73 @@ def get_effective_amount(txn: Transaction) -> float:
     """
     if txn.charged_amount is not None:
         return txn.charged_amount
-    return txn.original_amount or 0
\ No newline at end of file
+    return txn.original_amount or 0
+
+
+def apply_transaction_filters(
+    query,
+    account_id: Optional[int] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    status: Optional[str] = None,
+    institution: Optional[str] = None,
+    search: Optional[str] = None,
+    category: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    untagged_only: bool = False,
+):
+    """
+    Apply the transaction list filters to a query or select.
+
+    Args:
+        query: ORM Query or Select over Transaction, joined to Account
+        account_id: Filter by account ID
+        from_date: Start date
+        to_date: End date
+        status: Transaction status ('pending', 'completed')
+        institution: Filter by institution
+        search: Search description (case-insensitive substring)
+        category: Filter by effective category
+        tags: Filter by tags (AND logic - must have all specified tags)
+        untagged_only: If True, only transactions without any tags
+
+    Returns:
+        The filtered query
+    """
+    if account_id:
+        query = query.filter(Transaction.account_id == account_id)
+
+    if from_date:
+        query = query.filter(Transaction.transaction_date >= from_date)
+
+    if to_date:
+        query = query.filter(Transaction.transaction_date <= to_date)
+
+    if status:
+        query = query.filter(Transaction.status == status)
+
+    if institution:
+        query = query.filter(Account.institution == institution)
+
+    if search:
+        query = query.filter(Transaction.description.ilike(f"%{search}%"))
+
+    if category:
+        query = query.filter(effective_category_expr() == category)
+
+    # Tag filtering
+    if untagged_only:
+        # Transactions that have no tags
+        tagged_ids = select(TransactionTag.transaction_id).distinct()
+        query = query.filter(~Transaction.id.in_(tagged_ids))
+    elif tags:
+        # Must have all specified tags
+        for tag_name in tags:
+            tag_subquery = (
+                select(TransactionTag.transaction_id)
+                .join(Tag)
+                .where(func.lower(Tag.name) == func.lower(tag_name))
+            )
+            query = query.filter(Transaction.id.in_(tag_subquery))
+
+    return query
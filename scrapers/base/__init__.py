@@ -6,6 +6,7 @@ Modular architecture:
 - EmailMFARetriever: Email-based MFA code retrieval
 - MFAHandler: MFA code entry into web forms
 - SeleniumDriver: WebDriver lifecycle management
+- DriverPool: Warm browsers shared across scrapers
 - WebActions: Common web interaction utilities
 """
 
@@ -38,6 +39,11 @@ from .selenium_driver import (
     DriverConfig,
 )
 
+from .driver_pool import (
+    DriverPool,
+    driver_pool,
+)
+
 from .web_actions import (
     WebActions,
     WebActionError,
@@ -69,6 +75,8 @@ __all__ = [
     "MFAEntryError",
     "SeleniumDriver",
     "DriverConfig",
+    "DriverPool",
+    "driver_pool",
     "WebActions",
     "WebActionError",
     "ElementNotFoundError",
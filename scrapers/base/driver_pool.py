@@ -0,0 +1,296 @@
+"""
+Warm Chrome driver pool shared across scrapers
+
+Starting Chrome + chromedriver costs seconds per scraper (more in Docker).
+While a pool is active, SeleniumDriver.setup() checks out an already-running
+browser instead of launching one, and SeleniumDriver.cleanup() hands it back
+after wiping cookies, storage, cache and tabs so the next institution starts
+from a clean context.
+
+Usage:
+    with driver_pool(max_idle=2, max_uses=10) as pool:
+        pool.warm_in_background(DriverConfig.lightweight(headless=True), count=2)
+        run_scrapers()  # SeleniumDriver picks up pooled browsers automatically
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Generator, List, Optional, Set
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .selenium_driver import DriverConfig, apply_tab_settings, launch_chrome
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IDLE = 2
+DEFAULT_MAX_USES = 10
+DEFAULT_SCRIPT_TIMEOUT = 30  # Selenium's default, restored between users
+
+
+@dataclass
+class PooledDriver:
+    """A running browser plus pool bookkeeping."""
+    driver: WebDriver
+    signature: tuple
+    config: DriverConfig
+    uses: int = 0
+
+
+class DriverPool:
+    """
+    Pool of running Chrome browsers keyed by launch options.
+
+    Browsers are only shared between configs with the same launch signature
+    (headless, Chrome arguments, page load strategy, ...) since those cannot
+    change after startup. Each checkout gets a health check; each return resets the
+    browser context, and browsers are retired after max_uses checkouts.
+    """
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE, max_uses: int = DEFAULT_MAX_USES):
+        """
+        Args:
+            max_idle: Maximum idle browsers kept running (extra ones are quit)
+            max_uses: Checkouts per browser before it is replaced
+        """
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self._idle: Dict[tuple, List[PooledDriver]] = {}
+        self._in_use: Dict[int, PooledDriver] = {}
+        self._warming: Set[threading.Thread] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.launched = 0
+        self.reused = 0
+
+    def acquire(self, config: DriverConfig) -> WebDriver:
+        """
+        Check out a healthy browser for config, launching one if none is idle.
+
+        Args:
+            config: Driver configuration
+
+        Returns:
+            WebDriver ready for a new session
+        """
+        signature = config.launch_signature()
+
+        while True:
+            with self._lock:
+                candidates = self._idle.get(signature, [])
+                pooled = candidates.pop() if candidates else None
+
+            if pooled is None:
+                pooled = PooledDriver(driver=launch_chrome(config), signature=signature, config=config)
+                with self._lock:
+                    self.launched += 1
+                break
+
+            if self._is_healthy(pooled.driver):
+                try:
+                    # User agent and URL blocking are per checkout (configs sharing a browser may differ)
+                    apply_tab_settings(pooled.driver, config)
+                    with self._lock:
+                        self.reused += 1
+                    break
+                except Exception as e:
+                    logger.debug(f"Failed to apply tab settings to pooled browser: {e}")
+
+            logger.info("Discarding unresponsive pooled browser")
+            self._quit(pooled)
+
+        pooled.uses += 1
+        pooled.driver.implicitly_wait(config.implicit_wait)
+        pooled.driver.set_script_timeout(DEFAULT_SCRIPT_TIMEOUT)
+        with self._lock:
+            self._in_use[id(pooled.driver)] = pooled
+        logger.debug(f"Checked out pooled browser (use {pooled.uses}/{self.max_uses})")
+        return pooled.driver
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Return a browser to the pool, resetting its context.
+
+        Browsers that reached max_uses, fail to reset, or exceed max_idle are quit.
+
+        Args:
+            driver: WebDriver previously returned by acquire()
+        """
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+
+        if pooled is None:
+            # Not ours (e.g. pool closed and recreated) - just quit it
+            self._quit_driver(driver)
+            return
+
+        if self._closed or pooled.uses >= self.max_uses:
+            logger.debug("Retiring pooled browser")
+            self._quit(pooled)
+            return
+
+        try:
+            self._reset_context(pooled)
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled browser, discarding it: {e}")
+            self._quit(pooled)
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(pooled.signature, [])
+            if sum(len(v) for v in self._idle.values()) < self.max_idle:
+                idle.append(pooled)
+                return
+
+        self._quit(pooled)
+
+    def warm(self, config: DriverConfig, count: int = 1) -> None:
+        """
+        Pre-launch browsers for config (blocking).
+
+        Args:
+            config: Driver configuration the browsers will be used with
+            count: Number of browsers to launch (capped by max_idle)
+        """
+        signature = config.launch_signature()
+        for _ in range(count):
+            with self._lock:
+                if self._closed or sum(len(v) for v in self._idle.values()) >= self.max_idle:
+                    return
+            try:
+                pooled = PooledDriver(driver=launch_chrome(config), signature=signature, config=config)
+            except Exception as e:
+                logger.warning(f"Failed to pre-launch browser: {e}")
+                return
+            with self._lock:
+                self.launched += 1
+                if not self._closed:
+                    self._idle.setdefault(signature, []).append(pooled)
+                    continue
+            self._quit(pooled)
+            return
+
+    def warm_in_background(self, config: DriverConfig, count: int = 1) -> threading.Thread:
+        """
+        Pre-launch browsers on a background thread so startup overlaps other work.
+
+        Args:
+            config: Driver configuration the browsers will be used with
+            count: Number of browsers to launch
+
+        Returns:
+            The started thread
+        """
+        thread = threading.Thread(target=self.warm, args=(config, count), name="driver-pool-warm", daemon=True)
+        with self._lock:
+            self._warming.add(thread)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        """Quit all idle browsers. Browsers still in use are quit when released."""
+        with self._lock:
+            self._closed = True
+            warming = list(self._warming)
+
+        for thread in warming:
+            thread.join()
+
+        with self._lock:
+            idle = [pooled for drivers in self._idle.values() for pooled in drivers]
+            self._idle.clear()
+
+        for pooled in idle:
+            self._quit(pooled)
+        logger.info(f"Driver pool closed ({self.launched} launched, {self.reused} reused)")
+
+    def _is_healthy(self, driver: WebDriver) -> bool:
+        """Check the browser still responds to commands."""
+        try:
+            _ = driver.current_url
+            return bool(driver.window_handles)
+        except Exception:
+            return False
+
+    def _reset_context(self, pooled: PooledDriver) -> None:
+        """
+        Wipe everything the previous user left behind.
+
+        Clears cookies, cache and origin storage via CDP, then swaps to a
+        fresh tab (drops sessionStorage and history) and drains performance
+        logs so token-sniffing scrapers never see stale requests.
+        """
+        driver = pooled.driver
+
+        origins = set()
+        for cookie in driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', []):
+            domain = cookie.get('domain', '').lstrip('.')
+            if domain:
+                origins.add(f"https://{domain}")
+        for handle in driver.window_handles:
+            driver.switch_to.window(handle)
+            url = driver.current_url
+            if url.startswith('http'):
+                origins.add('/'.join(url.split('/')[:3]))
+
+        for origin in origins:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+
+        old_handles = driver.window_handles
+        driver.switch_to.new_window('tab')
+        fresh_handle = driver.current_window_handle
+        for handle in old_handles:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh_handle)
+
+        if pooled.config.enable_performance_logging:
+            driver.get_log('performance')
+
+    def _quit(self, pooled: PooledDriver) -> None:
+        self._quit_driver(pooled.driver)
+
+    @staticmethod
+    def _quit_driver(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting pooled browser: {e}")
+
+
+_active_pool: Optional[DriverPool] = None
+
+
+def get_active_pool() -> Optional[DriverPool]:
+    """Get the pool SeleniumDriver should use, if one is active."""
+    return _active_pool
+
+
+@contextmanager
+def driver_pool(
+    max_idle: int = DEFAULT_MAX_IDLE,
+    max_uses: int = DEFAULT_MAX_USES
+) -> Generator[DriverPool, None, None]:
+    """
+    Activate a driver pool for the duration of the block.
+
+    Args:
+        max_idle: Maximum idle browsers kept running
+        max_uses: Checkouts per browser before it is replaced
+
+    Yields:
+        The active DriverPool
+    """
+    global _active_pool
+    previous = _active_pool
+    pool = DriverPool(max_idle=max_idle, max_uses=max_uses)
+    _active_pool = pool
+    try:
+        yield pool
+    finally:
+        _active_pool = previous
+        pool.close()
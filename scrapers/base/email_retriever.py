@@ -5,14 +5,16 @@ Separated from Selenium to allow independent testing and reuse
 
 import imaplib
 import email
-import re
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional, Sequence
 from dataclasses import dataclass
 import logging
 
+from .imap_mailbox import ImapMailbox, get_shared_mailbox
+from .mfa_router import get_mfa_router
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +25,7 @@ class EmailConfig:
     password: str
     imap_server: str = "imap.gmail.com"
     imap_port: int = 993
+    use_ssl: bool = True
 
 
 @dataclass
@@ -50,12 +53,32 @@ class EmailMFARetriever(ABC):
 
     Handles IMAP connection, email searching, and code extraction.
     Subclasses only need to implement institution-specific extraction logic.
+
+    Waits are push-based and shared: one MFA router per mailbox sits in IMAP
+    IDLE, looks only at new UIDs (headers first, body text only for matching
+    senders) and hands each code to exactly one waiting login (see
+    mfa_router.MFACodeRouter). The connection is shared per mailbox (see
+    imap_mailbox.get_shared_mailbox).
     """
 
+    # Most recent messages inspected when catching up on existing mail
+    MAX_MESSAGES_CHECKED = 5
+    # Allowed difference between mail server Date headers and local clock
+    CLOCK_SKEW = timedelta(seconds=60)
+
     def __init__(self, email_config: EmailConfig, mfa_config: MFAConfig):
         self.email_config = email_config
         self.mfa_config = mfa_config
-        self.connection: Optional[imaplib.IMAP4_SSL] = None
+
+    @property
+    def mailbox(self) -> ImapMailbox:
+        """Process-wide mailbox connection for this email account"""
+        return get_shared_mailbox(self.email_config)
+
+    @property
+    def connection(self) -> Optional[imaplib.IMAP4]:
+        """Underlying IMAP connection (None until connected)"""
+        return self.mailbox.connection
 
     def __enter__(self):
         """Context manager entry"""
@@ -68,7 +91,7 @@ class EmailMFARetriever(ABC):
 
     def connect(self) -> bool:
         """
-        Connect to email server
+        Connect to email server (reuses the shared connection when alive)
 
         Returns:
             True if connection successful
@@ -76,20 +99,10 @@ class EmailMFARetriever(ABC):
         Raises:
             EmailRetrievalError: If connection fails
         """
+        mailbox = self.mailbox
         try:
-            logger.info(f"Connecting to {self.email_config.imap_server}:{self.email_config.imap_port}")
-
-            self.connection = imaplib.IMAP4_SSL(
-                self.email_config.imap_server,
-                self.email_config.imap_port
-            )
-            self.connection.login(
-                self.email_config.email_address,
-                self.email_config.password
-            )
-            self.connection.select('inbox')
-
-            logger.info("Email connection established")
+            with mailbox.lock:
+                mailbox.ensure_connected()
             return True
 
         except Exception as e:
@@ -97,17 +110,13 @@ class EmailMFARetriever(ABC):
             raise EmailRetrievalError(f"Email connection failed: {e}") from e
 
     def disconnect(self):
-        """Disconnect from email server (safe to call multiple times)"""
-        if self.connection:
-            try:
-                logger.debug("Closing email connection")
-                self.connection.close()
-                self.connection.logout()
-                logger.info("Email connection closed")
-            except Exception as e:
-                logger.warning(f"Error during email disconnect: {e}")
-            finally:
-                self.connection = None
+        """
+        Release the mailbox (safe to call multiple times)
+
+        The shared connection stays open for other accounts using the same
+        mailbox; it is logged out at process exit (close_shared_mailboxes).
+        """
+        logger.debug("Releasing shared email connection")
 
     def get_recent_mfa_code(self, since_time: Optional[datetime] = None) -> Optional[str]:
         """
@@ -119,82 +128,102 @@ class EmailMFARetriever(ABC):
         Returns:
             MFA code if found, None otherwise
         """
-        if not self.connection:
-            self.connect()
-
+        mailbox = self.mailbox
         try:
-            # Build search criteria
-            search_criteria = f'FROM "{self.mfa_config.sender_email}"'
-            if since_time:
-                date_str = since_time.strftime("%d-%b-%Y")
-                search_criteria += f' SINCE "{date_str}"'
+            with mailbox.lock:
+                mailbox.ensure_connected()
+                since_date = (since_time or datetime.now()).date()
+                uids = mailbox.search_from(self.mfa_config.sender_email, since_date)
+                if not uids:
+                    logger.warning(f"No emails found from {self.mfa_config.sender_email}")
+                    logger.info("TIP: Check if the sender email address is correct in your MFA config")
+                    return None
+                return self._find_code(mailbox, uids, since_time)
 
-            logger.debug(f"Searching emails: {search_criteria}")
-            status, messages = self.connection.search(None, search_criteria)
-
-            if status != 'OK' or not messages[0]:
-                logger.warning(f"No emails found from {self.mfa_config.sender_email}")
-                logger.info("TIP: Check if the sender email address is correct in your MFA config")
-                return None
+        except Exception as e:
+            logger.error(f"Error retrieving MFA code: {e}")
+            return None
 
-            message_ids = messages[0].split()
-            if not message_ids:
-                logger.warning("No message IDs found")
-                return None
+    def _find_code(
+        self,
+        mailbox: ImapMailbox,
+        uids: List[int],
+        since_time: Optional[datetime]
+    ) -> Optional[str]:
+        """
+        Check messages (newest first) for an MFA code
 
-            logger.info(f"Found {len(message_ids)} emails from {self.mfa_config.sender_email}, checking {min(5, len(message_ids))} most recent")
+        Only headers are fetched for filtering; body text is fetched just for
+        messages from the MFA sender that are recent enough. A message whose
+        code was returned is never used again (e.g. by the next account).
 
-            # Check last 5 messages (newest first)
-            for msg_id in reversed(message_ids[-5:]):
-                status, msg_data = self.connection.fetch(msg_id, '(RFC822)')
+        Args:
+            mailbox: Connected mailbox (lock held by caller)
+            uids: Candidate message UIDs
+            since_time: Ignore emails older than this
 
-                if status != 'OK':
-                    continue
+        Returns:
+            MFA code if found, None otherwise
+        """
+        if not uids:
+            return None
 
-                email_message = email.message_from_bytes(msg_data[0][1])
+        uids = [uid for uid in uids if uid not in mailbox.consumed_uids]
+        headers = mailbox.fetch_headers(uids[-self.MAX_MESSAGES_CHECKED:])
+        sender = self.mfa_config.sender_email.lower()
 
-                # Check if email is recent enough
-                if since_time and self._is_email_too_old(email_message, since_time):
-                    logger.debug(f"Email from {email_message['Date']} is too old")
-                    continue
+        for uid in sorted(headers, reverse=True):
+            message_headers = headers[uid]
+            if sender not in (message_headers['From'] or '').lower():
+                continue
 
-                logger.debug(f"Processing email: {email_message['Subject']}")
+            if since_time and self._is_email_too_old(message_headers, since_time):
+                logger.debug(f"Email from {message_headers['Date']} is too old")
+                continue
 
-                # Extract MFA code (institution-specific)
-                mfa_code = self.extract_mfa_code(email_message)
-                if mfa_code:
-                    logger.info(f"✓ MFA code extracted: {mfa_code}")
-                    return mfa_code
-                else:
-                    logger.warning(f"✗ No MFA code found in this email")
+            logger.debug(f"Processing email: {message_headers['Subject']}")
+            email_message = mailbox.fetch_message(uid, message_headers)
+            if email_message is None:
+                continue
 
-            logger.warning("No valid MFA codes found in recent emails")
-            logger.info(f"Checked {min(5, len(message_ids))} emails from {self.mfa_config.sender_email}")
-            return None
+            # Extract MFA code (institution-specific)
+            mfa_code = self.extract_mfa_code(email_message)
+            if mfa_code:
+                logger.info(f"✓ MFA code extracted: {mfa_code}")
+                mailbox.consumed_uids.add(uid)
+                return mfa_code
+            logger.warning(f"✗ No MFA code found in this email")
 
-        except Exception as e:
-            logger.error(f"Error retrieving MFA code: {e}")
-            return None
+        return None
 
     def _is_email_too_old(self, email_message, since_time: datetime) -> bool:
-        """Check if email is older than specified time"""
+        """Check if email is older than specified time (naive times are local)"""
         try:
-            email_date = email.utils.parsedate_to_datetime(email_message['Date'])
-            return email_date < since_time
-        except:
+            email_date = email.utils.parsedate_to_datetime(email_message['Date']).astimezone()
+            return email_date < since_time.astimezone() - self.CLOCK_SKEW
+        except (TypeError, ValueError):
             return False
 
     def wait_for_mfa_code(
         self,
         since_time: Optional[datetime] = None,
-        initial_delay: Optional[int] = None
+        initial_delay: Optional[int] = None,
+        recipient: Optional[str] = None,
+        id_hints: Sequence[str] = ()
     ) -> Optional[str]:
         """
         Wait for MFA code to arrive in email
 
+        The wait goes through the mailbox's MFA router, so concurrent logins
+        sharing the mailbox each get their own code. Mail that already arrived
+        since since_time is checked first, then new mail is watched via IMAP
+        IDLE (or polling when the server lacks IDLE).
+
         Args:
-            since_time: Only look at emails after this time
-            initial_delay: Delay before starting to check (defaults to config)
+            since_time: When the code was requested; older emails are ignored
+            initial_delay: Unused, kept for compatibility (new UIDs are cheap to poll)
+            recipient: Optional address the code was sent to (disambiguates logins)
+            id_hints: Optional strings identifying the account in the email body
 
         Returns:
             MFA code if found within max_wait_time, None otherwise
@@ -202,33 +231,18 @@ class EmailMFARetriever(ABC):
         if not since_time:
             since_time = datetime.now() - timedelta(minutes=2)
 
-        # Initial delay to allow email to be sent
-        delay = initial_delay if initial_delay is not None else self.mfa_config.email_delay
-        if delay > 0:
-            logger.info(f"Waiting {delay}s before checking for MFA email")
-            time.sleep(delay)
-
-        logger.info(f"Waiting for MFA code (max {self.mfa_config.max_wait_time}s)")
+        max_wait = self.mfa_config.max_wait_time
+        logger.info(f"Waiting for MFA code from {self.mfa_config.sender_email} (max {max_wait}s)")
         start_time = time.time()
-        attempt = 1
-
-        while time.time() - start_time < self.mfa_config.max_wait_time:
-            logger.debug(f"Check attempt {attempt}")
-
-            mfa_code = self.get_recent_mfa_code(since_time)
-            if mfa_code:
-                elapsed = time.time() - start_time
-                logger.info(f"MFA code found after {elapsed:.1f}s")
-                return mfa_code
-
-            elapsed = time.time() - start_time
-            remaining = self.mfa_config.max_wait_time - elapsed
-            logger.debug(f"No code yet. Elapsed: {elapsed:.1f}s, Remaining: {remaining:.1f}s")
 
-            time.sleep(self.mfa_config.check_interval)
-            attempt += 1
+        mfa_code = get_mfa_router(self.email_config).wait_for_code(
+            self, since_time, max_wait, recipient=recipient, id_hints=id_hints
+        )
+        if mfa_code:
+            logger.info(f"MFA code found after {time.time() - start_time:.1f}s")
+            return mfa_code
 
-        logger.error(f"Timeout waiting for MFA code after {self.mfa_config.max_wait_time}s")
+        logger.error(f"Timeout waiting for MFA code after {max_wait}s")
         return None
 
     def wait_for_mfa_code_with_delay(self, since_time: Optional[datetime] = None) -> Optional[str]:
@@ -236,7 +250,7 @@ class EmailMFARetriever(ABC):
         Wait for MFA code with initial delay (backward compatibility wrapper)
 
         This method exists for backward compatibility with old SeleniumMFAAutomatorBase.
-        It's just a wrapper around wait_for_mfa_code() with email_delay.
+        It's just a wrapper around wait_for_mfa_code().
 
         Args:
             since_time: Only look at emails after this time
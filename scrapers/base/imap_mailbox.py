@@ -0,0 +1,310 @@
+"""
+Shared IMAP mailbox connection with IDLE support
+
+Keeps one authenticated connection per mailbox for the whole process so
+several pension logins reuse it, tracks UIDNEXT so each check only looks at
+new messages, and fetches just the headers and body text (BODY.PEEK, which
+also leaves messages unread).
+"""
+
+import atexit
+import email
+import imaplib
+import logging
+import re
+import select
+import socket
+import threading
+import time
+from datetime import date
+from email.message import Message
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .email_retriever import EmailConfig
+
+logger = logging.getLogger(__name__)
+
+UID_PATTERN = re.compile(rb'UID (\d+)')
+UIDNEXT_PATTERN = re.compile(rb'UIDNEXT (\d+)')
+EXISTS_PATTERN = re.compile(rb'^\* \d+ EXISTS')
+
+
+class ImapMailbox:
+    """
+    One authenticated IMAP connection to a single mailbox
+
+    All protocol calls must hold self.lock (IMAP connections are not
+    thread-safe). Use get_shared_mailbox() rather than creating instances
+    directly so connections are shared.
+    """
+
+    # Headers needed to filter messages and to parse the MIME body
+    HEADER_FIELDS = (
+        'FROM', 'TO', 'CC', 'DELIVERED-TO', 'DATE', 'SUBJECT', 'MESSAGE-ID',
+        'MIME-VERSION', 'CONTENT-TYPE', 'CONTENT-TRANSFER-ENCODING',
+    )
+    # Cap on body bytes fetched per message (MFA mails are small; skips big attachments)
+    MAX_BODY_BYTES = 256 * 1024
+
+    def __init__(self, email_config: 'EmailConfig', mailbox: str = 'INBOX'):
+        self.email_config = email_config
+        self.mailbox = mailbox
+        self.connection: Optional[imaplib.IMAP4] = None
+        self.uid_next: Optional[int] = None
+        # Messages whose MFA code was already handed out (never reused)
+        self.consumed_uids: Set[int] = set()
+        self.lock = threading.RLock()
+        # Lets other threads interrupt idle()/pause() without touching the connection
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+
+    @property
+    def supports_idle(self) -> bool:
+        """Whether the server advertises IMAP IDLE (RFC 2177)"""
+        return bool(self.connection) and 'IDLE' in self.connection.capabilities
+
+    def connect(self) -> None:
+        """Open, authenticate and select the mailbox"""
+        config = self.email_config
+        logger.info(f"Connecting to {config.imap_server}:{config.imap_port}")
+        imap_class = imaplib.IMAP4_SSL if config.use_ssl else imaplib.IMAP4
+        self.connection = imap_class(config.imap_server, config.imap_port)
+        self.connection.login(config.email_address, config.password)
+        self.connection.select(self.mailbox)
+        self.uid_next = None
+        logger.info("Email connection established")
+
+    def ensure_connected(self) -> None:
+        """Connect, or reconnect if the server dropped an idle connection"""
+        if self.connection:
+            try:
+                self.connection.noop()
+                return
+            except (imaplib.IMAP4.error, OSError) as e:
+                logger.info(f"Reconnecting to mailbox: {e}")
+                self.close()
+        self.connect()
+
+    def close(self) -> None:
+        """Log out (safe to call multiple times)"""
+        if not self.connection:
+            return
+        try:
+            self.connection.close()
+            self.connection.logout()
+            logger.info("Email connection closed")
+        except Exception as e:
+            logger.warning(f"Error during email disconnect: {e}")
+        finally:
+            self.connection = None
+            self.uid_next = None
+
+    def refresh_uid_next(self) -> int:
+        """
+        Read the mailbox UIDNEXT; later new_uids() calls return only UIDs from here on
+
+        Returns:
+            Current UIDNEXT
+        """
+        status, data = self.connection.status(self.mailbox, '(UIDNEXT)')
+        match = UIDNEXT_PATTERN.search(data[0] or b'') if status == 'OK' else None
+        if match:
+            self.uid_next = int(match.group(1))
+        else:
+            # Server without STATUS UIDNEXT: fall back to the highest existing UID
+            uids = self._uid_search('ALL')
+            self.uid_next = (max(uids) + 1) if uids else 1
+        return self.uid_next
+
+    def new_uids(self) -> List[int]:
+        """
+        Get UIDs that arrived since the last check and advance the watermark
+
+        Returns:
+            New message UIDs (ascending)
+        """
+        if self.uid_next is None:
+            self.refresh_uid_next()
+            return []
+
+        # "n:*" always matches the last message, even if its UID is below n
+        uids = [uid for uid in self._uid_search(f'UID {self.uid_next}:*') if uid >= self.uid_next]
+        if uids:
+            self.uid_next = max(uids) + 1
+        return uids
+
+    def search_from(self, sender: str, since: date) -> List[int]:
+        """
+        Find messages from a sender on or after a date (server-side search)
+
+        Args:
+            sender: Sender address (substring match, as IMAP FROM)
+            since: Earliest date (IMAP SINCE has day granularity)
+
+        Returns:
+            Matching UIDs (ascending)
+        """
+        return self._uid_search(f'FROM "{sender}"', f'SINCE {since.strftime("%d-%b-%Y")}')
+
+    def fetch_headers(self, uids: List[int]) -> Dict[int, Message]:
+        """
+        Fetch only the headers needed for filtering and MIME parsing
+
+        Args:
+            uids: Message UIDs
+
+        Returns:
+            Dict of UID -> header-only Message
+        """
+        if not uids:
+            return {}
+        item = f'(BODY.PEEK[HEADER.FIELDS ({" ".join(self.HEADER_FIELDS)})])'
+        raw = self._uid_fetch(uids, item)
+        return {uid: email.message_from_bytes(data) for uid, data in raw.items()}
+
+    def fetch_message(self, uid: int, headers: Message) -> Optional[Message]:
+        """
+        Fetch a message's body text and combine it with already-fetched headers
+
+        Args:
+            uid: Message UID
+            headers: Header-only message from fetch_headers()
+
+        Returns:
+            Parsed message (headers + body) or None if the fetch failed
+        """
+        raw = self._uid_fetch([uid], f'(BODY.PEEK[TEXT]<0.{self.MAX_BODY_BYTES}>)')
+        if uid not in raw:
+            return None
+        return email.message_from_bytes(headers.as_bytes() + raw[uid])
+
+    def idle(self, timeout: float) -> bool:
+        """
+        Block in IMAP IDLE until the server reports new mail or timeout
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if new messages were announced, False on timeout or wake()
+        """
+        conn = self.connection
+        tag = conn._new_tag()
+        conn.send(tag + b' IDLE\r\n')
+        response = conn.readline()
+        if not response.startswith(b'+'):
+            raise conn.error(f"IDLE rejected: {response!r}")
+
+        new_mail = False
+        sock = conn.socket()
+        deadline = time.monotonic() + timeout
+        while not new_mail:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            pending = getattr(sock, 'pending', lambda: 0)()
+            if not pending:
+                readable = select.select([sock, self._wake_reader], [], [], remaining)[0]
+                if self._wake_reader in readable:
+                    self._drain_wake()
+                    break
+                if not readable:
+                    break
+            line = conn.readline()
+            if not line:
+                raise conn.abort("socket error: EOF during IDLE")
+            new_mail = bool(EXISTS_PATTERN.match(line))
+
+        conn.send(b'DONE\r\n')
+        while True:
+            line = conn.readline()
+            if not line:
+                raise conn.abort("socket error: EOF ending IDLE")
+            if line.startswith(tag):
+                break
+            new_mail = new_mail or bool(EXISTS_PATTERN.match(line))
+        return new_mail
+
+    def pause(self, timeout: float) -> None:
+        """Sleep up to timeout seconds, returning early on wake() (polling fallback)"""
+        if select.select([self._wake_reader], [], [], timeout)[0]:
+            self._drain_wake()
+
+    def wake(self) -> None:
+        """Interrupt a running idle() or pause() (safe from any thread, lock not needed)"""
+        try:
+            self._wake_writer.send(b'\0')
+        except BlockingIOError:
+            pass  # Already signalled
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_reader.recv(64):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _uid_search(self, *criteria: str) -> List[int]:
+        status, data = self.connection.uid('SEARCH', None, *criteria)
+        if status != 'OK' or not data or not data[0]:
+            return []
+        return sorted(int(uid) for uid in data[0].split())
+
+    def _uid_fetch(self, uids: List[int], item: str) -> Dict[int, bytes]:
+        """Run UID FETCH for a single data item and map UID -> literal"""
+        status, data = self.connection.uid('FETCH', ','.join(str(uid) for uid in uids), item)
+        if status != 'OK':
+            return {}
+
+        results: Dict[int, bytes] = {}
+        pending: Optional[bytes] = None
+        for part in data:
+            if isinstance(part, tuple):
+                prefix, literal = part
+                match = UID_PATTERN.search(prefix)
+                if match:
+                    results[int(match.group(1))] = literal
+                    pending = None
+                else:
+                    pending = literal  # UID may follow the literal
+            elif isinstance(part, bytes) and pending is not None:
+                match = UID_PATTERN.search(part)
+                if match:
+                    results[int(match.group(1))] = pending
+                pending = None
+        return results
+
+
+_mailboxes: Dict[Tuple[str, int, str, str], ImapMailbox] = {}
+_mailboxes_lock = threading.Lock()
+
+
+def get_shared_mailbox(email_config: 'EmailConfig', mailbox: str = 'INBOX') -> ImapMailbox:
+    """
+    Get the process-wide mailbox for an account (connects lazily)
+
+    Args:
+        email_config: Email account configuration
+        mailbox: Mailbox name
+
+    Returns:
+        Shared ImapMailbox
+    """
+    key = (email_config.imap_server, email_config.imap_port, email_config.email_address.lower(), mailbox)
+    with _mailboxes_lock:
+        if key not in _mailboxes:
+            _mailboxes[key] = ImapMailbox(email_config, mailbox)
+        return _mailboxes[key]
+
+
+@atexit.register
+def close_shared_mailboxes() -> None:
+    """Log out of all shared mailboxes"""
+    with _mailboxes_lock:
+        mailboxes = list(_mailboxes.values())
+        _mailboxes.clear()
+    for mailbox in mailboxes:
+        with mailbox.lock:
+            mailbox.close()
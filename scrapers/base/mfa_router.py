@@ -0,0 +1,303 @@
+"""
+MFA code router for concurrent logins sharing one mailbox
+
+One watcher thread per mailbox sits in IMAP IDLE (or polls) while any login
+is waiting for a code. Each new message is matched to the waiting logins by
+sender, request time and optional recipient / ID hints, and its code goes to
+exactly one of them - parallel logins never take each other's codes, and the
+mailbox is watched once instead of once per login.
+"""
+
+import email.utils
+import imaplib
+import itertools
+import logging
+import re
+import threading
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.message import Message
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from .imap_mailbox import ImapMailbox, get_shared_mailbox
+
+if TYPE_CHECKING:
+    from .email_retriever import EmailConfig, EmailMFARetriever
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class MFAWaiter:
+    """A login waiting for its MFA code"""
+    retriever: 'EmailMFARetriever'
+    since_time: datetime  # When the code was requested (timezone-aware)
+    recipient: Optional[str] = None  # Address the site sent the code to
+    id_hints: Sequence[str] = ()  # Strings identifying the account in the mail (e.g. ID digits)
+    order: int = 0
+    code: Optional[str] = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def sender(self) -> str:
+        return self.retriever.mfa_config.sender_email.lower()
+
+    def accepts(self, headers: Message, sent_at: Optional[datetime]) -> bool:
+        """Whether a message could carry this login's code (sender and send time)"""
+        if self.sender not in (headers['From'] or '').lower():
+            return False
+        return sent_at is None or sent_at >= self.since_time - self.retriever.CLOCK_SKEW
+
+    def hint_score(self, headers: Message, text: str) -> int:
+        """Number of hints (recipient, account ID) the message matches"""
+        score = 0
+        if self.recipient:
+            recipients = ' '.join(
+                str(value) for name in ('To', 'Cc', 'Delivered-To') for value in headers.get_all(name, [])
+            )
+            score += self.recipient.lower() in recipients.lower()
+        # Digit boundaries so a short ID hint never matches inside another code
+        if any(re.search(rf'(?<!\d){re.escape(hint)}(?!\d)', text) for hint in self.id_hints if hint):
+            score += 1
+        return score
+
+
+class MFACodeRouter:
+    """
+    Hands each incoming MFA code to exactly one waiting login
+
+    Assignment rules, per message (oldest first):
+    - Only logins whose sender matches and whose request time is not after
+      the message date (allowing clock skew) are candidates.
+    - The candidate matching the most hints wins; ties go to the earliest
+      request (sites send codes in request order).
+    - When there are more candidate messages from a sender than logins
+      waiting on it, only the newest are used (older ones are stale or
+      superseded by a resend).
+
+    Use get_mfa_router() so all retrievers for a mailbox share one router.
+    """
+
+    # Max seconds per IDLE round before re-checking (keeps the connection fresh)
+    IDLE_TIMEOUT = 30
+
+    def __init__(self, mailbox: ImapMailbox):
+        self.mailbox = mailbox
+        self._waiters: List[MFAWaiter] = []
+        self._catch_up: List[MFAWaiter] = []
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._order = itertools.count()
+
+    def wait_for_code(
+        self,
+        retriever: 'EmailMFARetriever',
+        since_time: datetime,
+        timeout: float,
+        recipient: Optional[str] = None,
+        id_hints: Sequence[str] = ()
+    ) -> Optional[str]:
+        """
+        Block until a code is routed to this login or timeout
+
+        Args:
+            retriever: Institution retriever (sender config and code extraction)
+            since_time: When the code was requested (naive times are local)
+            timeout: Maximum seconds to wait
+            recipient: Optional address the code was sent to
+            id_hints: Optional strings identifying the account in the mail body
+
+        Returns:
+            MFA code, or None on timeout / mailbox failure
+        """
+        waiter = MFAWaiter(
+            retriever=retriever,
+            since_time=since_time.astimezone(),
+            recipient=recipient,
+            id_hints=tuple(id_hints),
+            order=next(self._order)
+        )
+        with self._lock:
+            self._waiters.append(waiter)
+            self._catch_up.append(waiter)
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch, name='mfa-router', daemon=True)
+                self._watcher.start()
+        # Interrupt a running IDLE so the new login's catch-up search runs now
+        self.mailbox.wake()
+
+        waiter.done.wait(timeout)
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if waiter in self._catch_up:
+                self._catch_up.remove(waiter)
+        # Let the watcher stop if nobody else is waiting
+        self.mailbox.wake()
+        return waiter.code
+
+    def _watch(self) -> None:
+        """Watcher thread: check, dispatch and IDLE until no login is waiting"""
+        mailbox = self.mailbox
+        first_round = True
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._watcher = None
+                    return
+                catch_up, self._catch_up = self._catch_up, []
+                poll_interval = min(w.retriever.mfa_config.check_interval for w in self._waiters)
+
+            try:
+                with mailbox.lock:
+                    mailbox.ensure_connected()
+                    if first_round:
+                        # Earlier mail is covered by the catch-up search below
+                        mailbox.refresh_uid_next()
+                        first_round = False
+                        uids = set()
+                    else:
+                        uids = set(mailbox.new_uids())
+
+                    # A code may have arrived before its login started waiting
+                    for waiter in catch_up:
+                        uids.update(mailbox.search_from(waiter.sender, waiter.since_time.date()))
+                    catch_up = []
+
+                    self._dispatch(sorted(uids))
+                    use_idle = mailbox.supports_idle
+                    if use_idle and self._has_waiters():
+                        mailbox.idle(self.IDLE_TIMEOUT)
+
+                if not use_idle and self._has_waiters():
+                    mailbox.pause(poll_interval)
+
+            except (imaplib.IMAP4.error, OSError) as e:
+                logger.warning(f"Mailbox error while waiting for MFA codes: {e}")
+                with self._lock:
+                    self._catch_up.extend(w for w in catch_up if w in self._waiters)
+                if not self._reconnect():
+                    self._fail_all()
+                    return
+
+            except Exception:
+                logger.exception("MFA code router failed")
+                self._fail_all()
+                return
+
+    def _dispatch(self, uids: List[int]) -> None:
+        """Route codes in the given messages to waiting logins (mailbox lock held)"""
+        mailbox = self.mailbox
+        uids = [uid for uid in uids if uid not in mailbox.consumed_uids]
+        with self._lock:
+            waiters = list(self._waiters)
+        if not uids or not waiters:
+            return
+
+        # Headers first: only messages some login could be waiting for get their body fetched
+        groups: Dict[str, List[Tuple[int, Message, Optional[datetime]]]] = {}
+        for uid, headers in sorted(mailbox.fetch_headers(uids).items()):
+            sent_at = _sent_at(headers)
+            waiter = next((w for w in waiters if w.accepts(headers, sent_at)), None)
+            if waiter:
+                groups.setdefault(waiter.sender, []).append((uid, headers, sent_at))
+
+        limits = Counter(w.sender for w in waiters)
+        candidates = sorted(
+            item for sender, items in groups.items() for item in items[-limits[sender]:]
+        )
+
+        for uid, headers, sent_at in candidates:
+            message = mailbox.fetch_message(uid, headers)
+            if message is None:
+                continue
+            text = _message_text(message)
+
+            with self._lock:
+                best = None
+                for waiter in self._waiters:
+                    if not waiter.accepts(headers, sent_at):
+                        continue
+                    code = waiter.retriever.extract_mfa_code(message)
+                    if not code:
+                        continue
+                    rank = (waiter.hint_score(headers, text), -waiter.since_time.timestamp(), -waiter.order)
+                    if best is None or rank > best[0]:
+                        best = (rank, waiter, code)
+
+                if best:
+                    _, waiter, code = best
+                    waiter.code = code
+                    self._waiters.remove(waiter)
+                    mailbox.consumed_uids.add(uid)
+                    waiter.done.set()
+                    logger.info(f"✓ MFA code from {waiter.sender} routed to login #{waiter.order}")
+
+    def _has_waiters(self) -> bool:
+        with self._lock:
+            return bool(self._waiters)
+
+    def _reconnect(self) -> bool:
+        """Reconnect keeping the UID watermark; False if the server is unreachable"""
+        mailbox = self.mailbox
+        with mailbox.lock:
+            uid_next = mailbox.uid_next
+            mailbox.close()
+            try:
+                mailbox.connect()
+            except (imaplib.IMAP4.error, OSError) as e:
+                logger.error(f"Could not reconnect to mailbox: {e}")
+                return False
+            mailbox.uid_next = uid_next
+            return True
+
+    def _fail_all(self) -> None:
+        """Release every waiting login without a code"""
+        with self._lock:
+            waiters, self._waiters, self._catch_up = self._waiters, [], []
+            self._watcher = None
+        for waiter in waiters:
+            waiter.done.set()
+
+
+def _sent_at(headers: Message) -> Optional[datetime]:
+    """Parse the Date header (None if missing or malformed)"""
+    try:
+        return email.utils.parsedate_to_datetime(headers['Date']).astimezone()
+    except (TypeError, ValueError):
+        return None
+
+
+def _message_text(message: Message) -> str:
+    """Decoded text of all text/* parts (for ID hint matching)"""
+    texts = []
+    for part in message.walk():
+        if part.get_content_maintype() != 'text':
+            continue
+        payload = part.get_payload(decode=True) or b''
+        texts.append(payload.decode(part.get_content_charset() or 'utf-8', errors='replace'))
+    return '\n'.join(texts)
+
+
+_routers: 'weakref.WeakKeyDictionary[ImapMailbox, MFACodeRouter]' = weakref.WeakKeyDictionary()
+_routers_lock = threading.Lock()
+
+
+def get_mfa_router(email_config: 'EmailConfig', mailbox: str = 'INBOX') -> MFACodeRouter:
+    """
+    Get the process-wide MFA router for an email account
+
+    Args:
+        email_config: Email account configuration
+        mailbox: Mailbox name
+
+    Returns:
+        Shared MFACodeRouter (one per shared mailbox)
+    """
+    shared = get_shared_mailbox(email_config, mailbox)
+    with _routers_lock:
+        if shared not in _routers:
+            _routers[shared] = MFACodeRouter(shared)
+        return _routers[shared]
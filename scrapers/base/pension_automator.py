@@ -25,6 +25,7 @@ from scrapers.base.selenium_driver import SeleniumDriver, DriverConfig
 from scrapers.base.web_actions import WebActions
 from scrapers.base.mfa_handler import MFAHandler, MFAEntryError
 from scrapers.base.email_retriever import EmailMFARetriever
+from scrapers.utils.sync_metrics import SyncMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,9 @@ class PensionAutomatorBase(ABC):
         self._web_actions: Optional[WebActions] = None
         self._mfa_handler: Optional[MFAHandler] = None
 
+        # Per-phase timings (browser start and MFA wait are timed here)
+        self.metrics = SyncMetrics()
+
         # Timing configuration (can be overridden by subclasses)
         self.post_login_delay = 5  # Seconds after clicking login
         self.mfa_submission_delay = 5  # Seconds after entering MFA
@@ -79,8 +83,9 @@ class PensionAutomatorBase(ABC):
         """Setup Chrome WebDriver and initialize components"""
         logger.info("Setting up Chrome WebDriver...")
         config = DriverConfig(headless=self.headless)
-        self._selenium_driver = SeleniumDriver(config)
-        driver = self._selenium_driver.setup()
+        with self.metrics.phase("browser"):
+            self._selenium_driver = SeleniumDriver(config)
+            driver = self._selenium_driver.setup()
 
         # Initialize helper components
         self._web_actions = WebActions(driver)
@@ -207,10 +212,11 @@ class PensionAutomatorBase(ABC):
 
             # Wait for MFA code in email
             logger.info("Waiting for MFA code in email...")
-            mfa_code = self.email_retriever.wait_for_mfa_code(
-                since_time=login_time,
-                initial_delay=self.email_retriever.mfa_config.email_delay
-            )
+            with self.metrics.phase("mfa"):
+                mfa_code = self.email_retriever.wait_for_mfa_code(
+                    since_time=login_time,
+                    id_hints=self._mfa_id_hints(id_number)
+                )
 
             if not mfa_code:
                 logger.error("Failed to retrieve MFA code")
@@ -341,10 +347,12 @@ class PensionAutomatorBase(ABC):
 
             # Wait for MFA code in email
             logger.info("Waiting for MFA code in email...")
-            mfa_code = self.email_retriever.wait_for_mfa_code(
-                since_time=login_time,
-                initial_delay=self.email_retriever.mfa_config.email_delay
-            )
+            with self.metrics.phase("mfa"):
+                mfa_code = self.email_retriever.wait_for_mfa_code(
+                    since_time=login_time,
+                    recipient=email_address,
+                    id_hints=self._mfa_id_hints(id_number)
+                )
 
             if not mfa_code:
                 logger.error("Failed to retrieve MFA code")
@@ -388,6 +396,11 @@ class PensionAutomatorBase(ABC):
     # Helper Methods
     # =========================================================================
 
+    @staticmethod
+    def _mfa_id_hints(id_number: str) -> List[str]:
+        """Trailing ID digits, which code emails may show to identify the account"""
+        return [id_number[-4:]] if len(id_number) >= 4 else []
+
     def _wait_for_mfa_prompt(self, otp_selector: str, timeout: int = 15) -> bool:
         """Wait for MFA prompt to appear on the page"""
         try:
@@ -4,12 +4,14 @@ Selenium WebDriver setup and management
 Provides a clean interface for browser automation with:
 - Context manager for guaranteed cleanup
 - Configurable Chrome options
+- Lightweight profile that blocks heavy and third-party resources
+- Optional warm driver pool (see driver_pool.py)
 - Proper logging
 """
 
 import logging
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -18,6 +20,32 @@ from selenium.webdriver.remote.webdriver import WebDriver
 
 logger = logging.getLogger(__name__)
 
+# Resource groups blocked by the lightweight profile (CDP Network.setBlockedURLs patterns).
+# Scrapers opt back in per group via DriverConfig.allowed_resources.
+BLOCKABLE_RESOURCES: Dict[str, List[str]] = {
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.ico', '*.bmp'],
+    'svg': ['*.svg'],
+    'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'media': ['*.mp4', '*.webm', '*.mp3', '*.ogg', '*.wav', '*.m3u8'],
+    'trackers': [
+        '*google-analytics.com*',
+        '*googletagmanager.com*',
+        '*doubleclick.net*',
+        '*googleadservices.com*',
+        '*connect.facebook.net*',
+        '*hotjar.com*',
+        '*clarity.ms*',
+        '*nr-data.net*',
+        '*newrelic.com*',
+        '*analytics.tiktok.com*',
+        '*taboola.com*',
+        '*outbrain.com*',
+    ],
+}
+
+# V8 old-space heap cap for the lightweight profile, in MB
+LIGHTWEIGHT_JS_HEAP_MB = 512
+
 
 @dataclass
 class DriverConfig:
@@ -33,6 +61,73 @@ class DriverConfig:
     enable_performance_logging: bool = False
     # Additional Chrome arguments
     extra_arguments: list = field(default_factory=list)
+    # Block BLOCKABLE_RESOURCES groups (see lightweight())
+    block_resources: bool = False
+    # Resource groups (or single patterns) the scraper still needs when blocking, e.g. ['images', '*.svg']
+    allowed_resources: list = field(default_factory=list)
+    # Extra URL patterns to block (CDP wildcard syntax, e.g. '*chat-widget*')
+    blocked_urls: list = field(default_factory=list)
+    # 'normal' waits for every subresource, 'eager' returns at DOMContentLoaded
+    page_load_strategy: str = "normal"
+    # V8 old-space heap limit in MB (--js-flags=--max-old-space-size; None = Chrome default).
+    # Caps the JavaScript heap of each renderer, not the renderer's total memory.
+    js_heap_mb: Optional[int] = None
+
+    @classmethod
+    def lightweight(cls, **overrides) -> 'DriverConfig':
+        """
+        Profile for sites where only the login form and a token are needed
+
+        Blocks images, fonts, media and trackers, returns from navigation at
+        DOMContentLoaded and caps the V8 heap. Use explicit waits for the
+        elements a flow needs; override any field as keyword arguments.
+
+        Hebrew locale and performance logging are part of the profile so every
+        lightweight scraper shares one launch signature (and pooled browsers).
+        Per-scraper differences belong in per-checkout fields (user_agent,
+        allowed_resources, blocked_urls), not in launch options.
+
+        Returns:
+            DriverConfig with the lightweight defaults applied
+        """
+        settings = {
+            'block_resources': True,
+            'page_load_strategy': 'eager',
+            'js_heap_mb': LIGHTWEIGHT_JS_HEAP_MB,
+            'extra_arguments': ['--lang=he-IL'],
+            'enable_performance_logging': True,
+        }
+        settings.update(overrides)
+        return cls(**settings)
+
+    def blocked_url_patterns(self) -> List[str]:
+        """URL patterns to block via CDP for this config"""
+        patterns = []
+        if self.block_resources:
+            for group, group_patterns in BLOCKABLE_RESOURCES.items():
+                if group not in self.allowed_resources:
+                    patterns.extend(p for p in group_patterns if p not in self.allowed_resources)
+        patterns.extend(self.blocked_urls)
+        return patterns
+
+    def launch_signature(self) -> tuple:
+        """
+        Options fixed at browser startup - pooled browsers are only shared when these match
+
+        User agent and URL blocking are applied per tab on checkout
+        (apply_tab_settings), so they do not split the pool.
+        """
+        return (
+            self.headless,
+            self.window_size,
+            self.disable_gpu,
+            self.no_sandbox,
+            self.disable_dev_shm,
+            self.enable_performance_logging,
+            tuple(self.extra_arguments),
+            self.page_load_strategy,
+            self.js_heap_mb,
+        )
 
 
 class SeleniumDriver:
@@ -64,6 +159,7 @@ class SeleniumDriver:
         """
         self.config = config or DriverConfig()
         self.driver: Optional[WebDriver] = None
+        self._pool = None  # DriverPool the driver was checked out from
 
     def __enter__(self) -> WebDriver:
         """Context manager entry - setup and return driver"""
@@ -77,40 +173,37 @@ class SeleniumDriver:
         """
         Setup and return Chrome WebDriver
 
+        Checks out a warm browser when a driver pool is active, otherwise
+        launches a new one.
+
         Returns:
             Configured WebDriver instance
 
         Raises:
             Exception: If driver setup fails
         """
-        logger.info("Setting up Chrome WebDriver...")
-
-        options = self._build_options()
+        from .driver_pool import get_active_pool
 
-        # Use system chromedriver if CHROMEDRIVER_PATH is set (e.g., in Docker)
-        chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
-        service = Service(executable_path=chromedriver_path) if chromedriver_path else None
-
-        try:
-            logger.debug("Initializing Chrome driver...")
-            if service:
-                logger.debug(f"Using chromedriver at: {chromedriver_path}")
-                self.driver = webdriver.Chrome(service=service, options=options)
-            else:
-                self.driver = webdriver.Chrome(options=options)
-            self.driver.implicitly_wait(self.config.implicit_wait)
-            logger.info("Chrome driver initialized successfully")
+        pool = get_active_pool()
+        if pool:
+            logger.info("Checking out Chrome WebDriver from pool...")
+            self.driver = pool.acquire(self.config)
+            self._pool = pool
             return self.driver
 
-        except Exception as e:
-            logger.error(f"Failed to initialize Chrome driver: {e}", exc_info=True)
-            raise
+        self.driver = launch_chrome(self.config)
+        return self.driver
 
     def cleanup(self):
         """
         Clean up WebDriver resources (safe to call multiple times)
         """
-        if self.driver:
+        if self.driver and self._pool:
+            logger.debug("Returning Chrome driver to pool...")
+            self._pool.release(self.driver)
+            self._pool = None
+            self.driver = None
+        elif self.driver:
             try:
                 logger.debug("Closing Chrome driver...")
                 self.driver.quit()
@@ -124,42 +217,7 @@ class SeleniumDriver:
 
     def _build_options(self) -> Options:
         """Build Chrome options from config"""
-        options = Options()
-
-        # Use system Chrome/Chromium if CHROME_BIN is set (e.g., in Docker)
-        chrome_bin = os.environ.get('CHROME_BIN')
-        if chrome_bin:
-            logger.debug(f"Using Chrome binary at: {chrome_bin}")
-            options.binary_location = chrome_bin
-
-        if self.config.headless:
-            logger.debug("Running in headless mode")
-            options.add_argument('--headless')
-        else:
-            logger.debug("Running in visible mode")
-
-        if self.config.no_sandbox:
-            options.add_argument('--no-sandbox')
-
-        if self.config.disable_dev_shm:
-            options.add_argument('--disable-dev-shm-usage')
-
-        if self.config.disable_gpu:
-            options.add_argument('--disable-gpu')
-
-        options.add_argument(f'--window-size={self.config.window_size}')
-        options.add_argument(f'--user-agent={self.config.user_agent}')
-
-        # Add performance logging if enabled (for capturing network requests)
-        if self.config.enable_performance_logging:
-            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
-            logger.debug("Performance logging enabled")
-
-        # Add any extra arguments
-        for arg in self.config.extra_arguments:
-            options.add_argument(arg)
-
-        return options
+        return build_chrome_options(self.config)
 
     def get_driver(self) -> Optional[WebDriver]:
         """
@@ -184,4 +242,119 @@ class SeleniumDriver:
             _ = self.driver.current_url
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+
+def build_chrome_options(config: DriverConfig) -> Options:
+    """
+    Build Chrome options from config
+
+    Args:
+        config: Driver configuration
+
+    Returns:
+        Chrome Options instance
+    """
+    options = Options()
+
+    # Use system Chrome/Chromium if CHROME_BIN is set (e.g., in Docker)
+    chrome_bin = os.environ.get('CHROME_BIN')
+    if chrome_bin:
+        logger.debug(f"Using Chrome binary at: {chrome_bin}")
+        options.binary_location = chrome_bin
+
+    if config.headless:
+        logger.debug("Running in headless mode")
+        options.add_argument('--headless')
+    else:
+        logger.debug("Running in visible mode")
+
+    if config.no_sandbox:
+        options.add_argument('--no-sandbox')
+
+    if config.disable_dev_shm:
+        options.add_argument('--disable-dev-shm-usage')
+
+    if config.disable_gpu:
+        options.add_argument('--disable-gpu')
+
+    options.add_argument(f'--window-size={config.window_size}')
+    options.add_argument(f'--user-agent={config.user_agent}')
+
+    # Add performance logging if enabled (for capturing network requests)
+    if config.enable_performance_logging:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        logger.debug("Performance logging enabled")
+
+    options.page_load_strategy = config.page_load_strategy
+
+    if config.js_heap_mb:
+        options.add_argument(f'--js-flags=--max-old-space-size={config.js_heap_mb}')
+
+    if config.block_resources:
+        logger.debug("Lightweight profile: blocking heavy resources")
+        options.add_argument('--mute-audio')
+        options.add_argument('--disable-extensions')
+
+    # Add any extra arguments
+    for arg in config.extra_arguments:
+        options.add_argument(arg)
+
+    return options
+
+
+def apply_tab_settings(driver: WebDriver, config: DriverConfig) -> None:
+    """
+    Apply config's user agent and blocked URL patterns to the current tab via CDP
+
+    Both are per tab, so this runs after launch and on every pooled checkout
+    (an empty pattern list clears patterns left by a previous user).
+
+    Args:
+        driver: Chrome WebDriver
+        config: Driver configuration
+    """
+    patterns = config.blocked_url_patterns()
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': config.user_agent})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    if patterns:
+        logger.debug(f"Blocking {len(patterns)} URL patterns")
+
+
+def launch_chrome(config: DriverConfig) -> WebDriver:
+    """
+    Launch a new Chrome WebDriver
+
+    Args:
+        config: Driver configuration
+
+    Returns:
+        Configured WebDriver instance
+
+    Raises:
+        Exception: If driver setup fails
+    """
+    logger.info("Setting up Chrome WebDriver...")
+
+    options = build_chrome_options(config)
+
+    # Use system chromedriver if CHROMEDRIVER_PATH is set (e.g., in Docker)
+    chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
+    service = Service(executable_path=chromedriver_path) if chromedriver_path else None
+
+    try:
+        logger.debug("Initializing Chrome driver...")
+        if service:
+            logger.debug(f"Using chromedriver at: {chromedriver_path}")
+            driver = webdriver.Chrome(service=service, options=options)
+        else:
+            driver = webdriver.Chrome(options=options)
+        driver.implicitly_wait(config.implicit_wait)
+        apply_tab_settings(driver, config)
+        logger.info("Chrome driver initialized successfully")
+        return driver
+
+    except Exception as e:
+        logger.error(f"Failed to initialize Chrome driver: {e}", exc_info=True)
+        raise
@@ -8,13 +8,15 @@ from dotenv import load_dotenv
 
 import requests
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from scrapers.base.broker_base import AccountInfo, BalanceInfo, LoginCredentials, BrokerAPIClient
 from scrapers.base.selenium_driver import SeleniumDriver, DriverConfig
 from scrapers.utils.retry import retry_on_server_error, RetryableHTTPError
+from scrapers.utils.step_timer import StepTimer
+from scrapers.utils.sync_metrics import SyncMetrics
+from scrapers.utils.wait_conditions import SmartWait
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -49,6 +51,11 @@ class ExtraDeProAPIClient(BrokerAPIClient):
 
     BASE_URL = "https://extradepro.xnes.co.il"
     API_URL = "https://extradepro.xnes.co.il/api/v2/json2"
+    LOGIN_API_PATH = "/api/v2/json2/login"
+
+    # Max seconds to wait for page events during login
+    LOGIN_TIMEOUT = 15  # After submit, for the login API response
+    PAGE_SETTLE_TIMEOUT = 3  # For the dashboard to finish loading
 
     def __init__(self, credentials: LoginCredentials, headless: bool = True):
         super().__init__(credentials)
@@ -64,16 +71,21 @@ class ExtraDeProAPIClient(BrokerAPIClient):
             'referer': f'{self.BASE_URL}/login',
             'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36'
         }
+        # Per-step login durations (recorded in sync history)
+        self.login_timer = StepTimer()
+        # Per-phase timings and API request counters (recorded in sync history)
+        self.metrics = SyncMetrics()
+        self.metrics.attach(self.api_session)
 
     def setup_driver(self):
         """Setup Chrome WebDriver using centralized SeleniumDriver"""
-        config = DriverConfig(
+        config = DriverConfig.lightweight(
             headless=self.headless,
-            user_agent=self._headers["user-agent"],
-            enable_performance_logging=True  # Needed to capture session key from network logs
-        )
-        self._selenium_driver = SeleniumDriver(config)
-        self.driver = self._selenium_driver.setup()
+            user_agent=self._headers["user-agent"]
+        )  # The lightweight profile keeps performance logs, needed to capture the session key
+        with self.metrics.phase("browser"):
+            self._selenium_driver = SeleniumDriver(config)
+            self.driver = self._selenium_driver.setup()
 
     def cleanup(self):
         """Clean up resources"""
@@ -99,6 +111,10 @@ class ExtraDeProAPIClient(BrokerAPIClient):
             )
         response.raise_for_status()
 
+    def _wait_until_hidden(self, element, timeout: float = 1.0) -> None:
+        """Wait (bounded) for a dismissed popup element to disappear (or be removed from the DOM)"""
+        SmartWait(self.driver).until_any({'hidden': EC.invisibility_of_element(element)}, timeout=timeout)
+
     def _dismiss_popups(self, max_attempts: int = 5):
         """
         Dismiss any popups like 'בואו נתחיל!' (Let's start!), release notes, etc.
@@ -116,7 +132,7 @@ class ExtraDeProAPIClient(BrokerAPIClient):
                             logger.debug(f"Found popup button with Hebrew text, dismissing...")
                             btn.click()
                             popup_found = True
-                            self._human_delay(0.5, 1.0)
+                            self._wait_until_hidden(btn)
                             break
                 except Exception:
                     pass
@@ -136,7 +152,7 @@ class ExtraDeProAPIClient(BrokerAPIClient):
                                     logger.debug(f"Found popup with selector '{selector}', dismissing...")
                                     btn.click()
                                     popup_found = True
-                                    self._human_delay(0.5, 1.0)
+                                    self._wait_until_hidden(btn)
                                     break
                             if popup_found:
                                 break
@@ -157,63 +173,65 @@ class ExtraDeProAPIClient(BrokerAPIClient):
         Authenticate with ExtradePro using Selenium.
         Handles popups and extracts session key.
         """
+        timer = self.login_timer
         try:
             if not self.driver:
-                self.setup_driver()
+                with timer.step("browser_start"):
+                    self.setup_driver()
+            wait = SmartWait(self.driver, default_timeout=15)
 
             logger.info(f"Navigating to {self.BASE_URL}/login...")
-            self.driver.get(f"{self.BASE_URL}/login")
-            self._human_delay(1.0, 2.0)
+            with timer.step("navigate"):
+                self.driver.get(f"{self.BASE_URL}/login")
 
-            # Wait for username field
-            logger.debug("Waiting for login form...")
-            username_field = WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[formcontrolname='username'], input[name='username'], input#username, input[type='text']"))
-            )
+                # Wait for username field
+                logger.debug("Waiting for login form...")
+                username_field = wait.until_element_present(
+                    "input[formcontrolname='username'], input[name='username'], input#username, input[type='text']"
+                )
 
             # Enter username with human-like typing
             logger.info("Entering credentials...")
-            username_field.clear()
-            for char in self.credentials.user:
-                username_field.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
+            with timer.step("fill_credentials"):
+                username_field.clear()
+                for char in self.credentials.user:
+                    username_field.send_keys(char)
+                    time.sleep(random.uniform(0.05, 0.15))
 
-            self._human_delay(0.3, 0.6)
+                self._human_delay(0.3, 0.6)
 
-            # Find and fill password field
-            password_field = self.driver.find_element(By.CSS_SELECTOR, "input[formcontrolname='password'], input[name='password'], input#password, input[type='password']")
-            password_field.clear()
-            for char in self.credentials.password:
-                password_field.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
+                # Find and fill password field
+                password_field = self.driver.find_element(By.CSS_SELECTOR, "input[formcontrolname='password'], input[name='password'], input#password, input[type='password']")
+                password_field.clear()
+                for char in self.credentials.password:
+                    password_field.send_keys(char)
+                    time.sleep(random.uniform(0.05, 0.15))
 
-            self._human_delay(0.5, 1.0)
+                self._human_delay(0.5, 1.0)
 
             # Click login button
             logger.info("Submitting login...")
-            login_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit'], button.login-button")
-            login_btn.click()
-
-            # Wait for login to complete - wait for URL to change or dashboard element
-            logger.debug("Waiting for login to complete...")
-            try:
-                WebDriverWait(self.driver, 15).until(
-                    lambda d: "/login" not in d.current_url or "dashboard" in d.current_url or "main" in d.current_url
-                )
-            except TimeoutException:
-                logger.warning("Timeout waiting for dashboard, continuing anyway...")
+            with timer.step("submit"):
+                login_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit'], button.login-button")
+                login_btn.click()
 
-            self._human_delay(2.0, 3.0)
+                # The login API response carries the session key - proceed once it arrives
+                logger.debug("Waiting for login to complete...")
+                try:
+                    wait.until_network_event(self.LOGIN_API_PATH, timeout=self.LOGIN_TIMEOUT)
+                except TimeoutException:
+                    logger.warning("Timeout waiting for login response, continuing anyway...")
 
-            # Dismiss any post-login popups
-            self._dismiss_popups()
+            with timer.step("post_login"):
+                # Dismiss any post-login popups
+                self._dismiss_popups()
 
-            # Wait for page to fully load after popup dismissed
-            self._human_delay(2.0, 3.0)
+                # Wait for page to finish loading after popup dismissed
+                wait.until_network_idle(idle_time=0.5, timeout=self.PAGE_SETTLE_TIMEOUT)
 
-            # Extract session key from localStorage or sessionStorage
+            # Extract session key from login API response or storage
             logger.info("Extracting session data...")
-            session_key = self._extract_session_key()
+            session_key = self._extract_session_key(wait)
 
             # Log what we found for debugging
             if session_key:
@@ -242,45 +260,28 @@ class ExtraDeProAPIClient(BrokerAPIClient):
         except Exception as e:
             raise AuthenticationError(f"Login failed: {e}")
 
-    def _extract_session_key(self) -> Optional[str]:
-        """Extract session key from network logs (login API response)"""
-        import json as json_module
+    def _extract_session_key(self, wait: Optional[SmartWait] = None) -> Optional[str]:
+        """
+        Extract session key from the login API response (DevTools network events)
+
+        Args:
+            wait: SmartWait used during login (its drained network events are reused)
+        """
+        wait = wait or SmartWait(self.driver)
 
-        # Get performance logs and look for login response
         try:
-            logs = self.driver.get_log('performance')
-            for log in logs:
-                try:
-                    message = json_module.loads(log['message'])
-                    method = message.get('message', {}).get('method', '')
-
-                    # Look for Network.responseReceived for login endpoint
-                    if method == 'Network.responseReceived':
-                        params = message.get('message', {}).get('params', {})
-                        response = params.get('response', {})
-                        url = response.get('url', '')
-
-                        if '/api/v2/json2/login' in url:
-                            request_id = params.get('requestId')
-                            # Get the response body
-                            try:
-                                body = self.driver.execute_cdp_cmd(
-                                    'Network.getResponseBody',
-                                    {'requestId': request_id}
-                                )
-                                response_text = body.get('body', '')
-                                response_json = json_module.loads(response_text)
-                                session_key = response_json.get('Login', {}).get('SessionKey')
-                                if session_key:
-                                    logger.debug(f"Found session key from login API response")
-                                    return session_key
-                            except Exception as e:
-                                logger.debug(f"Could not get response body: {e}")
-                                continue
-                except Exception:
-                    continue
+            params = wait.until_network_event(self.LOGIN_API_PATH, timeout=1)
+            body = self.driver.execute_cdp_cmd(
+                'Network.getResponseBody',
+                {'requestId': params.get('requestId')}
+            )
+            response_json = json.loads(body.get('body', ''))
+            session_key = response_json.get('Login', {}).get('SessionKey')
+            if session_key:
+                logger.debug("Found session key from login API response")
+                return session_key
         except Exception as e:
-            logger.debug(f"Could not get performance logs: {e}")
+            logger.debug(f"Could not get session key from login response: {e}")
 
         # Fallback: Try localStorage/sessionStorage
         try:
@@ -14,6 +14,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from scrapers.base.selenium_driver import SeleniumDriver, DriverConfig
+from scrapers.utils.step_timer import StepTimer
+from scrapers.utils.sync_metrics import SyncMetrics
+from scrapers.utils.wait_conditions import SmartWait
 
 logger = logging.getLogger(__name__)
 
@@ -106,21 +109,28 @@ class MeitavBrokerScraper:
     # Holdings table selector (from your CSS path)
     HOLDINGS_CONTAINER_SELECTOR = "div.tab-pane.active dr-tab-module div.panel-body"
 
+    # Max seconds to wait for page events during login
+    LOGIN_TIMEOUT = 10  # After submit, for the "Enter system" popup or dashboard
+    POPUP_CLOSE_TIMEOUT = 2
+    DASHBOARD_TIMEOUT = 3
+
     def __init__(self, credentials: MeitavCredentials, headless: bool = True):
         self.credentials = credentials
         self.headless = headless
         self._selenium_driver: Optional[SeleniumDriver] = None
         self.driver = None  # Will be set by setup_driver
         self.account_number: Optional[str] = None
+        # Per-step login durations (recorded in sync history)
+        self.login_timer = StepTimer()
+        # Per-phase timings (recorded in sync history)
+        self.metrics = SyncMetrics()
 
     def setup_driver(self):
         """Setup Chrome WebDriver using centralized SeleniumDriver"""
-        config = DriverConfig(
-            headless=self.headless,
-            extra_arguments=['--lang=he-IL']  # Hebrew language support
-        )
-        self._selenium_driver = SeleniumDriver(config)
-        self.driver = self._selenium_driver.setup()
+        config = DriverConfig.lightweight(headless=self.headless)
+        with self.metrics.phase("browser"):
+            self._selenium_driver = SeleniumDriver(config)
+            self.driver = self._selenium_driver.setup()
 
     def cleanup(self):
         """Clean up resources"""
@@ -189,7 +199,11 @@ class MeitavBrokerScraper:
                             logger.debug(f"Found popup button: '{button_text}' with selector: {selector}")
                             button.click()
                             popup_found = True
-                            time.sleep(1)  # Wait for popup to close
+                            # Wait for popup to close (a removed button counts as closed)
+                            SmartWait(self.driver).until_any(
+                                {'closed': EC.invisibility_of_element(button)},
+                                timeout=self.POPUP_CLOSE_TIMEOUT
+                            )
                             break
                     if popup_found:
                         break
@@ -201,8 +215,6 @@ class MeitavBrokerScraper:
                 logger.debug(f"No more popups found after {attempt + 1} attempts")
                 break
 
-            time.sleep(0.5)
-
         logger.info("Finished handling popups")
 
     def login(self) -> bool:
@@ -215,72 +227,82 @@ class MeitavBrokerScraper:
         Raises:
             MeitavLoginError: If login fails
         """
+        timer = self.login_timer
         try:
             if not self.driver:
-                self.setup_driver()
+                with timer.step("browser_start"):
+                    self.setup_driver()
+            wait = SmartWait(self.driver, default_timeout=15)
 
             logger.info(f"Step 1/4: Navigating to {self.LOGIN_URL}...")
-            self.driver.get(self.LOGIN_URL)
-
-            # Wait for page to load
-            time.sleep(2)
+            with timer.step("navigate"):
+                self.driver.get(self.LOGIN_URL)
 
             # Enter username (card number)
             logger.info("Step 2/4: Entering credentials...")
-            username_field = WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.USERNAME_SELECTOR))
-            )
-            username_field.clear()
-            self._type_human_like(username_field, self.credentials.username)
+            with timer.step("fill_credentials"):
+                username_field = wait.until_element_present(self.USERNAME_SELECTOR)
+                username_field.clear()
+                self._type_human_like(username_field, self.credentials.username)
 
-            # Enter password
-            logger.debug("Entering password...")
-            password_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.PASSWORD_SELECTOR))
-            )
-            password_field.clear()
-            self._type_human_like(password_field, self.credentials.password)
+                # Enter password
+                logger.debug("Entering password...")
+                password_field = wait.until_element_present(self.PASSWORD_SELECTOR, timeout=10)
+                password_field.clear()
+                self._type_human_like(password_field, self.credentials.password)
 
             # Click login button
             logger.info("Step 3/4: Submitting login form...")
-            login_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, self.LOGIN_BUTTON_SELECTOR))
-            )
-            login_button.click()
-
-            # Wait for login to complete (at least 10 seconds as specified)
-            logger.debug("Waiting for login to complete...")
-            time.sleep(10)
+            with timer.step("submit"):
+                login_button = wait.until_element_clickable(self.LOGIN_BUTTON_SELECTOR, timeout=10)
+                login_button.click()
+
+                # Proceed once the "Enter system" popup or the dashboard shows up
+                logger.debug("Waiting for login to complete...")
+                outcome = wait.until_any({
+                    'enter_system': EC.element_to_be_clickable(
+                        (By.CSS_SELECTOR, self.ENTER_SYSTEM_BUTTON_SELECTOR)
+                    ),
+                    'dashboard': lambda d: "auth" not in d.current_url.lower(),
+                }, timeout=self.LOGIN_TIMEOUT)
+                logger.debug(f"Login outcome: {outcome}")
 
             # Handle the "כניסה למערכת" (Enter system) popup
             logger.info("Step 4/4: Handling login confirmation...")
-            try:
-                # Look for the account number in the popup to extract it
-                account_elem = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    "div.info-item-body.highlighted-text"
+            with timer.step("post_login"):
+                try:
+                    # Look for the account number in the popup to extract it
+                    account_elem = self.driver.find_element(
+                        By.CSS_SELECTOR,
+                        "div.info-item-body.highlighted-text"
+                    )
+                    self.account_number = account_elem.text.strip()
+                    logger.debug(f"Extracted account number: {self.account_number}")
+                except NoSuchElementException:
+                    logger.debug("Could not extract account number from popup")
+
+                # Click "כניסה למערכת" button
+                enter_button_clicked = self._click_button_if_exists(
+                    [self.ENTER_SYSTEM_BUTTON_SELECTOR],
+                    timeout=5
                 )
-                self.account_number = account_elem.text.strip()
-                logger.debug(f"Extracted account number: {self.account_number}")
-            except NoSuchElementException:
-                logger.debug("Could not extract account number from popup")
-
-            # Click "כניסה למערכת" button
-            enter_button_clicked = self._click_button_if_exists(
-                [self.ENTER_SYSTEM_BUTTON_SELECTOR],
-                timeout=5
-            )
-
-            if not enter_button_clicked:
-                logger.warning("Could not find 'Enter System' button, continuing anyway...")
 
-            time.sleep(2)
+                if enter_button_clicked:
+                    wait.until_any({
+                        'closed': EC.invisibility_of_element_located(
+                            (By.CSS_SELECTOR, self.ENTER_SYSTEM_BUTTON_SELECTOR)
+                        ),
+                    }, timeout=self.POPUP_CLOSE_TIMEOUT)
+                else:
+                    logger.warning("Could not find 'Enter System' button, continuing anyway...")
 
-            # Handle any additional popups
-            self._handle_post_login_popups()
+                # Handle any additional popups
+                self._handle_post_login_popups()
 
-            # Verify we're logged in by checking for dashboard elements
-            time.sleep(3)
+                # Verify we're logged in by checking for dashboard elements
+                wait.until_any({
+                    'dashboard': EC.presence_of_element_located((By.CSS_SELECTOR, self.SUMMARY_PANEL_SELECTOR)),
+                }, timeout=self.DASHBOARD_TIMEOUT)
 
             current_url = self.driver.current_url
             logger.debug(f"Current URL after login: {current_url}")
@@ -468,16 +490,20 @@ class MeitavBrokerScraper:
             logger.info("Starting Meitav broker scraper...")
 
             # Login
-            self.login()
+            with self.metrics.phase("login"):
+                self.login()
 
-            # Wait for dashboard to fully load
-            time.sleep(3)
+            with self.metrics.phase("fetch"):
+                # Wait for dashboard data to render
+                SmartWait(self.driver).until_any({
+                    'summary': EC.presence_of_element_located((By.CSS_SELECTOR, self.SUMMARY_PANEL_SELECTOR)),
+                }, timeout=self.DASHBOARD_TIMEOUT)
 
-            # Extract balance
-            balance = self.extract_balance()
+                # Extract balance
+                balance = self.extract_balance()
 
-            # Extract holdings (optional - may not be available on all views)
-            holdings = self.extract_holdings()
+                # Extract holdings (optional - may not be available on all views)
+                holdings = self.extract_holdings()
 
             account = MeitavAccount(
                 account_number=self.account_number or "Unknown",
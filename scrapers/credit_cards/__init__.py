@@ -11,6 +11,7 @@ from .shared_models import (
     TransactionType,
     Installments,
     Transaction,
+    TransactionBatch,
     # Base exceptions
     CreditCardScraperError,
     CreditCardLoginError,
@@ -63,6 +64,7 @@ __all__ = [
     "TransactionType",
     "Installments",
     "Transaction",
+    "TransactionBatch",
     # Base exceptions
     "CreditCardScraperError",
     "CreditCardLoginError",
@@ -5,11 +5,21 @@ Provides common driver lifecycle management and defines the scraping interface.
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Optional, List, Any, TypeVar, Generic
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Optional, List, Any, Dict, Iterable, Iterator, Tuple, TypeVar, Generic
+
+import requests
 
 from scrapers.base.selenium_driver import SeleniumDriver, DriverConfig
+from scrapers.credit_cards.shared_models import TransactionBatch
+from scrapers.utils.concurrent_fetch import RateLimiter
+from scrapers.utils.http_session import create_http_session
+from scrapers.utils.payload_log import PayloadLog
+from scrapers.utils.step_timer import StepTimer
+from scrapers.utils.sync_metrics import SyncMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -26,48 +36,190 @@ class BaseCreditCardScraper(ABC, Generic[CredentialsT, CardAccountT]):
     Provides:
     - Selenium WebDriver lifecycle management (setup, cleanup, context manager)
     - Common attributes (headless, driver)
+    - Pooled HTTP session for post-login API calls (http_session)
     - Template method pattern for scraping flow
 
+    Subclasses may set FETCH_CONCURRENCY / FETCH_RATE_LIMIT to tune how many
+    API calls run in parallel after login (overridable per instance).
+
+    Subclasses may set SESSION_TTL and implement export_session() /
+    restore_session() to let repeat syncs reuse a cached login.
+
+    API responses are recorded in payload_log so a sync can be replayed
+    offline; calls that bypass http_session must record/replay themselves,
+    and export_replay_state() / prepare_replay() carry the non-secret
+    post-login state fetch_transactions() needs.
+
+    login() implementations should wrap their steps in self.login_timer.step()
+    so per-step login durations end up in sync history. Phase timings
+    (browser, login, fetch, convert) and request counters go to metrics;
+    conversion code should time itself as the "convert" phase.
+
+    Transactions are fetched month by month: scrape_batches() yields each
+    month as soon as it is converted (so a long backfill can be saved as it
+    goes), while scrape() / fetch_transactions() merge all months per card.
+
     Subclasses must implement:
     - _create_driver_config(): Return DriverConfig for this scraper
     - login(): Perform login and return True on success
-    - fetch_transactions(): Fetch and return card accounts with transactions
+    - iter_transaction_batches(): Yield each month's transactions, oldest first
     """
 
-    def __init__(self, credentials: CredentialsT, headless: bool = True):
+    # Post-login API fetch limits (max concurrent requests, requests per second)
+    FETCH_CONCURRENCY: int = 1
+    FETCH_RATE_LIMIT: Optional[float] = None
+
+    # How long an exported login session may be reused (None = reuse unsupported)
+    SESSION_TTL: Optional[timedelta] = None
+
+    # Months fetched per round by scrape_batches() (bounds what is held in memory)
+    STREAM_MONTHS_PER_FETCH: int = 3
+
+    def __init__(
+        self,
+        credentials: CredentialsT,
+        headless: bool = True,
+        max_concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = None
+    ):
         """
         Initialize the scraper.
 
         Args:
             credentials: Institution-specific credentials dataclass
             headless: Run browser in headless mode (default True)
+            max_concurrency: Max concurrent API requests (default FETCH_CONCURRENCY)
+            rate_limit: Max API requests per second (default FETCH_RATE_LIMIT)
         """
         self.credentials = credentials
         self.headless = headless
+        self.max_concurrency = max_concurrency or self.FETCH_CONCURRENCY
+        self.rate_limiter = RateLimiter(rate_limit if rate_limit is not None else self.FETCH_RATE_LIMIT)
         self._selenium_driver: Optional[SeleniumDriver] = None
         self.driver: Optional[Any] = None  # WebDriver instance
+        self._http_session: Optional[requests.Session] = None
+        # First use can happen inside concurrent fetch workers
+        self._http_session_lock = threading.Lock()
+        # Post-login session state (set after login or a successful restore)
+        self.session_state: Optional[Dict[str, Any]] = None
+        self.session_restored = False
+        # Per-step login durations (recorded in sync history)
+        self.login_timer = StepTimer()
+        # Per-phase timings and counters (recorded in sync history)
+        self.metrics = SyncMetrics()
+        # Raw API responses (landed with the sync for offline replay)
+        self.payload_log = PayloadLog()
+        # (start_date, end_date) of the last fetch_transactions() call
+        self.fetched_range: Optional[Tuple[datetime, datetime]] = None
+        # Months (YYYY-MM) the last fetch_transactions() call could not fetch
+        self.months_failed: List[str] = []
 
     def _create_driver_config(self) -> DriverConfig:
         """
         Create driver configuration for this scraper.
 
-        Override to customize driver settings (e.g., enable performance logging).
+        Defaults to the lightweight profile (heavy resources blocked, eager
+        page load, performance logging). Override to allow resources the
+        login flow needs; keep launch options at the profile defaults so
+        pooled browsers are shared.
 
         Returns:
             DriverConfig instance
         """
-        return DriverConfig(headless=self.headless)
+        return DriverConfig.lightweight(headless=self.headless)
+
+    def _create_http_session(self) -> requests.Session:
+        """
+        Create the HTTP session used for API calls after login.
+
+        Override to seed the session with auth headers or browser cookies.
+
+        Returns:
+            requests.Session instance
+        """
+        return create_http_session()
+
+    @property
+    def http_session(self) -> requests.Session:
+        """Get the scraper's pooled HTTP session, creating it on first use (after login)."""
+        if self._http_session is None:
+            with self._http_session_lock:
+                if self._http_session is None:
+                    session = self._create_http_session()
+                    self.payload_log.attach(session)
+                    self.metrics.attach(session)
+                    self._http_session = session
+        return self._http_session
+
+    def reset_http_session(self) -> None:
+        """Close the HTTP session so the next call creates a fresh one."""
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
+    def export_session(self) -> Optional[Dict[str, Any]]:
+        """
+        Export post-login state (tokens, cookies, card metadata) for caching.
+
+        Returns:
+            JSON-serializable state, or None if session reuse is unsupported
+        """
+        return None
+
+    def restore_session(self, state: Dict[str, Any]) -> bool:
+        """
+        Restore a previously exported session and validate it.
+
+        Implementations should validate with one cheap API call and leave the
+        scraper logged out if it fails, so login() can run as the fallback.
+
+        Args:
+            state: State returned by export_session()
+
+        Returns:
+            True if the session is valid and login can be skipped
+        """
+        return False
+
+    def export_replay_state(self) -> Dict[str, Any]:
+        """
+        Export post-login state fetch_transactions() needs besides API responses.
+
+        Stored unencrypted with the raw payloads, so it must not contain
+        tokens or cookies.
+
+        Returns:
+            JSON-serializable state (empty by default)
+        """
+        return {}
+
+    def prepare_replay(self, payload_log: PayloadLog, state: Dict[str, Any]) -> None:
+        """
+        Serve API calls from a recording instead of logging in.
+
+        Override to restore what export_replay_state() exported (and any
+        placeholder auth the request code expects).
+
+        Args:
+            payload_log: Log created with the recorded entries (replay=...)
+            state: State returned by export_replay_state()
+        """
+        self.reset_http_session()
+        self.payload_log = payload_log
+        self.session_restored = True
 
     def setup_driver(self) -> None:
         """Setup Chrome WebDriver using centralized SeleniumDriver."""
         config = self._create_driver_config()
-        self._selenium_driver = SeleniumDriver(config)
-        self.driver = self._selenium_driver.setup()
+        with self.metrics.phase("browser"):
+            self._selenium_driver = SeleniumDriver(config)
+            self.driver = self._selenium_driver.setup()
         logger.debug("WebDriver initialized")
 
     def cleanup(self) -> None:
-        """Clean up WebDriver resources."""
+        """Clean up WebDriver and HTTP session resources."""
         logger.debug("Starting cleanup process...")
+        self.reset_http_session()
         if self._selenium_driver:
             self._selenium_driver.cleanup()
             self._selenium_driver = None
@@ -97,30 +249,135 @@ class BaseCreditCardScraper(ABC, Generic[CredentialsT, CardAccountT]):
         pass
 
     @abstractmethod
+    def iter_transaction_batches(
+        self,
+        start_date: Optional[datetime] = None,
+        months_back: int = 12,
+        months_forward: int = 1,
+        end_date: Optional[datetime] = None,
+        months_per_fetch: Optional[int] = None
+    ) -> Iterator[TransactionBatch]:
+        """
+        Fetch transactions for all cards, yielding one batch per month.
+
+        Months are fetched months_per_fetch at a time and yielded oldest
+        first. A month that cannot be fetched is yielded with error set
+        rather than raised. Implementations set fetched_range to the range
+        actually used.
+
+        Args:
+            start_date: Start date for fetching transactions
+            months_back: Number of months to fetch backwards
+            months_forward: Number of months to fetch forward
+            end_date: End date (default: months_forward from now; set by replay)
+            months_per_fetch: Months fetched per round (None = all at once)
+
+        Yields:
+            TransactionBatch per month
+        """
+        pass
+
     def fetch_transactions(
         self,
         start_date: Optional[datetime] = None,
         months_back: int = 12,
-        months_forward: int = 1
+        months_forward: int = 1,
+        end_date: Optional[datetime] = None
     ) -> List[CardAccountT]:
         """
-        Fetch transactions for all cards.
+        Fetch transactions for all cards (all months at once, merged per card).
 
         Args:
             start_date: Start date for fetching transactions
             months_back: Number of months to fetch backwards
             months_forward: Number of months to fetch forward
+            end_date: End date (default: months_forward from now; set by replay)
 
         Returns:
-            List of CardAccount objects with transactions
+            List of CardAccount objects with transactions (months that could
+            not be fetched are listed in months_failed)
         """
-        pass
+        self.months_failed = []
+        return self.merge_batches(
+            self.iter_transaction_batches(start_date, months_back, months_forward, end_date),
+            months_failed=self.months_failed
+        )
+
+    @staticmethod
+    def merge_batches(
+        batches: Iterable[TransactionBatch],
+        months_failed: Optional[List[str]] = None
+    ) -> List[CardAccountT]:
+        """
+        Merge monthly batches into one CardAccount per card.
+
+        Failed months are logged and skipped; their labels are appended to
+        months_failed so the caller can tell a partial fetch from a full one.
+
+        Args:
+            batches: Batches from iter_transaction_batches()
+            months_failed: List collecting the labels of failed months
+
+        Returns:
+            List of CardAccount objects with transactions, newest first
+
+        Raises:
+            The first month's error if no month could be fetched
+        """
+        accounts: Dict[str, Any] = {}
+        errors = []
+        for batch in batches:
+            if batch.error is not None:
+                logger.warning(f"Skipping month {batch.label}: {batch.error}")
+                errors.append(batch.error)
+                if months_failed is not None:
+                    months_failed.append(batch.label)
+            for account in batch.accounts:
+                merged = accounts.get(account.account_number)
+                if merged is None:
+                    accounts[account.account_number] = replace(account, transactions=list(account.transactions))
+                else:
+                    merged.transactions.extend(account.transactions)
+
+        if errors and not accounts:
+            raise errors[0]
+
+        for account in accounts.values():
+            account.transactions.sort(key=lambda t: t.date, reverse=True)
+            logger.info(f"Found {len(account.transactions)} transactions for card {account.account_number}")
+        return list(accounts.values())
+
+    def login_or_restore(self, session_state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Reuse a cached session if it is still valid, otherwise log in.
+
+        Sets session_state (for the caller to cache) and session_restored.
+
+        Args:
+            session_state: Previously exported session state, if any
+        """
+        if session_state:
+            with self.login_timer.step("restore_session"):
+                restored = self.restore_session(session_state)
+        else:
+            restored = False
+
+        if restored:
+            logger.info("Reusing cached session - skipping login")
+            self.session_restored = True
+            self.session_state = session_state
+            return
+
+        self.session_restored = False
+        self.login()
+        self.session_state = self.export_session()
 
     def scrape(
         self,
         start_date: Optional[datetime] = None,
         months_back: int = 12,
-        months_forward: int = 1
+        months_forward: int = 1,
+        session_state: Optional[Dict[str, Any]] = None
     ) -> List[CardAccountT]:
         """
         Complete scraping flow: login and fetch transactions.
@@ -131,6 +388,7 @@ class BaseCreditCardScraper(ABC, Generic[CredentialsT, CardAccountT]):
             start_date: Start date for fetching transactions
             months_back: Number of months to fetch backwards
             months_forward: Number of months to fetch forward
+            session_state: Cached session to try before logging in
 
         Returns:
             List of CardAccount objects with transactions
@@ -138,13 +396,60 @@ class BaseCreditCardScraper(ABC, Generic[CredentialsT, CardAccountT]):
         try:
             logger.info(f"Starting {self.__class__.__name__}...")
 
-            # Login
-            self.login()
+            # Login (or reuse cached session)
+            with self.metrics.phase("login"):
+                self.login_or_restore(session_state)
 
             # Fetch transactions
-            accounts = self.fetch_transactions(start_date, months_back, months_forward)
+            with self.metrics.phase("fetch"):
+                accounts = self.fetch_transactions(start_date, months_back, months_forward)
 
             return accounts
 
         finally:
             self.cleanup()
+
+    def scrape_batches(
+        self,
+        start_date: Optional[datetime] = None,
+        months_back: int = 12,
+        months_forward: int = 1,
+        session_state: Optional[Dict[str, Any]] = None
+    ) -> Iterator[TransactionBatch]:
+        """
+        Streaming scraping flow: login, then yield each month as it is fetched.
+
+        Only STREAM_MONTHS_PER_FETCH months are held at a time, and each batch
+        carries the raw payloads recorded since the previous one. The browser
+        is cleaned up when the generator finishes or is closed.
+
+        Args:
+            start_date: Start date for fetching transactions
+            months_back: Number of months to fetch backwards
+            months_forward: Number of months to fetch forward
+            session_state: Cached session to try before logging in
+
+        Yields:
+            TransactionBatch per month, oldest first
+        """
+        try:
+            logger.info(f"Starting {self.__class__.__name__} (streaming)...")
+
+            # Login (or reuse cached session)
+            with self.metrics.phase("login"):
+                self.login_or_restore(session_state)
+
+            batches = self.iter_transaction_batches(
+                start_date, months_back, months_forward, months_per_fetch=self.STREAM_MONTHS_PER_FETCH
+            )
+            while True:
+                # Only time the fetching - not the consumer saving each batch
+                with self.metrics.phase("fetch"):
+                    batch = next(batches, None)
+                if batch is None:
+                    break
+                batch.payloads = self.payload_log.drain()
+                yield batch
+
+        finally:
+            self.cleanup()
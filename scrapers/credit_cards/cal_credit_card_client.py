@@ -7,23 +7,26 @@ import json
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from dataclasses import dataclass
 from enum import Enum
 
 import requests
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-from scrapers.base.selenium_driver import DriverConfig
 from scrapers.credit_cards.base_scraper import BaseCreditCardScraper
+from scrapers.credit_cards.shared_helpers import month_chunks
+from scrapers.utils.concurrent_fetch import fetch_concurrently
+from scrapers.utils.http_session import create_http_session
+from scrapers.utils.payload_log import PayloadLog
+from scrapers.utils.wait_conditions import SmartWait
 from scrapers.credit_cards.shared_models import (
     TransactionStatus,
     TransactionType,
     Installments,
     Transaction,
+    TransactionBatch,
     CALScraperError,
     CALLoginError,
     CALAuthorizationError,
@@ -73,18 +76,27 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
 
     X_SITE_ID = "09031987-273E-2311-906C-8AF85B17C8D9"
 
-    def __init__(self, credentials: CALCredentials, headless: bool = True):
-        super().__init__(credentials, headless)
+    # CAL authorization tokens are short-lived; validation catches early expiry
+    SESSION_TTL = timedelta(minutes=30)
+
+    # Max seconds to wait for the login outcome after submitting the form
+    LOGIN_TIMEOUT = 5
+
+    # CAL API tolerates a handful of parallel month requests
+    FETCH_CONCURRENCY = 4
+    FETCH_RATE_LIMIT = 5.0
+
+    def __init__(
+        self,
+        credentials: CALCredentials,
+        headless: bool = True,
+        max_concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = None
+    ):
+        super().__init__(credentials, headless, max_concurrency, rate_limit)
         self.authorization_token: Optional[str] = None
         self.cards: List[Dict[str, str]] = []
 
-    def _create_driver_config(self) -> DriverConfig:
-        """CAL requires performance logging to capture authorization token."""
-        return DriverConfig(
-            headless=self.headless,
-            enable_performance_logging=True
-        )
-
     def wait_for_iframe(self, timeout: int = 10) -> Any:
         """Wait for and switch to login iframe"""
         logger.debug("Waiting for login iframe...")
@@ -106,69 +118,76 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
         """
         Perform login to CAL website.
 
+        Waits on page events (login form, auth token in session storage,
+        SSO request) instead of fixed sleeps; the old sleep lengths are
+        kept as upper bounds.
+
         Returns:
             True if login successful
 
         Raises:
             CALLoginError: If login fails
         """
+        timer = self.login_timer
         try:
             if not self.driver:
-                self.setup_driver()
+                with timer.step("browser_start"):
+                    self.setup_driver()
+            wait = SmartWait(self.driver, default_timeout=10)
 
             logger.info(f"Step 1/4: Navigating to {self.BASE_URL}...")
-            self.driver.get(self.BASE_URL)
+            with timer.step("navigate"):
+                self.driver.get(self.BASE_URL)
 
-            # Click login button
-            logger.debug("Waiting for login button...")
-            login_btn = WebDriverWait(self.driver, 15).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "#ccLoginDesktopBtn"))
-            )
-            logger.debug("Clicking login button...")
-            login_btn.click()
+                # Click login button
+                logger.debug("Waiting for login button...")
+                login_btn = wait.until_element_clickable("#ccLoginDesktopBtn", timeout=15)
+                logger.debug("Clicking login button...")
+                login_btn.click()
 
-            # Wait for and switch to iframe
-            self.wait_for_iframe()
+                # Wait for and switch to iframe
+                self.wait_for_iframe()
 
             # Click on regular login tab
-            logger.debug("Switching to password login tab...")
-            regular_login_tab = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "#regular-login"))
-            )
-            regular_login_tab.click()
-            time.sleep(1)
-
-            # Enter username
             logger.info("Step 2/4: Entering credentials...")
-            username_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[formcontrolname='userName']"))
-            )
-            username_field.clear()
-            username_field.send_keys(self.credentials.username)
+            with timer.step("fill_credentials"):
+                logger.debug("Switching to password login tab...")
+                wait.until_element_clickable("#regular-login").click()
+
+                # Enter username (form renders after the tab switch)
+                username_field = wait.until_element_clickable("[formcontrolname='userName']")
+                username_field.clear()
+                username_field.send_keys(self.credentials.username)
 
-            # Enter password
-            logger.debug("Entering password...")
-            password_field = self.driver.find_element(By.CSS_SELECTOR, "[formcontrolname='password']")
-            password_field.clear()
-            password_field.send_keys(self.credentials.password)
+                # Enter password
+                logger.debug("Entering password...")
+                password_field = self.driver.find_element(By.CSS_SELECTOR, "[formcontrolname='password']")
+                password_field.clear()
+                password_field.send_keys(self.credentials.password)
 
             # Submit login
             logger.info("Step 3/4: Submitting login form...")
-            submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            submit_btn.click()
-
-            # Switch back to main content
-            self.driver.switch_to.default_content()
-
-            # Wait for dashboard or check for errors
-            logger.debug("Waiting for login to complete...")
-            time.sleep(5)
+            with timer.step("submit"):
+                submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+                submit_btn.click()
+
+                # Switch back to main content
+                self.driver.switch_to.default_content()
+
+                # Proceed as soon as the token is issued or the login error renders
+                logger.debug("Waiting for login to complete...")
+                outcome = wait.until_any({
+                    'token': self._token_in_storage,
+                    'sso_request': lambda d: self._sso_request_seen(wait),
+                    'error': self._login_error_shown,
+                }, timeout=self.LOGIN_TIMEOUT)
+                logger.debug(f"Login outcome: {outcome}")
 
             current_url = self.driver.current_url
             logger.debug(f"Current URL: {current_url}")
 
             # Check for invalid password error
-            if "connect" in current_url:
+            if "connect" in current_url or outcome == 'error':
                 # Still on login page - check for error
                 self.wait_for_iframe()
                 try:
@@ -186,17 +205,18 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
                 try:
                     close_btn = self.driver.find_element(By.CSS_SELECTOR, "button.btn-close")
                     close_btn.click()
-                    time.sleep(1)
+                    wait.until_any({'closed': lambda d: "site-tutorial" not in d.current_url}, timeout=1)
                 except NoSuchElementException:
                     pass
 
             # Extract authorization token
             logger.info("Step 4/4: Extracting session data...")
-            self.extract_authorization_token()
+            with timer.step("session_data"):
+                self.extract_authorization_token(wait)
 
-            # Extract card information
-            logger.debug("Extracting card information...")
-            self.extract_card_info()
+                # Extract card information
+                logger.debug("Extracting card information...")
+                self.extract_card_info()
 
             logger.info(f"Login successful! Found {len(self.cards)} card(s)")
             return True
@@ -206,43 +226,67 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
         except Exception as e:
             raise CALLoginError(f"Login failed: {e}")
 
-    def extract_authorization_token(self):
-        """Extract authorization token from browser logs or session storage"""
-        try:
-            # Try to get from session storage
-            auth_module = self.driver.execute_script(
-                "return JSON.parse(sessionStorage.getItem('auth-module'));"
-            )
+    @staticmethod
+    def _read_storage_token(driver) -> Optional[str]:
+        """Get calConnectToken from the auth-module session storage entry"""
+        auth_module = driver.execute_script(
+            "return JSON.parse(sessionStorage.getItem('auth-module'));"
+        )
+        token = ((auth_module or {}).get('auth') or {}).get('calConnectToken')
+        return token if token and token.strip() else None
 
-            if auth_module and 'auth' in auth_module and 'calConnectToken' in auth_module['auth']:
-                token = auth_module['auth']['calConnectToken']
-                if token and token.strip():
-                    self.authorization_token = f"CALAuthScheme {token}"
-                    logger.debug("Authorization token extracted from session storage")
-                    return
+    def _token_in_storage(self, driver) -> bool:
+        """Login-complete condition: auth token written to session storage"""
+        return self._read_storage_token(driver) is not None
 
-            # Fallback: Parse performance logs
-            logs = self.driver.get_log('performance')
-            for entry in logs:
+    def _sso_request_seen(self, wait: SmartWait) -> bool:
+        """Login-complete condition: SSO request with the auth header was sent"""
+        try:
+            wait.until_network_event(self.SSO_AUTH_ENDPOINT, method='Network.requestWillBeSent', timeout=0.01)
+            return True
+        except TimeoutException:
+            return False
+
+    def _login_error_shown(self, driver) -> bool:
+        """Login-failed condition: error message rendered inside the login iframe"""
+        for iframe in driver.find_elements(By.TAG_NAME, "iframe"):
+            src = iframe.get_attribute("src")
+            if src and "connect" in src:
+                driver.switch_to.frame(iframe)
                 try:
-                    log = json.loads(entry['message'])
-                    message = log.get('message', {})
-                    method = message.get('method', '')
-
-                    if method == 'Network.requestWillBeSent':
-                        params = message.get('params', {})
-                        request = params.get('request', {})
-                        url = request.get('url', '')
-
-                        if self.SSO_AUTH_ENDPOINT in url:
-                            headers = request.get('headers', {})
-                            auth_header = headers.get('Authorization') or headers.get('authorization')
-                            if auth_header:
-                                self.authorization_token = auth_header
-                                logger.debug("Authorization token extracted from network logs")
-                                return
-                except:
-                    continue
+                    return bool(driver.find_elements(By.CSS_SELECTOR, "div.general-error > div"))
+                finally:
+                    driver.switch_to.default_content()
+        return False
+
+    def extract_authorization_token(self, wait: Optional[SmartWait] = None):
+        """
+        Extract authorization token from session storage or network events
+
+        Args:
+            wait: SmartWait used during login (its drained network events are reused)
+        """
+        wait = wait or SmartWait(self.driver)
+        try:
+            token = self._read_storage_token(self.driver)
+            if token:
+                self.authorization_token = f"CALAuthScheme {token}"
+                logger.debug("Authorization token extracted from session storage")
+                return
+
+            # Fallback: SSO request headers from DevTools network events
+            try:
+                params = wait.until_network_event(
+                    self.SSO_AUTH_ENDPOINT, method='Network.requestWillBeSent', timeout=1
+                )
+                headers = params.get('request', {}).get('headers', {})
+                auth_header = headers.get('Authorization') or headers.get('authorization')
+                if auth_header:
+                    self.authorization_token = auth_header
+                    logger.debug("Authorization token extracted from network logs")
+                    return
+            except TimeoutException:
+                pass
 
             raise CALAuthorizationError("Failed to extract authorization token")
 
@@ -253,6 +297,12 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
         """Extract card information from session storage with retry logic"""
         last_error = None
 
+        # Returns as soon as the app writes its init data; retries below cover parsing
+        SmartWait(self.driver).until_any(
+            {'init': lambda d: d.execute_script("return sessionStorage.getItem('init');")},
+            timeout=max_retries * retry_delay
+        )
+
         for attempt in range(max_retries):
             try:
                 # Get all session storage keys for debugging
@@ -346,6 +396,63 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
             'Sec-Fetch-Dest': 'empty',
         }
 
+    def _create_http_session(self) -> requests.Session:
+        """Create pooled API session carrying the authorization headers"""
+        return create_http_session(headers=self.get_api_headers())
+
+    def export_session(self) -> Optional[Dict[str, Any]]:
+        """Export authorization token and card list for session reuse"""
+        if not self.authorization_token or not self.cards:
+            return None
+        return {
+            'authorization_token': self.authorization_token,
+            'cards': self.cards,
+        }
+
+    def restore_session(self, state: Dict[str, Any]) -> bool:
+        """Restore a cached token and card list, validated with one pending-transactions call"""
+        self.authorization_token = state.get('authorization_token')
+        self.cards = state.get('cards') or []
+
+        if self.authorization_token and self.cards and self.validate_session():
+            return True
+
+        logger.info("Cached CAL session is no longer valid")
+        self.authorization_token = None
+        self.cards = []
+        self.reset_http_session()
+        return False
+
+    def validate_session(self) -> bool:
+        """
+        Check the current token with a single lightweight API call.
+
+        Returns:
+            True if the API accepts the token
+        """
+        try:
+            response = self.http_session.post(
+                self.PENDING_ENDPOINT,
+                json={'cardUniqueIDArray': [self.cards[0]['cardUniqueId']]},
+                timeout=15
+            )
+            if response.status_code != 200:
+                return False
+            # 1 = success, 96 = no pending transactions - both mean the token works
+            return response.json().get('statusCode') in (1, 96)
+        except (requests.RequestException, ValueError):
+            return False
+
+    def export_replay_state(self) -> Dict[str, Any]:
+        """Card list (ids and last digits) - the token is not exported"""
+        return {'cards': self.cards}
+
+    def prepare_replay(self, payload_log: PayloadLog, state: Dict[str, Any]) -> None:
+        """Restore the card list; a placeholder token satisfies the header builder"""
+        super().prepare_replay(payload_log, state)
+        self.cards = state.get('cards') or []
+        self.authorization_token = 'replay'
+
     def fetch_completed_transactions(
         self,
         card_unique_id: str,
@@ -370,9 +477,8 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
         }
 
         try:
-            response = requests.post(
+            response = self.http_session.post(
                 self.TRANSACTIONS_ENDPOINT,
-                headers=self.get_api_headers(),
                 json=payload,
                 timeout=30
             )
@@ -400,9 +506,8 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
         payload = {'cardUniqueIDArray': card_unique_ids}
 
         try:
-            response = requests.post(
+            response = self.http_session.post(
                 self.PENDING_ENDPOINT,
-                headers=self.get_api_headers(),
                 json=payload,
                 timeout=30
             )
@@ -564,22 +669,30 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
 
         return result
 
-    def fetch_transactions(
+    def iter_transaction_batches(
         self,
         start_date: Optional[datetime] = None,
         months_back: int = 18,
-        months_forward: int = 1
-    ) -> List[CardAccount]:
+        months_forward: int = 1,
+        end_date: Optional[datetime] = None,
+        months_per_fetch: Optional[int] = None
+    ) -> Iterator[TransactionBatch]:
         """
-        Fetch all transactions for all cards.
+        Fetch transactions for all cards, yielding one batch per month.
+
+        Every (card, month) pair of a round is fetched concurrently. Pending
+        transactions are per card rather than per month, so they come with
+        the newest month.
 
         Args:
             start_date: Start date for fetching transactions (default: 18 months ago)
             months_back: Number of months to fetch backwards
             months_forward: Number of months to fetch forward
+            end_date: End date (default: months_forward from now; set by replay)
+            months_per_fetch: Months fetched per round (None = all at once)
 
-        Returns:
-            List of CardAccount objects with transactions
+        Yields:
+            TransactionBatch per month, oldest first
         """
         if not self.authorization_token:
             raise CALAuthorizationError("Not logged in - call login() first")
@@ -591,43 +704,70 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
         if start_date is None:
             start_date = datetime.now() - timedelta(days=months_back * 30)
 
-        end_date = datetime.now() + timedelta(days=months_forward * 30)
+        if end_date is None:
+            end_date = datetime.now() + timedelta(days=months_forward * 30)
 
         logger.info(f"Fetching transactions from {start_date.date()} to {end_date.date()}")
+        self.fetched_range = (start_date, end_date)
 
-        accounts = []
-
-        for card in self.cards:
-            card_id = card['cardUniqueId']
-            last_4 = card['last4Digits']
-
-            logger.info(f"Processing card ending in {last_4}...")
-
-            # Fetch pending transactions
-            logger.debug(f"Fetching pending transactions for card {last_4}...")
-            pending_data = self.fetch_pending_transactions([card_id])
-
-            # Fetch completed transactions by month
-            logger.debug(f"Fetching completed transactions for card {last_4}...")
-            completed_data_list = []
+        chunks = month_chunks(start_date, end_date, months_per_fetch)
+        logger.info(
+            f"Fetching {len(self.cards)} card(s) x {sum(len(months) for months in chunks)} month(s) "
+            f"with up to {self.max_concurrency} concurrent requests..."
+        )
 
-            current_date = end_date
-            while current_date >= start_date:
-                month = current_date.month
-                year = current_date.year
+        for chunk_index, months in enumerate(chunks):
+            # Fetch every (card, month) pair concurrently - results come back in request order
+            completed_results = fetch_concurrently(
+                lambda key: self.fetch_completed_transactions(*key),
+                [(card['cardUniqueId'], month, year) for year, month in months for card in self.cards],
+                max_workers=self.max_concurrency,
+                rate_limiter=self.rate_limiter
+            )
+            pending_results = []
+            if chunk_index == len(chunks) - 1:
+                pending_results = fetch_concurrently(
+                    lambda card_id: self.fetch_pending_transactions([card_id]),
+                    [card['cardUniqueId'] for card in self.cards],
+                    max_workers=self.max_concurrency,
+                    rate_limiter=self.rate_limiter
+                )
 
-                logger.debug(f"  Fetching month {month}/{year}...")
-                month_data = self.fetch_completed_transactions(card_id, month, year)
-                completed_data_list.append(month_data)
+            for position, (year, month) in enumerate(months):
+                month_results = completed_results[position * len(self.cards):(position + 1) * len(self.cards)]
+                with_pending = bool(pending_results) and position == len(months) - 1
+                yield self._build_month_batch(year, month, month_results, pending_results if with_pending else [], start_date, end_date)
 
-                # Move to previous month (set day=1 to avoid "day out of range" errors)
-                if current_date.month == 1:
-                    current_date = current_date.replace(year=current_date.year - 1, month=12, day=1)
-                else:
-                    current_date = current_date.replace(month=current_date.month - 1, day=1)
+    def _build_month_batch(
+        self,
+        year: int,
+        month: int,
+        month_results: List[Any],
+        pending_results: List[Any],
+        start_date: datetime,
+        end_date: datetime
+    ) -> TransactionBatch:
+        """Convert one month's per-card results (and any pending results) into a batch"""
+        accounts = []
+        errors = []
+
+        for index, card in enumerate(self.cards):
+            result = month_results[index]
+            pending = pending_results[index] if pending_results else None
+            pending_data = pending.value if pending is not None else None
+            if pending is not None and not pending.ok:
+                logger.warning(f"Pending transactions failed for card {card['cardUniqueId']}: {pending.error}")
+                errors.append(pending.error)
+            if not result.ok:
+                logger.warning(f"Skipping month {month}/{year} for card {card['cardUniqueId']}: {result.error}")
+                errors.append(result.error)
+                if pending_data is None:
+                    continue
 
             # Convert to Transaction objects
-            transactions = self.convert_transactions(completed_data_list, pending_data)
+            with self.metrics.phase("convert"):
+                transactions = self.convert_transactions([result.value] if result.ok else [], pending_data)
+            self.metrics.count("rows_converted", len(transactions))
 
             # Filter by date
             transactions = [
@@ -635,21 +775,20 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
                 if start_date <= datetime.fromisoformat(t.date) <= end_date
             ]
 
-            logger.info(f"Found {len(transactions)} transactions for card {last_4}")
-
             accounts.append(CardAccount(
-                account_number=last_4,
-                card_unique_id=card_id,
+                account_number=card['last4Digits'],
+                card_unique_id=card['cardUniqueId'],
                 transactions=transactions
             ))
 
-        return accounts
+        return TransactionBatch(year=year, month=month, accounts=accounts, error=errors[0] if errors else None)
 
     def scrape(
         self,
         start_date: Optional[datetime] = None,
         months_back: int = 18,
-        months_forward: int = 1
+        months_forward: int = 1,
+        session_state: Optional[Dict[str, Any]] = None
     ) -> List[CardAccount]:
         """
         Complete scraping flow: login and fetch transactions.
@@ -658,6 +797,7 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
             start_date: Start date for fetching transactions
             months_back: Number of months to fetch backwards (default: 18)
             months_forward: Number of months to fetch forward (default: 1)
+            session_state: Cached session to try before logging in
 
         Returns:
             List of CardAccount objects with transactions
@@ -665,8 +805,8 @@ class CALCreditCardScraper(BaseCreditCardScraper['CALCredentials', 'CardAccount'
         try:
             logger.info("Starting CAL credit card scraper...")
 
-            # Login
-            self.login()
+            # Login (or reuse cached session)
+            self.login_or_restore(session_state)
 
             # Fetch transactions
             accounts = self.fetch_transactions(start_date, months_back, months_forward)
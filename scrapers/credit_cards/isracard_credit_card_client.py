@@ -4,9 +4,8 @@ Automated transaction extraction for Israeli Isracard credit cards
 """
 
 import logging
-import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from dataclasses import dataclass
 from enum import Enum
 
@@ -19,12 +18,16 @@ from scrapers.credit_cards.shared_models import (
     TransactionType,
     Installments,
     Transaction,
+    TransactionBatch,
     IsracardScraperError,
     IsracardLoginError,
     IsracardAPIError,
     IsracardChangePasswordError,
 )
-from scrapers.credit_cards.shared_helpers import get_cookies, extract_installments
+from scrapers.credit_cards.shared_helpers import get_cookies, extract_installments, month_chunks
+from scrapers.utils.concurrent_fetch import AdaptiveRateLimiter
+from scrapers.utils.payload_log import PayloadLog
+from scrapers.utils.wait_conditions import SmartWait
 
 logger = logging.getLogger(__name__)
 
@@ -63,9 +66,79 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
     ALT_SHEKEL_CURRENCY = 'שח'
     SHEKEL_CURRENCY = 'ILS'
 
-    # Rate limiting
-    SLEEP_BETWEEN_REQUESTS = 2.0  # seconds
-    TRANSACTIONS_BATCH_SIZE = 10
+    SESSION_TTL = timedelta(minutes=20)
+
+    # Login page must settle (bot detection scripts done) before API calls
+    PAGE_IDLE_TIME = 1.5  # Seconds without new requests
+    PAGE_LOAD_TIMEOUT = 12
+
+    # Rate limiting - no fixed delay, back off only when the site throttles
+    THROTTLE_STATUS_CODES = (429, 503)
+    THROTTLE_MARKER = 'Block Automation'
+    MAX_THROTTLE_RETRIES = 3
+
+    # Batched in-page fetching. The rate limiter paces script calls, not
+    # single requests: each call runs up to BATCH_CONCURRENCY requests at once,
+    # and a throttled response backs the limiter off before the next call.
+    BATCH_CONCURRENCY = 4  # Parallel fetch() calls inside the page
+    BATCH_MAX_URLS = 40  # Upper bound on URLs per execute_async_script call
+    FETCH_TIMEOUT = 10  # Seconds before an in-page fetch() is aborted
+    SCRIPT_TIMEOUT = 60  # WebDriver script timeout (seconds)
+
+    # Runs a list of GET requests inside the page, BATCH_CONCURRENCY at a time,
+    # and returns every parsed body (or error marker) in one callback
+    BATCH_FETCH_SCRIPT = """
+    const callback = arguments[arguments.length - 1];
+    const urls = arguments[0];
+    const concurrency = arguments[1];
+    const throttleStatuses = arguments[2];
+    const timeoutMs = arguments[3];
+
+    const fetchOne = (url) => {
+        const controller = new AbortController();
+        const timer = setTimeout(() => controller.abort(), timeoutMs);
+        return fetch(url, {
+            method: 'GET',
+            headers: {
+                'Accept': 'application/json, text/plain, */*',
+            },
+            credentials: 'include',
+            signal: controller.signal
+        })
+        .then(response => response.text().then(text => ({
+            status: response.status,
+            text: text
+        })))
+        .finally(() => clearTimeout(timer))
+        .then(result => {
+            if (throttleStatuses.includes(result.status)) {
+                return {_error: 'Throttled', _status: result.status};
+            }
+            if (!result.text || result.text.trim() === '') {
+                return {_error: 'Empty response', _status: result.status};
+            }
+            try {
+                return JSON.parse(result.text);
+            } catch (e) {
+                return {
+                    _error: 'Invalid JSON',
+                    _status: result.status,
+                    _text: result.text.substring(0, 500)
+                };
+            }
+        })
+        .catch(error => ({_error: error.message, _type: 'fetch_error'}));
+    };
+
+    (async () => {
+        const results = [];
+        for (let i = 0; i < urls.length; i += concurrency) {
+            const chunk = urls.slice(i, i + concurrency);
+            results.push(...await Promise.all(chunk.map(fetchOne)));
+        }
+        callback(results);
+    })();
+    """
 
     def __init__(
             self,
@@ -90,25 +163,59 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
         self.company_code = company_code
         self.fetch_categories = fetch_categories
         self.services_url = f"{base_url}/services/ProxyRequestHandler.ashx"
+        self.rate_limiter = AdaptiveRateLimiter()
 
     def _create_driver_config(self) -> DriverConfig:
-        """Isracard requires Hebrew language support."""
-        return DriverConfig(
+        """
+        Third-party scripts stay enabled: the site's bot detection must run
+        before the login API accepts requests. Navigation returns early like
+        every lightweight profile, so callers wait for network idle instead.
+        """
+        return DriverConfig.lightweight(
             headless=self.headless,
-            extra_arguments=['--lang=he-IL']
+            allowed_resources=['trackers']
         )
 
     def setup_driver(self) -> None:
         """Setup driver with Isracard-specific timeouts."""
         super().setup_driver()
         self.driver.implicitly_wait(10)
-        self.driver.set_script_timeout(30)
+        self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
         logger.info("Chrome driver initialized successfully")
 
     def get_cookies_dict(self) -> Dict[str, str]:
         """Get cookies as dictionary using shared helper"""
         return get_cookies(self.driver)
 
+    def build_url(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> str:
+        """
+        Build API URL from endpoint and query parameters.
+
+        Args:
+            endpoint: API endpoint path or full URL
+            params: Query parameters
+
+        Returns:
+            Full request URL
+        """
+        if endpoint.startswith('http'):
+            url = endpoint
+        else:
+            url = f"{self.services_url}?{endpoint}" if '=' in endpoint else self.services_url
+
+        if params:
+            separator = '&' if '?' in url else '?'
+            url += separator + '&'.join(f"{k}={v}" for k, v in params.items())
+        return url
+
+    def is_throttled(self, result: Any) -> bool:
+        """Check whether an in-page fetch result indicates the site is throttling us"""
+        if not isinstance(result, dict) or '_error' not in result:
+            return False
+        if result.get('_status') in self.THROTTLE_STATUS_CODES:
+            return True
+        return self.THROTTLE_MARKER in result.get('_text', '')
+
     def api_request(
             self,
             endpoint: str,
@@ -128,19 +235,18 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
         Returns:
             API response as dictionary
         """
-        # Build URL
-        if endpoint.startswith('http'):
-            url = endpoint
-        else:
-            url = f"{self.services_url}?{endpoint}" if '=' in endpoint else self.services_url
+        url = self.build_url(endpoint, params)
+        key = PayloadLog.request_key(method, url, data)
 
-        # Append query parameters for GET requests
-        if params:
-            separator = '&' if '?' in url else '?'
-            url += separator + '&'.join(f"{k}={v}" for k, v in params.items())
+        # Offline replay - answer from the recorded payloads
+        if self.payload_log.replaying:
+            entry = self.payload_log.lookup(key)
+            if entry is None or 'json' not in entry:
+                raise IsracardAPIError(f"No recorded payload for {url}")
+            return entry['json']
 
-        # Rate limit all API requests to avoid bot detection
-        time.sleep(self.SLEEP_BETWEEN_REQUESTS)
+        # Adaptive rate limit - only delays after the site has throttled us
+        self.rate_limiter.acquire()
 
         # Execute fetch within the page context (like TypeScript fetchPostWithinPage/fetchGetWithinPage)
         # This ensures browser session tokens and CSRF tokens are included automatically
@@ -255,6 +361,11 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
                 result = self.driver.execute_async_script(script, url)
 
             # Check for errors in the response
+            if self.is_throttled(result):
+                self.rate_limiter.backoff()
+            elif isinstance(result, dict):
+                self.rate_limiter.record_success()
+
             if isinstance(result, dict) and '_error' in result:
                 error_msg = f"Request to {url} failed: {result['_error']}"
                 if '_text' in result:
@@ -265,6 +376,7 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
                     logger.error(error_msg)
                 raise IsracardAPIError(error_msg)
 
+            self.payload_log.record(key, {'json': result})
             return result
 
         except IsracardAPIError:
@@ -273,6 +385,136 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
             logger.error(f"API request failed for {url}: {e}")
             raise IsracardAPIError(f"API request failed: {e}")
 
+    def api_request_batch(
+            self,
+            urls: List[str],
+            concurrency: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch many GET URLs within the page context in as few WebDriver round-trips as possible.
+
+        URLs run BATCH_CONCURRENCY at a time inside the page (Promise.all over
+        chunks), each aborted after FETCH_TIMEOUT. A script call gets as many
+        URLs as fit in SCRIPT_TIMEOUT even if every fetch times out (at most
+        BATCH_MAX_URLS). Throttled requests are retried after the adaptive
+        rate limiter backs off; other failures - including a whole script
+        call failing - are logged and returned as None, so one bad month does
+        not sink the whole fetch.
+
+        Args:
+            urls: Full request URLs (see build_url)
+            concurrency: Parallel in-page requests (default BATCH_CONCURRENCY)
+
+        Returns:
+            Parsed JSON responses in the same order as urls (None for failures)
+        """
+        if self.payload_log.replaying:
+            entries = [self.payload_log.lookup(PayloadLog.request_key('GET', url)) for url in urls]
+            return [entry.get('json') if entry else None for entry in entries]
+
+        concurrency = concurrency or self.BATCH_CONCURRENCY
+        # Waves of concurrent fetches that fit in the script timeout, with a margin
+        waves = max(1, (self.SCRIPT_TIMEOUT - 5) // self.FETCH_TIMEOUT)
+        chunk_size = min(self.BATCH_MAX_URLS, concurrency * waves)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        pending = list(range(len(urls)))
+
+        for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+            throttled = []
+
+            for start in range(0, len(pending), chunk_size):
+                chunk = pending[start:start + chunk_size]
+                self.rate_limiter.acquire()
+
+                try:
+                    responses = self.driver.execute_async_script(
+                        self.BATCH_FETCH_SCRIPT,
+                        [urls[i] for i in chunk],
+                        concurrency,
+                        list(self.THROTTLE_STATUS_CODES),
+                        self.FETCH_TIMEOUT * 1000
+                    )
+                except Exception as e:
+                    logger.warning(f"Batch of {len(chunk)} request(s) failed: {e}")
+                    continue
+
+                chunk_throttled = False
+                for index, response in zip(chunk, responses, strict=True):
+                    if self.is_throttled(response):
+                        throttled.append(index)
+                        chunk_throttled = True
+                    elif isinstance(response, dict) and '_error' in response:
+                        logger.warning(f"Request to {urls[index]} failed: {response['_error']}")
+                    else:
+                        results[index] = response
+                        self.payload_log.record(PayloadLog.request_key('GET', urls[index]), {'json': response})
+
+                if chunk_throttled:
+                    self.rate_limiter.backoff()
+                else:
+                    self.rate_limiter.record_success()
+
+            if not throttled:
+                break
+            pending = throttled
+            if attempt < self.MAX_THROTTLE_RETRIES:
+                logger.debug(f"Retrying {len(pending)} throttled request(s)...")
+        else:
+            logger.warning(f"{len(pending)} request(s) still throttled after {self.MAX_THROTTLE_RETRIES} retries")
+
+        return results
+
+    def export_replay_state(self) -> Dict[str, Any]:
+        """Whether categories were fetched (decides which requests replay makes)"""
+        return {'fetch_categories': self.fetch_categories}
+
+    def prepare_replay(self, payload_log: PayloadLog, state: Dict[str, Any]) -> None:
+        """Restore the category setting; in-page requests are answered from the recording"""
+        super().prepare_replay(payload_log, state)
+        self.fetch_categories = state.get('fetch_categories', False)
+
+    def export_session(self) -> Optional[Dict[str, Any]]:
+        """Export browser cookies (with domains) for session reuse"""
+        if not self.driver:
+            return None
+        return {'cookies': self.driver.get_cookies()}
+
+    def restore_session(self, state: Dict[str, Any]) -> bool:
+        """
+        Restore cached cookies into the browser and validate with one dashboard call.
+
+        API calls must run inside the page, so the browser is still started -
+        but the login flow (bot-detection wait, validation and logon requests)
+        is skipped.
+        """
+        cookies = state.get('cookies') or []
+        if not cookies:
+            return False
+
+        try:
+            if not self.driver:
+                self.setup_driver()
+
+            # Cookies can only be set for the domain currently loaded
+            self.driver.get(self.base_url)
+            SmartWait(self.driver).until_network_idle(
+                idle_time=self.PAGE_IDLE_TIME, timeout=self.PAGE_LOAD_TIMEOUT
+            )
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+
+            now = datetime.now()
+            data = self.api_request(self.services_url, params=self.accounts_params(now.year, now.month))
+            if data and data.get('Header', {}).get('Status') == '1':
+                return True
+        except Exception as e:
+            logger.debug(f"Session restore failed: {e}")
+
+        logger.info("Cached Isracard session is no longer valid")
+        if self.driver:
+            self.driver.delete_all_cookies()
+        return False
+
     def login(self) -> bool:
         """
         Perform login to Isracard website.
@@ -284,17 +526,22 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
             IsracardLoginError: If login fails
             IsracardChangePasswordError: If password change required
         """
+        timer = self.login_timer
         try:
             if not self.driver:
-                self.setup_driver()
+                with timer.step("browser_start"):
+                    self.setup_driver()
 
             logger.info(f"Step 1/4: Navigating to {self.base_url}...")
             login_url = f"{self.base_url}/personalarea/Login"
-            self.driver.get(login_url)
+            with timer.step("navigate"):
+                self.driver.get(login_url)
 
-            # Wait for page to fully load and bot detection scripts to complete
-            # Longer wait helps avoid "Block Automation" responses
-            time.sleep(12)
+                # Wait for the page and its bot detection scripts to finish loading;
+                # calling the API earlier triggers "Block Automation" responses
+                SmartWait(self.driver).until_network_idle(
+                    idle_time=self.PAGE_IDLE_TIME, timeout=self.PAGE_LOAD_TIMEOUT
+                )
 
             logger.info("Step 2/4: Validating credentials...")
 
@@ -308,11 +555,12 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
                 'companyCode': self.company_code,
             }
 
-            validate_result = self.api_request(
-                'reqName=ValidateIdData',
-                data=validate_data,
-                method='POST'
-            )
+            with timer.step("validate_id"):
+                validate_result = self.api_request(
+                    'reqName=ValidateIdData',
+                    data=validate_data,
+                    method='POST'
+                )
 
             # Check validation response
             if not validate_result or not validate_result.get('Header') or validate_result['Header'].get(
@@ -345,11 +593,12 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
                 'idType': self.ID_TYPE,
             }
 
-            login_result = self.api_request(
-                'reqName=performLogonI',
-                data=login_data,
-                method='POST'
-            )
+            with timer.step("submit"):
+                login_result = self.api_request(
+                    'reqName=performLogonI',
+                    data=login_data,
+                    method='POST'
+                )
 
             if not login_result:
                 raise IsracardLoginError("No response from login request")
@@ -470,29 +719,43 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
 
         return [self.convert_transaction(txn, processed_date) for txn in filtered_txns]
 
-    def fetch_accounts_for_month(self, year: int, month: int) -> List[Dict[str, Any]]:
+    def accounts_params(self, year: int, month: int) -> Dict[str, str]:
+        """Query parameters for the DashboardMonth (cards list) request"""
+        return {
+            'reqName': 'DashboardMonth',
+            'actionCode': '0',
+            'billingDate': f"{year}-{month:02d}-01",
+            'format': 'Json'
+        }
+
+    def transactions_params(self, year: int, month: int) -> Dict[str, str]:
+        """Query parameters for the CardsTransactionsList request"""
+        return {
+            'reqName': 'CardsTransactionsList',
+            'month': f"{month:02d}",
+            'year': str(year),
+            'requiredDate': 'N',
+        }
+
+    def category_params(self, account_index: int, transaction: Transaction, year: int, month: int) -> Dict[str, str]:
+        """Query parameters for the PirteyIska_204 (transaction details) request"""
+        return {
+            'reqName': 'PirteyIska_204',
+            'CardIndex': str(account_index),
+            'shovarRatz': str(transaction.identifier),
+            'moedChiuv': f"{month:02d}{year}",
+        }
+
+    def parse_accounts(self, data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Fetch accounts (cards) for a specific month.
+        Parse accounts (cards) from a DashboardMonth response.
 
         Args:
-            year: Year
-            month: Month (1-12)
+            data: API response
 
         Returns:
             List of account dictionaries
         """
-        billing_date = f"{year}-{month:02d}-01"
-
-        params = {
-            'reqName': 'DashboardMonth',
-            'actionCode': '0',
-            'billingDate': billing_date,
-            'format': 'Json'
-        }
-
-        logger.debug(f"Fetching accounts for {year}-{month:02d}...")
-        data = self.api_request(self.services_url, params=params)
-
         if not data or data.get('Header', {}).get('Status') != '1':
             return []
 
@@ -518,42 +781,24 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
 
         return accounts
 
-    def fetch_transactions_for_month(
+    def parse_month_transactions(
             self,
-            year: int,
-            month: int,
+            data: Optional[Dict[str, Any]],
+            accounts: List[Dict[str, Any]],
             start_date: datetime
     ) -> Dict[str, CardAccount]:
         """
-        Fetch transactions for a specific month.
+        Parse a CardsTransactionsList response into per-card accounts.
 
         Args:
-            year: Year
-            month: Month (1-12)
+            data: API response
+            accounts: Accounts for the month (from parse_accounts)
             start_date: Filter transactions after this date
 
         Returns:
             Dictionary mapping account numbers to CardAccount objects
         """
-        # Fetch accounts first
-        accounts = self.fetch_accounts_for_month(year, month)
-        if not accounts:
-            logger.debug(f"No accounts found for {year}-{month:02d}")
-            return {}
-
-        # Fetch transactions
-        params = {
-            'reqName': 'CardsTransactionsList',
-            'month': f"{month:02d}",
-            'year': str(year),
-            'requiredDate': 'N',
-        }
-
-        logger.debug(f"Fetching transactions for {year}-{month:02d}...")
-        data = self.api_request(self.services_url, params=params)
-
         if not data or data.get('Header', {}).get('Status') != '1':
-            logger.debug(f"No transaction data for {year}-{month:02d}")
             return {}
 
         cards_bean = data.get('CardsTransactionsListBean')
@@ -577,16 +822,18 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
 
             all_txns: List[Transaction] = []
 
-            for txn_group in current_card_txns_list:
-                # Process Israel transactions
-                if 'txnIsrael' in txn_group and txn_group['txnIsrael']:
-                    txns = self.convert_transactions(txn_group['txnIsrael'], processed_date)
-                    all_txns.extend(txns)
+            with self.metrics.phase("convert"):
+                for txn_group in current_card_txns_list:
+                    # Process Israel transactions
+                    if 'txnIsrael' in txn_group and txn_group['txnIsrael']:
+                        txns = self.convert_transactions(txn_group['txnIsrael'], processed_date)
+                        all_txns.extend(txns)
 
-                # Process abroad transactions
-                if 'txnAbroad' in txn_group and txn_group['txnAbroad']:
-                    txns = self.convert_transactions(txn_group['txnAbroad'], processed_date)
-                    all_txns.extend(txns)
+                    # Process abroad transactions
+                    if 'txnAbroad' in txn_group and txn_group['txnAbroad']:
+                        txns = self.convert_transactions(txn_group['txnAbroad'], processed_date)
+                        all_txns.extend(txns)
+            self.metrics.count("rows_converted", len(all_txns))
 
             # Filter by start date
             filtered_txns = [
@@ -603,6 +850,60 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
 
         return account_txns
 
+    def apply_category(self, transaction: Transaction, data: Optional[Dict[str, Any]]) -> Transaction:
+        """Set transaction category from a PirteyIska_204 response"""
+        if data and 'PirteyIska_204Bean' in data:
+            raw_category = data['PirteyIska_204Bean'].get('sector', '')
+            if raw_category:
+                transaction.category = raw_category.strip()
+        return transaction
+
+    def fetch_accounts_for_month(self, year: int, month: int) -> List[Dict[str, Any]]:
+        """
+        Fetch accounts (cards) for a specific month.
+
+        Args:
+            year: Year
+            month: Month (1-12)
+
+        Returns:
+            List of account dictionaries
+        """
+        logger.debug(f"Fetching accounts for {year}-{month:02d}...")
+        data = self.api_request(self.services_url, params=self.accounts_params(year, month))
+        return self.parse_accounts(data)
+
+    def fetch_transactions_for_month(
+            self,
+            year: int,
+            month: int,
+            start_date: datetime
+    ) -> Dict[str, CardAccount]:
+        """
+        Fetch transactions for a specific month.
+
+        Args:
+            year: Year
+            month: Month (1-12)
+            start_date: Filter transactions after this date
+
+        Returns:
+            Dictionary mapping account numbers to CardAccount objects
+        """
+        # Fetch accounts first
+        accounts = self.fetch_accounts_for_month(year, month)
+        if not accounts:
+            logger.debug(f"No accounts found for {year}-{month:02d}")
+            return {}
+
+        logger.debug(f"Fetching transactions for {year}-{month:02d}...")
+        data = self.api_request(self.services_url, params=self.transactions_params(year, month))
+
+        if not data or data.get('Header', {}).get('Status') != '1':
+            logger.debug(f"No transaction data for {year}-{month:02d}")
+
+        return self.parse_month_transactions(data, accounts, start_date)
+
     def fetch_transaction_category(
             self,
             account_index: int,
@@ -625,22 +926,14 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
         if not transaction.identifier:
             return transaction
 
-        params = {
-            'reqName': 'PirteyIska_204',
-            'CardIndex': str(account_index),
-            'shovarRatz': str(transaction.identifier),
-            'moedChiuv': f"{month:02d}{year}",
-        }
-
         logger.debug(f"Fetching category for transaction {transaction.identifier}")
 
         try:
-            data = self.api_request(self.services_url, params=params)
-
-            if data and 'PirteyIska_204Bean' in data:
-                raw_category = data['PirteyIska_204Bean'].get('sector', '')
-                if raw_category:
-                    transaction.category = raw_category.strip()
+            data = self.api_request(
+                self.services_url,
+                params=self.category_params(account_index, transaction, year, month)
+            )
+            self.apply_category(transaction, data)
         except Exception as e:
             logger.warning(f"Failed to fetch category for transaction {transaction.identifier}: {e}")
 
@@ -663,45 +956,69 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
         Returns:
             Updated CardAccount with categories
         """
-        updated_txns: List[Transaction] = []
+        self.fetch_categories_batch([(account.index, txn, year, month) for txn in account.transactions])
+        return account
 
-        # Process in batches to avoid rate limiting
-        for i in range(0, len(account.transactions), self.TRANSACTIONS_BATCH_SIZE):
-            batch = account.transactions[i:i + self.TRANSACTIONS_BATCH_SIZE]
+    def fetch_categories_batch(self, items: List[tuple[int, Transaction, int, int]]) -> None:
+        """
+        Fetch categories for many transactions in batched in-page requests.
 
-            for txn in batch:
-                updated_txn = self.fetch_transaction_category(account.index, txn, year, month)
-                updated_txns.append(updated_txn)
+        Args:
+            items: (account_index, transaction, year, month) tuples; transactions
+                are updated in place
+        """
+        items = [item for item in items if item[1].identifier]
+        if not items:
+            return
 
-            # Rate limiting between batches
-            if i + self.TRANSACTIONS_BATCH_SIZE < len(account.transactions):
-                time.sleep(self.SLEEP_BETWEEN_REQUESTS)
+        urls = [
+            self.build_url(self.services_url, self.category_params(index, txn, year, month))
+            for index, txn, year, month in items
+        ]
+        try:
+            responses = self.api_request_batch(urls)
+        except Exception as e:
+            # Categories are optional - keep the transactions without them
+            logger.warning(f"Failed to fetch categories for {len(items)} transaction(s): {e}")
+            return
 
-        account.transactions = updated_txns
-        return account
+        for (_, txn, _, _), data in zip(items, responses, strict=True):
+            try:
+                self.apply_category(txn, data)
+            except Exception as e:
+                logger.warning(f"Failed to apply category for transaction {txn.identifier}: {e}")
 
-    def fetch_transactions(
+    def iter_transaction_batches(
             self,
             start_date: Optional[datetime] = None,
             months_back: int = 12,
-            months_forward: int = 1
-    ) -> List[CardAccount]:
+            months_forward: int = 1,
+            end_date: Optional[datetime] = None,
+            months_per_fetch: Optional[int] = None
+    ) -> Iterator[TransactionBatch]:
         """
-        Fetch all transactions for all cards.
+        Fetch transactions for all cards, yielding one batch per month.
+
+        Uses batched in-page requests per round: one round-trip for the
+        months' card lists, one for their transactions and (optionally) one
+        per BATCH_MAX_URLS transactions for categories.
 
         Args:
             start_date: Start date for fetching transactions (default: 12 months ago)
             months_back: Number of months to fetch backwards
             months_forward: Number of months to fetch forward
+            end_date: End date (default: months_forward from now; set by replay)
+            months_per_fetch: Months fetched per round (None = all at once)
 
-        Returns:
-            List of CardAccount objects with transactions
+        Yields:
+            TransactionBatch per month, oldest first
         """
         # Calculate date range
         if start_date is None:
             start_date = datetime.now() - timedelta(days=months_back * 30)
 
-        end_date = datetime.now() + timedelta(days=months_forward * 30)
+        if end_date is None:
+            end_date = datetime.now() + timedelta(days=months_forward * 30)
 
         # Limit to 1 year back (Isracard limitation)
         max_start_date = datetime.now() - timedelta(days=365)
@@ -710,58 +1027,63 @@ class IsracardCreditCardScraper(BaseCreditCardScraper['IsracardCredentials', 'Ca
             start_date = max_start_date
 
         logger.info(f"Fetching transactions from {start_date.date()} to {end_date.date()}")
+        self.fetched_range = (start_date, end_date)
+
+        for months in month_chunks(start_date, end_date, months_per_fetch):
+            yield from self._fetch_month_batches(months, start_date)
+
+    def _fetch_month_batches(self, months: List[tuple[int, int]], start_date: datetime) -> List[TransactionBatch]:
+        """Fetch one round of months and convert them into batches (in the given order)"""
+        # Round-trip 1: card list for every month
+        logger.debug(f"Fetching accounts for {len(months)} month(s)...")
+        dashboard_responses = self.api_request_batch([
+            self.build_url(self.services_url, self.accounts_params(year, month))
+            for year, month in months
+        ])
+
+        errors: Dict[tuple[int, int], Exception] = {}
+        months_with_accounts = []
+        for (year, month), response in zip(months, dashboard_responses, strict=True):
+            if response is None:
+                errors[(year, month)] = IsracardAPIError(f"Failed to fetch accounts for {month}/{year}")
+                continue
+            accounts = self.parse_accounts(response)
+            if accounts:
+                months_with_accounts.append((year, month, accounts))
+
+        # Round-trip 2: transactions for every month that has cards
+        logger.debug(f"Fetching transactions for {len(months_with_accounts)} month(s)...")
+        transaction_responses = self.api_request_batch([
+            self.build_url(self.services_url, self.transactions_params(year, month))
+            for year, month, _ in months_with_accounts
+        ])
+
+        month_accounts: Dict[tuple[int, int], Dict[str, CardAccount]] = {}
+        for (year, month, accounts), response in zip(months_with_accounts, transaction_responses, strict=True):
+            if response is None:
+                errors[(year, month)] = IsracardAPIError(f"Failed to fetch transactions for {month}/{year}")
+                continue
+            month_accounts[(year, month)] = self.parse_month_transactions(response, accounts, start_date)
 
-        # Fetch transactions by month
-        combined_accounts: Dict[str, CardAccount] = {}
-
-        current_date = end_date
-        months_data = []  # For category fetching
-
-        while current_date >= start_date:
-            month = current_date.month
-            year = current_date.year
-
-            month_accounts = self.fetch_transactions_for_month(year, month, start_date)
-            months_data.append((year, month, month_accounts))
-
-            # Merge transactions into combined_accounts
-            for account_number, account in month_accounts.items():
-                if account_number not in combined_accounts:
-                    combined_accounts[account_number] = account
-                else:
-                    # Append transactions to existing account
-                    combined_accounts[account_number].transactions.extend(account.transactions)
-
-            # Move to previous month
-            if current_date.month == 1:
-                current_date = current_date.replace(year=current_date.year - 1, month=12, day=1)
-            else:
-                current_date = current_date.replace(month=current_date.month - 1, day=1)
-
-        # Fetch categories if enabled
+        # Fetch categories if enabled (each transaction against its own billing month)
         if self.fetch_categories:
             logger.info("Fetching transaction categories...")
-            for year, month, month_accounts in months_data:
-                for account_number in month_accounts:
-                    if account_number in combined_accounts:
-                        logger.debug(f"Fetching categories for card {account_number}, month {year}-{month:02d}")
-                        combined_accounts[account_number] = self.fetch_categories_for_account(
-                            combined_accounts[account_number],
-                            year,
-                            month
-                        )
-
-        # Convert to list and sort transactions
-        accounts = []
-        for account in combined_accounts.values():
-            # Sort by date
-            account.transactions.sort(key=lambda t: t.date, reverse=True)
-
-            logger.info(f"Found {len(account.transactions)} transactions for card {account.account_number}")
-            accounts.append(account)
-
-        return accounts
-
+            self.fetch_categories_batch([
+                (account.index, txn, year, month)
+                for (year, month), accounts in month_accounts.items()
+                for account in accounts.values()
+                for txn in account.transactions
+            ])
+
+        return [
+            TransactionBatch(
+                year=year,
+                month=month,
+                accounts=list(month_accounts.get((year, month), {}).values()),
+                error=errors.get((year, month))
+            )
+            for year, month in months
+        ]
 
 def main():
     """Main entry point for Isracard Credit Card Scraper"""
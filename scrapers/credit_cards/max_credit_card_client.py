@@ -5,9 +5,8 @@ Automated transaction extraction for Israeli Max credit cards
 
 import json
 import logging
-import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from dataclasses import dataclass
 from enum import Enum
 
@@ -24,11 +23,16 @@ from scrapers.credit_cards.shared_models import (
     TransactionType,
     Installments,
     Transaction,
+    TransactionBatch,
     MaxScraperError,
     MaxLoginError,
     MaxAPIError,
 )
-from scrapers.credit_cards.shared_helpers import get_cookies, extract_installments
+from scrapers.credit_cards.shared_helpers import get_cookies, extract_installments, month_chunks
+from scrapers.utils.concurrent_fetch import fetch_concurrently
+from scrapers.utils.http_session import create_http_session
+from scrapers.utils.payload_log import PayloadLog
+from scrapers.utils.wait_conditions import SmartWait
 
 logger = logging.getLogger(__name__)
 
@@ -100,9 +104,32 @@ class MaxCreditCardScraper(BaseCreditCardScraper['MaxCredentials', 'CardAccount'
     CURRENCY_USD = 840
     CURRENCY_EUR = 978
 
-    def __init__(self, credentials: MaxCredentials, headless: bool = True):
-        super().__init__(credentials, headless)
+    SESSION_TTL = timedelta(minutes=30)
+
+    # Max seconds to wait for the login outcome after submitting the form
+    LOGIN_TIMEOUT = 3
+
+    # Max serves all cards per month request - parallelize across months
+    FETCH_CONCURRENCY = 3
+    FETCH_RATE_LIMIT = 3.0
+
+    def __init__(
+        self,
+        credentials: MaxCredentials,
+        headless: bool = True,
+        max_concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = None
+    ):
+        super().__init__(credentials, headless, max_concurrency, rate_limit)
         self.categories: Dict[int, str] = {}
+        self._session_cookies: Optional[Dict[str, str]] = None  # Restored from cache
+
+    def _create_driver_config(self) -> DriverConfig:
+        """Login links/tabs are icon-based - keep images so they render clickable."""
+        return DriverConfig.lightweight(
+            headless=self.headless,
+            allowed_resources=['images', 'svg']
+        )
 
     def wait_for_element(self, selector: str, timeout: int = 10, clickable: bool = False):
         """Wait for element to be present or clickable"""
@@ -128,66 +155,82 @@ class MaxCreditCardScraper(BaseCreditCardScraper['MaxCredentials', 'CardAccount'
         """
         Perform login to Max website.
 
+        After submitting, proceeds as soon as the success URL, the
+        password-expired URL or an error message appears (bounded by
+        LOGIN_TIMEOUT) instead of sleeping.
+
         Returns:
             True if login successful
 
         Raises:
             MaxLoginError: If login fails
         """
+        timer = self.login_timer
         try:
             if not self.driver:
-                self.setup_driver()
+                with timer.step("browser_start"):
+                    self.setup_driver()
+            wait = SmartWait(self.driver, default_timeout=10)
 
             logger.info(f"Step 1/4: Navigating to {self.LOGIN_URL}...")
-            self.driver.get(self.LOGIN_URL)
+            with timer.step("navigate"):
+                self.driver.get(self.LOGIN_URL)
 
-            # Wait for page to load
-            logger.debug("Waiting for page to load...")
-            self.wait_for_element('.personal-area > a.go-to-personal-area')
+                # Wait for page to load
+                logger.debug("Waiting for page to load...")
+                self.wait_for_element('.personal-area > a.go-to-personal-area')
 
-            # Close popup if present
-            if self.element_present('#closePopup'):
-                logger.debug("Closing popup...")
-                self.click_button('#closePopup')
+                # Close popup if present
+                if self.element_present('#closePopup'):
+                    logger.debug("Closing popup...")
+                    self.click_button('#closePopup')
 
-            # Click personal area link
-            logger.debug("Clicking personal area link...")
-            self.click_button('.personal-area > a.go-to-personal-area')
+                # Click personal area link
+                logger.debug("Clicking personal area link...")
+                self.click_button('.personal-area > a.go-to-personal-area')
 
-            # Click private login if present
-            if self.element_present('.login-link#private'):
-                logger.debug("Clicking private login link...")
-                self.click_button('.login-link#private')
+                # Click private login if present
+                if self.element_present('.login-link#private'):
+                    logger.debug("Clicking private login link...")
+                    self.click_button('.login-link#private')
 
-            # Click password login tab
-            logger.debug("Clicking password login tab...")
-            self.wait_for_element('#login-password-link', clickable=True)
-            self.click_button('#login-password-link')
+                # Click password login tab
+                logger.debug("Clicking password login tab...")
+                self.wait_for_element('#login-password-link', clickable=True)
+                self.click_button('#login-password-link')
 
-            # Wait for password login form to be active
-            logger.debug("Waiting for password login form...")
-            self.wait_for_element('#login-password.tab-pane.active app-user-login-form')
+                # Wait for password login form to be active
+                logger.debug("Waiting for password login form...")
+                self.wait_for_element('#login-password.tab-pane.active app-user-login-form')
 
             # Enter username
             logger.info("Step 2/4: Entering credentials...")
-            username_field = self.wait_for_element('#user-name')
-            username_field.clear()
-            username_field.send_keys(self.credentials.username)
+            with timer.step("fill_credentials"):
+                username_field = self.wait_for_element('#user-name')
+                username_field.clear()
+                username_field.send_keys(self.credentials.username)
 
-            # Enter password
-            logger.debug("Entering password...")
-            password_field = self.driver.find_element(By.CSS_SELECTOR, '#password')
-            password_field.clear()
-            password_field.send_keys(self.credentials.password)
+                # Enter password
+                logger.debug("Entering password...")
+                password_field = self.driver.find_element(By.CSS_SELECTOR, '#password')
+                password_field.clear()
+                password_field.send_keys(self.credentials.password)
 
             # Submit login
             logger.info("Step 3/4: Submitting login form...")
-            submit_btn = self.driver.find_element(By.CSS_SELECTOR, 'app-user-login-form .general-button.send-me-code')
-            submit_btn.click()
-
-            # Wait for redirect or error
-            logger.debug("Waiting for login to complete...")
-            time.sleep(3)
+            with timer.step("submit"):
+                submit_btn = self.driver.find_element(By.CSS_SELECTOR, 'app-user-login-form .general-button.send-me-code')
+                submit_btn.click()
+
+                # Wait for redirect or error
+                logger.debug("Waiting for login to complete...")
+                outcome = wait.until_any({
+                    'success': lambda d: self.SUCCESS_URL in d.current_url,
+                    'password_expired': lambda d: self.PASSWORD_EXPIRED_URL in d.current_url,
+                    'invalid_details': lambda d: self.element_present(self.INVALID_DETAILS_SELECTOR),
+                    'login_error': lambda d: self.element_present(self.LOGIN_ERROR_SELECTOR),
+                }, timeout=self.LOGIN_TIMEOUT)
+                logger.debug(f"Login outcome: {outcome}")
 
             current_url = self.driver.current_url
             logger.debug(f"Current URL: {current_url}")
@@ -219,15 +262,57 @@ class MaxCreditCardScraper(BaseCreditCardScraper['MaxCredentials', 'CardAccount'
         """Get cookies as dictionary using shared helper"""
         return get_cookies(self.driver)
 
+    def _create_http_session(self) -> requests.Session:
+        """Create pooled API session seeded with the login cookies (browser or cache)"""
+        cookies = self._session_cookies if self._session_cookies is not None else self.get_cookies_dict()
+        return create_http_session(cookies=cookies)
+
+    def export_session(self) -> Optional[Dict[str, Any]]:
+        """Export login cookies for session reuse"""
+        if not self.driver:
+            return None
+        return {'cookies': self.get_cookies_dict()}
+
+    def restore_session(self, state: Dict[str, Any]) -> bool:
+        """Restore cached cookies, validated with one current-month transactions call"""
+        self._session_cookies = state.get('cookies') or None
+
+        if self._session_cookies and self.validate_session():
+            return True
+
+        logger.info("Cached Max session is no longer valid")
+        self._session_cookies = None
+        self.reset_http_session()
+        return False
+
+    def prepare_replay(self, payload_log: PayloadLog, state: Dict[str, Any]) -> None:
+        """No browser cookies on replay - requests are answered from the recording"""
+        super().prepare_replay(payload_log, state)
+        self._session_cookies = {}
+
+    def validate_session(self) -> bool:
+        """
+        Check the current cookies with a single lightweight API call.
+
+        Returns:
+            True if the API returns transaction data
+        """
+        now = datetime.now()
+        try:
+            response = self.http_session.get(self.get_transactions_url(now.month, now.year), timeout=15)
+            if response.status_code != 200:
+                return False
+            data = response.json()
+            return isinstance(data, dict) and isinstance(data.get('result'), dict)
+        except (requests.RequestException, ValueError):
+            return False
+
     def load_categories(self):
         """Load transaction categories from API"""
         try:
             logger.debug("Loading categories...")
-            cookies = self.get_cookies_dict()
-
-            response = requests.get(
+            response = self.http_session.get(
                 self.CATEGORIES_ENDPOINT,
-                cookies=cookies,
                 timeout=30
             )
             response.raise_for_status()
@@ -290,9 +375,7 @@ class MaxCreditCardScraper(BaseCreditCardScraper['MaxCredentials', 'CardAccount'
         try:
             logger.debug(f"Fetching transactions for {month}/{year}...")
             url = self.get_transactions_url(month, year)
-            cookies = self.get_cookies_dict()
-
-            response = requests.get(url, cookies=cookies, timeout=30)
+            response = self.http_session.get(url, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -311,17 +394,21 @@ class MaxCreditCardScraper(BaseCreditCardScraper['MaxCredentials', 'CardAccount'
                 logger.debug(f"No transactions found for {month}/{year}")
                 return transactions_by_card
 
-            for raw_txn in data['result']['transactions']:
-                # Filter out summary rows without plan type
-                if not raw_txn.get('planName'):
-                    continue
+            converted = 0
+            with self.metrics.phase("convert"):
+                for raw_txn in data['result']['transactions']:
+                    # Filter out summary rows without plan type
+                    if not raw_txn.get('planName'):
+                        continue
 
-                card_number = raw_txn.get('shortCardNumber', 'unknown')
-                if card_number not in transactions_by_card:
-                    transactions_by_card[card_number] = []
+                    card_number = raw_txn.get('shortCardNumber', 'unknown')
+                    if card_number not in transactions_by_card:
+                        transactions_by_card[card_number] = []
 
-                transaction = self._convert_transaction(raw_txn)
-                transactions_by_card[card_number].append(transaction)
+                    transaction = self._convert_transaction(raw_txn)
+                    transactions_by_card[card_number].append(transaction)
+                    converted += 1
+            self.metrics.count("rows_converted", converted)
 
             return transactions_by_card
 
@@ -466,28 +553,36 @@ class MaxCreditCardScraper(BaseCreditCardScraper['MaxCredentials', 'CardAccount'
             installments=installments,
         )
 
-    def fetch_transactions(
+    def iter_transaction_batches(
         self,
         start_date: Optional[datetime] = None,
         months_back: int = 12,
-        months_forward: int = 1
-    ) -> List[CardAccount]:
+        months_forward: int = 1,
+        end_date: Optional[datetime] = None,
+        months_per_fetch: Optional[int] = None
+    ) -> Iterator[TransactionBatch]:
         """
-        Fetch all transactions for all cards.
+        Fetch transactions for all cards, yielding one batch per month.
+
+        The months of each round are fetched concurrently; one response
+        covers every card.
 
         Args:
             start_date: Start date for fetching transactions (default: 12 months ago)
             months_back: Number of months to fetch backwards
             months_forward: Number of months to fetch forward
+            end_date: End date (default: months_forward from now; set by replay)
+            months_per_fetch: Months fetched per round (None = all at once)
 
-        Returns:
-            List of CardAccount objects with transactions
+        Yields:
+            TransactionBatch per month, oldest first
         """
         # Calculate date range
         if start_date is None:
             start_date = datetime.now() - timedelta(days=months_back * 30)
 
-        end_date = datetime.now() + timedelta(days=months_forward * 30)
+        if end_date is None:
+            end_date = datetime.now() + timedelta(days=months_forward * 30)
 
         # Max allows up to 4 years back
         max_start_date = datetime.now() - timedelta(days=4 * 365)
@@ -496,53 +591,44 @@ class MaxCreditCardScraper(BaseCreditCardScraper['MaxCredentials', 'CardAccount'
             start_date = max_start_date
 
         logger.info(f"Fetching transactions from {start_date.date()} to {end_date.date()}")
+        self.fetched_range = (start_date, end_date)
 
         # Load categories
         self.load_categories()
 
-        # Fetch transactions by month
-        all_transactions: Dict[str, List[Transaction]] = {}
-
-        current_date = end_date
-        while current_date >= start_date:
-            month = current_date.month
-            year = current_date.year
-
-            month_transactions = self.fetch_transactions_for_month(month, year)
-
-            # Merge into all_transactions
-            for card_number, transactions in month_transactions.items():
-                if card_number not in all_transactions:
-                    all_transactions[card_number] = []
-                all_transactions[card_number].extend(transactions)
-
-            # Move to previous month (set day=1 to avoid "day out of range" errors)
-            if current_date.month == 1:
-                current_date = current_date.replace(year=current_date.year - 1, month=12, day=1)
-            else:
-                current_date = current_date.replace(month=current_date.month - 1, day=1)
-
-        # Filter and sort transactions
-        accounts = []
-        for card_number, transactions in all_transactions.items():
-            # Filter by date
-            filtered_txns = [
-                t for t in transactions
-                if start_date <= datetime.fromisoformat(t.date) <= end_date
-            ]
-
-            # Sort by date
-            filtered_txns.sort(key=lambda t: t.date, reverse=True)
-
-            logger.info(f"Found {len(filtered_txns)} transactions for card {card_number}")
+        chunks = month_chunks(start_date, end_date, months_per_fetch)
+        logger.info(
+            f"Fetching {sum(len(months) for months in chunks)} month(s) "
+            f"with up to {self.max_concurrency} concurrent requests..."
+        )
 
-            accounts.append(CardAccount(
-                account_number=card_number,
-                transactions=filtered_txns
-            ))
+        for months in chunks:
+            # Results come back in request order (oldest month first)
+            month_results = fetch_concurrently(
+                lambda key: self.fetch_transactions_for_month(*key),
+                [(month, year) for year, month in months],
+                max_workers=self.max_concurrency,
+                rate_limiter=self.rate_limiter
+            )
 
-        return accounts
+            for result in month_results:
+                month, year = result.key
+                if not result.ok:
+                    yield TransactionBatch(year=year, month=month, accounts=[], error=result.error)
+                    continue
 
+                accounts = [
+                    CardAccount(
+                        account_number=card_number,
+                        # Filter by date
+                        transactions=[
+                            t for t in transactions
+                            if start_date <= datetime.fromisoformat(t.date) <= end_date
+                        ]
+                    )
+                    for card_number, transactions in result.value.items()
+                ]
+                yield TransactionBatch(year=year, month=month, accounts=accounts)
 
 def main():
     """Main entry point for Max Credit Card Scraper"""
@@ -31,6 +31,23 @@ def iterate_months(start_date: date, end_date: date) -> Generator[tuple[int, int
             current = current.replace(month=current.month - 1, day=1)
 
 
+def month_chunks(start_date: date, end_date: date, size: Optional[int] = None) -> List[List[tuple[int, int]]]:
+    """
+    Split the months of a date range into groups, oldest month first.
+
+    Args:
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (inclusive)
+        size: Months per group (None = a single group)
+
+    Returns:
+        Lists of (year, month) tuples in chronological order
+    """
+    months = list(reversed(list(iterate_months(start_date, end_date))))
+    size = size or len(months) or 1
+    return [months[i:i + size] for i in range(0, len(months), size)]
+
+
 def calculate_date_range(months_back: int, months_forward: int = 1) -> tuple[date, date]:
     """
     Calculate start and end dates for transaction fetching.
@@ -5,9 +5,9 @@ This module contains common enums, dataclasses, and exceptions
 used across CAL, Max, and Isracard scrapers.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 
 # ==================== Transaction Enums ====================
@@ -56,6 +56,26 @@ class Transaction:
     installments: Optional[Installments] = None
 
 
+@dataclass
+class TransactionBatch:
+    """
+    One month of transactions for every card.
+
+    Yielded by scrapers' iter_transaction_batches(), oldest month first, so
+    a sync can save each month as it arrives.
+    """
+    year: int
+    month: int
+    accounts: List[Any]  # Scraper's CardAccount per card, with this month's transactions
+    error: Optional[Exception] = None  # Month could not be fetched (accounts is empty)
+    payloads: Dict[str, Any] = field(default_factory=dict)  # Raw API payloads recorded since the last batch
+
+    @property
+    def label(self) -> str:
+        """Month as YYYY-MM"""
+        return f"{self.year}-{self.month:02d}"
+
+
 # ==================== Base Exceptions ====================
 
 class CreditCardScraperError(Exception):
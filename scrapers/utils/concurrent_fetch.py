@@ -0,0 +1,172 @@
+"""
+Bounded concurrent fetching for post-login scraper API calls.
+
+Only the Selenium login has to be serial - the per-card/per-month API calls
+that follow are independent. fetch_concurrently() runs them on a small
+thread pool, paced by a shared rate limiter, and returns results in input
+order with each failure isolated to its own item. AdaptiveRateLimiter is
+for sites where a fixed pace is too slow - it only slows down once throttled.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar('K')
+T = TypeVar('T')
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter spacing call starts evenly at a maximum rate.
+
+    Example:
+        limiter = RateLimiter(5.0)  # at most 5 calls per second
+        limiter.acquire()
+        do_request()
+    """
+
+    def __init__(self, rate_per_second: Optional[float]):
+        """
+        Args:
+            rate_per_second: Maximum call rate (None or <= 0 disables limiting)
+        """
+        self.interval = 1.0 / rate_per_second if rate_per_second and rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may start its next call."""
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AdaptiveRateLimiter:
+    """
+    Limiter that runs at full speed until the site throttles.
+
+    Each backoff() doubles the delay between calls (up to max_backoff);
+    each record_success() halves it, dropping back to min_interval once it
+    falls below initial_backoff.
+    Shares the acquire() interface with RateLimiter.
+
+    Example:
+        limiter = AdaptiveRateLimiter()
+        limiter.acquire()
+        response = do_request()
+        if response.status == 429:
+            limiter.backoff()
+        else:
+            limiter.record_success()
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.0,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 30.0
+    ):
+        """
+        Args:
+            min_interval: Delay between calls while not throttled (seconds)
+            initial_backoff: Delay after the first throttled response (seconds)
+            max_backoff: Upper bound for the delay (seconds)
+        """
+        self.min_interval = min_interval
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._delay = min_interval
+        self._lock = threading.Lock()
+
+    @property
+    def delay(self) -> float:
+        """Current delay applied by acquire()."""
+        return self._delay
+
+    def acquire(self) -> None:
+        """Block for the current delay before the caller's next call."""
+        delay = self._delay
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self) -> None:
+        """Record a throttled response - increase the delay."""
+        with self._lock:
+            self._delay = min(self.max_backoff, max(self.initial_backoff, self._delay * 2))
+        logger.warning(f"Rate limited by server - backing off to {self._delay:.1f}s between requests")
+
+    def record_success(self) -> None:
+        """Record an unthrottled response - decay the delay back toward min_interval."""
+        with self._lock:
+            if self._delay <= self.min_interval:
+                return
+            delay = self._delay / 2
+            self._delay = delay if delay >= self.initial_backoff else self.min_interval
+
+
+@dataclass
+class FetchResult(Generic[K, T]):
+    """Outcome of fetching a single item."""
+    key: K
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def fetch_concurrently(
+    fetch: Callable[[K], T],
+    keys: Sequence[K],
+    max_workers: int = 4,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> List[FetchResult[K, T]]:
+    """
+    Call fetch(key) for every key on a bounded thread pool.
+
+    Exceptions are captured per key rather than raised, so one failing
+    month does not abort (or wait on) the others.
+
+    Args:
+        fetch: Function fetching a single item
+        keys: Items to fetch (e.g. (card_id, month, year) tuples)
+        max_workers: Maximum concurrent calls
+        rate_limiter: Optional limiter shared by all workers
+
+    Returns:
+        List of FetchResult in the same order as keys
+    """
+    def run(key: K) -> FetchResult[K, T]:
+        if rate_limiter:
+            rate_limiter.acquire()
+        try:
+            return FetchResult(key=key, value=fetch(key))
+        except Exception as e:
+            logger.debug(f"Fetch failed for {key}: {e}")
+            return FetchResult(key=key, error=e)
+
+    if not keys:
+        return []
+
+    workers = max(1, min(max_workers, len(keys)))
+    if workers == 1:
+        return [run(key) for key in keys]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch') as executor:
+        # map() yields in submission order regardless of completion order
+        return list(executor.map(run, keys))
@@ -0,0 +1,84 @@
+"""
+Pooled HTTP sessions for scraper API calls.
+
+After the Selenium login, scrapers hit the same API host once per card and
+month. A shared requests.Session keeps those connections alive (no new TLS
+handshake per call) and retries transient failures at the transport level.
+"""
+
+import logging
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing - one pool per host, each holding up to POOL_MAXSIZE
+# keep-alive connections (enough for concurrent month fetches)
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10
+
+# Transport-level retry: connection resets, read errors and 5xx responses
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+def create_http_session(
+    headers: Optional[Dict[str, str]] = None,
+    cookies: Optional[Dict[str, str]] = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    status_forcelist: Iterable[int] = RETRY_STATUS_CODES,
+) -> requests.Session:
+    """
+    Create a keep-alive session with a tuned connection pool and retries.
+
+    POST is retried as well - the scraper APIs use POST for read-only
+    queries, so repeating a request is safe.
+
+    Args:
+        headers: Default headers sent with every request (e.g. auth token)
+        cookies: Cookies to seed the session with (e.g. from Selenium)
+        pool_connections: Number of per-host pools to cache
+        pool_maxsize: Maximum keep-alive connections per host
+        max_retries: Total retries for connection errors and 5xx responses
+        backoff_factor: Exponential backoff factor between retries (seconds)
+        status_forcelist: HTTP status codes that trigger a retry
+
+    Returns:
+        Configured requests.Session (caller closes it)
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=tuple(status_forcelist),
+        allowed_methods=frozenset({'GET', 'POST'}),
+        raise_on_status=False,  # Let callers see the final response via raise_for_status()
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    if headers:
+        session.headers.update(headers)
+    if cookies:
+        session.cookies.update(cookies)
+
+    logger.debug(
+        f"HTTP session created (pool_maxsize={pool_maxsize}, max_retries={max_retries})"
+    )
+    return session
@@ -0,0 +1,143 @@
+"""
+Raw API payload capture and replay for scrapers
+
+While a scraper fetches data after login, every API response is recorded by
+request (method, URL and body). The recording is landed with the sync (see
+config.landing_store) and can later be served back to the same scraper code
+instead of the network, so conversion and persistence can be rerun - or
+benchmarked - without a browser or login.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class PayloadNotRecorded(requests.ConnectionError):
+    """Replay asked for a request that is not part of the recording"""
+
+
+class PayloadLog:
+    """
+    Recorded API responses of one scrape, keyed by request
+
+    Entries are {'status': int, 'json': payload} ({'text': body} instead of
+    'json' when the response was not JSON).
+
+    Usage:
+        log = PayloadLog()                   # Recording
+        log.attach(http_session)             # requests sessions record automatically
+        log.record(PayloadLog.request_key('GET', url), {'json': data})
+
+        log = PayloadLog(replay=entries)     # Replay
+        log.attach(http_session)             # served from entries, no network
+        log.lookup(PayloadLog.request_key('GET', url))
+
+    Safe to record from several fetch threads at once.
+    """
+
+    def __init__(self, replay: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Args:
+            replay: Recorded entries to serve instead of recording new ones
+        """
+        self.entries: Dict[str, Dict[str, Any]] = dict(replay or {})
+        self.replaying = replay is not None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_key(method: str, url: str, body: Any = None) -> str:
+        """
+        Build the key identifying a request
+
+        Args:
+            method: HTTP method
+            url: Full request URL (including query string)
+            body: Request body (bytes, str or JSON-serializable data)
+
+        Returns:
+            Key such as "POST https://api/x {...}"
+        """
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', errors='replace')
+        elif body is not None and not isinstance(body, str):
+            body = json.dumps(body, sort_keys=True, ensure_ascii=False)
+        key = f"{method.upper()} {url}"
+        return f"{key} {body}" if body else key
+
+    def record(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a response (ignored while replaying)"""
+        if self.replaying:
+            return
+        with self._lock:
+            self.entries[key] = entry
+
+    def drain(self) -> Dict[str, Dict[str, Any]]:
+        """Take the entries recorded so far, leaving the log empty"""
+        with self._lock:
+            entries, self.entries = self.entries, {}
+        return entries
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a recorded response, or None if the request was not recorded"""
+        return self.entries.get(key)
+
+    def attach(self, session: requests.Session) -> None:
+        """
+        Record a requests session's responses, or serve them when replaying
+
+        Args:
+            session: Session used for the scraper's API calls
+        """
+        if self.replaying:
+            adapter = ReplayAdapter(self)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        else:
+            session.hooks['response'].append(self._record_response)
+
+    def _record_response(self, response: requests.Response, *args, **kwargs) -> requests.Response:
+        request = response.request
+        try:
+            entry = {'status': response.status_code, 'json': response.json()}
+        except ValueError:
+            entry = {'status': response.status_code, 'text': response.text}
+        self.record(self.request_key(request.method, request.url, request.body), entry)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter answering requests from a PayloadLog"""
+
+    def __init__(self, payload_log: PayloadLog):
+        super().__init__()
+        self.payload_log = payload_log
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        entry = self.payload_log.lookup(PayloadLog.request_key(request.method, request.url, request.body))
+        if entry is None:
+            raise PayloadNotRecorded(f"No recorded payload for {request.method} {request.url}", request=request)
+
+        if 'json' in entry:
+            body, content_type = json.dumps(entry['json'], ensure_ascii=False), 'application/json'
+        else:
+            body, content_type = entry.get('text', ''), 'text/plain'
+
+        response = requests.Response()
+        response.status_code = entry.get('status', 200)
+        response._content = body.encode('utf-8')
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = content_type
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,69 @@
+"""
+Per-step timing for scraper flows (login, MFA, data fetch)
+
+Records how long each named step took so slow or regressing steps show up
+in sync history instead of only in debug logs.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Generator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StepTimer:
+    """
+    Collects wall-clock durations of named steps
+
+    Usage:
+        timer = StepTimer()
+        with timer.step("navigate"):
+            driver.get(url)
+        with timer.step("submit"):
+            ...
+        timer.as_dict()  # {'navigate': 1.234, 'submit': 0.871}
+
+    A step that raises is still recorded (time until the failure).
+    """
+
+    def __init__(self):
+        self.steps: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def step(self, name: str) -> Generator[None, None, None]:
+        """
+        Time a block as a named step
+
+        Args:
+            name: Step name (repeated names are summed in as_dict)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.steps.append((name, elapsed))
+            logger.debug(f"Step '{name}' took {elapsed:.2f}s")
+
+    @property
+    def total(self) -> float:
+        """Total seconds across all recorded steps"""
+        return sum(elapsed for _, elapsed in self.steps)
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Get step durations in seconds, in first-run order
+
+        Returns:
+            Dict of step name -> seconds (rounded to ms)
+        """
+        durations: Dict[str, float] = {}
+        for name, elapsed in self.steps:
+            durations[name] = durations.get(name, 0.0) + elapsed
+        return {name: round(elapsed, 3) for name, elapsed in durations.items()}
+
+    def reset(self) -> None:
+        """Forget all recorded steps"""
+        self.steps.clear()
@@ -0,0 +1,132 @@
+"""
+Per-phase timings and counters of a sync (browser, login, MFA, fetch, save)
+
+Scrapers and services report into one SyncMetrics per sync; it is stored
+in the sync history record so a slow or regressing phase can be told apart
+from the others.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List, Optional
+
+import requests
+
+# Phases reported by scrapers and services, in the order a sync runs them
+PHASES = ("browser", "login", "mfa", "fetch", "convert", "persist", "tagging", "rules")
+
+
+class SyncMetrics:
+    """
+    Collects exclusive phase durations and counters of one sync (thread-safe)
+
+    Usage:
+        metrics = SyncMetrics()
+        metrics.attach(http_session)          # counts requests / bytes_received
+        with metrics.phase("fetch"):
+            data = fetch()
+            with metrics.phase("convert"):    # not counted as fetch time
+                rows = convert(data)
+            metrics.count("rows_converted", len(rows))
+        metrics.as_dict()
+        # {'phases': {'fetch': 1.2, 'convert': 0.05}, 'counters': {'requests': 3, ...}}
+
+    A phase started inside another on the same thread is subtracted from
+    the outer one, so phases add up to the time they cover. Phases timed on
+    worker threads are summed, so with concurrent fetches they can add up
+    to more than the wall-clock time.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'SyncMetrics':
+        """
+        Rebuild metrics stored with as_dict()
+
+        Args:
+            data: Stored metrics (None for empty metrics)
+        """
+        metrics = cls()
+        if data:
+            metrics.phases.update(data.get('phases') or {})
+            metrics.counters.update(data.get('counters') or {})
+        return metrics
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """
+        Time a block as a named phase
+
+        Args:
+            name: Phase name (repeated names are summed)
+        """
+        stack: List[float] = self._nested()
+        start = time.perf_counter()
+        stack.append(0.0)  # Time of phases nested in this one
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.add_time(name, elapsed - nested)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add seconds to a phase timed elsewhere"""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a counter (requests, rows_converted, queries, ...)"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def attach(self, session: requests.Session) -> None:
+        """
+        Count a requests session's responses and their bytes
+
+        Args:
+            session: Session used for the scraper's API calls
+        """
+        session.hooks['response'].append(self._count_response)
+
+    def merge(self, other: 'SyncMetrics') -> None:
+        """Add another sync's (or stage's) phases and counters to these"""
+        data = other.as_dict(rounded=False)
+        for name, seconds in data['phases'].items():
+            self.add_time(name, seconds)
+        for name, amount in data['counters'].items():
+            self.count(name, amount)
+
+    def as_dict(self, rounded: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Get phases (seconds, in first-run order) and counters
+
+        Args:
+            rounded: Round seconds to ms (for storage and display)
+        """
+        with self._lock:
+            phases = dict(self.phases)
+            counters = dict(self.counters)
+        if rounded:
+            phases = {name: round(seconds, 3) for name, seconds in phases.items()}
+        return {'phases': phases, 'counters': counters}
+
+    def _nested(self) -> List[float]:
+        """This thread's stack of open phases"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _count_response(self, response: requests.Response, *args, **kwargs) -> requests.Response:
+        self.count('requests')
+        self.count('bytes_received', len(response.content or b''))
+        return response
@@ -8,8 +8,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, Any, List, Sequence
+import json
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +24,14 @@ class SmartWait:
     More reliable and faster than fixed sleep times.
     """
 
+    POLL_INTERVAL = 0.25
+
     def __init__(self, driver: WebDriver, default_timeout: int = 30):
         self.driver = driver
         self.default_timeout = default_timeout
+        # Performance log entries drained while waiting for network events.
+        # get_log() empties the browser buffer, so keep them for later parsing.
+        self.network_events: List[Dict[str, Any]] = []
 
     def until_element_present(
         self,
@@ -247,4 +254,184 @@ class SmartWait:
             return True
         except TimeoutException:
             logger.error(f"Element '{selector}' did not have text '{text}' after {timeout}s")
-            raise
\ No newline at end of file
+            raise
+
+    def until_any(
+        self,
+        conditions: Dict[str, Callable],
+        timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Wait until the first of several named conditions is met
+
+        Conditions that raise are treated as not met yet. Unlike the other
+        waits this does not raise on timeout, so a former fixed sleep can be
+        replaced by an upper bound and the caller's existing checks still run.
+
+        Args:
+            conditions: Mapping of name -> callable(driver) returning truthy when met
+            timeout: Timeout in seconds (uses default if not specified)
+
+        Returns:
+            Name of the first condition met, or None on timeout
+        """
+        timeout = timeout or self.default_timeout
+        deadline = time.monotonic() + timeout
+        logger.debug(f"Waiting for any of: {', '.join(conditions)}")
+
+        while True:
+            for name, condition in conditions.items():
+                try:
+                    if condition(self.driver):
+                        logger.debug(f"Condition met: {name}")
+                        return name
+                except Exception:
+                    continue
+            if time.monotonic() >= deadline:
+                logger.debug(f"No condition met after {timeout}s: {', '.join(conditions)}")
+                return None
+            time.sleep(self.POLL_INTERVAL)
+
+    def until_storage_item(
+        self,
+        key: str,
+        path: Sequence[str] = (),
+        storage: str = "sessionStorage",
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Wait until a web storage item (or a nested field of its JSON value) is set
+
+        Args:
+            key: Storage key
+            path: Keys to follow inside the JSON value (e.g. ('auth', 'token'))
+            storage: 'sessionStorage' or 'localStorage'
+            timeout: Timeout in seconds (uses default if not specified)
+
+        Returns:
+            The (parsed) value
+
+        Raises:
+            TimeoutException: If the item is not set within timeout
+        """
+        timeout = timeout or self.default_timeout
+        script = f"return window.{storage}.getItem(arguments[0]);"
+
+        def item_value(driver):
+            value = driver.execute_script(script, key)
+            if path:
+                value = json.loads(value) if value else None
+                for part in path:
+                    value = value.get(part) if isinstance(value, dict) else None
+            if isinstance(value, str) and not value.strip():
+                return None
+            return value
+
+        try:
+            logger.debug(f"Waiting for {storage} item: {key}")
+            value = WebDriverWait(self.driver, timeout, poll_frequency=self.POLL_INTERVAL).until(item_value)
+            logger.debug(f"{storage} item set: {key}")
+            return value
+        except TimeoutException:
+            logger.error(f"{storage} item '{key}' not set after {timeout}s")
+            raise
+
+    def until_network_event(
+        self,
+        url_fragment: str,
+        method: str = "Network.responseReceived",
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait until Chrome reports a network event for a matching URL
+
+        Reads DevTools events from the performance log, so the driver must
+        be started with DriverConfig(enable_performance_logging=True).
+        Drained events are kept in self.network_events and also matched
+        by later waits.
+
+        Args:
+            url_fragment: Text that should be in the request/response URL
+            method: DevTools event (e.g. 'Network.requestWillBeSent')
+            timeout: Timeout in seconds (uses default if not specified)
+
+        Returns:
+            The event params (request/response, requestId, ...)
+
+        Raises:
+            TimeoutException: If no matching event within timeout
+        """
+        timeout = timeout or self.default_timeout
+        seen = 0  # Events drained by earlier waits count too
+
+        def matching_event(driver):
+            nonlocal seen
+            for entry in driver.get_log('performance'):
+                try:
+                    self.network_events.append(json.loads(entry['message'])['message'])
+                except (KeyError, TypeError, ValueError):
+                    continue
+            for event in self.network_events[seen:]:
+                if event.get('method') != method:
+                    continue
+                params = event.get('params', {})
+                url = (params.get('response') or params.get('request') or {}).get('url', '')
+                if url_fragment in url:
+                    return params
+            seen = len(self.network_events)
+            return None
+
+        try:
+            logger.debug(f"Waiting for {method}: {url_fragment}")
+            params = WebDriverWait(self.driver, timeout, poll_frequency=self.POLL_INTERVAL).until(matching_event)
+            logger.debug(f"Network event received: {url_fragment}")
+            return params
+        except TimeoutException:
+            logger.error(f"No {method} for '{url_fragment}' after {timeout}s")
+            raise
+
+    def until_network_idle(
+        self,
+        idle_time: float = 1.0,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Wait until the page has loaded and stopped fetching resources
+
+        Uses the Resource Timing API: the page counts as idle once
+        document.readyState is 'complete' and no new resource entries
+        appeared for idle_time seconds. Does not raise on timeout.
+
+        Args:
+            idle_time: Seconds without new requests
+            timeout: Timeout in seconds (uses default if not specified)
+
+        Returns:
+            True if idle, False on timeout
+        """
+        timeout = timeout or self.default_timeout
+        script = (
+            "return [document.readyState, "
+            "performance.getEntriesByType('resource').length];"
+        )
+        deadline = time.monotonic() + timeout
+        last_count = None
+        last_change = time.monotonic()
+
+        while time.monotonic() < deadline:
+            try:
+                ready_state, count = self.driver.execute_script(script)
+            except Exception:
+                ready_state, count = None, None
+
+            now = time.monotonic()
+            if count != last_count:
+                last_count = count
+                last_change = now
+            elif ready_state == 'complete' and now - last_change >= idle_time:
+                logger.debug(f"Network idle ({count} resources)")
+                return True
+            time.sleep(self.POLL_INTERVAL)
+
+        logger.debug(f"Network not idle after {timeout}s")
+        return False
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+API Response Benchmark
+
+Compares latency (p50/p95) and payload bytes of the large API responses -
+transactions page, portfolio progression, category trends and retirement
+simulation - on a synthetic database, in three modes:
+
+    pydantic      Response validated through the route's response_model and
+                  serialized by Pydantic (how these routes responded before
+                  api.responses), uncompressed
+    orjson        Unvalidated dicts rendered by ORJSONResponse, uncompressed
+    orjson+gzip   As orjson, with the client accepting gzip
+
+Requests go through the ASGI app in-process (TestClient), so the numbers
+are server time plus ASGI overhead, without network transfer.
+
+Usage:
+    python scripts/benchmark_api_responses.py
+    python scripts/benchmark_api_responses.py --transactions 100000 --requests 50
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Project root (script is in scripts/)
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from fastapi import FastAPI, Response  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from api.deps import get_async_db, get_db  # noqa: E402
+from api.responses import CompressionMiddleware  # noqa: E402
+from api.routers import analytics, balances, retirement, transactions  # noqa: E402
+from api.schemas.analytics import CategoryTrendsResponse  # noqa: E402
+from api.schemas.balances import PortfolioProgressionResponse  # noqa: E402
+from api.schemas.common import PaginatedResponse  # noqa: E402
+from api.schemas.retirement import SimulationResponse  # noqa: E402
+from api.schemas.transactions import TransactionResponse  # noqa: E402
+from db.database import create_async_database_engine  # noqa: E402
+from db.models import Account, Balance, Base, Transaction  # noqa: E402
+
+CATEGORIES = ["food", "transport", "shopping", "health", "bills", "leisure", "education", "home"]
+
+SIMULATION_CONFIG = {
+    "persons": [{"name": "Dana", "dob": "1990-05-01", "gender": "female"}],
+    "portfolios": [{"designation": "withdraw", "balance": 800000, "interest": 6, "fee": 0.1}],
+    "incomes": [{"amount": 25000, "start": "now", "end": "fire"}],
+    "expenses": [{"amount": 14000, "start": "now", "end": "forever", "rise": 2}],
+}
+
+# (label, method, path, request kwargs, router module, response model)
+ENDPOINTS = [
+    ("transactions (200)", "GET", "/transactions", {"params": {"limit": 200}},
+     transactions, PaginatedResponse[TransactionResponse]),
+    ("portfolio by account", "GET", "/balances/progression/by-account", {},
+     balances, PortfolioProgressionResponse),
+    ("category trends", "GET", "/analytics/category-trends", {"params": {"months": 24, "top_n": 8}},
+     analytics, CategoryTrendsResponse),
+    ("retirement simulate", "POST", "/retirement/simulate", {"json": SIMULATION_CONFIG},
+     retirement, SimulationResponse),
+]
+
+
+def build_database(path: Path, transaction_count: int, seed: int = 7) -> None:
+    """Fill a SQLite database with accounts, transactions and daily balances"""
+    rng = random.Random(seed)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    cards = [Account(account_type="credit_card", institution=name, account_number=f"{n:04d}")
+             for n, name in enumerate(["cal", "max", "isracard"], start=1)]
+    investments = [Account(account_type=kind, institution=name, account_number=f"9{n}")
+                   for n, (kind, name) in enumerate([("broker", "excellence"), ("pension", "migdal"),
+                                                      ("savings", "meitav")])]
+    session.add_all(cards + investments)
+    session.flush()
+
+    today = date.today()
+    for n in range(transaction_count):
+        day = today - timedelta(days=rng.randrange(3 * 365))
+        amount = -round(rng.uniform(5, 900), 2)
+        session.add(Transaction(
+            account_id=rng.choice(cards).id, transaction_date=day, processed_date=day,
+            description=f"Merchant {rng.randrange(400)}", original_amount=amount, original_currency="ILS",
+            charged_amount=amount, charged_currency="ILS", status="completed", transaction_type="normal",
+            raw_category=rng.choice(CATEGORIES), category=rng.choice(CATEGORIES),
+        ))
+        if n % 5000 == 0:
+            session.flush()
+
+    for account in investments:
+        amount = rng.uniform(50000, 400000)
+        for offset in range(3 * 365, -1, -1):
+            amount *= 1 + rng.uniform(-0.01, 0.011)
+            session.add(Balance(account_id=account.id, balance_date=today - timedelta(days=offset),
+                                total_amount=round(amount, 2), profit_loss=round(amount * 0.1, 2),
+                                currency="ILS"))
+    session.commit()
+    session.close()
+    engine.dispose()
+
+
+def validated_response(model):
+    """Stand-in for ORJSONResponse that validates and serializes like a response_model route"""
+    adapter = TypeAdapter(model)
+
+    def respond(content, **kwargs):
+        return Response(adapter.dump_json(adapter.validate_python(content)), media_type="application/json")
+
+    return respond
+
+
+def measure(client: TestClient, method: str, path: str, kwargs: dict, headers: dict, requests: int):
+    """Latencies (ms) and bytes on the wire of repeated requests"""
+    client.request(method, path, headers=headers, **kwargs)  # Warm up (and fill the analytics cache)
+    latencies = []
+    size = 0
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.request(method, path, headers=headers, **kwargs)
+        latencies.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        size = response.num_bytes_downloaded
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1], size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark large API responses")
+    parser.add_argument("--transactions", type=int, default=50000, help="Synthetic transactions (default: 50000)")
+    parser.add_argument("--requests", type=int, default=30, help="Requests per endpoint and mode (default: 30)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "benchmark.db"
+        print(f"Building synthetic database ({args.transactions:,} transactions)...")
+        build_database(db_path, args.transactions)
+
+        engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+        Session = sessionmaker(bind=engine)
+        async_engine = create_async_database_engine(db_path)
+        AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+        def session_per_request():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        async def async_session_per_request():
+            async with AsyncSession() as db:
+                yield db
+
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware)
+        for module in (transactions, balances, analytics, retirement):
+            app.include_router(module.router)
+        app.dependency_overrides[get_db] = session_per_request
+        app.dependency_overrides[get_async_db] = async_session_per_request
+
+        identity = {"Accept-Encoding": "identity"}
+        gzip = {"Accept-Encoding": "gzip"}
+        print(f"\n{'Endpoint':<22} {'Mode':<12} {'p50 ms':>8} {'p95 ms':>8} {'Bytes':>10}")
+        print("-" * 64)
+        with patch("api.deps.is_auth_enabled", return_value=False), TestClient(app) as client:
+            for label, method, path, kwargs, module, model in ENDPOINTS:
+                with patch.object(module, "ORJSONResponse", validated_response(model)):
+                    rows = [("pydantic", measure(client, method, path, kwargs, identity, args.requests))]
+                rows.append(("orjson", measure(client, method, path, kwargs, identity, args.requests)))
+                rows.append(("orjson+gzip", measure(client, method, path, kwargs, gzip, args.requests)))
+                for mode, (p50, p95, size) in rows:
+                    print(f"{label:<22} {mode:<12} {p50:>8.1f} {p95:>8.1f} {size:>10,}")
+            client.portal.call(async_engine.dispose)
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
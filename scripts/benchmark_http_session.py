@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+HTTP Session Benchmark
+
+Compares per-request latency of module-level requests.post (new connection
+per call, as the scrapers used to do) against the pooled keep-alive session
+from scrapers.utils.http_session, using a local stub API server.
+
+The stub serves plain HTTP, so this measures TCP connection setup only. Against
+the real HTTPS APIs each avoided connection also saves a TLS handshake, so the
+gap is larger in practice.
+
+Usage:
+    python scripts/benchmark_http_session.py
+    python scripts/benchmark_http_session.py --requests 54 --latency-ms 20
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Project root (script is in scripts/)
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scrapers.utils.http_session import create_http_session  # noqa: E402
+
+# Simulated server processing time, set from --latency-ms
+SERVER_LATENCY = 0.0
+# Sample transactions payload, similar in shape to a CAL month response
+RESPONSE_BODY = json.dumps({
+    'statusCode': 1,
+    'result': {'bankAccounts': [{'debitDates': [{'transactions': [
+        {'trnAmt': 100.0, 'merchantName': 'Store', 'trnPurchaseDate': '2024-01-15'}
+    ] * 40}]}]},
+}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Allow keep-alive
+    disable_nagle_algorithm = True  # Avoid delayed-ACK stalls on reused connections
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        if SERVER_LATENCY:
+            time.sleep(SERVER_LATENCY)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def time_requests(post, url: str, count: int) -> list[float]:
+    """Time count sequential POSTs, returning per-request latency in ms."""
+    latencies = []
+    for month in range(count):
+        start = time.perf_counter()
+        response = post(url, json={'cardUniqueId': 'card', 'month': str(month % 12 + 1)}, timeout=30)
+        response.raise_for_status()
+        response.json()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    """Print latency summary line."""
+    print(
+        f"{name:<22} total {sum(latencies):8.1f} ms   "
+        f"mean {statistics.mean(latencies):6.2f} ms   "
+        f"p95 {sorted(latencies)[int(len(latencies) * 0.95) - 1]:6.2f} ms"
+    )
+
+
+def main():
+    global SERVER_LATENCY
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=54,
+                        help='Requests per run (default: 54 = 3 cards x 18 months)')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='Simulated server processing time per request')
+    parser.add_argument('--rounds', type=int, default=3, help='Rounds per variant')
+    args = parser.parse_args()
+
+    SERVER_LATENCY = args.latency_ms / 1000
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api"
+
+    print(f"Stub server at {url} - {args.requests} requests x {args.rounds} rounds\n")
+
+    unpooled, pooled = [], []
+    for _ in range(args.rounds):
+        unpooled.extend(time_requests(requests.post, url, args.requests))
+
+        with create_http_session() as session:
+            pooled.extend(time_requests(session.post, url, args.requests))
+
+    report("requests.post", unpooled)
+    report("pooled session", pooled)
+    print(f"\nSpeedup: {statistics.mean(unpooled) / statistics.mean(pooled):.2f}x per request")
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == '__main__':
+    main()
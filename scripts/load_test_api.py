@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+API Load Test
+
+Fires concurrent users at a running API server and reports throughput and
+latency (p50/p95/p99) per endpoint. Each user requests the endpoints in
+turn, back to back, for the given duration.
+
+Run it against the server before and after a change (e.g. different
+FIN_API_DB_CONNECTIONS values) to compare concurrent read performance.
+
+Usage:
+    python scripts/load_test_api.py --url http://localhost:8000
+    python scripts/load_test_api.py --users 50 --duration 30 --token <jwt>
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+
+# Read endpoints served by the async session (transactions, stats, latest balances) and the thread pool
+ENDPOINTS = [
+    "/transactions?limit=50",
+    "/analytics/stats",
+    "/balances/latest",
+    "/balances/progression/by-type",
+    "/analytics/categories",
+]
+
+
+async def user(client: httpx.AsyncClient, deadline: float, latencies: dict, errors: dict) -> None:
+    """Request the endpoints round-robin until the deadline"""
+    n = 0
+    while time.perf_counter() < deadline:
+        path = ENDPOINTS[n % len(ENDPOINTS)]
+        n += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            errors[path] += 1
+            continue
+        latencies[path].append((time.perf_counter() - started) * 1000)
+
+
+def percentile(values: list, fraction: float) -> float:
+    return values[max(int(len(values) * fraction) - 1, 0)]
+
+
+async def run(url: str, users: int, duration: float, token: str) -> None:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+
+    async with httpx.AsyncClient(base_url=url, headers=headers, limits=limits, timeout=60) as client:
+        # Warm up (fills the analytics cache, as in steady state)
+        for path in ENDPOINTS:
+            await client.get(path)
+
+        print(f"Running {users} concurrent users for {duration:.0f}s against {url}...")
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(user(client, deadline, latencies, errors) for _ in range(users)))
+
+    print(f"\n{'Endpoint':<32} {'Requests':>9} {'Errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    print("-" * 76)
+    total = 0
+    for path in ENDPOINTS:
+        values = sorted(latencies[path])
+        total += len(values)
+        if not values:
+            print(f"{path:<32} {0:>9} {errors[path]:>7}")
+            continue
+        print(f"{path:<32} {len(values):>9} {errors[path]:>7} {statistics.median(values):>8.1f} "
+              f"{percentile(values, 0.95):>8.1f} {percentile(values, 0.99):>8.1f}")
+    print(f"\nThroughput: {total / duration:.1f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the API's read endpoints")
+    parser.add_argument("--url", default="http://localhost:8000", help="API base URL (default: http://localhost:8000)")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent users (default: 20)")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds to run (default: 15)")
+    parser.add_argument("--token", default="", help="Bearer token, when auth is enabled")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.url, args.users, args.duration, args.token))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@
 Services package for data synchronization and analytics
 """
 
-from .base_service import BaseSyncService
+from .base_service import BaseSyncService, StreamingSyncMixin
 from .broker_service import BrokerService
 from .pension_service import PensionService
 from .credit_card_service import CreditCardService
@@ -14,6 +14,7 @@ from .tag_service import TagService
 
 __all__ = [
     'BaseSyncService',
+    'StreamingSyncMixin',
     'BrokerService',
     'PensionService',
     'CreditCardService',
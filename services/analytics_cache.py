@@ -0,0 +1,263 @@
+"""
+Result cache for AnalyticsService read methods.
+
+Results are keyed by method, arguments, the current day and the global data
+version (DataVersionKey.DATA). Writers of transactions, tags, categories and
+sync results bump that version in the same transaction as their change, so
+a cached result is reused until - and only until - the data it was computed
+from changes, in this process or in any other.
+
+Entries are kept pickled (each caller gets its own copy) in a per-database
+LRU. With FIN_ANALYTICS_CACHE_DIR set they are also written to that
+directory, so API workers and the CLI share each other's results.
+
+Async callers (AsyncAnalyticsService.run) look results up with
+get_or_compute_async(), which reads and writes that directory in a worker
+thread so the event loop never waits on disk.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from config.constants import DataVersionKey
+from db.data_versions import get_data_version
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar('F', bound=Callable[..., Any])
+T = TypeVar('T')
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU of pickled results"""
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: Entries kept (0 disables the cache)
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: bytes) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DirectoryStore:
+    """
+    Pickled results shared through a directory (one file per entry).
+
+    File names start with the data version; entries of older versions are
+    deleted when the first entry of a newer one is written.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pruned_version: Optional[int] = None
+
+    def get(self, version: int, digest: str) -> Optional[bytes]:
+        try:
+            return (self.path / f"v{version}-{digest}.pkl").read_bytes()
+        except OSError:
+            return None
+
+    def set(self, version: int, digest: str, value: bytes) -> None:
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            if self._pruned_version is None or version > self._pruned_version:
+                self._prune(version)
+            # Write then rename, so other workers never read a partial file
+            fd, temp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(value)
+            os.replace(temp_path, self.path / f"v{version}-{digest}.pkl")
+        except OSError as e:
+            logger.debug(f"Could not write analytics cache entry to {self.path}: {e}")
+
+    def _prune(self, version: int) -> None:
+        """Delete entries of older versions (newer ones may be other workers' fresh results)"""
+        for entry in self.path.glob("v*.pkl"):
+            entry_version, _, _ = entry.name[1:].partition('-')
+            if entry_version.isdigit() and int(entry_version) < version:
+                entry.unlink(missing_ok=True)
+        self._pruned_version = version
+
+
+class AnalyticsCache:
+    """Cached results of one database (shared by every AnalyticsService using it)"""
+
+    def __init__(self, database: str, maxsize: int, store: Optional[DirectoryStore] = None):
+        """
+        Args:
+            database: Database URL (tells apart databases in a shared store)
+            maxsize: In-memory entries kept
+            store: Shared store, if configured
+        """
+        self.database = database
+        self.memory = LRUCache(maxsize)
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, version: int) -> Optional[bytes]:
+        """Pickled result computed at this data version, None on a miss"""
+        value = self.memory.get((version, key))
+        if value is None and self.store is not None:
+            value = self.store.get(version, self._digest(key))
+            if value is not None:
+                self.memory.set((version, key), value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: tuple, version: int, value: bytes) -> None:
+        self.memory.set((version, key), value)
+        if self.store is not None:
+            self.store.set(version, self._digest(key), value)
+
+    def _digest(self, key: tuple) -> str:
+        return hashlib.sha256(repr((self.database, key)).encode()).hexdigest()
+
+
+# Process-wide caches, one per engine (tests use several in-memory engines)
+_caches: "weakref.WeakKeyDictionary[Engine, AnalyticsCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_analytics_cache(session: Session) -> AnalyticsCache:
+    """
+    Get the result cache of a session's database.
+
+    Sized by FIN_ANALYTICS_CACHE_SIZE (entries, 0 disables it) and shared
+    through FIN_ANALYTICS_CACHE_DIR when set.
+    """
+    bind = session.get_bind()
+    engine = getattr(bind, 'engine', bind)
+
+    cache = _caches.get(engine)
+    if cache is not None:
+        return cache
+
+    with _caches_lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            from config.settings import get_settings
+            settings = get_settings()
+            store_dir = settings.analytics_cache_dir
+            cache = AnalyticsCache(
+                database=engine.url.render_as_string(hide_password=True),
+                maxsize=settings.analytics_cache_size,
+                store=DirectoryStore(store_dir) if store_dir else None
+            )
+            _caches[engine] = cache
+        return cache
+
+
+def cached_result(method: F) -> F:
+    """
+    Cache an AnalyticsService method's result until the data changes.
+
+    Only for methods returning plain (picklable) data - not ORM objects,
+    which belong to the session that loaded them. Reads from a session
+    holding unflushed changes are not cached.
+
+    The wrapper's cache_key(*args, **kwargs) gives the key of a call, for
+    callers looking results up themselves (see get_or_compute_async).
+    """
+    signature = inspect.signature(method)
+
+    def cache_key(*args: Any, **kwargs: Any) -> tuple:
+        bound = signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(bound.arguments.items())[1:]  # Without self
+        # Results relative to today (trends, last N months) expire at midnight
+        return (method.__qualname__, repr(arguments), date.today().isoformat())
+
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        session = self.session
+        if session.new or session.dirty or session.deleted:
+            return method(self, *args, **kwargs)
+
+        version = get_data_version(session, DataVersionKey.DATA)
+        if version is None:
+            return method(self, *args, **kwargs)
+
+        key = cache_key(*args, **kwargs)
+        cache = get_analytics_cache(session)
+        cached = cache.get(key, version)
+        if cached is not None:
+            return pickle.loads(cached)
+
+        result = method(self, *args, **kwargs)
+        cache.set(key, version, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        return result
+
+    wrapper.cache_key = cache_key  # type: ignore[attr-defined]
+    return wrapper  # type: ignore[return-value]
+
+
+async def get_or_compute_async(
+    cache: AnalyticsCache,
+    key: tuple,
+    version: int,
+    compute: Callable[[], Awaitable[T]]
+) -> T:
+    """
+    Cached result of an async computation, computing and storing it on a miss.
+
+    The shared directory store is read and written in a worker thread; the
+    in-memory LRU alone is used on the event loop.
+
+    Args:
+        cache: Cache of the database (get_analytics_cache)
+        key: Call key (a cached_result method's cache_key())
+        version: Current data version
+        compute: Awaitable producing the result (plain, picklable data)
+    """
+    async def store_io(operation: Callable[..., Any], *args: Any) -> Any:
+        if cache.store is None:
+            return operation(*args)
+        return await asyncio.to_thread(operation, *args)
+
+    cached = await store_io(cache.get, key, version)
+    if cached is not None:
+        return pickle.loads(cached)
+
+    result = await compute()
+    await store_io(cache.set, key, version, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    return result
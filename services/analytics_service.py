@@ -3,22 +3,52 @@ Analytics service for querying and analyzing financial data
 """
 
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy import func, extract, and_, or_
-from sqlalchemy.orm import Session, joinedload
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+from sqlalchemy import func, extract, and_, or_, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 from db.models import Account, Transaction, Balance, SyncHistory, Tag, TransactionTag
 from db.database import get_db
 from db.query_utils import (
+    apply_transaction_filters,
     effective_amount_expr,
     effective_category_expr,
     get_effective_amount,
 )
-from config.constants import AccountType, Currency
+from config.constants import AccountType, Currency, DataVersionKey
+from db.data_versions import get_data_version
+from services.analytics_cache import cached_result, get_analytics_cache, get_or_compute_async
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar('T')
+
+# Transaction columns in exports, followed by the account and effective category
+_TRANSACTION_EXPORT_COLUMNS = [
+    'id', 'account_id', 'transaction_id', 'transaction_date', 'processed_date',
+    'description', 'original_amount', 'original_currency', 'charged_amount',
+    'charged_currency', 'transaction_type', 'status', 'raw_category', 'category',
+    'user_category', 'memo', 'installment_number', 'installment_total', 'created_at',
+]
+
+# Field order of exported transaction rows
+TRANSACTION_EXPORT_FIELDS = [
+    'id', 'account_id', 'institution', 'account_number',
+    'transaction_id', 'transaction_date', 'processed_date',
+    'description', 'original_amount', 'original_currency',
+    'charged_amount', 'charged_currency', 'transaction_type',
+    'status', 'raw_category', 'category', 'user_category',
+    'effective_category', 'memo', 'installment_number',
+    'installment_total', 'created_at'
+]
 
 
 class AnalyticsService:
     """
     Service for querying and analyzing financial data
+
+    Read methods returning plain data are cached until the data version
+    changes (see services.analytics_cache).
     """
 
     def __init__(self, session: Optional[Session] = None):
@@ -91,6 +121,7 @@ class AnalyticsService:
             query = query.filter(Account.is_active == True)
         return query.order_by(Account.account_number).all()
 
+    @cached_result
     def get_account_summary(self) -> Dict[str, Any]:
         """
         Get summary of all accounts
@@ -161,51 +192,23 @@ class AnalyticsService:
         Returns:
             List of Transaction objects
         """
-        query = self.session.query(Transaction).join(Account)
-
-        if account_id:
-            query = query.filter(Transaction.account_id == account_id)
-
-        if from_date:
-            query = query.filter(Transaction.transaction_date >= from_date)
-
-        if to_date:
-            query = query.filter(Transaction.transaction_date <= to_date)
-
-        if status:
-            query = query.filter(Transaction.status == status)
-
-        if institution:
-            query = query.filter(Account.institution == institution)
-
-        if search:
-            query = query.filter(Transaction.description.ilike(f"%{search}%"))
-
-        if category:
-            query = query.filter(
-                func.coalesce(
-                    Transaction.user_category,
-                    Transaction.category,
-                    Transaction.raw_category,
-                ) == category
-            )
+        query = apply_transaction_filters(
+            self.session.query(Transaction).join(Account),
+            account_id=account_id,
+            from_date=from_date,
+            to_date=to_date,
+            status=status,
+            institution=institution,
+            search=search,
+            category=category,
+            tags=tags,
+            untagged_only=untagged_only,
+        )
 
-        # Tag filtering
-        if untagged_only:
-            # Get transactions that have no tags
-            tagged_ids = self.session.query(TransactionTag.transaction_id).distinct()
-            query = query.filter(~Transaction.id.in_(tagged_ids))
-        elif tags:
-            # Filter by tags (AND logic - must have all specified tags)
-            for tag_name in tags:
-                tag_subquery = (
-                    self.session.query(TransactionTag.transaction_id)
-                    .join(Tag)
-                    .filter(func.lower(Tag.name) == func.lower(tag_name))
-                )
-                query = query.filter(Transaction.id.in_(tag_subquery))
-
-        query = query.order_by(Transaction.transaction_date.desc())
+        # Tags in one extra query rather than one per transaction
+        query = query.options(
+            selectinload(Transaction.transaction_tags).joinedload(TransactionTag.tag)
+        ).order_by(Transaction.transaction_date.desc())
 
         if offset:
             query = query.offset(offset)
@@ -215,6 +218,50 @@ class AnalyticsService:
 
         return query.all()
 
+    def iter_transaction_rows(
+        self,
+        account_id: Optional[int] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        status: Optional[str] = None,
+        institution: Optional[str] = None,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        untagged_only: bool = False,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream transactions (with their account) as plain dicts, for exports
+
+        Rows are fetched batch_size at a time from a streaming cursor and no
+        ORM objects are built, so memory stays flat however many rows match.
+        Filters are as in get_transactions.
+
+        Yields:
+            Dicts keyed by TRANSACTION_EXPORT_FIELDS, newest first
+        """
+        columns = [getattr(Transaction, field).label(field) for field in _TRANSACTION_EXPORT_COLUMNS]
+        query = apply_transaction_filters(
+            self.session.query(
+                *columns,
+                Account.institution.label('institution'),
+                Account.account_number.label('account_number'),
+                effective_category_expr().label('effective_category'),
+            ).join(Account),
+            account_id=account_id,
+            from_date=from_date,
+            to_date=to_date,
+            status=status,
+            institution=institution,
+            search=search,
+            category=category,
+            untagged_only=untagged_only,
+        ).order_by(Transaction.transaction_date.desc(), Transaction.id.desc())
+
+        query = query.execution_options(yield_per=batch_size, stream_results=True)
+        for row in query:
+            yield {field: getattr(row, field) for field in TRANSACTION_EXPORT_FIELDS}
+
     def get_transaction_by_id(self, transaction_id: int) -> Optional[Transaction]:
         """
         Get transaction by ID
@@ -227,6 +274,7 @@ class AnalyticsService:
         """
         return self.session.query(Transaction).filter(Transaction.id == transaction_id).first()
 
+    @cached_result
     def get_transaction_count(
         self,
         account_id: Optional[int] = None,
@@ -359,6 +407,7 @@ class AnalyticsService:
 
     # ==================== Statistics Methods ====================
 
+    @cached_result
     def get_overall_stats(self) -> Dict[str, Any]:
         """
         Get overall statistics
@@ -393,10 +442,14 @@ class AnalyticsService:
             "last_sync": last_sync.completed_at if last_sync else None
         }
 
+    @cached_result
     def get_monthly_summary(self, year: int, month: int) -> Dict[str, Any]:
         """
         Get monthly transaction summary
 
+        Aggregated in SQL: one GROUP BY over status, type and account, with a
+        date range the transaction_date index can serve.
+
         Args:
             year: Year
             month: Month (1-12)
@@ -404,44 +457,58 @@ class AnalyticsService:
         Returns:
             Dictionary with monthly summary
         """
-        # Get transactions for the month with eager-loaded accounts (fixes N+1 query)
-        transactions = (
-            self.session.query(Transaction)
-            .options(joinedload(Transaction.account))
+        first_day = date(year, month, 1)
+        next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+
+        rows = (
+            self.session.query(
+                Transaction.status,
+                Transaction.transaction_type,
+                Account.id.label('account_id'),
+                Account.institution,
+                Account.account_type,
+                func.count(Transaction.id).label('count'),
+                func.coalesce(func.sum(func.abs(Transaction.original_amount)), 0).label('total_amount'),
+                func.coalesce(func.sum(func.abs(Transaction.charged_amount)), 0).label('total_charged'),
+            )
+            .outerjoin(Account, Transaction.account_id == Account.id)
             .filter(
-                extract('year', Transaction.transaction_date) == year,
-                extract('month', Transaction.transaction_date) == month
+                Transaction.transaction_date >= first_day,
+                Transaction.transaction_date < next_month
+            )
+            .group_by(
+                Transaction.status,
+                Transaction.transaction_type,
+                Account.id
             )
             .all()
         )
 
         total_amount = 0
         total_charged = 0
-        transaction_count = len(transactions)
+        transaction_count = 0
 
         by_status = {}
         by_type = {}
         by_account = {}
 
-        for txn in transactions:
-            # Sum amounts
-            total_amount += abs(txn.original_amount or 0)
-            if txn.charged_amount:
-                total_charged += abs(txn.charged_amount)
+        for row in rows:
+            transaction_count += row.count
+            total_amount += row.total_amount
+            total_charged += row.total_charged
 
             # Group by status
-            status = txn.status or 'unknown'
-            by_status[status] = by_status.get(status, 0) + 1
+            status = row.status or 'unknown'
+            by_status[status] = by_status.get(status, 0) + row.count
 
             # Group by type
-            txn_type = txn.transaction_type or 'unknown'
-            by_type[txn_type] = by_type.get(txn_type, 0) + 1
+            txn_type = row.transaction_type or 'unknown'
+            by_type[txn_type] = by_type.get(txn_type, 0) + row.count
 
-            # Group by account (account already loaded via joinedload)
-            account = txn.account
-            if account:
-                key = f"{account.institution} ({account.account_type})"
-                by_account[key] = by_account.get(key, 0) + 1
+            # Group by account
+            if row.account_id is not None:
+                key = f"{row.institution} ({row.account_type})"
+                by_account[key] = by_account.get(key, 0) + row.count
 
         return {
             "year": year,
@@ -454,6 +521,7 @@ class AnalyticsService:
             "by_account": by_account
         }
 
+    @cached_result
     def get_category_breakdown(
         self,
         from_date: Optional[date] = None,
@@ -462,6 +530,9 @@ class AnalyticsService:
         """
         Get transaction breakdown by category
 
+        Aggregated in SQL (GROUP BY effective category), so the cost does not
+        grow with loading each transaction.
+
         Args:
             from_date: Start date
             to_date: End date
@@ -469,7 +540,21 @@ class AnalyticsService:
         Returns:
             Dictionary with category breakdown
         """
-        query = self.session.query(Transaction)
+        # Effective category (user_category, then category, then raw_category);
+        # empty strings fall through like Transaction.effective_category
+        category = func.coalesce(
+            func.nullif(Transaction.user_category, ''),
+            func.nullif(Transaction.category, ''),
+            func.nullif(Transaction.raw_category, ''),
+            'Uncategorized'
+        ).label('category')
+
+        query = self.session.query(
+            category,
+            func.count(Transaction.id).label('count'),
+            # Use charged_amount (actual payment) if available, otherwise original_amount
+            func.sum(func.abs(func.coalesce(effective_amount_expr(), 0))).label('total_amount'),
+        )
 
         if from_date:
             query = query.filter(Transaction.transaction_date >= from_date)
@@ -477,35 +562,19 @@ class AnalyticsService:
         if to_date:
             query = query.filter(Transaction.transaction_date <= to_date)
 
-        transactions = query.all()
-
         categories = {}
-        for txn in transactions:
-            # Use effective_category (user_category if set, otherwise original category)
-            category = txn.effective_category or 'Uncategorized'
-
-            if category not in categories:
-                categories[category] = {
-                    "count": 0,
-                    "total_amount": 0,
-                    "avg_amount": 0
-                }
-
-            categories[category]["count"] += 1
-            # Use charged_amount (actual payment) if available, otherwise original_amount
-            categories[category]["total_amount"] += abs(get_effective_amount(txn))
-
-        # Calculate averages
-        for category in categories:
-            if categories[category]["count"] > 0:
-                categories[category]["avg_amount"] = (
-                    categories[category]["total_amount"] / categories[category]["count"]
-                )
+        for row in query.group_by(category).all():
+            categories[row.category] = {
+                "count": row.count,
+                "total_amount": row.total_amount,
+                "avg_amount": row.total_amount / row.count,
+            }
 
         return categories
 
     # ==================== Tag Analytics Methods ====================
 
+    @cached_result
     def get_tag_breakdown(
         self,
         from_date: Optional[date] = None,
@@ -584,6 +653,7 @@ class AnalyticsService:
 
         return result
 
+    @cached_result
     def get_monthly_tag_breakdown(self, year: int, month: int) -> Dict[str, Dict[str, Any]]:
         """
         Get monthly transaction breakdown by tag
@@ -603,6 +673,7 @@ class AnalyticsService:
 
         return self.get_tag_breakdown(from_date=first_day, to_date=last_day)
 
+    @cached_result
     def get_spending_for_tag(
         self,
         tag_name: str,
@@ -712,6 +783,7 @@ class AnalyticsService:
                 last_per_month[key] = d
         return last_per_month
 
+    @cached_result
     def get_portfolio_by_type(
         self,
         from_date: Optional[date] = None,
@@ -809,6 +881,7 @@ class AnalyticsService:
 
         return points, self._series_sorted_by_latest(points)
 
+    @cached_result
     def get_portfolio_by_account(
         self,
         from_date: Optional[date] = None,
@@ -890,6 +963,7 @@ class AnalyticsService:
 
     # ==================== Spending Trends Methods ====================
 
+    @cached_result
     def get_monthly_spending_trends(
         self,
         months: int = 6,
@@ -979,6 +1053,7 @@ class AnalyticsService:
 
         return monthly_data
 
+    @cached_result
     def get_category_trends(
         self,
         months: int = 6,
@@ -1180,4 +1255,120 @@ class AnalyticsService:
     def close(self):
         """Close the database session"""
         if self.session:
-            self.session.close()
\ No newline at end of file
+            self.session.close()
+
+
+class AsyncAnalyticsService:
+    """
+    AnalyticsService for async API routes
+
+    Runs AnalyticsService code on an AsyncSession's connection (SQLAlchemy
+    run_sync), so queries wait on aiosqlite instead of holding a worker
+    thread. The Python side of fn still runs on the event loop, so use it
+    for aggregate queries with small results; routes that hydrate many rows
+    or post-process in Python stay sync def routes on the thread pool, or
+    use the Core queries here (get_transaction_rows). Functions passed to
+    run() should return plain data: ORM objects cannot lazy-load once run()
+    has returned.
+
+    Usage:
+        stats = await analytics.run(AnalyticsService.get_overall_stats)
+        rows = await analytics.get_transaction_rows(limit=50, search='wolt')
+    """
+
+    def __init__(self, session: "AsyncSession"):
+        """
+        Initialize async analytics service
+
+        Args:
+            session: SQLAlchemy AsyncSession
+        """
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call fn(AnalyticsService, *args, **kwargs) on this session's connection
+
+        Results of cached methods are looked up outside run_sync, with the
+        shared cache directory read and written in a worker thread (see
+        get_or_compute_async), so the event loop never waits on disk.
+
+        Args:
+            fn: AnalyticsService method or function taking an AnalyticsService
+        """
+        cache_key = getattr(fn, 'cache_key', None)
+        if cache_key is None:
+            return await self._run_sync(fn, *args, **kwargs)
+
+        version = await self.session.run_sync(get_data_version, DataVersionKey.DATA)
+        if version is None:
+            return await self._run_sync(fn, *args, **kwargs)
+
+        return await get_or_compute_async(
+            get_analytics_cache(self.session.sync_session),
+            cache_key(*args, **kwargs),
+            version,
+            lambda: self._run_sync(fn.__wrapped__, *args, **kwargs)
+        )
+
+    async def _run_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await self.session.run_sync(lambda session: fn(AnalyticsService(session), *args, **kwargs))
+
+    async def get_transaction_rows(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        **filters: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a page of transactions as plain dicts, newest first
+
+        Core selects awaited on aiosqlite (the page, then its tags): no ORM
+        objects are built, so the event loop only turns rows into dicts.
+
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip
+            **filters: As in AnalyticsService.get_transactions
+
+        Returns:
+            Dicts with the transaction columns, effective_category and tags
+        """
+        columns = [getattr(Transaction, field).label(field) for field in _TRANSACTION_EXPORT_COLUMNS]
+        query = apply_transaction_filters(
+            select(*columns, effective_category_expr().label('effective_category')).join(Account),
+            **filters
+        ).order_by(Transaction.transaction_date.desc(), Transaction.id.desc())
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        rows = [dict(row) for row in (await self.session.execute(query)).mappings()]
+
+        tags: Dict[int, List[str]] = {row['id']: [] for row in rows}
+        if tags:
+            tag_rows = await self.session.execute(
+                select(TransactionTag.transaction_id, Tag.name)
+                .join(Tag)
+                .where(TransactionTag.transaction_id.in_(tags))
+                .order_by(TransactionTag.id)
+            )
+            for transaction_id, name in tag_rows:
+                tags[transaction_id].append(name)
+        for row in rows:
+            row['tags'] = tags[row['id']]
+        return rows
+
+    async def count_transactions(self, **filters: Any) -> int:
+        """
+        Count transactions matching the list filters
+
+        Args:
+            **filters: As in AnalyticsService.get_transactions
+        """
+        query = apply_transaction_filters(
+            select(func.count(Transaction.id)).select_from(Transaction).join(Account),
+            **filters
+        )
+        return (await self.session.execute(query)).scalar_one()
+
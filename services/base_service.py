@@ -3,15 +3,23 @@ Base service class with common database operations.
 Provides transaction management and shared methods for all sync services.
 """
 
-from contextlib import contextmanager
+import json
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Optional, Generator, List, Dict, Any
+from typing import Optional, Generator, List, Dict, Any, ContextManager
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
 
 from db.models import Account, Balance, SyncHistory
+from db.data_versions import bump_data_version
 from db.database import get_db
-from config.constants import SyncStatus
+from config.constants import DataVersionKey, SyncStatus
+from scrapers.utils.step_timer import StepTimer
+from scrapers.utils.sync_metrics import SyncMetrics
 
 
 class SessionMixin:
@@ -54,6 +62,10 @@ class SessionMixin:
             self._session = next(get_db())
         return self._session
 
+    def _bump_data_version(self) -> None:
+        """Invalidate cached analytics in all processes (call before commit)"""
+        bump_data_version(self.session, DataVersionKey.DATA)
+
     def close(self):
         """Close session if owned by this instance."""
         if self._owns_session and self._session:
@@ -92,6 +104,65 @@ class SyncResult:
     # Type-specific optional fields
     financial_data: Optional[Dict[str, Any]] = None  # Pension
     unmapped_categories: List[Dict[str, Any]] = field(default_factory=list)  # Credit Card
+    transaction_ids: List[int] = field(default_factory=list)  # Credit Card: inserted/updated (rules run on these)
+    months_failed: List[str] = field(default_factory=list)  # Credit Card: months (YYYY-MM) that could not be fetched
+
+
+@dataclass
+class ScrapeOutcome:
+    """
+    Output of a scrape that ran without touching the database.
+
+    Services split each sync into fetch_<institution>() (browser/network
+    only, safe on a worker thread) and sync_<institution>(prefetched=...),
+    which saves the outcome in one sync transaction. A failed scrape is
+    carried as error and recorded as a failed sync when saved.
+
+    Usage:
+        outcome = service.fetch_cal(username, password)   # any thread
+        result = service.sync_cal(username, password, prefetched=outcome)  # DB thread
+    """
+
+    data: Any = None
+    error: Optional[BaseException] = None
+    scraper: Any = None  # Scraper/client whose login_timer and metrics are recorded on save
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    replay_of: Optional[int] = None  # Sync id whose landed payloads were replayed
+
+    def unwrap(self) -> Any:
+        """Return the scraped data, re-raising the scrape's error if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.data
+
+
+class StreamingSyncMixin(ABC):
+    """
+    Mixin for sync services whose scrapes stream batches as they are fetched.
+
+    SyncOrchestrator passes the stream's save(batch) to fetch_<institution>()
+    as on_batch and completes the sync with finish(outcome) -> SyncResult,
+    instead of saving the whole outcome with sync_<institution>().
+
+    Usage:
+        class CardService(StreamingSyncMixin, BaseSyncService):
+            def open_stream(self, institution, started_at=None, **job_kwargs):
+                return CardStream(self, institution, started_at)
+    """
+
+    @abstractmethod
+    def open_stream(self, institution: str, started_at: Optional[datetime] = None, **job_kwargs: Any) -> Any:
+        """
+        Start a sync that saves batches as they are scraped.
+
+        Args:
+            institution: Institution name
+            started_at: When the scrape started
+            **job_kwargs: Arguments of the sync (credentials, date range)
+
+        Returns:
+            Stream with save(batch) and finish(outcome) -> SyncResult
+        """
 
 
 class BaseSyncService:
@@ -108,12 +179,16 @@ class BaseSyncService:
             db_session: SQLAlchemy database session
         """
         self.db = db_session
+        # Metrics of the sync being saved (see measure_persist)
+        self.metrics: Optional[SyncMetrics] = None
 
     @contextmanager
     def sync_transaction(
         self,
         sync_type: str,
-        institution: str
+        institution: str,
+        started_at: Optional[datetime] = None,
+        scraper: Any = None
     ) -> Generator[SyncHistory, None, None]:
         """
         Context manager for atomic sync operations.
@@ -125,6 +200,10 @@ class BaseSyncService:
         Args:
             sync_type: Type of sync ('broker', 'pension', 'credit_card')
             institution: Institution name
+            started_at: When the sync started, if earlier than now (e.g. the
+                scrape ran on a worker thread before this transaction)
+            scraper: Scraper/client of the saved scrape - its metrics, with
+                the save timed as the "persist" phase, are recorded
 
         Yields:
             SyncHistory record
@@ -139,32 +218,163 @@ class BaseSyncService:
             sync_type=sync_type,
             institution=institution,
             status=SyncStatus.IN_PROGRESS,
-            started_at=datetime.utcnow()
+            started_at=started_at or datetime.utcnow()
         )
         self.db.add(sync_record)
         self.db.flush()  # Get ID without committing
 
         try:
-            yield sync_record
-            sync_record.status = SyncStatus.SUCCESS
+            with self._persisting(sync_record, scraper):
+                yield sync_record
+            if sync_record.status != SyncStatus.PARTIAL:
+                sync_record.status = SyncStatus.SUCCESS
             sync_record.completed_at = datetime.utcnow()
+            bump_data_version(self.db, DataVersionKey.DATA)
             self.db.commit()
 
         except Exception as e:
+            # Keep diagnostics (e.g. login step timings) recorded before the failure
+            sync_metadata = sync_record.sync_metadata
+            sync_id = sync_record.id
             self.db.rollback()
             # Re-create sync record after rollback to save failure status
+            # Same id, so anything filed under it (e.g. landed payloads) still matches
             sync_record = SyncHistory(
+                id=sync_id,
                 sync_type=sync_type,
                 institution=institution,
                 status=SyncStatus.FAILED,
                 started_at=sync_record.started_at,
                 completed_at=datetime.utcnow(),
-                error_message=str(e)
+                error_message=str(e),
+                sync_metadata=sync_metadata
             )
             self.db.add(sync_record)
             self.db.commit()
             raise
 
+    def record_sync_metadata(self, sync_record: SyncHistory, **values: Any) -> None:
+        """
+        Merge values into the sync record's JSON metadata.
+
+        Metadata set before a failure is kept on the failed sync record.
+
+        Args:
+            sync_record: SyncHistory record from sync_transaction
+            **values: JSON-serializable values to store
+        """
+        metadata = json.loads(sync_record.sync_metadata) if sync_record.sync_metadata else {}
+        metadata.update(values)
+        sync_record.sync_metadata = json.dumps(metadata)
+
+    def record_login_steps(self, sync_record: SyncHistory, scraper: Any) -> None:
+        """
+        Store a scraper's per-step login durations in the sync record.
+
+        Args:
+            sync_record: SyncHistory record from sync_transaction
+            scraper: Scraper/client with a login_timer (StepTimer)
+        """
+        timer = getattr(scraper, 'login_timer', None)
+        if isinstance(timer, StepTimer) and timer.steps:
+            self.record_sync_metadata(sync_record, login_steps=timer.as_dict())
+
+    @contextmanager
+    def _persisting(self, sync_record: SyncHistory, scraper: Any) -> Generator[None, None, None]:
+        """Time a sync_transaction body and record the scrape's metrics (also on failure)"""
+        if scraper is None:
+            yield
+            return
+
+        metrics = getattr(scraper, 'metrics', None)
+        if not isinstance(metrics, SyncMetrics):
+            metrics = SyncMetrics()
+        try:
+            with self.measure_persist(metrics):
+                yield
+        finally:
+            self.record_sync_metrics(sync_record, metrics)
+
+    @contextmanager
+    def measure_persist(self, metrics: SyncMetrics) -> Generator[None, None, None]:
+        """
+        Time saving a sync as its "persist" phase.
+
+        Queries issued on this thread are counted, and phase() reports into
+        the same metrics (e.g. "tagging", which is then not persist time).
+
+        Args:
+            metrics: Metrics of the sync being saved
+        """
+        bind = self.db.get_bind()
+        thread_id = threading.get_ident()
+
+        def count_query(*args: Any, **kwargs: Any) -> None:
+            if threading.get_ident() == thread_id:
+                metrics.count('queries')
+
+        listening = isinstance(bind, (Engine, Connection))
+        if listening:
+            event.listen(bind, 'before_cursor_execute', count_query)
+        previous, self.metrics = self.metrics, metrics
+        try:
+            with metrics.phase('persist'):
+                yield
+        finally:
+            self.metrics = previous
+            if listening:
+                event.remove(bind, 'before_cursor_execute', count_query)
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """Time a block as a phase of the sync being saved (no-op outside measure_persist)"""
+        return self.metrics.phase(name) if self.metrics is not None else nullcontext()
+
+    def record_sync_metrics(self, sync_record: SyncHistory, metrics: SyncMetrics) -> None:
+        """
+        Add phase timings and counters to the sync record's metadata.
+
+        Stored as metrics: {'phases': {name: seconds}, 'counters': {name: n}};
+        values already stored are added to.
+
+        Args:
+            sync_record: SyncHistory record
+            metrics: Metrics to add
+        """
+        metadata = json.loads(sync_record.sync_metadata) if sync_record.sync_metadata else {}
+        merged = SyncMetrics.from_dict(metadata.get('metrics'))
+        merged.merge(metrics)
+        self.record_sync_metadata(sync_record, metrics=merged.as_dict())
+
+    def add_sync_metrics(self, sync_history_id: Optional[int], metrics: SyncMetrics) -> None:
+        """
+        Add metrics of work done after a sync was saved (e.g. applying rules).
+
+        Args:
+            sync_history_id: Id of the saved sync (None is ignored)
+            metrics: Metrics to add
+        """
+        sync_record = self.db.get(SyncHistory, sync_history_id) if sync_history_id else None
+        if sync_record is None:
+            return
+        self.record_sync_metrics(sync_record, metrics)
+        self.db.commit()
+
+    def get_incremental_start(self, institution: str, **job_kwargs: Any) -> Optional[date]:
+        """
+        Earliest date an incremental sync needs to fetch, from stored watermarks.
+
+        Services whose scrapes cannot be narrowed (e.g. balance snapshots)
+        keep this default and always sync fully.
+
+        Args:
+            institution: Institution name
+            **job_kwargs: Arguments of the sync (credentials, date range)
+
+        Returns:
+            Date to pass as since= to fetch_/sync_<institution>, or None for a full sync
+        """
+        return None
+
     def get_or_create_account(
         self,
         account_type: str,
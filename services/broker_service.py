@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 
 from db.models import Account, Balance
 from config.constants import AccountType, Institution, SyncType
-from services.base_service import BaseSyncService, SyncResult
+from services.base_service import BaseSyncService, ScrapeOutcome, SyncResult
 from scrapers.brokers.excellence_broker_client import BrokerClientFactory
 from scrapers.base.broker_base import LoginCredentials, BrokerAPIError
 from scrapers.brokers.meitav_broker_client import (
@@ -24,15 +24,15 @@ class BrokerService(BaseSyncService):
     Inherits common database operations from BaseSyncService.
     """
 
-    def sync_excellence(
+    def fetch_excellence(
         self,
         username: str,
         password: str,
         headless: bool = True,
         currency: str = "ILS"
-    ) -> SyncResult:
+    ) -> ScrapeOutcome:
         """
-        Sync Excellence broker data.
+        Log in to Excellence and fetch account balances (no database access).
 
         Args:
             username: Excellence username
@@ -41,31 +41,83 @@ class BrokerService(BaseSyncService):
             currency: Currency for balance retrieval (default: ILS)
 
         Returns:
-            SyncResult with sync operation details
+            ScrapeOutcome with a list of (broker account, balance info) pairs
         """
-        result = SyncResult()
+        outcome = ScrapeOutcome()
         client = None
 
         try:
-            with self.sync_transaction(SyncType.BROKER, Institution.EXCELLENCE) as sync_record:
-                result.sync_history_id = sync_record.id
-
-                # Create credentials and client
-                credentials = LoginCredentials(user=username, password=password)
-                from scrapers.brokers.excellence_broker_client import ExtraDeProAPIClient
-                client = ExtraDeProAPIClient(credentials, headless=headless)
-
-                # Login
+            # Create credentials and client
+            credentials = LoginCredentials(user=username, password=password)
+            from scrapers.brokers.excellence_broker_client import ExtraDeProAPIClient
+            client = ExtraDeProAPIClient(credentials, headless=headless)
+            outcome.scraper = client
+
+            # Login
+            with client.metrics.phase("login"):
                 client.login()
 
+            with client.metrics.phase("fetch"):
                 # Get accounts
                 broker_accounts = client.get_accounts()
 
                 if not broker_accounts:
                     raise BrokerAPIError("No accounts found for Excellence broker")
 
+                outcome.data = [
+                    (broker_account, client.get_balance(broker_account, currency))
+                    for broker_account in broker_accounts
+                ]
+
+            # Logout
+            client.logout()
+
+        except Exception as e:
+            outcome.error = e
+        finally:
+            # Ensure browser is closed even on error
+            if client:
+                try:
+                    client.cleanup()
+                except Exception:
+                    pass
+
+        return outcome
+
+    def sync_excellence(
+        self,
+        username: str,
+        password: str,
+        headless: bool = True,
+        currency: str = "ILS",
+        prefetched: Optional[ScrapeOutcome] = None
+    ) -> SyncResult:
+        """
+        Sync Excellence broker data.
+
+        Args:
+            username: Excellence username
+            password: Excellence password
+            headless: Run browser in headless mode (default: True)
+            currency: Currency for balance retrieval (default: ILS)
+            prefetched: Outcome of fetch_excellence() (e.g. from a worker
+                thread); saved instead of scraping here
+
+        Returns:
+            SyncResult with sync operation details
+        """
+        result = SyncResult()
+        outcome = prefetched or self.fetch_excellence(username, password, headless, currency)
+
+        try:
+            with self.sync_transaction(
+                SyncType.BROKER, Institution.EXCELLENCE, started_at=outcome.started_at, scraper=outcome.scraper
+            ) as sync_record:
+                result.sync_history_id = sync_record.id
+                self.record_login_steps(sync_record, outcome.scraper)
+
                 # Process each account
-                for broker_account in broker_accounts:
+                for broker_account, balance_info in outcome.unwrap():
                     # Get or create account in database (no commit - handled by context)
                     db_account = self.get_or_create_account(
                         account_type=AccountType.BROKER,
@@ -75,9 +127,6 @@ class BrokerService(BaseSyncService):
                     )
                     result.accounts_synced += 1
 
-                    # Get balance
-                    balance_info = client.get_balance(broker_account, currency)
-
                     # Save balance to database (no commit - handled by context)
                     is_new = self.save_balance(
                         account=db_account,
@@ -95,9 +144,6 @@ class BrokerService(BaseSyncService):
                     else:
                         result.balances_updated += 1
 
-                # Logout
-                client.logout()
-
                 # Update sync record
                 sync_record.records_added = result.balances_added
                 sync_record.records_updated = result.balances_updated
@@ -106,22 +152,51 @@ class BrokerService(BaseSyncService):
 
         except Exception as e:
             result.error_message = str(e)
-        finally:
-            # Ensure browser is closed even on error
-            if client:
-                try:
-                    client.cleanup()
-                except Exception:
-                    pass
 
         return result
 
-    def sync_meitav(
+    def fetch_meitav(
         self,
         username: str,
         password: str,
         headless: bool = True,
         currency: str = "ILS"
+    ) -> ScrapeOutcome:
+        """
+        Log in to Meitav and scrape account data (no database access).
+
+        Args:
+            username: Meitav card number
+            password: Meitav password
+            headless: Run browser in headless mode
+            currency: Unused (kept for a signature matching sync_meitav)
+
+        Returns:
+            ScrapeOutcome with the scraped Meitav account data
+        """
+        outcome = ScrapeOutcome()
+
+        try:
+            # Create credentials and scraper
+            credentials = MeitavCredentials(username=username, password=password)
+            scraper = MeitavBrokerScraper(credentials, headless=headless)
+            outcome.scraper = scraper
+
+            # Scrape account data
+            outcome.data = scraper.scrape()
+
+        except Exception as e:
+            outcome.error = e
+
+        return outcome
+
+    def sync_meitav(
+        self,
+        username: str,
+        password: str,
+        headless: bool = True,
+        currency: str = "ILS",
+        prefetched: Optional[ScrapeOutcome] = None
     ) -> SyncResult:
         """
         Sync Meitav broker data.
@@ -131,22 +206,23 @@ class BrokerService(BaseSyncService):
             password: Meitav password
             headless: Run browser in headless mode
             currency: Currency for balance retrieval (default: ILS)
+            prefetched: Outcome of fetch_meitav() (e.g. from a worker thread);
+                saved instead of scraping here
 
         Returns:
             SyncResult with sync operation details
         """
         result = SyncResult()
+        outcome = prefetched or self.fetch_meitav(username, password, headless, currency)
 
         try:
-            with self.sync_transaction(SyncType.BROKER, Institution.MEITAV) as sync_record:
+            with self.sync_transaction(
+                SyncType.BROKER, Institution.MEITAV, started_at=outcome.started_at, scraper=outcome.scraper
+            ) as sync_record:
                 result.sync_history_id = sync_record.id
+                self.record_login_steps(sync_record, outcome.scraper)
 
-                # Create credentials and scraper
-                credentials = MeitavCredentials(username=username, password=password)
-                scraper = MeitavBrokerScraper(credentials, headless=headless)
-
-                # Scrape account data
-                account_data = scraper.scrape()
+                account_data = outcome.unwrap()
 
                 # Get or create account in database
                 db_account = self.get_or_create_account(
@@ -5,16 +5,45 @@ Handles mapping provider-specific categories (CAL, Max, Isracard) to unified cat
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+import threading
+import weakref
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Tuple
 from sqlalchemy import func, distinct
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 from db.models import CategoryMapping, MerchantMapping, Transaction, Account
-from config.constants import Institution
+from db.data_versions import get_data_version, bump_data_version
+from config.constants import DataVersionKey, Institution
 from services.base_service import SessionMixin
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class CategoryMappingSnapshot:
+    """
+    Immutable view of the category_mappings table.
+
+    Shared by every CategoryService in the process (per database engine) and
+    replaced as a whole when the category_mappings data version changes.
+    """
+    version: int
+    mappings: Mapping[Tuple[str, str], str]  # {(provider, raw_category): unified_category}
+
+    def get(self, provider: str, raw_category: Optional[str]) -> Optional[str]:
+        """Lookup unified category, None if not mapped"""
+        if not raw_category:
+            return None
+        return self.mappings.get((provider.lower(), raw_category))
+
+
+# Process-wide snapshots, one per engine (tests use several in-memory engines)
+_snapshots: "weakref.WeakKeyDictionary[Engine, CategoryMappingSnapshot]" = weakref.WeakKeyDictionary()
+_snapshots_lock = threading.Lock()
+
+
 class CategoryService(SessionMixin):
     """
     Service for managing category mappings and normalization.
@@ -36,6 +65,10 @@ class CategoryService(SessionMixin):
         if not raw_category:
             return None
 
+        snapshot = self.get_mapping_snapshot()
+        if snapshot is not None:
+            return snapshot.get(provider, raw_category)
+
         mapping = self.session.query(CategoryMapping).filter(
             CategoryMapping.provider == provider.lower(),
             CategoryMapping.raw_category == raw_category
@@ -63,6 +96,52 @@ class CategoryService(SessionMixin):
             cache[key] = self.normalize_category(provider, raw_category)
         return cache[key]
 
+    # ==================== Mapping Snapshot ====================
+
+    def get_mapping_snapshot(self) -> Optional[CategoryMappingSnapshot]:
+        """
+        Get the process-wide category mapping snapshot for this database.
+
+        Costs one primary-key lookup on data_versions; the full table is only
+        reloaded when another writer (any process) has bumped the version.
+
+        Returns:
+            CategoryMappingSnapshot, or None if version tracking is unavailable
+            (data_versions table not migrated yet)
+        """
+        version = get_data_version(self.session, DataVersionKey.CATEGORY_MAPPINGS)
+        if version is None:
+            return None
+
+        bind = self.session.get_bind()
+        engine = getattr(bind, 'engine', bind)
+
+        snapshot = _snapshots.get(engine)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with _snapshots_lock:
+            snapshot = _snapshots.get(engine)
+            if snapshot is not None and snapshot.version == version:
+                return snapshot
+
+            rows = self.session.query(
+                CategoryMapping.provider,
+                CategoryMapping.raw_category,
+                CategoryMapping.unified_category
+            ).all()
+            snapshot = CategoryMappingSnapshot(
+                version=version,
+                mappings=MappingProxyType({(r.provider, r.raw_category): r.unified_category for r in rows})
+            )
+            _snapshots[engine] = snapshot
+            logger.debug(f"Loaded category mapping snapshot v{version} ({len(rows)} mappings)")
+            return snapshot
+
+    def _bump_mappings_version(self) -> None:
+        """Invalidate mapping snapshots in all processes (call before commit)"""
+        bump_data_version(self.session, DataVersionKey.CATEGORY_MAPPINGS)
+
     # ==================== Mapping CRUD ====================
 
     def add_mapping(
@@ -100,6 +179,7 @@ class CategoryService(SessionMixin):
             self.session.add(mapping)
             logger.info(f"Created mapping: {provider}/{raw_category} -> {unified_category}")
 
+        self._bump_mappings_version()
         self.session.commit()
         return mapping
 
@@ -123,6 +203,7 @@ class CategoryService(SessionMixin):
             return False
 
         self.session.delete(mapping)
+        self._bump_mappings_version()
         self.session.commit()
         logger.info(f"Removed mapping: {provider}/{raw_category}")
         return True
@@ -279,15 +360,20 @@ class CategoryService(SessionMixin):
         results = query.all()
 
         # Enrich with mapping info
+        snapshot = self.get_mapping_snapshot()
         enriched = []
         for r in results:
-            mapping = self.get_mapping(r.provider, r.raw_category)
+            if snapshot is not None:
+                unified = snapshot.get(r.provider, r.raw_category)
+            else:
+                mapping = self.get_mapping(r.provider, r.raw_category)
+                unified = mapping.unified_category if mapping else None
             enriched.append({
                 'provider': r.provider,
                 'raw_category': r.raw_category,
                 'count': r.count,
-                'is_mapped': mapping is not None,
-                'unified_category': mapping.unified_category if mapping else None
+                'is_mapped': unified is not None,
+                'unified_category': unified
             })
 
         return enriched
@@ -387,6 +473,7 @@ class CategoryService(SessionMixin):
 
             results[prov] = updated
 
+        self._bump_data_version()
         self.session.commit()
         total = sum(results.values())
         logger.info(f"Applied mappings to {total} transactions: {results}")
@@ -415,6 +502,7 @@ class CategoryService(SessionMixin):
             query = query.filter(Transaction.account_id.in_(account_ids))
 
         count = query.update({Transaction.category: None}, synchronize_session=False)
+        self._bump_data_version()
         self.session.commit()
         logger.info(f"Cleared normalized category for {count} transactions")
         return count
@@ -439,6 +527,8 @@ class CategoryService(SessionMixin):
             synchronize_session=False
         )
 
+        self._bump_mappings_version()
+        self._bump_data_version()
         self.session.commit()
         logger.info(f"Renamed unified category '{old_name}' to '{new_name}' ({count} mappings)")
         return count
@@ -461,6 +551,8 @@ class CategoryService(SessionMixin):
             synchronize_session=False
         )
 
+        self._bump_mappings_version()
+        self._bump_data_version()
         self.session.commit()
         logger.info(f"Merged {sources} into '{target}' ({count} mappings)")
         return count
@@ -580,6 +672,8 @@ class CategoryService(SessionMixin):
                 ))
                 results['added'] += 1
 
+        if results['added'] or results['updated']:
+            self._bump_mappings_version()
         self.session.commit()
         logger.info(f"Imported mappings: {results}")
         return results
@@ -739,6 +833,7 @@ class CategoryService(SessionMixin):
             synchronize_session=False
         )
 
+        self._bump_data_version()
         self.session.commit()
         logger.info(f"Set category='{category}' on {count} transactions")
         return count
@@ -1037,6 +1132,7 @@ class CategoryService(SessionMixin):
             if self.apply_merchant_mappings_to_transaction(txn, account.institution if account else None):
                 updated += 1
 
+        self._bump_data_version()
         self.session.commit()
         logger.info(f"Applied merchant mappings to {updated} transactions")
         return updated
\ No newline at end of file
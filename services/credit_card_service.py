@@ -3,13 +3,20 @@ Credit card data synchronization service.
 Integrates credit card scrapers with database storage.
 """
 
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+import json
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Optional, List, Dict, Any, Callable, Tuple
 
-from db.models import Account, Transaction as DBTransaction
-from config.constants import AccountType, Institution, SyncType
+from sqlalchemy.exc import OperationalError
+
+from db.models import Account, SyncHistory, SyncWatermark, Transaction as DBTransaction
+from config.constants import AccountType, DataVersionKey, Institution, SyncStatus, SyncType
 from config.settings import get_card_holder_name
-from services.base_service import BaseSyncService, SyncResult
+from config.landing_store import LandingStore
+from config.session_cache import SessionCache
+from db.data_versions import bump_data_version
+from services.base_service import BaseSyncService, ScrapeOutcome, StreamingSyncMixin, SyncResult
 from services.tag_service import TagService
 from services.category_service import CategoryService
 from scrapers.credit_cards.cal_credit_card_client import (
@@ -28,20 +35,44 @@ from scrapers.credit_cards.isracard_credit_card_client import (
     IsracardCredentials,
     IsracardScraperError
 )
+from scrapers.credit_cards.shared_models import CreditCardScraperError, TransactionBatch
+from scrapers.utils.payload_log import PayloadLog
+from scrapers.utils.sync_metrics import SyncMetrics
+
+logger = logging.getLogger(__name__)
+
+ISRACARD_BASE_URL = "https://digital.isracard.co.il"
+ISRACARD_COMPANY_CODE = "11"
+
+# Display name and account name ({number} = card's account number) per institution
+CARD_INSTITUTIONS = {
+    Institution.CAL: ("CAL", "CAL Card ****{number}"),
+    Institution.MAX: ("Max", "Max Card {number}"),
+    Institution.ISRACARD: ("Isracard", "Isracard Card {number}"),
+}
 
 
-class CreditCardService(BaseSyncService):
+class CreditCardService(StreamingSyncMixin, BaseSyncService):
     """
     Service for synchronizing credit card data with the database.
-    Inherits common database operations from BaseSyncService.
+    Inherits common database operations from BaseSyncService; scrapes run
+    by SyncOrchestrator are saved month by month (see open_stream).
     """
 
+    # Days re-fetched before the watermark (late postings, pending -> completed)
+    WATERMARK_OVERLAP_DAYS = 14
+
+    # Recent sync records searched for an interrupted streamed sync to resume
+    RESUME_LOOKBACK = 20
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._category_service: Optional[CategoryService] = None
         self._category_cache: Dict[Tuple[str, str], Optional[str]] = {}
         self._unmapped_categories: Dict[str, int] = {}  # {raw_category: count}
         self._current_institution: Optional[str] = None
+        self._session_cache: Optional[SessionCache] = None
+        self._landing_store: Optional[LandingStore] = None
 
     @property
     def category_service(self) -> CategoryService:
@@ -50,6 +81,205 @@ class CreditCardService(BaseSyncService):
             self._category_service = CategoryService(session=self.db)
         return self._category_service
 
+    @property
+    def session_cache(self) -> SessionCache:
+        """Lazy-load encrypted login session cache"""
+        if self._session_cache is None:
+            self._session_cache = SessionCache()
+        return self._session_cache
+
+    @property
+    def landing_store(self) -> LandingStore:
+        """Lazy-load raw payload landing store (pruning syncs past retention)"""
+        if self._landing_store is None:
+            self._landing_store = LandingStore()
+            try:
+                self._landing_store.prune()
+            except OSError as e:
+                logger.warning(f"Could not prune landed payloads: {e}")
+        return self._landing_store
+
+    def _land_payloads(self, sync_record, institution: str, outcome: ScrapeOutcome) -> None:
+        """
+        Land the scrape's raw API payloads under the sync's id.
+
+        Replays only record which sync they replayed. Landing is best effort -
+        a full disk should not fail the sync.
+
+        Args:
+            sync_record: SyncHistory record from sync_transaction
+            institution: Institution name
+            outcome: Scrape outcome (its scraper holds the payload log)
+        """
+        if outcome.replay_of is not None:
+            self.record_sync_metadata(sync_record, replay_of=outcome.replay_of)
+            return
+
+        scraper = outcome.scraper
+        payload_log = getattr(scraper, 'payload_log', None)
+        if not isinstance(payload_log, PayloadLog) or not payload_log.entries:
+            return
+
+        start_date, end_date = scraper.fetched_range or (None, None)
+        try:
+            stats = self.landing_store.save(
+                sync_record.id,
+                institution,
+                payload_log.entries,
+                start_date=start_date.isoformat() if start_date else None,
+                end_date=end_date.isoformat() if end_date else None,
+                state=scraper.export_replay_state()
+            )
+        except OSError as e:
+            logger.warning(f"Could not land raw payloads for sync {sync_record.id}: {e}")
+            return
+        self.record_sync_metadata(sync_record, raw_payloads=stats['payloads'])
+
+    def _create_replay_scraper(self, institution: str):
+        """Scraper for replaying an institution's payloads (no credentials needed)"""
+        if institution == Institution.CAL:
+            return CALCreditCardScraper(CALCredentials(username='', password=''))
+        if institution == Institution.MAX:
+            return MaxCreditCardScraper(MaxCredentials(username='', password=''))
+        if institution == Institution.ISRACARD:
+            return IsracardCreditCardScraper(
+                credentials=IsracardCredentials(user_id='', password='', card_6_digits=''),
+                base_url=ISRACARD_BASE_URL,
+                company_code=ISRACARD_COMPANY_CODE
+            )
+        raise ValueError(f"Replay is not supported for {institution}")
+
+    def replay_fetch(self, sync_id: int) -> Tuple[str, ScrapeOutcome]:
+        """
+        Rerun a sync's conversion from its landed payloads (no browser or login).
+
+        The scraper's own fetch_transactions() runs over the recorded
+        responses, for the same date range as the original sync.
+
+        Args:
+            sync_id: SyncHistory id whose payloads were landed
+
+        Returns:
+            Tuple of (institution, ScrapeOutcome) - save it with save_replay()
+
+        Raises:
+            ValueError: If no payloads were landed for the sync
+        """
+        manifest = self.landing_store.load(sync_id)
+        if manifest is None:
+            raise ValueError(f"No landed payloads for sync {sync_id}")
+
+        institution = manifest['institution']
+        outcome = ScrapeOutcome(replay_of=sync_id)
+        try:
+            scraper = self._create_replay_scraper(institution)
+            scraper.prepare_replay(PayloadLog(replay=manifest['payloads']), manifest.get('state') or {})
+            outcome.scraper = scraper
+
+            start_date, end_date = manifest.get('start_date'), manifest.get('end_date')
+            outcome.data = scraper.fetch_transactions(
+                start_date=datetime.fromisoformat(start_date) if start_date else None,
+                end_date=datetime.fromisoformat(end_date) if end_date else None
+            )
+        except Exception as e:
+            outcome.error = e
+
+        return institution, outcome
+
+    def save_replay(self, institution: str, outcome: ScrapeOutcome) -> SyncResult:
+        """
+        Save a replayed outcome as a new sync (see replay_fetch).
+
+        Args:
+            institution: Institution name
+            outcome: Outcome from replay_fetch()
+
+        Returns:
+            SyncResult with sync operation details
+        """
+        sync_method = getattr(self, f"sync_{institution}")
+        return sync_method(username=None, password=None, prefetched=outcome)
+
+    def open_stream(
+        self,
+        institution: str,
+        username: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        **job_kwargs: Any
+    ) -> 'CardSyncStream':
+        """
+        Start a streamed sync that saves each month as it is scraped.
+
+        Args:
+            institution: Institution name
+            username: Login username (checkpoint and watermark key)
+            started_at: When the scrape started
+            **job_kwargs: Remaining fetch_<institution>() arguments (unused)
+
+        Returns:
+            CardSyncStream - pass its save() as fetch_<institution>(on_batch=...)
+            and its finish() the fetch's outcome
+        """
+        return CardSyncStream(self, institution, username, started_at)
+
+    def _scrape_with_cached_session(
+        self,
+        scraper,
+        institution: str,
+        username: str,
+        months_back: int,
+        months_forward: int,
+        since: Optional[date] = None,
+        on_batch: Optional[Callable[[TransactionBatch], None]] = None
+    ) -> Optional[List[Any]]:
+        """
+        Scrape, reusing a cached login session when it is still valid.
+
+        A fresh login's session is cached for the next sync; a cached session
+        that failed validation is dropped.
+
+        Args:
+            scraper: Credit card scraper instance
+            institution: Institution name
+            username: Login username (cache key)
+            months_back: Number of months to fetch backwards
+            months_forward: Number of months to fetch forward
+            since: Incremental start date (overrides months_back)
+            on_batch: Stream instead - called with each month's batch as it
+                is fetched (see open_stream)
+
+        Returns:
+            Card accounts returned by the scraper (None when streamed)
+        """
+        key = SessionCache.make_key(institution, username)
+        cached_state = self.session_cache.get(key)
+        start_date = datetime.combine(since, time.min) if since else None
+
+        if on_batch is None:
+            card_accounts = scraper.scrape(
+                start_date=start_date,
+                months_back=months_back,
+                months_forward=months_forward,
+                session_state=cached_state
+            )
+        else:
+            card_accounts = None
+            for batch in scraper.scrape_batches(
+                start_date=start_date,
+                months_back=months_back,
+                months_forward=months_forward,
+                session_state=cached_state
+            ):
+                on_batch(batch)
+
+        if not scraper.session_restored:
+            if isinstance(scraper.session_state, dict) and scraper.SESSION_TTL:
+                self.session_cache.put(key, scraper.session_state, scraper.SESSION_TTL)
+            elif cached_state:
+                self.session_cache.invalidate(key)
+
+        return card_accounts
+
     def _reset_category_tracking(self, institution: str):
         """Reset category tracking for a new sync operation"""
         self._category_cache = {}
@@ -67,13 +297,248 @@ class CreditCardService(BaseSyncService):
             )
         ]
 
+    def get_incremental_start(
+        self,
+        institution: str,
+        username: Optional[str] = None,
+        months_back: int = 3,
+        **job_kwargs: Any
+    ) -> Optional[date]:
+        """
+        Start date for an incremental sync of one login.
+
+        Starts WATERMARK_OVERLAP_DAYS before the newest completed transaction
+        seen (or the last sync), and never after the oldest transaction that
+        was still pending, so late postings and pending -> completed updates
+        are picked up. A streamed sync that was interrupted since resumes
+        after the last month it committed.
+
+        Args:
+            institution: Institution name
+            username: Login username (watermark key)
+            months_back: Requested full range in months
+
+        Returns:
+            Start date, or None if there is no watermark (or interrupted
+            sync) or it is older than the full range
+        """
+        if not username:
+            return None
+
+        try:
+            watermark = self._get_watermark(institution, username)
+        except OperationalError:
+            logger.debug("sync_watermarks table missing - incremental sync disabled")
+            return None
+
+        start = None
+        if watermark is not None:
+            anchor = watermark.last_completed_date or watermark.last_synced_at.date()
+            start = anchor - timedelta(days=self.WATERMARK_OVERLAP_DAYS)
+            if watermark.oldest_pending_date:
+                start = min(start, watermark.oldest_pending_date)
+
+        resume = self._get_resume_start(institution, username, watermark)
+        if resume and (start is None or resume > start):
+            start = resume
+        if start is None:
+            return None
+
+        # Same window the scrapers use for months_back
+        full_start = date.today() - timedelta(days=months_back * 30)
+        return start if start > full_start else None
+
+    def _get_resume_start(
+        self,
+        institution: str,
+        username: str,
+        watermark: Optional[SyncWatermark]
+    ) -> Optional[date]:
+        """
+        Where to resume the login's last streamed sync, if it did not finish.
+
+        Args:
+            institution: Institution name
+            username: Login username
+            watermark: Login's watermark (a later successful sync supersedes the checkpoint)
+
+        Returns:
+            First day of the month after the last committed one, or None
+        """
+        login_key = SessionCache.make_key(institution, username)
+        recent = self.db.query(SyncHistory).filter(
+            SyncHistory.institution == institution,
+            SyncHistory.sync_metadata.isnot(None)
+        ).order_by(SyncHistory.id.desc()).limit(self.RESUME_LOOKBACK)
+
+        for record in recent:
+            checkpoint = json.loads(record.sync_metadata).get('checkpoint') or {}
+            if checkpoint.get('login_key') != login_key:
+                continue
+            if record.status == SyncStatus.SUCCESS or not checkpoint.get('completed_through'):
+                return None
+            if watermark is not None and watermark.last_synced_at >= record.started_at:
+                return None
+
+            year, month = (int(part) for part in checkpoint['completed_through'].split('-'))
+            resume = date(year + month // 12, month % 12 + 1, 1)
+            logger.info(f"Resuming interrupted sync {record.id} after {checkpoint['completed_through']}")
+            return min(resume, date.today())
+        return None
+
+    def _get_watermark(self, institution: str, username: str) -> Optional[SyncWatermark]:
+        return self.db.query(SyncWatermark).filter(
+            SyncWatermark.institution == institution,
+            SyncWatermark.login_key == SessionCache.make_key(institution, username)
+        ).first()
+
+    @staticmethod
+    def _transaction_date_bounds(card_accounts: List[Any]) -> Tuple[Optional[date], Optional[date]]:
+        """
+        Newest completed and oldest pending transaction dates of card accounts.
+
+        Args:
+            card_accounts: Card accounts returned by the scraper
+
+        Returns:
+            Tuple of (newest completed date, oldest pending date), None where absent
+        """
+        completed_dates, pending_dates = [], []
+        for card_account in card_accounts:
+            for transaction in card_account.transactions:
+                transaction_date = datetime.fromisoformat(transaction.date).date()
+                if transaction.status.value == 'completed':
+                    completed_dates.append(transaction_date)
+                else:
+                    pending_dates.append(transaction_date)
+        return max(completed_dates, default=None), min(pending_dates, default=None)
+
+    def _update_watermark(
+        self,
+        institution: str,
+        username: str,
+        last_completed: Optional[date],
+        oldest_pending: Optional[date]
+    ) -> None:
+        """
+        Advance a login's watermark after its transactions were saved.
+
+        Does NOT commit - part of the sync transaction, so a failed sync keeps
+        the previous watermark.
+
+        Args:
+            institution: Institution name
+            username: Login username (watermark key)
+            last_completed: Newest completed transaction date of this sync
+            oldest_pending: Oldest pending transaction date of this sync
+        """
+        if not username:
+            return  # Replays have no login
+
+        try:
+            watermark = self._get_watermark(institution, username)
+        except OperationalError:
+            return  # Table not migrated yet - syncs stay full
+
+        if watermark is None:
+            watermark = SyncWatermark(
+                institution=institution,
+                login_key=SessionCache.make_key(institution, username)
+            )
+            self.db.add(watermark)
+
+        # A narrow incremental window may hold no completed transactions - keep the old mark
+        completed_dates = [d for d in (last_completed, watermark.last_completed_date) if d]
+        watermark.last_completed_date = max(completed_dates) if completed_dates else None
+        watermark.oldest_pending_date = oldest_pending
+        watermark.last_synced_at = datetime.utcnow()
+
+    def _complete_card_sync(
+        self,
+        sync_record,
+        institution: str,
+        username: str,
+        card_accounts: List[Any],
+        scraper: Any,
+        result: SyncResult
+    ) -> None:
+        """
+        Advance the login's watermark, or mark the sync partial.
+
+        If the scraper could not fetch some months, the previous watermark is
+        kept so the next incremental sync fetches those months again.
+
+        Args:
+            sync_record: SyncHistory record from sync_transaction
+            institution: Institution name
+            username: Login username (watermark key)
+            card_accounts: Saved card accounts
+            scraper: Scraper that fetched them (its months_failed is checked)
+            result: SyncResult to report the failed months on
+        """
+        months_failed = getattr(scraper, 'months_failed', None)
+        if isinstance(months_failed, list) and months_failed:
+            logger.warning(f"{institution} sync is partial, months not fetched: {', '.join(months_failed)}")
+            sync_record.status = SyncStatus.PARTIAL
+            self.record_sync_metadata(sync_record, months_failed=months_failed)
+            result.months_failed = list(months_failed)
+            return
+        self._update_watermark(institution, username, *self._transaction_date_bounds(card_accounts))
+
+    def fetch_cal(
+        self,
+        username: str,
+        password: str,
+        months_back: int = 3,
+        months_forward: int = 1,
+        headless: bool = True,
+        since: Optional[date] = None,
+        on_batch: Optional[Callable[[TransactionBatch], None]] = None
+    ) -> ScrapeOutcome:
+        """
+        Scrape CAL transactions (no database access, safe on a worker thread).
+
+        Args:
+            username: CAL username
+            password: CAL password
+            months_back: Number of months to fetch backwards (default: 3)
+            months_forward: Number of months to fetch forward (default: 1)
+            headless: Run browser in headless mode (default: True)
+            since: Only fetch from this date (incremental sync, see
+                get_incremental_start); None fetches months_back
+            on_batch: Stream each month's batch to this callback instead of
+                returning the card accounts (see open_stream)
+
+        Returns:
+            ScrapeOutcome with the scraped card accounts
+        """
+        outcome = ScrapeOutcome()
+
+        try:
+            # Create credentials and scraper
+            credentials = CALCredentials(username=username, password=password)
+            scraper = CALCreditCardScraper(credentials, headless=headless)
+            outcome.scraper = scraper
+
+            # Scrape transactions (reusing cached login when possible)
+            outcome.data = self._scrape_with_cached_session(
+                scraper, Institution.CAL, username, months_back, months_forward, since, on_batch
+            )
+
+        except Exception as e:
+            outcome.error = e
+
+        return outcome
+
     def sync_cal(
         self,
         username: str,
         password: str,
         months_back: int = 3,
         months_forward: int = 1,
-        headless: bool = True
+        headless: bool = True,
+        since: Optional[date] = None,
+        prefetched: Optional[ScrapeOutcome] = None
     ) -> SyncResult:
         """
         Sync CAL credit card data.
@@ -84,49 +549,39 @@ class CreditCardService(BaseSyncService):
             months_back: Number of months to fetch backwards (default: 3)
             months_forward: Number of months to fetch forward (default: 1)
             headless: Run browser in headless mode (default: True)
+            since: Only fetch from this date (incremental sync, see
+                get_incremental_start); None fetches months_back
+            prefetched: Outcome of fetch_cal() (e.g. from a worker thread);
+                saved instead of scraping here
 
         Returns:
             SyncResult with sync operation details
         """
         result = SyncResult()
+        outcome = prefetched or self.fetch_cal(username, password, months_back, months_forward, headless, since)
         self._reset_category_tracking(Institution.CAL)
 
         try:
-            with self.sync_transaction(SyncType.CREDIT_CARD, Institution.CAL) as sync_record:
+            with self.sync_transaction(
+                SyncType.CREDIT_CARD, Institution.CAL, started_at=outcome.started_at, scraper=outcome.scraper
+            ) as sync_record:
                 result.sync_history_id = sync_record.id
+                self.record_login_steps(sync_record, outcome.scraper)
+                self._land_payloads(sync_record, Institution.CAL, outcome)
 
-                # Create credentials and scraper
-                credentials = CALCredentials(username=username, password=password)
-                scraper = CALCreditCardScraper(credentials, headless=headless)
-
-                # Scrape transactions
-                card_accounts = scraper.scrape(months_back=months_back, months_forward=months_forward)
-
+                card_accounts = outcome.unwrap()
                 if not card_accounts:
                     raise CALScraperError("No card accounts found for CAL")
 
-                # Process each card account
+                # Process each card account (no commit - handled by context)
                 for card_account in card_accounts:
-                    # Get or create account in database (no commit - handled by context)
-                    db_account = self.get_or_create_account(
-                        account_type=AccountType.CREDIT_CARD,
-                        institution=Institution.CAL,
-                        account_number=card_account.account_number,
-                        account_name=f"CAL Card ****{card_account.account_number}",
-                        card_unique_id=card_account.card_unique_id
-                    )
+                    self._save_card_account(Institution.CAL, card_account, result)
                     result.cards_synced += 1
 
-                    # Save transactions (no commit per transaction - handled by context)
-                    for transaction in card_account.transactions:
-                        if self._save_transaction(db_account, transaction, Institution.CAL):
-                            result.transactions_added += 1
-                        else:
-                            result.transactions_updated += 1
-
                 # Update sync record
                 sync_record.records_added = result.transactions_added
                 sync_record.records_updated = result.transactions_updated
+                self._complete_card_sync(sync_record, Institution.CAL, username, card_accounts, outcome.scraper, result)
 
                 result.success = True
                 result.unmapped_categories = self._get_unmapped_summary()
@@ -136,13 +591,60 @@ class CreditCardService(BaseSyncService):
 
         return result
 
+    def fetch_max(
+        self,
+        username: str,
+        password: str,
+        months_back: int = 3,
+        months_forward: int = 1,
+        headless: bool = True,
+        since: Optional[date] = None,
+        on_batch: Optional[Callable[[TransactionBatch], None]] = None
+    ) -> ScrapeOutcome:
+        """
+        Scrape Max transactions (no database access, safe on a worker thread).
+
+        Args:
+            username: Max username
+            password: Max password
+            months_back: Number of months to fetch backwards (default: 3)
+            months_forward: Number of months to fetch forward (default: 1)
+            headless: Run browser in headless mode (default: True)
+            since: Only fetch from this date (incremental sync, see
+                get_incremental_start); None fetches months_back
+            on_batch: Stream each month's batch to this callback instead of
+                returning the card accounts (see open_stream)
+
+        Returns:
+            ScrapeOutcome with the scraped card accounts
+        """
+        outcome = ScrapeOutcome()
+
+        try:
+            # Create credentials and scraper
+            credentials = MaxCredentials(username=username, password=password)
+            scraper = MaxCreditCardScraper(credentials, headless=headless)
+            outcome.scraper = scraper
+
+            # Scrape transactions (reusing cached login when possible)
+            outcome.data = self._scrape_with_cached_session(
+                scraper, Institution.MAX, username, months_back, months_forward, since, on_batch
+            )
+
+        except Exception as e:
+            outcome.error = e
+
+        return outcome
+
     def sync_max(
         self,
         username: str,
         password: str,
         months_back: int = 3,
         months_forward: int = 1,
-        headless: bool = True
+        headless: bool = True,
+        since: Optional[date] = None,
+        prefetched: Optional[ScrapeOutcome] = None
     ) -> SyncResult:
         """
         Sync Max credit card data.
@@ -153,49 +655,39 @@ class CreditCardService(BaseSyncService):
             months_back: Number of months to fetch backwards (default: 3)
             months_forward: Number of months to fetch forward (default: 1)
             headless: Run browser in headless mode (default: True)
+            since: Only fetch from this date (incremental sync, see
+                get_incremental_start); None fetches months_back
+            prefetched: Outcome of fetch_max() (e.g. from a worker thread);
+                saved instead of scraping here
 
         Returns:
             SyncResult with sync operation details
         """
         result = SyncResult()
+        outcome = prefetched or self.fetch_max(username, password, months_back, months_forward, headless, since)
         self._reset_category_tracking(Institution.MAX)
 
         try:
-            with self.sync_transaction(SyncType.CREDIT_CARD, Institution.MAX) as sync_record:
+            with self.sync_transaction(
+                SyncType.CREDIT_CARD, Institution.MAX, started_at=outcome.started_at, scraper=outcome.scraper
+            ) as sync_record:
                 result.sync_history_id = sync_record.id
+                self.record_login_steps(sync_record, outcome.scraper)
+                self._land_payloads(sync_record, Institution.MAX, outcome)
 
-                # Create credentials and scraper
-                credentials = MaxCredentials(username=username, password=password)
-                scraper = MaxCreditCardScraper(credentials, headless=headless)
-
-                # Scrape transactions
-                card_accounts = scraper.scrape(months_back=months_back, months_forward=months_forward)
-
+                card_accounts = outcome.unwrap()
                 if not card_accounts:
                     raise MaxScraperError("No card accounts found for Max")
 
-                # Process each card account
+                # Process each card account (no commit - handled by context)
                 for card_account in card_accounts:
-                    # Get or create account in database (no commit - handled by context)
-                    db_account = self.get_or_create_account(
-                        account_type=AccountType.CREDIT_CARD,
-                        institution=Institution.MAX,
-                        account_number=card_account.account_number,
-                        account_name=f"Max Card {card_account.account_number}",
-                        card_unique_id=None  # Max doesn't use card_unique_id
-                    )
+                    self._save_card_account(Institution.MAX, card_account, result)
                     result.cards_synced += 1
 
-                    # Save transactions (no commit per transaction - handled by context)
-                    for transaction in card_account.transactions:
-                        if self._save_transaction(db_account, transaction, Institution.MAX):
-                            result.transactions_added += 1
-                        else:
-                            result.transactions_updated += 1
-
                 # Update sync record
                 sync_record.records_added = result.transactions_added
                 sync_record.records_updated = result.transactions_updated
+                self._complete_card_sync(sync_record, Institution.MAX, username, card_accounts, outcome.scraper, result)
 
                 result.success = True
                 result.unmapped_categories = self._get_unmapped_summary()
@@ -205,13 +697,78 @@ class CreditCardService(BaseSyncService):
 
         return result
 
+    def fetch_isracard(
+        self,
+        username: str,
+        password: str,
+        months_back: int = 3,
+        months_forward: int = 1,
+        headless: bool = True,
+        since: Optional[date] = None,
+        on_batch: Optional[Callable[[TransactionBatch], None]] = None
+    ) -> ScrapeOutcome:
+        """
+        Scrape Isracard transactions (no database access, safe on a worker thread).
+
+        Args:
+            username: Isracard username in format "user_id:card_6_digits"
+            password: Isracard password
+            months_back: Number of months to fetch backwards (default: 3)
+            months_forward: Number of months to fetch forward (default: 1)
+            headless: Run browser in headless mode (default: True)
+            since: Only fetch from this date (incremental sync, see
+                get_incremental_start); None fetches months_back
+            on_batch: Stream each month's batch to this callback instead of
+                returning the card accounts (see open_stream)
+
+        Returns:
+            ScrapeOutcome with the scraped card accounts
+        """
+        outcome = ScrapeOutcome()
+
+        try:
+            # Parse username (format: "user_id:card_6_digits")
+            if ':' in username:
+                user_id, card_6_digits = username.split(':', 1)
+            else:
+                raise IsracardScraperError(
+                    "Invalid Isracard username format. Expected 'user_id:card_6_digits' "
+                    "(e.g., '123456789:123456')"
+                )
+
+            # Create credentials and scraper
+            credentials = IsracardCredentials(
+                user_id=user_id,
+                password=password,
+                card_6_digits=card_6_digits
+            )
+            scraper = IsracardCreditCardScraper(
+                credentials=credentials,
+                base_url=ISRACARD_BASE_URL,
+                company_code=ISRACARD_COMPANY_CODE,
+                headless=headless
+            )
+            outcome.scraper = scraper
+
+            # Scrape transactions (reusing cached login when possible)
+            outcome.data = self._scrape_with_cached_session(
+                scraper, Institution.ISRACARD, username, months_back, months_forward, since, on_batch
+            )
+
+        except Exception as e:
+            outcome.error = e
+
+        return outcome
+
     def sync_isracard(
         self,
         username: str,
         password: str,
         months_back: int = 3,
         months_forward: int = 1,
-        headless: bool = True
+        headless: bool = True,
+        since: Optional[date] = None,
+        prefetched: Optional[ScrapeOutcome] = None
     ) -> SyncResult:
         """
         Sync Isracard credit card data.
@@ -222,67 +779,39 @@ class CreditCardService(BaseSyncService):
             months_back: Number of months to fetch backwards (default: 3)
             months_forward: Number of months to fetch forward (default: 1)
             headless: Run browser in headless mode (default: True)
+            since: Only fetch from this date (incremental sync, see
+                get_incremental_start); None fetches months_back
+            prefetched: Outcome of fetch_isracard() (e.g. from a worker thread);
+                saved instead of scraping here
 
         Returns:
             SyncResult with sync operation details
         """
         result = SyncResult()
+        outcome = prefetched or self.fetch_isracard(username, password, months_back, months_forward, headless, since)
         self._reset_category_tracking(Institution.ISRACARD)
 
         try:
-            with self.sync_transaction(SyncType.CREDIT_CARD, Institution.ISRACARD) as sync_record:
+            with self.sync_transaction(
+                SyncType.CREDIT_CARD, Institution.ISRACARD, started_at=outcome.started_at, scraper=outcome.scraper
+            ) as sync_record:
                 result.sync_history_id = sync_record.id
+                self.record_login_steps(sync_record, outcome.scraper)
+                self._land_payloads(sync_record, Institution.ISRACARD, outcome)
 
-                # Parse username (format: "user_id:card_6_digits")
-                if ':' in username:
-                    user_id, card_6_digits = username.split(':', 1)
-                else:
-                    raise IsracardScraperError(
-                        "Invalid Isracard username format. Expected 'user_id:card_6_digits' "
-                        "(e.g., '123456789:123456')"
-                    )
-
-                # Create credentials and scraper
-                credentials = IsracardCredentials(
-                    user_id=user_id,
-                    password=password,
-                    card_6_digits=card_6_digits
-                )
-                scraper = IsracardCreditCardScraper(
-                    credentials=credentials,
-                    base_url="https://digital.isracard.co.il",
-                    company_code="11",
-                    headless=headless
-                )
-
-                # Scrape transactions
-                card_accounts = scraper.scrape(months_back=months_back, months_forward=months_forward)
-
+                card_accounts = outcome.unwrap()
                 if not card_accounts:
                     raise IsracardScraperError("No card accounts found for Isracard")
 
-                # Process each card account
+                # Process each card account (no commit - handled by context)
                 for card_account in card_accounts:
-                    # Get or create account in database (no commit - handled by context)
-                    db_account = self.get_or_create_account(
-                        account_type=AccountType.CREDIT_CARD,
-                        institution=Institution.ISRACARD,
-                        account_number=card_account.account_number,
-                        account_name=f"Isracard Card {card_account.account_number}",
-                        card_unique_id=None  # Isracard doesn't use card_unique_id
-                    )
+                    self._save_card_account(Institution.ISRACARD, card_account, result)
                     result.cards_synced += 1
 
-                    # Save transactions (no commit per transaction - handled by context)
-                    for transaction in card_account.transactions:
-                        if self._save_transaction(db_account, transaction, Institution.ISRACARD):
-                            result.transactions_added += 1
-                        else:
-                            result.transactions_updated += 1
-
                 # Update sync record
                 sync_record.records_added = result.transactions_added
                 sync_record.records_updated = result.transactions_updated
+                self._complete_card_sync(sync_record, Institution.ISRACARD, username, card_accounts, outcome.scraper, result)
 
                 result.success = True
                 result.unmapped_categories = self._get_unmapped_summary()
@@ -292,12 +821,44 @@ class CreditCardService(BaseSyncService):
 
         return result
 
+    def _save_card_account(self, institution: str, card_account: Any, result: SyncResult) -> Account:
+        """
+        Save a scraped card account and its transactions, counting them in result.
+
+        Does NOT commit - relies on the caller's transaction management.
+
+        Args:
+            institution: Institution name
+            card_account: Card account returned by the scraper
+            result: SyncResult whose transaction counts and ids are updated
+
+        Returns:
+            The database account
+        """
+        db_account = self.get_or_create_account(
+            account_type=AccountType.CREDIT_CARD,
+            institution=institution,
+            account_number=card_account.account_number,
+            account_name=CARD_INSTITUTIONS[institution][1].format(number=card_account.account_number),
+            # Only CAL identifies cards by a unique id
+            card_unique_id=getattr(card_account, 'card_unique_id', None)
+        )
+
+        for transaction in card_account.transactions:
+            added, transaction_id = self._save_transaction(db_account, transaction, institution)
+            if added:
+                result.transactions_added += 1
+            else:
+                result.transactions_updated += 1
+            result.transaction_ids.append(transaction_id)
+        return db_account
+
     def _save_transaction(
         self,
         account: Account,
         transaction: Transaction,
         institution: str
-    ) -> bool:
+    ) -> Tuple[bool, int]:
         """
         Save transaction to database with deduplication and category normalization.
 
@@ -318,7 +879,8 @@ class CreditCardService(BaseSyncService):
             institution: Institution name for category normalization
 
         Returns:
-            True if new transaction was added, False if existing was updated
+            Tuple of (True if new transaction was added / False if existing
+            was updated, database id of the transaction)
         """
         # Parse dates
         transaction_date = datetime.fromisoformat(transaction.date).date()
@@ -389,7 +951,7 @@ class CreditCardService(BaseSyncService):
                 existing_transaction.installment_number = transaction.installments.number
                 existing_transaction.installment_total = transaction.installments.total
 
-            return False
+            return False, existing_transaction.id
 
         # Create new transaction
         db_transaction = DBTransaction(
@@ -415,27 +977,28 @@ class CreditCardService(BaseSyncService):
         self.db.flush()  # Get the transaction ID before committing
 
         # Auto-tag new transaction
-        try:
-            tag_service = TagService(session=self.db)
-            tags_to_add = []
+        with self.phase("tagging"):
+            try:
+                tag_service = TagService(session=self.db)
+                tags_to_add = []
 
-            # Tag with effective category (normalized if available, otherwise raw)
-            effective_cat = normalized_category or raw_category
-            if effective_cat:
-                tags_to_add.append(effective_cat)
+                # Tag with effective category (normalized if available, otherwise raw)
+                effective_cat = normalized_category or raw_category
+                if effective_cat:
+                    tags_to_add.append(effective_cat)
 
-            # Tag with card holder name if configured
-            if account.account_number:
-                holder_name = get_card_holder_name(account.account_number)
-                if holder_name:
-                    tags_to_add.append(holder_name)
+                # Tag with card holder name if configured
+                if account.account_number:
+                    holder_name = get_card_holder_name(account.account_number)
+                    if holder_name:
+                        tags_to_add.append(holder_name)
 
-            if tags_to_add:
-                tag_service.tag_transaction(db_transaction.id, tags_to_add)
-        except Exception:
-            pass  # Don't fail sync if tagging fails
+                if tags_to_add:
+                    tag_service.tag_transaction(db_transaction.id, tags_to_add)
+            except Exception:
+                pass  # Don't fail sync if tagging fails
 
-        return True
+        return True, db_transaction.id
 
     def get_card_transactions(
         self,
@@ -499,4 +1062,215 @@ class CreditCardService(BaseSyncService):
                 "installments": f"{t.installment_number}/{t.installment_total}" if t.installment_number else None
             }
             for t in transactions
-        ]
\ No newline at end of file
+        ]
+
+
+class CardSyncStream:
+    """
+    Writer side of a streamed credit card sync.
+
+    Each TransactionBatch (one month, all cards) is saved and committed as it
+    arrives, so a long backfill holds only a few months in memory and a late
+    failure keeps the months already saved. After each month the sync
+    record's metadata gets a checkpoint naming the last month committed
+    without gaps; get_incremental_start() resumes an interrupted sync after
+    it. The watermark only moves once every month was fetched and saved; a
+    sync with failed months is recorded as partial and resumed. Saving is
+    timed per month and recorded with the scraper's metrics on finish.
+
+    Usage:
+        stream = service.open_stream('cal', username=username)
+        outcome = service.fetch_cal(username, password, on_batch=stream.save)
+        result = stream.finish(outcome)
+    """
+
+    def __init__(
+        self,
+        service: CreditCardService,
+        institution: str,
+        username: Optional[str] = None,
+        started_at: Optional[datetime] = None
+    ):
+        """
+        Args:
+            service: Service (and session) the batches are saved with
+            institution: Institution name
+            username: Login username (checkpoint and watermark key)
+            started_at: When the scrape started
+        """
+        self.service = service
+        self.db = service.db
+        self.institution = institution
+        self.username = username
+        self.result = SyncResult()
+        self.error: Optional[Exception] = None  # Saving failed - later batches are dropped
+
+        self._cards: set = set()
+        self._months_failed: List[str] = []
+        self._first_month_error: Optional[Exception] = None
+        self._checkpoint: Dict[str, Any] = {'batches': 0}
+        if username:
+            self._checkpoint['login_key'] = SessionCache.make_key(institution, username)
+        self._last_completed: Optional[date] = None
+        self._oldest_pending: Optional[date] = None
+        self._raw_payloads = 0
+        self.metrics = SyncMetrics()  # Saving side (the scraper times its own phases)
+
+        service._reset_category_tracking(institution)
+        self.sync_record = SyncHistory(
+            sync_type=SyncType.CREDIT_CARD,
+            institution=institution,
+            status=SyncStatus.IN_PROGRESS,
+            started_at=started_at or datetime.utcnow()
+        )
+        self.db.add(self.sync_record)
+        self.db.commit()
+        self.result.sync_history_id = self.sync_record.id
+
+    def save(self, batch: TransactionBatch) -> None:
+        """
+        Save and commit one month.
+
+        A month the scraper could not fetch stops the checkpoint from
+        advancing (later months are still saved).
+
+        Args:
+            batch: Month from the scraper's iter_transaction_batches()
+        """
+        if self.error is not None:
+            return
+
+        try:
+            with self.service.measure_persist(self.metrics):
+                self._save_batch(batch)
+        except Exception as e:
+            logger.exception(f"Failed to save {batch.label} for {self.institution}")
+            self.db.rollback()
+            self.error = e
+
+    def _save_batch(self, batch: TransactionBatch) -> None:
+        """Save one month, its checkpoint and payloads, and commit"""
+        for card_account in batch.accounts:
+            self.service._save_card_account(self.institution, card_account, self.result)
+            self._cards.add(card_account.account_number)
+
+        last_completed, oldest_pending = self.service._transaction_date_bounds(batch.accounts)
+        if last_completed and (self._last_completed is None or last_completed > self._last_completed):
+            self._last_completed = last_completed
+        if oldest_pending and (self._oldest_pending is None or oldest_pending < self._oldest_pending):
+            self._oldest_pending = oldest_pending
+
+        self._checkpoint['batches'] += 1
+        if batch.error is not None:
+            self._months_failed.append(batch.label)
+            self._first_month_error = self._first_month_error or batch.error
+        elif not self._months_failed:
+            self._checkpoint['completed_through'] = batch.label
+
+        self.sync_record.records_added = self.result.transactions_added
+        self.sync_record.records_updated = self.result.transactions_updated
+        self.service.record_sync_metadata(
+            self.sync_record,
+            checkpoint=self._checkpoint,
+            **({'months_failed': self._months_failed} if self._months_failed else {})
+        )
+        self._land(batch.payloads)
+        bump_data_version(self.db, DataVersionKey.DATA)
+        self.db.commit()
+
+    def finish(self, outcome: ScrapeOutcome) -> SyncResult:
+        """
+        Complete the sync once the scrape ended.
+
+        Args:
+            outcome: The streamed fetch's outcome (carries any scrape error)
+
+        Returns:
+            SyncResult with sync operation details
+        """
+        result = self.result
+        record = self.sync_record
+        record.started_at = min(record.started_at, outcome.started_at)
+        self.service.record_login_steps(record, outcome.scraper)
+
+        try:
+            if self.error is not None:
+                raise self.error
+            outcome.unwrap()
+            if not self._cards:
+                if self._first_month_error is not None:
+                    raise self._first_month_error
+                raise CreditCardScraperError(f"No card accounts found for {CARD_INSTITUTIONS[self.institution][0]}")
+
+            payload_log = getattr(outcome.scraper, 'payload_log', None)
+            if isinstance(payload_log, PayloadLog):
+                self._land(payload_log.drain(), **self._landing_context(outcome.scraper))
+
+            self._record_metrics(outcome.scraper)
+            if self._months_failed:
+                # Keep the watermark - the next sync resumes after the checkpoint
+                logger.warning(
+                    f"{self.institution} sync is partial, months not fetched: {', '.join(self._months_failed)}"
+                )
+                record.status = SyncStatus.PARTIAL
+                result.months_failed = list(self._months_failed)
+            else:
+                self.service._update_watermark(
+                    self.institution, self.username, self._last_completed, self._oldest_pending
+                )
+                record.status = SyncStatus.SUCCESS
+            record.completed_at = datetime.utcnow()
+            bump_data_version(self.db, DataVersionKey.DATA)
+            self.db.commit()
+            result.success = True
+            result.cards_synced = len(self._cards)
+            result.unmapped_categories = self.service._get_unmapped_summary()
+
+        except Exception as e:
+            # Months already committed stay saved; the checkpoint lets the next sync resume
+            self.db.rollback()
+            self._record_metrics(outcome.scraper)
+            record.status = SyncStatus.FAILED
+            record.completed_at = datetime.utcnow()
+            record.error_message = str(e)
+            self.db.commit()
+            result.error_message = str(e)
+
+        return result
+
+    def _record_metrics(self, scraper: Any) -> None:
+        """Record the scraper's metrics with the time spent saving months"""
+        metrics = SyncMetrics()
+        scraper_metrics = getattr(scraper, 'metrics', None)
+        if isinstance(scraper_metrics, SyncMetrics):
+            metrics.merge(scraper_metrics)
+        metrics.merge(self.metrics)
+        self.service.record_sync_metrics(self.sync_record, metrics)
+
+    def _land(self, payloads: Dict[str, Any], **context: Any) -> None:
+        """Append raw payloads to the sync's landing manifest (best effort)"""
+        if not payloads and not context:
+            return
+        try:
+            stats = self.service.landing_store.save(
+                self.sync_record.id, self.institution, payloads, append=True, **context
+            )
+        except OSError as e:
+            logger.warning(f"Could not land raw payloads for sync {self.sync_record.id}: {e}")
+            return
+        if stats['payloads']:
+            self._raw_payloads += stats['payloads']
+            self.service.record_sync_metadata(self.sync_record, raw_payloads=self._raw_payloads)
+
+    @staticmethod
+    def _landing_context(scraper: Any) -> Dict[str, Any]:
+        """Date range and replay state for the landing manifest"""
+        fetched_range = getattr(scraper, 'fetched_range', None)
+        if not isinstance(fetched_range, tuple):
+            return {}
+        start_date, end_date = fetched_range
+        return {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'state': scraper.export_replay_state(),
+        }
@@ -9,7 +9,7 @@ import re
 
 from db.models import Account, Balance
 from config.constants import AccountType, Institution, SyncType
-from services.base_service import BaseSyncService, SyncResult
+from services.base_service import BaseSyncService, ScrapeOutcome, SyncResult
 from scrapers.pensions.migdal_pension_client import (
     MigdalEmailMFARetriever,
     MigdalSeleniumMFAAutomator
@@ -27,12 +27,80 @@ class PensionService(BaseSyncService):
     Inherits common database operations from BaseSyncService.
     """
 
-    def sync_migdal(
+    def fetch_migdal(
         self,
         user_id: str,
         email_address: str,
         email_password: str,
         headless: bool = True
+    ) -> ScrapeOutcome:
+        """
+        Log in to Migdal and extract financial data (no database access).
+
+        Safe to run on a worker thread while other accounts log in - MFA codes
+        are routed to the right login (see scrapers.base.mfa_router).
+
+        Args:
+            user_id: Migdal user ID
+            email_address: Email for MFA
+            email_password: Email password (app password)
+            headless: Run browser in headless mode (default: True)
+
+        Returns:
+            ScrapeOutcome with the financial data dict (or the login error)
+        """
+        # Configure email and MFA
+        email_config = EmailConfig(
+            email_address=email_address,
+            password=email_password
+        )
+
+        mfa_config = MFAConfig(
+            sender_email="noreply@migdal.co.il",
+            sender_name="Migdal",
+            code_pattern=r'\b\d{6}\b'
+        )
+
+        # Create retriever and automator
+        email_retriever = MigdalEmailMFARetriever(email_config, mfa_config)
+        automator = MigdalSeleniumMFAAutomator(email_retriever, headless=headless)
+        outcome = ScrapeOutcome(scraper=automator)
+
+        try:
+            # Login
+            site_url = "https://my.migdal.co.il/mymigdal/process/login"
+            credentials = {'id': user_id}
+            selectors = {
+                'id_selector': "input#username[type='number']",
+                'login_button_selector': 'button[type="submit"]',
+                'email_label_selector': 'label[for="otpToEmail"]',
+                'continue_button_selector': 'button.form-btn'
+            }
+
+            with automator.metrics.phase("login"):
+                success = automator.login(site_url, credentials, selectors)
+            if not success:
+                raise Exception("Failed to login to Migdal")
+
+            # Extract financial data
+            with automator.metrics.phase("fetch"):
+                outcome.data = automator.extract_financial_data()
+
+        except Exception as e:
+            outcome.error = e
+
+        finally:
+            automator.cleanup()
+
+        return outcome
+
+    def sync_migdal(
+        self,
+        user_id: str,
+        email_address: str,
+        email_password: str,
+        headless: bool = True,
+        prefetched: Optional[ScrapeOutcome] = None
     ) -> SyncResult:
         """
         Sync Migdal pension data.
@@ -42,49 +110,23 @@ class PensionService(BaseSyncService):
             email_address: Email for MFA
             email_password: Email password (app password)
             headless: Run browser in headless mode (default: True)
+            prefetched: Outcome of fetch_migdal() (e.g. from a worker thread);
+                saved instead of scraping here
 
         Returns:
             SyncResult with sync operation details
         """
         result = SyncResult()
-        automator = None
+        outcome = prefetched or self.fetch_migdal(user_id, email_address, email_password, headless)
 
         try:
-            with self.sync_transaction(SyncType.PENSION, Institution.MIGDAL) as sync_record:
+            with self.sync_transaction(
+                SyncType.PENSION, Institution.MIGDAL, started_at=outcome.started_at, scraper=outcome.scraper
+            ) as sync_record:
                 result.sync_history_id = sync_record.id
+                self.record_login_steps(sync_record, outcome.scraper)
 
-                # Configure email and MFA
-                email_config = EmailConfig(
-                    email_address=email_address,
-                    password=email_password
-                )
-
-                mfa_config = MFAConfig(
-                    sender_email="noreply@migdal.co.il",
-                    sender_name="Migdal",
-                    code_pattern=r'\b\d{6}\b'
-                )
-
-                # Create retriever and automator
-                email_retriever = MigdalEmailMFARetriever(email_config, mfa_config)
-                automator = MigdalSeleniumMFAAutomator(email_retriever, headless=headless)
-
-                # Login
-                site_url = "https://my.migdal.co.il/mymigdal/process/login"
-                credentials = {'id': user_id}
-                selectors = {
-                    'id_selector': "input#username[type='number']",
-                    'login_button_selector': 'button[type="submit"]',
-                    'email_label_selector': 'label[for="otpToEmail"]',
-                    'continue_button_selector': 'button.form-btn'
-                }
-
-                success = automator.login(site_url, credentials, selectors)
-                if not success:
-                    raise Exception("Failed to login to Migdal")
-
-                # Extract financial data
-                financial_data = automator.extract_financial_data()
+                financial_data = outcome.unwrap()
                 result.financial_data = financial_data
 
                 # Parse and save balances
@@ -129,18 +171,85 @@ class PensionService(BaseSyncService):
         except Exception as e:
             result.error_message = str(e)
 
+        return result
+
+    def fetch_phoenix(
+        self,
+        user_id: str,
+        email_address: str,
+        email_password: str,
+        headless: bool = True
+    ) -> ScrapeOutcome:
+        """
+        Log in to Phoenix and extract financial data (no database access).
+
+        Safe to run on a worker thread while other accounts log in - MFA codes
+        are routed to the right login (see scrapers.base.mfa_router).
+
+        Args:
+            user_id: Phoenix user ID
+            email_address: Email for MFA
+            email_password: Email password (app password)
+            headless: Run browser in headless mode (default: True)
+
+        Returns:
+            ScrapeOutcome with the financial data dict (or the login error)
+        """
+        # Configure email and MFA
+        email_config = EmailConfig(
+            email_address=email_address,
+            password=email_password
+        )
+
+        mfa_config = MFAConfig(
+            sender_email="fnxnoreplay@fnx.co.il",
+            sender_name="Phoenix",
+            code_pattern=r'\b\d{6}\b'
+        )
+
+        # Create retriever and automator
+        email_retriever = PhoenixEmailMFARetriever(email_config, mfa_config)
+        automator = PhoenixSeleniumMFAAutomator(email_retriever, headless=headless)
+        outcome = ScrapeOutcome(scraper=automator)
+
+        try:
+            # Login
+            site_url = "https://my.fnx.co.il/"
+            credentials = {
+                'id': user_id,
+                'email': email_address
+            }
+            selectors = {
+                'id_field': 'input[name="identityNumber"]',
+                'email_field': 'input[name="email"]',
+                'mfa_field': 'input[name="otpCode"]',
+                'mfa_submit_button': 'button[type="submit"]'
+            }
+
+            with automator.metrics.phase("login"):
+                success = automator.login(site_url, credentials, selectors)
+            if not success:
+                raise Exception("Failed to login to Phoenix")
+
+            # Extract financial data
+            with automator.metrics.phase("fetch"):
+                outcome.data = automator.extract_financial_data()
+
+        except Exception as e:
+            outcome.error = e
+
         finally:
-            if automator:
-                automator.cleanup()
+            automator.cleanup()
 
-        return result
+        return outcome
 
     def sync_phoenix(
         self,
         user_id: str,
         email_address: str,
         email_password: str,
-        headless: bool = True
+        headless: bool = True,
+        prefetched: Optional[ScrapeOutcome] = None
     ) -> SyncResult:
         """
         Sync Phoenix pension data.
@@ -150,52 +259,23 @@ class PensionService(BaseSyncService):
             email_address: Email for MFA
             email_password: Email password (app password)
             headless: Run browser in headless mode (default: True)
+            prefetched: Outcome of fetch_phoenix() (e.g. from a worker thread);
+                saved instead of scraping here
 
         Returns:
             SyncResult with sync operation details
         """
         result = SyncResult()
-        automator = None
+        outcome = prefetched or self.fetch_phoenix(user_id, email_address, email_password, headless)
 
         try:
-            with self.sync_transaction(SyncType.PENSION, Institution.PHOENIX) as sync_record:
+            with self.sync_transaction(
+                SyncType.PENSION, Institution.PHOENIX, started_at=outcome.started_at, scraper=outcome.scraper
+            ) as sync_record:
                 result.sync_history_id = sync_record.id
+                self.record_login_steps(sync_record, outcome.scraper)
 
-                # Configure email and MFA
-                email_config = EmailConfig(
-                    email_address=email_address,
-                    password=email_password
-                )
-
-                mfa_config = MFAConfig(
-                    sender_email="fnxnoreplay@fnx.co.il",
-                    sender_name="Phoenix",
-                    code_pattern=r'\b\d{6}\b'
-                )
-
-                # Create retriever and automator
-                email_retriever = PhoenixEmailMFARetriever(email_config, mfa_config)
-                automator = PhoenixSeleniumMFAAutomator(email_retriever, headless=headless)
-
-                # Login
-                site_url = "https://my.fnx.co.il/"
-                credentials = {
-                    'id': user_id,
-                    'email': email_address
-                }
-                selectors = {
-                    'id_field': 'input[name="identityNumber"]',
-                    'email_field': 'input[name="email"]',
-                    'mfa_field': 'input[name="otpCode"]',
-                    'mfa_submit_button': 'button[type="submit"]'
-                }
-
-                success = automator.login(site_url, credentials, selectors)
-                if not success:
-                    raise Exception("Failed to login to Phoenix")
-
-                # Extract financial data
-                financial_data = automator.extract_financial_data()
+                financial_data = outcome.unwrap()
                 result.financial_data = financial_data
 
                 # Parse and save individual balances
@@ -268,10 +348,6 @@ class PensionService(BaseSyncService):
         except Exception as e:
             result.error_message = str(e)
 
-        finally:
-            if automator:
-                automator.cleanup()
-
         return result
 
     def _parse_amount(self, amount_str: str) -> Optional[float]:
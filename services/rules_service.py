@@ -5,17 +5,21 @@ Rules are stored in ~/.fin/category_rules.yaml and applied automatically after s
 or manually via `fin rules apply`.
 """
 
+import hashlib
+import json
 import logging
 import re
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
 import yaml
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
-from db.models import Transaction
+from db.models import RulesState, Transaction
 from services.tag_service import TagService
 from services.base_service import SessionMixin
 from config.settings import CONFIG_DIR
@@ -25,6 +29,9 @@ logger = logging.getLogger(__name__)
 # Default rules file location
 RULES_FILE = CONFIG_DIR / "category_rules.yaml"
 
+# Transaction ids per query when applying rules to a sync's transactions
+APPLY_BATCH_SIZE = 500
+
 
 class MatchType(Enum):
     """How to match the pattern against transaction description"""
@@ -118,6 +125,11 @@ class Rule:
             enabled=data.get("enabled", True),
         )
 
+    @property
+    def fingerprint(self) -> str:
+        """Hash of everything that affects what the rule does"""
+        return hashlib.sha256(json.dumps(self.to_dict(), sort_keys=True).encode("utf-8")).hexdigest()
+
 
 class RulesService(SessionMixin):
     """Service for managing and applying categorization rules"""
@@ -332,6 +344,7 @@ class RulesService(SessionMixin):
             if result["remove_tags"]:
                 tag_service.untag_transaction(transaction.id, result["remove_tags"])
 
+            self._bump_data_version()
             self.session.commit()
 
         return result
@@ -400,10 +413,73 @@ class RulesService(SessionMixin):
                 })
 
         if not dry_run:
+            self._bump_data_version()
             self.session.commit()
 
         return results
 
+    def apply_rules_after_sync(self, transaction_ids: Iterable[int]) -> Dict[str, Any]:
+        """
+        Apply rules to what a sync changed, instead of to all history
+
+        All rules are applied to the sync's inserted/updated transactions
+        (if uncategorized). If the rules file changed since rules were last
+        applied after a sync (its hash is kept in rules_state), the new or
+        edited rules are also applied to all uncategorized transactions -
+        unchanged rules already saw those.
+
+        Args:
+            transaction_ids: Ids of the transactions the sync inserted or updated
+
+        Returns:
+            Summary: {processed: int, modified: int, details: [...]}
+        """
+        self._ensure_loaded()
+
+        if not self._rules:
+            return {"processed": 0, "modified": 0, "details": [], "message": "No rules defined"}
+
+        results = {"processed": 0, "modified": 0, "details": []}
+
+        ids = sorted(set(transaction_ids))
+        for start in range(0, len(ids), APPLY_BATCH_SIZE):
+            self._add_results(results, self.apply_rules(ids[start:start + APPLY_BATCH_SIZE], only_uncategorized=True))
+
+        file_hash = hashlib.sha256(self.rules_file.read_bytes()).hexdigest() if self.rules_file.exists() else ""
+        try:
+            state = self.session.get(RulesState, str(self.rules_file))
+        except OperationalError:
+            # rules_state table missing (run 'fin-cli maintenance migrate') - all rules may be new
+            logger.debug("rules_state table missing - applying all rules to uncategorized transactions")
+            self._add_results(results, self.apply_rules(only_uncategorized=True))
+            return results
+
+        if state is not None and state.file_hash == file_hash:
+            return results
+
+        applied = set(json.loads(state.rule_hashes)) if state is not None else set()
+        changed = [index for index, rule in enumerate(self._rules) if rule.fingerprint not in applied]
+        if changed:
+            logger.info(f"Rules file changed - applying {len(changed)} new or edited rules to uncategorized transactions")
+            self._add_results(results, self.apply_rules(only_uncategorized=True, rule_indices=changed))
+
+        if state is None:
+            state = RulesState(rules_file=str(self.rules_file))
+            self.session.add(state)
+        state.file_hash = file_hash
+        state.rule_hashes = json.dumps([rule.fingerprint for rule in self._rules])
+        state.applied_at = datetime.utcnow()
+        self.session.commit()
+
+        return results
+
+    @staticmethod
+    def _add_results(results: Dict[str, Any], more: Dict[str, Any]) -> None:
+        """Add one apply_rules() summary to another"""
+        results["processed"] += more["processed"]
+        results["modified"] += more["modified"]
+        results["details"].extend(more["details"])
+
     def create_default_rules_file(self) -> bool:
         """Create an empty rules file with format documentation"""
         if self.rules_file.exists():
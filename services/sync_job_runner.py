@@ -0,0 +1,650 @@
+"""
+In-process runner for syncs started through the API.
+
+Each job is a row in sync_jobs and runs on a small thread pool inside the
+API process, calling the sync services directly through SyncOrchestrator -
+no CLI subprocess per job and no scraping of its stdout. Progress is
+recorded as structured events in sync_job_events ({'message': ...,
+'data': {'phase': 'month', 'card': ..., 'month': '2026-03', ...}}), so any
+API worker can stream a job and a client that reconnects resumes after the
+last event it received (SSE Last-Event-ID).
+
+Jobs of one institution run at most PER_INSTITUTION_LIMIT at a time per
+process (they would share logins and cached sessions); the rest wait as
+pending. Jobs left pending or running by a process that is gone are
+marked failed when the next runner starts.
+
+Streams of jobs running in this process are pushed, not polled: each job
+has a JobChannel holding its latest events in a bounded ring buffer, and
+every subscribed stream is woken the moment an event is recorded. A
+subscriber that falls behind the buffer (or resumes from an old
+Last-Event-ID) reads the gap from the database, so memory stays capped
+however long the sync runs.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from config.constants import SyncJobStatus, SyncType
+from db.database import SessionLocal
+from db.models import SyncJobEvent, SyncJobRecord
+from scrapers.utils.sync_metrics import SyncMetrics
+from services.base_service import BaseSyncService, SyncResult
+from services.rules_service import RULES_FILE, RulesService
+from services.sync_orchestrator import (
+    INSTITUTION_NAMES,
+    SYNC_SERVICES,
+    SyncJob,
+    SyncOrchestrator,
+    build_sync_jobs,
+)
+
+logger = logging.getLogger(__name__)
+
+# Jobs running at once in one API process
+MAX_CONCURRENT_JOBS = 3
+
+# Jobs of the same institution running at once in one API process
+PER_INSTITUTION_LIMIT = 1
+
+# Accounts of one job scraped at the same time
+ACCOUNTS_IN_PARALLEL = 2
+
+# Credit card range when the request does not give one (matches fin-cli sync)
+DEFAULT_MONTHS_BACK = 3
+
+# Event types that end a job's stream
+FINAL_EVENTS = ("success", "error")
+
+# Latest events kept in memory per running job for streaming subscribers
+EVENT_BUFFER_SIZE = 256
+
+
+class JobChannel:
+    """
+    Broadcast of one running job's events to its stream subscribers.
+
+    publish() is called from the job's worker thread; subscribers live on
+    the event loop and are woken through it. Only the latest events are
+    kept (EVENT_BUFFER_SIZE); older ones are read from the database.
+    """
+
+    def __init__(self, capacity: int = EVENT_BUFFER_SIZE):
+        """
+        Args:
+            capacity: Events kept in the ring buffer
+        """
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._subscribers: set = set()
+        self._lock = threading.Lock()
+        self.evicted_through = 0  # Id of the newest event dropped from the buffer
+        self.closed = False
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """Add an event and wake every subscriber (any thread)"""
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.evicted_through = self._buffer[0]['id']
+            self._buffer.append(event)
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.notify()
+
+    def close(self) -> None:
+        """Mark the job finished - subscribers end once they read the buffer"""
+        with self._lock:
+            self.closed = True
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.notify()
+
+    def read_after(self, after_id: int) -> Tuple[List[Dict[str, Any]], bool, bool]:
+        """
+        Returns:
+            (buffered events after after_id, whether events after after_id
+            were dropped from the buffer, whether the channel is closed)
+        """
+        with self._lock:
+            events = [event for event in self._buffer if event['id'] > after_id]
+            return events, after_id < self.evicted_through, self.closed
+
+    def _add(self, subscriber: 'JobSubscription') -> None:
+        with self._lock:
+            self._subscribers.add(subscriber)
+
+    def _remove(self, subscriber: 'JobSubscription') -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+
+class JobSubscription:
+    """
+    One stream client following a JobChannel (use on the event loop).
+
+    Usage:
+        subscription = runner.subscribe(job_id, after_id=last_event_id)
+        try:
+            while (events := await subscription.next_events(timeout=15)) is not None:
+                ...                          # [] = nothing within timeout (send a keepalive)
+        finally:
+            subscription.close()
+    """
+
+    def __init__(
+        self,
+        channel: JobChannel,
+        after_id: int,
+        backfill: Callable[[int], List[Dict[str, Any]]]
+    ):
+        """
+        Args:
+            channel: Channel of the job to follow
+            after_id: Last event id the client already has
+            backfill: Reads events after an id from the database
+        """
+        self.channel = channel
+        self.last_id = after_id
+        self._backfill = backfill
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        channel._add(self)
+
+    def notify(self) -> None:
+        """Wake the subscriber (any thread)"""
+        self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def next_events(self, timeout: float) -> Optional[List[Dict[str, Any]]]:
+        """
+        Wait for events after the last one returned.
+
+        Args:
+            timeout: Seconds to wait for a new event
+
+        Returns:
+            New events in order, [] if none arrived within timeout, or None
+            once the job finished and every event was returned
+        """
+        while True:
+            self._wake.clear()
+            events, missed, closed = self.channel.read_after(self.last_id)
+            if missed:
+                # Behind the ring buffer - the database has every event
+                events = await asyncio.to_thread(self._backfill, self.last_id)
+            if events:
+                self.last_id = events[-1]['id']
+                return events
+            if closed:
+                return None
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+
+    def close(self) -> None:
+        """Stop following the channel (client disconnected or stream ended)"""
+        self.channel._remove(self)
+
+
+class SyncJobRunner:
+    """
+    Runs API sync jobs on a worker pool, recording their progress events.
+
+    Usage:
+        runner = get_job_runner()
+        job_id = runner.submit('cal', months_back=6)
+        runner.events_after(job_id, 0)      # [{'id': 1, 'type': 'progress', 'data': {...}}, ...]
+        runner.cancel(job_id)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_workers: int = MAX_CONCURRENT_JOBS,
+        per_institution: int = PER_INSTITUTION_LIMIT
+    ):
+        """
+        Args:
+            session_factory: Creates the sessions jobs and readers use
+            max_workers: Maximum jobs running at once
+            per_institution: Maximum jobs of one institution running at once
+        """
+        self.session_factory = session_factory
+        self.per_institution = max(1, per_institution)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='sync-job')
+        self._lock = threading.Lock()
+        self._queued: Dict[str, Deque[str]] = defaultdict(deque)
+        self._running: Dict[str, int] = defaultdict(int)
+        self._orchestrators: Dict[str, SyncOrchestrator] = {}  # job id -> running orchestrator
+        self._channels: Dict[str, JobChannel] = {}  # job id -> channel, while unfinished
+        self._fail_orphaned_jobs()
+
+    # ==================== Public API ====================
+
+    def submit(
+        self,
+        institution: str,
+        months_back: Optional[int] = None,
+        account_index: Optional[int] = None
+    ) -> str:
+        """
+        Queue a sync of an institution's configured accounts.
+
+        Args:
+            institution: Institution identifier
+            months_back: Credit card months to fetch (default DEFAULT_MONTHS_BACK)
+            account_index: Sync only this configured account (default: all)
+
+        Returns:
+            The new job's id
+
+        Raises:
+            ValueError: If the institution is unknown
+        """
+        if institution not in SYNC_SERVICES:
+            raise ValueError(f"Unknown institution: {institution}")
+
+        job_id = str(uuid.uuid4())
+        options = {'months_back': months_back, 'account_index': account_index}
+        with self._lock:
+            self._channels[job_id] = JobChannel()
+        with self._session() as db:
+            record = SyncJobRecord(
+                id=job_id,
+                institution=institution,
+                status=SyncJobStatus.PENDING,
+                options=json.dumps(options),
+                worker_pid=os.getpid(),
+            )
+            db.add(record)
+            self._emit(db, record, "progress", "Queued", phase="queued")
+
+        with self._lock:
+            self._queued[institution].append(job_id)
+            self._dispatch(institution)
+        return job_id
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """
+        Cancel a job.
+
+        A pending job is cancelled at once. A running one stops at its next
+        month (credit cards) or before its scrape is saved; when another
+        process runs it, that process picks up the request the next time it
+        records progress.
+
+        Args:
+            job_id: Job to cancel
+
+        Returns:
+            The job's status after the request, or None if there is no such job
+        """
+        with self._lock:
+            for queued in self._queued.values():
+                if job_id in queued:
+                    queued.remove(job_id)
+            orchestrator = self._orchestrators.get(job_id)
+
+        with self._session() as db:
+            record = db.get(SyncJobRecord, job_id)
+            if record is None:
+                return None
+            if record.status in SyncJobStatus.finished():
+                return record.status
+
+            # Only a job still pending can be cancelled outright - the claim is atomic
+            if self._transition(db, job_id, SyncJobStatus.PENDING, SyncJobStatus.CANCELLED):
+                db.refresh(record)
+                self._finish(db, record, SyncJobStatus.CANCELLED)
+                return record.status
+
+            record.cancel_requested = True
+            self._emit(db, record, "progress", "Cancelling...", phase="cancelling")
+
+        if orchestrator is not None:
+            orchestrator.cancel()
+        return SyncJobStatus.RUNNING
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job's current state.
+
+        Returns:
+            Job dict (id, institution, status, options, timestamps, error),
+            or None if there is no such job
+        """
+        with self._session() as db:
+            record = db.get(SyncJobRecord, job_id)
+            return self._job_dict(record) if record else None
+
+    def list_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent jobs first"""
+        with self._session() as db:
+            records = db.query(SyncJobRecord).order_by(SyncJobRecord.created_at.desc()).limit(limit).all()
+            return [self._job_dict(record) for record in records]
+
+    def events_after(self, job_id: str, after_id: int = 0) -> List[Dict[str, Any]]:
+        """
+        Get a job's events recorded after a given one.
+
+        Args:
+            job_id: Job whose events to read
+            after_id: Last event id already seen (0 = from the start)
+
+        Returns:
+            Events in order: {'id': int, 'type': str, 'data': dict}
+        """
+        with self._session() as db:
+            events = (
+                db.query(SyncJobEvent)
+                .filter(SyncJobEvent.job_id == job_id, SyncJobEvent.id > after_id)
+                .order_by(SyncJobEvent.id)
+                .all()
+            )
+            return [{'id': e.id, 'type': e.event_type, 'data': json.loads(e.data)} for e in events]
+
+    def subscribe(self, job_id: str, after_id: int = 0) -> Optional[JobSubscription]:
+        """
+        Follow a job's events as they are recorded (call on the event loop).
+
+        Args:
+            job_id: Job to follow
+            after_id: Last event id the client already has (Last-Event-ID)
+
+        Returns:
+            JobSubscription, or None if the job is not running in this
+            process (finished, or owned by another API worker) - read
+            events_after() instead
+        """
+        with self._lock:
+            channel = self._channels.get(job_id)
+        if channel is None:
+            return None
+        return JobSubscription(channel, after_id, lambda last_id: self.events_after(job_id, last_id))
+
+    def shutdown(self) -> None:
+        """Cancel running jobs and wait for the workers to stop"""
+        with self._lock:
+            self._queued.clear()
+            orchestrators = list(self._orchestrators.values())
+            channels, self._channels = list(self._channels.values()), {}
+        for orchestrator in orchestrators:
+            orchestrator.cancel()
+        self._executor.shutdown(wait=True)
+        for channel in channels:
+            channel.close()
+
+    # ==================== Scheduling ====================
+
+    def _dispatch(self, institution: str) -> None:
+        """Start queued jobs up to the institution's limit (lock held)"""
+        queued = self._queued[institution]
+        while queued and self._running[institution] < self.per_institution:
+            job_id = queued.popleft()
+            self._running[institution] += 1
+            self._executor.submit(self._run, job_id, institution)
+
+    def _run(self, job_id: str, institution: str) -> None:
+        """Worker: run one job, then start the institution's next"""
+        try:
+            with self._session() as db:
+                self._run_job(db, job_id)
+        except Exception:
+            logger.exception(f"Sync job {job_id} crashed")
+        finally:
+            with self._lock:
+                self._running[institution] -= 1
+                self._orchestrators.pop(job_id, None)
+                self._dispatch(institution)
+
+    def _run_job(self, db: Session, job_id: str) -> None:
+        """Worker: scrape and save the job's accounts with this thread as the writer"""
+        if not self._transition(db, job_id, SyncJobStatus.PENDING, SyncJobStatus.RUNNING):
+            return  # Cancelled while queued
+
+        record = db.get(SyncJobRecord, job_id)
+        record.started_at = datetime.utcnow()
+        record.worker_pid = os.getpid()
+        db.commit()
+
+        try:
+            self._sync_accounts(db, record)
+        except Exception as e:
+            logger.exception(f"Sync job {job_id} failed")
+            db.rollback()
+            self._finish(db, record, SyncJobStatus.FAILED, str(e))
+
+    def _sync_accounts(self, db: Session, record: SyncJobRecord) -> None:
+        options = json.loads(record.options or '{}')
+        account_index = options.get('account_index')
+        try:
+            jobs, errors = build_sync_jobs(
+                record.institution,
+                [str(account_index)] if account_index is not None else None,
+                months_back=options.get('months_back') or DEFAULT_MONTHS_BACK,
+            )
+        except ValueError as e:
+            self._finish(db, record, SyncJobStatus.FAILED, str(e))
+            return
+
+        for error in errors:
+            self._emit(db, record, "progress", error, phase="skipped")
+
+        orchestrator = SyncOrchestrator(
+            db,
+            max_workers=ACCOUNTS_IN_PARALLEL,
+            on_batch_saved=lambda job, batch: self._on_batch_saved(db, record, orchestrator, job, batch)
+        )
+        with self._lock:
+            self._orchestrators[record.id] = orchestrator
+
+        saved = orchestrator.run(jobs)
+        for job in jobs:
+            since = job.kwargs.get('since')
+            self._emit(
+                db, record, "progress",
+                f"{job.title}: scraping" + (f" from {since}" if since else ""),
+                phase="scraping", card=job.title, since=since.isoformat() if since else None
+            )
+
+        succeeded = 0
+        totals = {'added': 0, 'updated': 0}
+        for job, result in saved:
+            if result.success:
+                succeeded += 1
+                totals['added'] += result.transactions_added + result.balances_added
+                totals['updated'] += result.transactions_updated + result.balances_updated
+                self._emit(
+                    db, record, "progress", f"{job.title}: saved",
+                    phase="saved", card=job.title, sync_id=result.sync_history_id,
+                    cards=result.cards_synced, added=result.transactions_added + result.balances_added,
+                    updated=result.transactions_updated + result.balances_updated,
+                )
+                if job.sync_type == SyncType.CREDIT_CARD:
+                    self._apply_rules(db, record, result)
+            else:
+                self._emit(
+                    db, record, "progress", f"{job.title}: failed - {result.error_message}",
+                    phase="failed", card=job.title, sync_id=result.sync_history_id, error=result.error_message,
+                )
+            self._check_cancel_requested(db, record, orchestrator)
+
+        if orchestrator.cancelled:
+            self._finish(db, record, SyncJobStatus.CANCELLED, **totals)
+        elif succeeded:
+            self._finish(db, record, SyncJobStatus.SUCCESS, accounts=succeeded, **totals)
+        else:
+            failures = len(jobs) + len(errors)
+            self._finish(db, record, SyncJobStatus.FAILED, f"All {failures} accounts failed" if failures else "No accounts to sync")
+
+    def _on_batch_saved(
+        self,
+        db: Session,
+        record: SyncJobRecord,
+        orchestrator: SyncOrchestrator,
+        job: SyncJob,
+        batch: Any
+    ) -> None:
+        """Writer: report a streamed month once it is committed"""
+        transactions = sum(len(account.transactions) for account in batch.accounts)
+        message = f"{job.title}: {batch.label} - {transactions} transactions"
+        if batch.error is not None:
+            message += f" (failed: {batch.error})"
+        self._emit(
+            db, record, "progress", message,
+            phase="month", card=job.title, month=batch.label, cards=len(batch.accounts),
+            transactions=transactions, error=str(batch.error) if batch.error is not None else None,
+        )
+        self._check_cancel_requested(db, record, orchestrator)
+
+    def _apply_rules(self, db: Session, record: SyncJobRecord, sync_result: SyncResult) -> None:
+        """Apply categorization rules to the sync's uncategorized transactions (best effort, timed as the sync's "rules" phase)"""
+        if not sync_result.transaction_ids or not RULES_FILE.exists():
+            return
+        try:
+            metrics = SyncMetrics()
+            with metrics.phase("rules"):
+                rules_service = RulesService(session=db)
+                if not rules_service.get_rules():
+                    return
+                result = rules_service.apply_rules_after_sync(sync_result.transaction_ids)
+            BaseSyncService(db).add_sync_metrics(sync_result.sync_history_id, metrics)
+            if result["modified"]:
+                self._emit(db, record, "progress", f"Rules applied to {result['modified']} transactions",
+                           phase="rules", modified=result["modified"])
+        except Exception as e:
+            logger.warning(f"Could not apply rules after sync job {record.id}: {e}")
+
+    def _check_cancel_requested(self, db: Session, record: SyncJobRecord, orchestrator: SyncOrchestrator) -> None:
+        """Pick up a cancel made through another API process"""
+        if orchestrator.cancelled:
+            return
+        requested = db.query(SyncJobRecord.cancel_requested).filter(SyncJobRecord.id == record.id).scalar()
+        if requested:
+            orchestrator.cancel()
+
+    # ==================== Records and events ====================
+
+    def _finish(self, db: Session, record: SyncJobRecord, status: str, error: Optional[str] = None, **counts: Any) -> None:
+        """Record a job's final status and its closing event"""
+        record.status = status
+        record.error_message = error
+        record.completed_at = datetime.utcnow()
+        name = INSTITUTION_NAMES.get(record.institution, record.institution)
+        if status == SyncJobStatus.SUCCESS:
+            self._emit(db, record, "success", f"{name} sync completed", status=status, **counts)
+        elif status == SyncJobStatus.CANCELLED:
+            self._emit(db, record, "error", f"{name} sync cancelled", status=status, **counts)
+        else:
+            self._emit(db, record, "error", f"{name} sync failed: {error}", status=status, error=error)
+
+        with self._lock:
+            channel = self._channels.pop(record.id, None)
+        if channel is not None:
+            channel.close()
+
+    def _emit(self, db: Session, record: SyncJobRecord, event_type: str, message: str, **data: Any) -> None:
+        """Record and commit one event (commits pending job changes with it), then push it to subscribers"""
+        payload = {
+            'message': message,
+            'institution': record.institution,
+            'data': {key: value for key, value in data.items() if value is not None},
+        }
+        event = SyncJobEvent(job_id=record.id, event_type=event_type, data=json.dumps(payload))
+        db.add(event)
+        db.commit()
+
+        with self._lock:
+            channel = self._channels.get(record.id)
+        if channel is not None:
+            channel.publish({'id': event.id, 'type': event_type, 'data': payload})
+
+    @staticmethod
+    def _transition(db: Session, job_id: str, from_status: str, to_status: str) -> bool:
+        """Atomically move a job between statuses; False if it was not in from_status"""
+        claimed = (
+            db.query(SyncJobRecord)
+            .filter(SyncJobRecord.id == job_id, SyncJobRecord.status == from_status)
+            .update({SyncJobRecord.status: to_status}, synchronize_session=False)
+        )
+        db.commit()
+        return claimed == 1
+
+    def _fail_orphaned_jobs(self) -> None:
+        """Fail jobs whose process stopped before finishing them"""
+        with self._session() as db:
+            unfinished = (
+                db.query(SyncJobRecord)
+                .filter(SyncJobRecord.status.in_([SyncJobStatus.PENDING, SyncJobStatus.RUNNING]))
+                .all()
+            )
+            for record in unfinished:
+                if not _process_alive(record.worker_pid):
+                    self._finish(db, record, SyncJobStatus.FAILED, "Interrupted - the API process running it stopped")
+
+    @staticmethod
+    def _job_dict(record: SyncJobRecord) -> Dict[str, Any]:
+        return {
+            'id': record.id,
+            'institution': record.institution,
+            'status': record.status,
+            'options': json.loads(record.options or '{}'),
+            'cancel_requested': record.cancel_requested,
+            'error_message': record.error_message,
+            'created_at': record.created_at,
+            'started_at': record.started_at,
+            'completed_at': record.completed_at,
+        }
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        db = self.session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+def _process_alive(pid: Optional[int]) -> bool:
+    """Whether another live process has this pid (a runner's own pid means a previous run)"""
+    if not pid or pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+_runner: Optional[SyncJobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> SyncJobRunner:
+    """Get the process-wide job runner (created on first use)"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = SyncJobRunner()
+        return _runner
+
+
+def shutdown_job_runner() -> None:
+    """Stop the process-wide job runner if it was started"""
+    global _runner
+    with _runner_lock:
+        runner, _runner = _runner, None
+    if runner is not None:
+        runner.shutdown()
@@ -0,0 +1,321 @@
+"""
+Parallel sync orchestration with a single database writer.
+
+Scrapes are dominated by browser and network time, so several institutions
+(and accounts within one) can run at once on a bounded thread pool. Workers
+only call fetch_<institution>() - which never touches the database - and put
+the ScrapeOutcome on a queue. The thread that owns the Session takes
+outcomes off the queue as they finish and saves each one with
+sync_<institution>(prefetched=...), so SQLite never sees concurrent writers
+and every account still gets its own SyncHistory record.
+
+Services that stream (StreamingSyncMixin) send each month's batch through the
+same queue as soon as it is scraped; the writer saves and commits it right
+away (see CreditCardService.open_stream), so a long backfill is never held
+in memory in full. The queue is bounded - a worker whose batches are not
+saved yet waits rather than piling them up.
+
+cancel() stops a run cooperatively: scrapes not started yet are skipped,
+streaming scrapes stop at their next month, and outcomes that arrive after
+the cancel are recorded as failed syncs instead of saved.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from sqlalchemy.orm import Session
+
+from config.constants import Institution, SyncType
+from config.settings import load_credentials, select_accounts_to_sync, select_pension_accounts_to_sync
+from scrapers.base.selenium_driver import DriverConfig
+from services.base_service import BaseSyncService, ScrapeOutcome, StreamingSyncMixin, SyncResult
+from services.broker_service import BrokerService
+from services.credit_card_service import CreditCardService
+from services.pension_service import PensionService
+
+logger = logging.getLogger(__name__)
+
+# Display names for job titles, progress and summaries
+INSTITUTION_NAMES = {
+    Institution.EXCELLENCE: "Excellence",
+    Institution.MEITAV: "Meitav",
+    Institution.MIGDAL: "Migdal",
+    Institution.PHOENIX: "Phoenix",
+    Institution.CAL: "CAL",
+    Institution.MAX: "Max",
+    Institution.ISRACARD: "Isracard",
+}
+
+# Queued batches per worker before a streaming scrape waits for the writer
+BATCHES_PER_WORKER = 4
+
+# Service implementing fetch_<institution>() / sync_<institution>() per institution
+SYNC_SERVICES: Dict[str, Tuple[str, Type[BaseSyncService]]] = {
+    **{institution: (SyncType.BROKER, BrokerService) for institution in Institution.brokers()},
+    **{institution: (SyncType.PENSION, PensionService) for institution in Institution.pensions()},
+    **{institution: (SyncType.CREDIT_CARD, CreditCardService) for institution in Institution.credit_cards()},
+}
+
+
+@dataclass
+class SyncJob:
+    """One institution account to scrape and save"""
+    institution: str
+    title: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)  # Arguments for fetch_/sync_<institution>
+
+    @property
+    def sync_type(self) -> str:
+        return SYNC_SERVICES[self.institution][0]
+
+    @property
+    def service_class(self) -> Type[BaseSyncService]:
+        return SYNC_SERVICES[self.institution][1]
+
+    @property
+    def streams_batches(self) -> bool:
+        """Whether the scrape's batches are saved as they arrive (see StreamingSyncMixin)"""
+        return issubclass(self.service_class, StreamingSyncMixin)
+
+    def driver_config(self) -> DriverConfig:
+        """Browser profile this job's scraper launches (pension automators need full pages)"""
+        headless = self.kwargs.get("headless", True)
+        if self.sync_type == SyncType.PENSION:
+            return DriverConfig(headless=headless)
+        return DriverConfig.lightweight(headless=headless)
+
+
+def browsers_to_warm(jobs: List[SyncJob], max_parallel: int) -> List[Tuple[DriverConfig, int]]:
+    """
+    Browsers the first wave of jobs will check out, grouped by launch signature
+
+    Args:
+        jobs: Jobs in the order they will be started
+        max_parallel: Maximum concurrent scrapes
+
+    Returns:
+        (config, count) per distinct launch signature, in first-use order
+    """
+    wanted: Dict[tuple, List[Any]] = {}
+    for job in jobs[:max(max_parallel, 1)]:
+        config = job.driver_config()
+        entry = wanted.setdefault(config.launch_signature(), [config, 0])
+        entry[1] += 1
+    return [(config, count) for config, count in wanted.values()]
+
+
+class SyncCancelled(Exception):
+    """The run was cancelled before this job's scrape completed"""
+
+    def __init__(self, message: str = "Sync cancelled"):
+        super().__init__(message)
+
+
+def build_sync_jobs(
+    institution: str,
+    account_filters: Optional[List[str]] = None,
+    headless: bool = True,
+    months_back: int = 3,
+    months_forward: int = 1
+) -> Tuple[List[SyncJob], List[str]]:
+    """
+    Build sync jobs for an institution's configured accounts
+
+    Args:
+        institution: Institution identifier
+        account_filters: Account indices or labels (None = all; ignored for brokers)
+        headless: Headless mode flag
+        months_back, months_forward: Credit card date range
+
+    Returns:
+        (jobs, errors) - errors lists accounts that cannot be synced
+
+    Raises:
+        ValueError: If credentials are missing or the account selection is invalid
+    """
+    name = INSTITUTION_NAMES[institution]
+
+    if institution in Institution.brokers():
+        broker_creds = getattr(load_credentials(), institution)
+        if not broker_creds.username or not broker_creds.password:
+            raise ValueError(f"{name} credentials not configured")
+        return [SyncJob(institution, name, {
+            "username": broker_creds.username,
+            "password": broker_creds.password,
+            "headless": headless,
+        })], []
+
+    jobs, errors = [], []
+    if institution in Institution.pensions():
+        # Global email credentials are the fallback for accounts without their own
+        email = load_credentials().email
+        for idx, account_creds in select_pension_accounts_to_sync(institution, account_filters):
+            label = f" ({account_creds.label})" if account_creds.label else ""
+            title = f"{name} account {idx}{label}"
+            email_address = account_creds.email_address or email.address
+            email_password = account_creds.email_password or email.password
+            if not email_address or not email_password:
+                errors.append(f"{title}: Email credentials missing")
+                continue
+            jobs.append(SyncJob(institution, title, {
+                "user_id": account_creds.user_id,
+                "email_address": email_address,
+                "email_password": email_password,
+                "headless": headless,
+            }))
+        return jobs, errors
+
+    for idx, account_creds in select_accounts_to_sync(institution, account_filters):
+        label = f" ({account_creds.label})" if account_creds.label else ""
+        jobs.append(SyncJob(institution, f"{name} account {idx}{label}", {
+            "username": account_creds.username,
+            "password": account_creds.password,
+            "months_back": months_back,
+            "months_forward": months_forward,
+            "headless": headless,
+        }))
+    return jobs, errors
+
+
+class SyncOrchestrator:
+    """
+    Runs sync jobs in parallel with the calling thread as the only DB writer.
+
+    Usage:
+        orchestrator = SyncOrchestrator(db, max_workers=3)
+        for job, result in orchestrator.run(jobs):
+            print(job.title, result.success)   # in completion order
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        max_workers: int = 3,
+        full: bool = False,
+        on_batch_saved: Optional[Callable[[SyncJob, Any], None]] = None
+    ):
+        """
+        Args:
+            db: Session used for all writes (only from the calling thread)
+            max_workers: Maximum concurrent scrapes (1 = one at a time)
+            full: Ignore sync watermarks and fetch each job's full range
+            on_batch_saved: Called on the calling thread after each streamed
+                batch is saved (progress reporting)
+        """
+        self.db = db
+        self.max_workers = max(1, max_workers)
+        self.full = full
+        self.on_batch_saved = on_batch_saved
+        self.pending: List[SyncJob] = []  # Jobs not saved yet (scraping or queued)
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop the run at the next opportunity (safe from any thread)"""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self, jobs: List[SyncJob]) -> Iterator[Tuple[SyncJob, SyncResult]]:
+        """
+        Start scraping all jobs and yield each one's result once it is saved.
+
+        Unless full, jobs with a stored watermark get a since= start date
+        (set before this returns, so callers can report it).
+
+        Args:
+            jobs: Jobs to run
+
+        Returns:
+            Iterator of (job, SyncResult) in completion order
+        """
+        if not self.full:
+            for job in jobs:
+                self._apply_watermark(job)
+        self.pending = list(jobs)
+        return self._save_as_completed(list(jobs))
+
+    def _apply_watermark(self, job: SyncJob) -> None:
+        """Narrow a job to an incremental range (watermarks are read on this thread)"""
+        since = job.service_class(self.db).get_incremental_start(job.institution, **job.kwargs)
+        if since:
+            job.kwargs["since"] = since
+
+    def _save_as_completed(self, jobs: List[SyncJob]) -> Iterator[Tuple[SyncJob, SyncResult]]:
+        # (job, batch) while a streaming scrape runs, then (job, outcome) once it ended
+        events: "queue.Queue[Tuple[SyncJob, Union[ScrapeOutcome, Any]]]" = queue.Queue(
+            maxsize=self.max_workers * BATCHES_PER_WORKER
+        )
+        streams: Dict[int, Any] = {}  # id(job) -> open stream
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='sync') as executor:
+            futures = [executor.submit(self._scrape, job, events) for job in jobs]
+            try:
+                remaining = len(jobs)
+                while remaining:
+                    job, item = events.get()
+                    if not isinstance(item, ScrapeOutcome):
+                        self._stream_for(job, streams).save(item)
+                        if self.on_batch_saved is not None:
+                            self.on_batch_saved(job, item)
+                        continue
+
+                    if self.cancelled and item.error is None:
+                        item = ScrapeOutcome(error=SyncCancelled(), scraper=item.scraper, started_at=item.started_at)
+                    if job.streams_batches:
+                        result = self._stream_for(job, streams, item.started_at).finish(item)
+                        streams.pop(id(job))
+                    else:
+                        result = self._save(job, item)
+                    remaining -= 1
+                    self.pending.remove(job)
+                    yield job, result
+            finally:
+                # Unblock workers still queueing batches if the caller stopped early
+                while not all(future.done() for future in futures):
+                    try:
+                        events.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+
+    def _scrape(self, job: SyncJob, events: "queue.Queue[Tuple[SyncJob, Any]]") -> None:
+        """Worker: scrape one job (no database access), queueing its batches and outcome"""
+        if self.cancelled:
+            events.put((job, ScrapeOutcome(error=SyncCancelled())))
+            return
+
+        kwargs = dict(job.kwargs)
+        if job.streams_batches:
+            kwargs['on_batch'] = lambda batch: self._queue_batch(job, batch, events)
+        try:
+            # fetch_* never use the session, so the worker's service has none
+            service = job.service_class(None)
+            outcome = getattr(service, f"fetch_{job.institution}")(**kwargs)
+        except Exception as e:
+            # fetch_* capture their own errors; this only guards unexpected ones
+            logger.exception(f"Scrape failed for {job.title}")
+            outcome = ScrapeOutcome(error=e)
+        events.put((job, outcome))
+
+    def _queue_batch(self, job: SyncJob, batch: Any, events: "queue.Queue[Tuple[SyncJob, Any]]") -> None:
+        """Worker: hand a streamed batch to the writer, or end the scrape if cancelled"""
+        if self.cancelled:
+            raise SyncCancelled()
+        events.put((job, batch))
+
+    def _stream_for(self, job: SyncJob, streams: Dict[int, Any], started_at=None) -> Any:
+        """Writer: the job's open stream, opened on its first batch"""
+        if id(job) not in streams:
+            service = job.service_class(self.db)
+            streams[id(job)] = service.open_stream(job.institution, started_at=started_at, **job.kwargs)
+        return streams[id(job)]
+
+    def _save(self, job: SyncJob, outcome: ScrapeOutcome) -> SyncResult:
+        """Writer: save one outcome in its own sync transaction"""
+        service = job.service_class(self.db)
+        return getattr(service, f"sync_{job.institution}")(**job.kwargs, prefetched=outcome)
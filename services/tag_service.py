@@ -3,15 +3,20 @@ Tag service for managing transaction tags and editing transactions
 """
 
 import logging
-from typing import List, Optional, Dict, Any
-from sqlalchemy import func
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import delete, func, insert, literal, or_, select, update
 from sqlalchemy.orm import Session
 from db.models import Tag, TransactionTag, Transaction, Account
-from db.query_utils import effective_amount_expr
+from db.query_utils import apply_transaction_filters, effective_amount_expr
 from services.base_service import SessionMixin
 
 logger = logging.getLogger(__name__)
 
+BULK_EDIT_OPERATIONS = ('set_category', 'set_memo', 'add_tags', 'remove_tags')
+
+# Transaction ids per bulk edit statement (well under SQLite's bound-parameter limit)
+BULK_EDIT_CHUNK = 500
+
 
 class TagService(SessionMixin):
     """
@@ -30,18 +35,28 @@ class TagService(SessionMixin):
         Returns:
             Tag object
         """
+        tag, created = self._find_or_add_tag(name)
+        if created:
+            self._bump_data_version()
+            self.session.commit()
+
+        return tag
+
+    def _find_or_add_tag(self, name: str) -> Tuple[Tag, bool]:
+        """Look up a tag (case-insensitive), adding it uncommitted if missing"""
         name = name.strip()
         tag = self.session.query(Tag).filter(
             func.lower(Tag.name) == func.lower(name)
         ).first()
 
-        if not tag:
-            tag = Tag(name=name)
-            self.session.add(tag)
-            self.session.commit()
-            logger.info(f"Created new tag: {name}")
+        if tag:
+            return tag, False
 
-        return tag
+        tag = Tag(name=name)
+        self.session.add(tag)
+        self.session.flush()
+        logger.info(f"Created new tag: {name}")
+        return tag, True
 
     def get_all_tags(self) -> List[Tag]:
         """
@@ -104,6 +119,7 @@ class TagService(SessionMixin):
             old_tag.name = new_name.strip()
             logger.info(f"Renamed tag '{old_name}' to '{new_name}'")
 
+        self._bump_data_version()
         self.session.commit()
         return True
 
@@ -122,6 +138,7 @@ class TagService(SessionMixin):
             return False
 
         self.session.delete(tag)
+        self._bump_data_version()
         self.session.commit()
         logger.info(f"Deleted tag: {name}")
         return True
@@ -161,6 +178,7 @@ class TagService(SessionMixin):
                 self.session.add(tt)
                 added += 1
 
+        self._bump_data_version()
         self.session.commit()
         return added
 
@@ -190,6 +208,7 @@ class TagService(SessionMixin):
                 self.session.delete(tt)
                 removed += 1
 
+        self._bump_data_version()
         self.session.commit()
         return removed
 
@@ -209,6 +228,138 @@ class TagService(SessionMixin):
 
     # ==================== Bulk Operations ====================
 
+    def bulk_edit_transactions(
+        self,
+        operations: List[Dict[str, Any]],
+        transaction_ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Apply edit operations to many transactions in one DB transaction
+
+        Targets are resolved once (so an operation changing a filtered field
+        doesn't change what later operations apply to), then each operation
+        runs as set-based UPDATE / INSERT ... SELECT / DELETE statements over
+        BULK_EDIT_CHUNK ids at a time. Nothing is committed if any fails.
+
+        Operations (dicts with an 'op' key):
+            {'op': 'set_category', 'value': str}  - user_category ('' or None clears)
+            {'op': 'set_memo', 'value': str}      - memo ('' or None clears)
+            {'op': 'add_tags', 'tags': [...]}     - creates missing tags
+            {'op': 'remove_tags', 'tags': [...]}
+
+        Args:
+            operations: Operations, applied in order
+            transaction_ids: Transactions to edit
+            filters: Or, transaction list filters selecting them (see
+                db.query_utils.apply_transaction_filters; {} selects all)
+
+        Returns:
+            Dict with 'matched' (target count) and 'counts' (transactions
+            changed by each operation, in order)
+
+        Raises:
+            ValueError: On an unknown operation, or unless exactly one of
+                transaction_ids and filters is given
+        """
+        if (transaction_ids is None) == (filters is None):
+            raise ValueError("Give either transaction_ids or filters")
+        for operation in operations:
+            if operation.get('op') not in BULK_EDIT_OPERATIONS:
+                raise ValueError(f"Unknown bulk operation '{operation.get('op')}'")
+
+        target = select(Transaction.id)
+        if transaction_ids is not None:
+            target = target.where(Transaction.id.in_(set(transaction_ids)))
+        else:
+            target = apply_transaction_filters(target.join(Account), **filters)
+        ids = self.session.scalars(target.order_by(Transaction.id)).all()
+        chunks = [ids[i:i + BULK_EDIT_CHUNK] for i in range(0, len(ids), BULK_EDIT_CHUNK)]
+
+        try:
+            counts = []
+            for operation in operations:
+                op = operation['op']
+                if op in ('set_category', 'set_memo'):
+                    column = Transaction.user_category if op == 'set_category' else Transaction.memo
+                    counts.append(sum(self._bulk_set(column, operation.get('value') or None, chunk)
+                                      for chunk in chunks))
+                else:
+                    tag_ids = self._bulk_tag_ids(operation.get('tags') or [], create=op == 'add_tags')
+                    edit = self._bulk_add_tags if op == 'add_tags' else self._bulk_remove_tags
+                    counts.append(sum(edit(tag_ids, chunk) for chunk in chunks) if tag_ids else 0)
+
+            if any(counts):
+                self._bump_data_version()
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        logger.info(f"Bulk edit of {len(ids)} transactions: {list(zip((o['op'] for o in operations), counts, strict=True))}")
+        return {'matched': len(ids), 'counts': counts}
+
+    def _bulk_set(self, column, value: Optional[str], ids: List[int]) -> int:
+        """Set a column on transactions where it differs, returning rows changed"""
+        if value is None:
+            differs = column.isnot(None)
+        else:
+            differs = or_(column.is_(None), column != value)
+        result = self.session.execute(
+            update(Transaction)
+            .where(Transaction.id.in_(ids), differs)
+            .values({column.key: value})
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def _bulk_tag_ids(self, tag_names: List[str], create: bool) -> List[int]:
+        """Ids of the named tags (existing ones only, unless create)"""
+        names = {name.strip() for name in tag_names if name and name.strip()}
+        if create:
+            return sorted({self._find_or_add_tag(name)[0].id for name in names})
+        lowered = [name.lower() for name in names]
+        return self.session.scalars(select(Tag.id).where(func.lower(Tag.name).in_(lowered))).all()
+
+    def _bulk_add_tags(self, tag_ids: List[int], ids: List[int]) -> int:
+        """Link tags to transactions missing them, returning transactions changed"""
+        changed = self.session.scalar(
+            select(func.count()).select_from(Transaction).where(
+                Transaction.id.in_(ids),
+                select(func.count(TransactionTag.id)).where(
+                    TransactionTag.transaction_id == Transaction.id,
+                    TransactionTag.tag_id.in_(tag_ids),
+                ).scalar_subquery() < len(tag_ids),
+            )
+        )
+        for tag_id in tag_ids:
+            missing = select(Transaction.id, literal(tag_id)).where(
+                Transaction.id.in_(ids),
+                ~select(TransactionTag.id).where(
+                    TransactionTag.transaction_id == Transaction.id,
+                    TransactionTag.tag_id == tag_id,
+                ).exists(),
+            )
+            self.session.execute(
+                insert(TransactionTag).from_select(['transaction_id', 'tag_id'], missing)
+            )
+        return changed
+
+    def _bulk_remove_tags(self, tag_ids: List[int], ids: List[int]) -> int:
+        """Unlink tags from transactions, returning transactions changed"""
+        changed = self.session.scalar(
+            select(func.count(func.distinct(TransactionTag.transaction_id))).where(
+                TransactionTag.transaction_id.in_(ids),
+                TransactionTag.tag_id.in_(tag_ids),
+            )
+        )
+        self.session.execute(
+            delete(TransactionTag)
+            .where(TransactionTag.transaction_id.in_(ids), TransactionTag.tag_id.in_(tag_ids))
+            .execution_options(synchronize_session=False)
+        )
+        return changed
+
     def bulk_tag_by_merchant(self, merchant_pattern: str, tag_names: List[str]) -> int:
         """
         Tag all transactions matching merchant pattern
@@ -220,17 +371,11 @@ class TagService(SessionMixin):
         Returns:
             Number of transactions tagged
         """
-        transactions = self.session.query(Transaction).filter(
-            Transaction.description.ilike(f"%{merchant_pattern}%")
-        ).all()
-
-        count = 0
-        for txn in transactions:
-            added = self.tag_transaction(txn.id, tag_names)
-            if added > 0:
-                count += 1
-
-        return count
+        result = self.bulk_edit_transactions(
+            [{'op': 'add_tags', 'tags': tag_names}],
+            filters={'search': merchant_pattern},
+        )
+        return result['counts'][0]
 
     def bulk_tag_by_category(self, category: str, tag_names: List[str]) -> int:
         """
@@ -243,17 +388,14 @@ class TagService(SessionMixin):
         Returns:
             Number of transactions tagged
         """
-        transactions = self.session.query(Transaction).filter(
-            func.lower(Transaction.category) == func.lower(category)
+        transaction_ids = self.session.scalars(
+            select(Transaction.id).where(func.lower(Transaction.category) == func.lower(category))
         ).all()
-
-        count = 0
-        for txn in transactions:
-            added = self.tag_transaction(txn.id, tag_names)
-            if added > 0:
-                count += 1
-
-        return count
+        result = self.bulk_edit_transactions(
+            [{'op': 'add_tags', 'tags': tag_names}],
+            transaction_ids=transaction_ids,
+        )
+        return result['counts'][0]
 
     # ==================== Transaction Editing ====================
 
@@ -287,6 +429,7 @@ class TagService(SessionMixin):
         if memo is not None:
             transaction.memo = memo if memo else None
 
+        self._bump_data_version()
         self.session.commit()
         return True
 
@@ -0,0 +1,129 @@
+"""
+Incremental CSV / NDJSON / JSON writers for transaction exports.
+
+Each writer turns an iterator of row dicts (AnalyticsService.iter_transaction_rows)
+into an iterator of encoded chunks, buffering about CHUNK_ROWS rows at a time.
+The same chunks are written to a file by the CLI and sent as a
+StreamingResponse by the API, so neither ever holds the full export.
+"""
+
+import csv
+import io
+import zlib
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+import orjson
+
+from services.analytics_service import TRANSACTION_EXPORT_FIELDS
+
+# Rows encoded per chunk
+CHUNK_ROWS = 500
+
+EXPORT_FORMATS = ("csv", "ndjson", "json")
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def csv_chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode rows as CSV with a header line (UTF-8)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(TRANSACTION_EXPORT_FIELDS)
+    for n, row in enumerate(rows, start=1):
+        writer.writerow([_csv_value(row[field]) for field in TRANSACTION_EXPORT_FIELDS])
+        if n % CHUNK_ROWS == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
+
+
+def ndjson_chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode rows as newline-delimited JSON, one object per line"""
+    lines = []
+    for row in rows:
+        lines.append(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+        if len(lines) == CHUNK_ROWS:
+            yield b''.join(lines)
+            lines.clear()
+    if lines:
+        yield b''.join(lines)
+
+
+def json_chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode rows as one JSON array, written element by element"""
+    separator = b'[\n'
+    lines = []
+    for row in rows:
+        lines.append(separator + orjson.dumps(row))
+        separator = b',\n'
+        if len(lines) == CHUNK_ROWS:
+            yield b''.join(lines)
+            lines.clear()
+    lines.append(b'\n]\n' if separator == b',\n' else b'[]\n')
+    yield b''.join(lines)
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a chunk stream into a single gzip member"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_chunks(rows: Iterable[Dict[str, Any]], format: str, compress: bool = False) -> Iterator[bytes]:
+    """
+    Encode transaction rows in an export format
+
+    Args:
+        rows: Row dicts keyed by TRANSACTION_EXPORT_FIELDS
+        format: One of EXPORT_FORMATS
+        compress: Gzip the output
+
+    Returns:
+        Iterator of encoded chunks
+    """
+    encoders = {"csv": csv_chunks, "ndjson": ndjson_chunks, "json": json_chunks}
+    if format not in encoders:
+        raise ValueError(f"Unknown export format '{format}'. Use one of: {', '.join(EXPORT_FORMATS)}")
+    chunks = encoders[format](rows)
+    return gzip_chunks(chunks) if compress else chunks
+
+
+def write_export(rows: Iterable[Dict[str, Any]], output_path: Path, format: str) -> int:
+    """
+    Stream transaction rows to a file, gzip-compressed if it ends in .gz
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+
+    def counted():
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row
+
+    compress = output_path.suffix == '.gz'
+    with open(output_path, 'wb') as f:
+        for chunk in export_chunks(counted(), format, compress=compress):
+            f.write(chunk)
+    return count
@@ -24,6 +24,7 @@ from streamlit_app.utils.session import (
     get_accounts_display,
 )
 from streamlit_app.utils.cache import (
+    data_version,
     get_dashboard_stats,
     get_recent_transactions,
     get_hub_alerts,
@@ -218,7 +219,7 @@ def render_insight_banner(stats: dict):
     """Render contextual insight banner if there's a meaningful insight."""
     # Get monthly trend for insight calculation
     try:
-        monthly_df = get_monthly_trend_cached(months_back=6)
+        monthly_df = get_monthly_trend_cached(data_version(), months_back=6)
         monthly_trend = monthly_df.to_dict('records') if not monthly_df.empty else None
     except Exception:
         monthly_trend = None
@@ -241,7 +242,7 @@ def render_insight_banner(stats: dict):
 
 def render_alerts():
     """Render alerts section with color-coded cards."""
-    alerts = get_hub_alerts()
+    alerts = get_hub_alerts(data_version())
 
     if not alerts:
         return
@@ -282,7 +283,7 @@ def render_recent_activity(min_height: int = None) -> int:
     Returns:
         The actual height used
     """
-    recent = get_recent_transactions(limit=7)
+    recent = get_recent_transactions(data_version(), limit=7)
 
     if not recent:
         st.markdown("#### 📋 Recent Activity")
@@ -379,7 +380,7 @@ def calculate_card_heights():
         Tuple of (transactions_height, accounts_height, max_height)
     """
     # Calculate transactions height
-    recent = get_recent_transactions(limit=7)
+    recent = get_recent_transactions(data_version(), limit=7)
     if recent:
         num_dates = len(set(t['transaction_date'] for t in recent))
         num_with_cat = sum(1 for t in recent if t.get('effective_category'))
@@ -405,7 +406,7 @@ def main():
     # Note: Authentication, session init, theme, and sidebar are handled by main.py
 
     # Get stats to check if we have data
-    stats = get_dashboard_stats()
+    stats = get_dashboard_stats(data_version())
 
     # Empty state - no accounts yet
     if not stats or stats.get('account_count', 0) == 0:
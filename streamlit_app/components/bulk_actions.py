@@ -113,15 +113,13 @@ def bulk_action_workflow(
         def preview_matches():
             return db.query().filter(...).all()
 
-        def apply_tags():
-            count = service.bulk_tag(...)
-            return count
-
         bulk_action_workflow(
             preview_button_text="Preview Matches",
             apply_button_text="Apply Tags",
             preview_callback=preview_matches,
-            apply_callback=apply_tags,
+            apply_callback=bulk_edit_callback(
+                tag_service, [{'op': 'add_tags', 'tags': ['food']}], filters={'search': 'wolt'}
+            ),
             preview_columns=['Date', 'Description', 'Amount'],
             operation_name="tag",
             success_message="Tagged {count} transactions",
@@ -200,6 +198,35 @@ def bulk_action_workflow(
                 st.rerun()
 
 
+def bulk_edit_callback(
+    tag_service,
+    operations: List[Dict[str, Any]],
+    transaction_ids: Optional[List[int]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Callable[[], int]:
+    """
+    Apply callback running TagService.bulk_edit_transactions
+
+    The same set-based edit as POST /transactions/bulk, in one commit.
+
+    Args:
+        tag_service: TagService instance
+        operations: Edit operations (see TagService.bulk_edit_transactions)
+        transaction_ids: Transactions to edit
+        filters: Or, transaction filters selecting them
+
+    Returns:
+        Callback returning the most transactions changed by any operation
+    """
+    def apply() -> int:
+        result = tag_service.bulk_edit_transactions(
+            operations, transaction_ids=transaction_ids, filters=filters
+        )
+        return max(result['counts'], default=0)
+
+    return apply
+
+
 def quick_bulk_preview(
     query_pattern: str,
     get_matches_func: Callable[[str], List[Any]],
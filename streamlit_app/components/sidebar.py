@@ -14,7 +14,7 @@ sys.path.insert(0, str(project_root))
 
 from streamlit_app.utils.formatters import format_datetime
 from streamlit_app.utils.session import format_amount_private
-from streamlit_app.utils.cache import get_dashboard_stats
+from streamlit_app.utils.cache import data_version, get_dashboard_stats
 from streamlit_app.config.theme import set_theme_mode
 from streamlit_app.components.theme import _save_privacy_to_localstorage, _save_theme_to_localstorage
 
@@ -57,7 +57,7 @@ def render_quick_stats():
 
     try:
         # Use the same cached stats as Dashboard - single source of truth
-        stats = get_dashboard_stats()
+        stats = get_dashboard_stats(data_version())
 
         if stats and stats['account_count'] > 0:
             # Total Balance card - using metric-card class for consistent dark/light mode styling
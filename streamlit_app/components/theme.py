@@ -872,6 +872,7 @@ def format_status_themed(status: str, theme: Theme, as_badge: bool = True) -> st
         'pending': {'icon': '⏳', 'label': 'Pending'},
         'failed': {'icon': '❌', 'label': 'Failed'},
         'success': {'icon': '✅', 'label': 'Success'},
+        'partial': {'icon': '⚠️', 'label': 'Partial'},
         'error': {'icon': '❌', 'label': 'Error'},
         'running': {'icon': '🔄', 'label': 'Running'},
         'active': {'icon': '✅', 'label': 'Active'},
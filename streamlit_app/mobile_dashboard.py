@@ -10,6 +10,7 @@ from datetime import date
 
 from streamlit_app.utils.session import format_amount_private
 from streamlit_app.utils.cache import (
+    data_version,
     get_dashboard_stats,
     get_recent_transactions,
     get_hub_alerts,
@@ -83,7 +84,7 @@ def render_budget_progress():
 
 def render_alerts():
     """Render expandable alerts section."""
-    alerts = get_hub_alerts()
+    alerts = get_hub_alerts(data_version())
 
     if not alerts:
         return
@@ -100,7 +101,7 @@ def render_alerts():
 
 def render_recent_transactions():
     """Render recent transactions as mobile cards."""
-    recent = get_recent_transactions(limit=5)
+    recent = get_recent_transactions(data_version(), limit=5)
 
     if not recent:
         st.info("No recent transactions. Sync to see activity.")
@@ -145,7 +146,7 @@ def render_mobile_dashboard():
     apply_mobile_css()
 
     # Get stats
-    stats = get_dashboard_stats()
+    stats = get_dashboard_stats(data_version())
 
     # Empty state
     if not stats or stats.get('account_count', 0) == 0:
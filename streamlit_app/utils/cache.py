@@ -1,7 +1,10 @@
 """
 Caching utilities for Streamlit UI performance optimization.
 
-Provides centralized caching functions for expensive database queries with configurable TTL.
+Provides centralized caching functions for expensive database queries.
+Each takes the current data version (data_version()) as its first argument,
+so results are reused until a sync or edit - in this process or any other -
+bumps the version, and recomputed on the first render after it.
 """
 
 import streamlit as st
@@ -9,9 +12,40 @@ from typing import Optional, List, Dict, Any, Tuple
 from datetime import date, datetime, timedelta
 import pandas as pd
 
+from config.constants import DataVersionKey
 
-@st.cache_data(ttl=300, show_spinner=False)
+# Results kept per function (entries of older data versions are evicted first)
+CACHE_MAX_ENTRIES = 32
+
+# Results relative to today or now (current month, days since sync) are recomputed this often
+RELATIVE_TTL = 3600
+
+
+def data_version(name: str = DataVersionKey.DATA) -> Optional[int]:
+    """
+    Current value of a data version counter, to key cached results by.
+
+    Args:
+        name: Counter name (DataVersionKey.DATA for transactions, tags,
+            balances and accounts)
+
+    Returns:
+        Version, or None if the data_versions table is not migrated yet
+        (results are then only refreshed by the invalidate_* helpers)
+    """
+    from db.database import get_session
+    from db.data_versions import get_data_version
+
+    session = get_session()
+    try:
+        return get_data_version(session, name)
+    finally:
+        session.close()
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
 def get_transactions_cached(
+    version: Optional[int],
     start_date: date,
     end_date: date,
     account_ids: Optional[Tuple[int, ...]] = None,
@@ -23,6 +57,7 @@ def get_transactions_cached(
     Cached transaction query - returns serializable data.
 
     Args:
+        version: Data version the result belongs to (data_version())
         start_date: Start date for transactions
         end_date: End date for transactions
         account_ids: Optional tuple of account IDs (must be tuple for hashability)
@@ -33,7 +68,7 @@ def get_transactions_cached(
     Returns:
         List of transaction dictionaries
 
-    Cache: 5 minutes TTL
+    Cache: until the data version changes
     """
     from db.database import get_session
     from db.models import Transaction, Account
@@ -86,18 +121,19 @@ def get_transactions_cached(
         session.close()
 
 
-@st.cache_data(ttl=60, show_spinner=False)
-def get_dashboard_stats(months_back: int = 3) -> Dict[str, Any]:
+@st.cache_data(ttl=RELATIVE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def get_dashboard_stats(version: Optional[int], months_back: int = 3) -> Dict[str, Any]:
     """
     Cached dashboard statistics query.
 
     Args:
+        version: Data version the result belongs to (data_version())
         months_back: Number of months of data to include
 
     Returns:
         Dictionary with dashboard statistics
 
-    Cache: 1 minute TTL
+    Cache: until the data version changes (at most 1 hour, relative to today)
     """
     from db.database import get_session
     from db.models import Transaction, Account
@@ -168,8 +204,9 @@ def get_dashboard_stats(months_back: int = 3) -> Dict[str, Any]:
         session.close()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
 def get_category_spending_cached(
+    version: Optional[int],
     start_date: date,
     end_date: date,
     top_n: Optional[int] = None
@@ -178,6 +215,7 @@ def get_category_spending_cached(
     Cached category spending aggregation.
 
     Args:
+        version: Data version the result belongs to (data_version())
         start_date: Start date
         end_date: End date
         top_n: Optional limit to top N categories
@@ -185,7 +223,7 @@ def get_category_spending_cached(
     Returns:
         DataFrame with category spending data
 
-    Cache: 5 minutes TTL
+    Cache: until the data version changes
     """
     from db.database import get_session
     from db.models import Transaction
@@ -231,18 +269,19 @@ def get_category_spending_cached(
         session.close()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
-def get_monthly_trend_cached(months_back: int = 6) -> pd.DataFrame:
+@st.cache_data(ttl=RELATIVE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def get_monthly_trend_cached(version: Optional[int], months_back: int = 6) -> pd.DataFrame:
     """
     Cached monthly spending trend data.
 
     Args:
+        version: Data version the result belongs to (data_version())
         months_back: Number of months to include
 
     Returns:
         DataFrame with monthly trend data
 
-    Cache: 5 minutes TTL
+    Cache: until the data version changes (at most 1 hour, relative to today)
     """
     from db.database import get_session
     from db.models import Transaction
@@ -284,15 +323,18 @@ def get_monthly_trend_cached(months_back: int = 6) -> pd.DataFrame:
         session.close()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
-def get_accounts_cached() -> List[Dict[str, Any]]:
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def get_accounts_cached(version: Optional[int]) -> List[Dict[str, Any]]:
     """
     Cached accounts query with latest balances.
 
+    Args:
+        version: Data version the result belongs to (data_version())
+
     Returns:
         List of account dictionaries with balance info
 
-    Cache: 5 minutes TTL
+    Cache: until the data version changes
     """
     from db.database import get_session
     from db.models import Account
@@ -324,15 +366,18 @@ def get_accounts_cached() -> List[Dict[str, Any]]:
         session.close()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
-def get_tags_cached() -> List[Dict[str, Any]]:
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def get_tags_cached(version: Optional[int]) -> List[Dict[str, Any]]:
     """
     Cached tags query with usage statistics.
 
+    Args:
+        version: Data version the result belongs to (data_version())
+
     Returns:
         List of tag dictionaries with usage stats
 
-    Cache: 5 minutes TTL
+    Cache: until the data version changes
     """
     from db.database import get_session
     from db.models import Tag, Transaction
@@ -396,18 +441,19 @@ def invalidate_tag_cache():
 # HUB PAGE CACHE FUNCTIONS
 # =============================================================================
 
-@st.cache_data(ttl=300, show_spinner=False)
-def get_recent_transactions(limit: int = 7) -> List[Dict[str, Any]]:
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def get_recent_transactions(version: Optional[int], limit: int = 7) -> List[Dict[str, Any]]:
     """
     Get most recent transactions for hub display.
 
     Args:
+        version: Data version the result belongs to (data_version())
         limit: Maximum number of transactions to return
 
     Returns:
         List of transaction dictionaries ordered by date (newest first)
 
-    Cache: 5 minutes TTL
+    Cache: until the data version changes
     """
     from db.database import get_session
     from db.models import Transaction, Account
@@ -438,18 +484,19 @@ def get_recent_transactions(limit: int = 7) -> List[Dict[str, Any]]:
         session.close()
 
 
-@st.cache_data(ttl=60, show_spinner=False)
-def get_stale_accounts(days: int = 3) -> List[Dict[str, Any]]:
+@st.cache_data(ttl=RELATIVE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def get_stale_accounts(version: Optional[int], days: int = 3) -> List[Dict[str, Any]]:
     """
     Get accounts that haven't been synced in the specified number of days.
 
     Args:
+        version: Data version the result belongs to (data_version())
         days: Number of days threshold for "stale"
 
     Returns:
         List of stale account info dicts with institution and days since sync
 
-    Cache: 1 minute TTL
+    Cache: until the data version changes (at most 1 hour, relative to today)
     """
     from db.database import get_session
     from db.models import Account
@@ -500,15 +547,18 @@ def get_stale_accounts(days: int = 3) -> List[Dict[str, Any]]:
         session.close()
 
 
-@st.cache_data(ttl=60, show_spinner=False)
-def get_unmapped_category_count() -> int:
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def get_unmapped_category_count(version: Optional[int]) -> int:
     """
     Get count of unmapped categories (raw_category with no mapping).
 
+    Args:
+        version: Data version the result belongs to (data_version())
+
     Returns:
         Count of unmapped categories
 
-    Cache: 1 minute TTL
+    Cache: until the data version changes
     """
     from db.database import get_session
     from db.models import Transaction, CategoryMapping
@@ -540,15 +590,18 @@ def get_unmapped_category_count() -> int:
         session.close()
 
 
-@st.cache_data(ttl=60, show_spinner=False)
-def get_uncategorized_transaction_count() -> Dict[str, Any]:
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def get_uncategorized_transaction_count(version: Optional[int]) -> Dict[str, Any]:
     """
     Get count and total amount of uncategorized transactions.
 
+    Args:
+        version: Data version the result belongs to (data_version())
+
     Returns:
         Dict with 'count' and 'amount' keys
 
-    Cache: 1 minute TTL
+    Cache: until the data version changes
     """
     from db.database import get_session
     from db.models import Transaction
@@ -579,8 +632,8 @@ def get_uncategorized_transaction_count() -> Dict[str, Any]:
         session.close()
 
 
-@st.cache_data(ttl=60, show_spinner=False)
-def get_hub_alerts() -> List[Dict[str, Any]]:
+@st.cache_data(ttl=RELATIVE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def get_hub_alerts(version: Optional[int]) -> List[Dict[str, Any]]:
     """
     Get actionable alerts for the hub page.
 
@@ -589,17 +642,20 @@ def get_hub_alerts() -> List[Dict[str, Any]]:
     - Unmapped categories
     - Uncategorized transactions
 
+    Args:
+        version: Data version the result belongs to (data_version())
+
     Returns:
         List of alert dictionaries sorted by priority
 
-    Cache: 1 minute TTL (alerts should be fresh)
+    Cache: until the data version changes (at most 1 hour, relative to today)
     """
     from streamlit_app.utils.session import format_amount_private
 
     alerts = []
 
     # 1. Stale syncs
-    stale_accounts = get_stale_accounts(days=3)
+    stale_accounts = get_stale_accounts(version, days=3)
     for acc in stale_accounts[:3]:  # Limit to 3 stale alerts
         if acc['days'] >= 3:
             if acc['days'] >= 999:
@@ -616,7 +672,7 @@ def get_hub_alerts() -> List[Dict[str, Any]]:
             })
 
     # 2. Unmapped categories
-    unmapped = get_unmapped_category_count()
+    unmapped = get_unmapped_category_count(version)
     if unmapped > 0:
         alerts.append({
             'icon': '📂',
@@ -628,7 +684,7 @@ def get_hub_alerts() -> List[Dict[str, Any]]:
         })
 
     # 3. Uncategorized transactions
-    uncategorized = get_uncategorized_transaction_count()
+    uncategorized = get_uncategorized_transaction_count(version)
     if uncategorized['count'] > 0:
         amount_str = format_amount_private(uncategorized['amount'])
         alerts.append({
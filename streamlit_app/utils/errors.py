@@ -131,6 +131,7 @@ def safe_call_with_spinner(
             get_transactions_cached,
             spinner_text="Loading transactions...",
             error_message="Failed to load transactions",
+            version=data_version(),
             start_date=start,
             end_date=end
         )
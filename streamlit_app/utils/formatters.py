@@ -247,6 +247,12 @@ def format_status(status: str, as_badge: bool = True) -> str:
             'bg': '#e0f2f1',
             'label': 'Success'
         },
+        'partial': {
+            'icon': '⚠️',
+            'color': '#f57c00',
+            'bg': '#fff3e0',
+            'label': 'Partial'
+        },
         'error': {
             'icon': '❌',
             'color': '#c62828',
@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from streamlit_app.utils.cache import CACHE_MAX_ENTRIES
 from streamlit_app.utils.formatters import format_balance
 
 
@@ -53,8 +54,8 @@ def get_accounts_display() -> list[dict]:
         - All fields from get_accounts_cached()
         - balance_display: formatted balance string (respects mask_balances)
     """
-    from streamlit_app.utils.cache import get_accounts_cached
-    accounts = get_accounts_cached()
+    from streamlit_app.utils.cache import data_version, get_accounts_cached
+    accounts = get_accounts_cached(data_version())
     for acc in accounts:
         acc['balance_display'] = format_amount_private(acc['latest_balance'])
     return accounts
@@ -238,11 +239,14 @@ def safe_service_call(func, *args, **kwargs):
         return None
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def get_all_categories() -> list[str]:
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)  # Until the data version changes
+def get_all_categories(version: Optional[int]) -> list[str]:
     """
     Get all unique categories from transactions (user_category, normalized category, raw_category).
     Returns a sorted list of category names.
+
+    Args:
+        version: Data version the result belongs to (data_version())
     """
     from sqlalchemy.exc import SQLAlchemyError
     try:
@@ -281,11 +285,14 @@ def get_all_categories() -> list[str]:
         return []
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def get_unified_categories() -> list[str]:
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)  # Until the mappings version changes
+def get_unified_categories(version: Optional[int]) -> list[str]:
     """
     Get all unified category names from mappings.
     Returns a sorted list of unified category names.
+
+    Args:
+        version: Category mappings version (data_version(DataVersionKey.CATEGORY_MAPPINGS))
     """
     from sqlalchemy.exc import SQLAlchemyError
     try:
@@ -308,11 +315,14 @@ def get_unified_categories() -> list[str]:
         return []
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def get_all_tags() -> list[str]:
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)  # Until the data version changes
+def get_all_tags(version: Optional[int]) -> list[str]:
     """
     Get all tag names from the database.
     Returns a sorted list of tag names.
+
+    Args:
+        version: Data version the result belongs to (data_version())
     """
     from sqlalchemy.exc import SQLAlchemyError
     try:
@@ -15,6 +15,7 @@ from typing import Optional
 from streamlit_app.utils.session import format_amount_private, get_accounts_display
 from streamlit_app.utils.formatters import format_number, format_datetime
 from streamlit_app.utils.cache import (
+    data_version,
     get_transactions_cached,
     get_category_spending_cached,
     get_monthly_trend_cached,
@@ -72,7 +73,7 @@ def render_mobile_analytics():
 
     # Get category spending data
     try:
-        df_spending = get_category_spending_cached(start_date, end_date, top_n=5)
+        df_spending = get_category_spending_cached(data_version(), start_date, end_date, top_n=5)
 
         if not df_spending.empty:
             total_spent = df_spending['amount'].sum()
@@ -122,7 +123,7 @@ def render_mobile_analytics():
     st.markdown("**Monthly Trend**")
 
     try:
-        df_trend = get_monthly_trend_cached(months_back=6)
+        df_trend = get_monthly_trend_cached(data_version(), months_back=6)
 
         if not df_trend.empty:
             fig = px.line(
@@ -182,12 +183,13 @@ def render_desktop_analytics():
         )
         st.info(f"Showing data from **{start_date}** to **{end_date}**")
 
-        # Fetch transactions for selected period (cached for 5 minutes)
+        # Fetch transactions for selected period (cached until the data changes)
         transactions_list = safe_call_with_spinner(
             get_transactions_cached,
             spinner_text=contextual_spinner("analyzing", "transaction patterns"),
             error_message="Failed to load transaction data",
             default_return=[],
+            version=data_version(),
             start_date=start_date,
             end_date=end_date
         )
@@ -15,7 +15,7 @@ import yaml
 from datetime import datetime
 
 from streamlit_app.utils.session import format_amount_private, get_all_categories, get_all_tags
-from streamlit_app.utils.cache import invalidate_transaction_cache, invalidate_tag_cache
+from streamlit_app.utils.cache import data_version, invalidate_transaction_cache, invalidate_tag_cache
 from streamlit_app.utils.formatters import format_number, format_tags
 from streamlit_app.components.theme import render_page_header
 from streamlit_app.components.cards import render_metric_row
@@ -261,8 +261,8 @@ try:
         with st.expander("Add New Rule", expanded=False):
             col1, col2 = st.columns(2)
 
-            all_categories_for_rules = get_all_categories()
-            all_tags_for_rules = get_all_tags()
+            all_categories_for_rules = get_all_categories(data_version())
+            all_tags_for_rules = get_all_tags(data_version())
             category_options = ["(No category)", "(Enter new...)"] + all_categories_for_rules
 
             with col1:
@@ -548,18 +548,18 @@ try:
                             tags_list = [tag.strip() for tag in category_tags_input.split(',') if tag.strip()]
                             if tags_list:
                                 try:
-                                    transactions = session.query(Transaction).filter(
+                                    transaction_ids = [txn_id for (txn_id,) in session.query(Transaction.id).filter(
                                         or_(
                                             Transaction.user_category == selected_category,
                                             and_(Transaction.user_category.is_(None), Transaction.category == selected_category)
                                         )
-                                    ).all()
+                                    )]
 
-                                    count = 0
-                                    for txn in transactions:
-                                        added = tag_service.tag_transaction(txn.id, tags_list)
-                                        if added > 0:
-                                            count += 1
+                                    result = tag_service.bulk_edit_transactions(
+                                        [{'op': 'add_tags', 'tags': tags_list}],
+                                        transaction_ids=transaction_ids,
+                                    )
+                                    count = result['counts'][0]
 
                                     st.session_state['category_preview_ready'] = False
                                     st.toast(f"Tagged {count} transactions", icon="tag")
@@ -15,7 +15,7 @@ from streamlit_app.utils.formatters import (
     format_number, format_datetime, AMOUNT_STYLE_CSS
 )
 from streamlit_app.utils.rtl import fix_rtl, has_hebrew
-from streamlit_app.utils.cache import get_transactions_cached, invalidate_transaction_cache, invalidate_tag_cache
+from streamlit_app.utils.cache import data_version, get_transactions_cached, invalidate_transaction_cache, invalidate_tag_cache
 from streamlit_app.utils.errors import safe_call_with_spinner, ErrorBoundary
 from streamlit_app.components.empty_states import empty_transactions_state
 from streamlit_app.components.theme import render_page_header
@@ -849,7 +849,7 @@ def render_desktop_transactions():
 
                         # --- Category Editor ---
                         # Get all unique categories for autocomplete
-                        all_categories = get_all_categories()
+                        all_categories = get_all_categories(data_version())
                         category_options = ["(No category)", "(Enter new...)"] + all_categories
 
                         # Determine current selection
@@ -882,7 +882,7 @@ def render_desktop_transactions():
                         st.markdown('<div class="edit-field-label">Tags</div>', unsafe_allow_html=True)
 
                         # Get all existing tags for multiselect
-                        all_tags = get_all_tags()
+                        all_tags = get_all_tags(data_version())
 
                         # Multiselect for existing tags
                         selected_tags = st.multiselect(
@@ -933,16 +933,13 @@ def render_desktop_transactions():
                         memo_changed = (new_memo.strip() or None) != (txn.memo or None)
                         category_changed = (final_category or None) != (txn.user_category or None)
 
-                        if memo_changed or category_changed:
-                            tag_service.update_transaction(
-                                txn.id,
-                                user_category=final_category if category_changed else None,
-                                memo=new_memo.strip() if memo_changed else None
-                            )
-                            if memo_changed:
-                                changes_made.append("notes")
-                            if category_changed:
-                                changes_made.append("category")
+                        operations = []
+                        if memo_changed:
+                            operations.append({'op': 'set_memo', 'value': new_memo.strip()})
+                            changes_made.append("notes")
+                        if category_changed:
+                            operations.append({'op': 'set_category', 'value': final_category})
+                            changes_made.append("category")
 
                         # Process tags
                         # Combine selected tags with any new tags from text input
@@ -957,13 +954,17 @@ def render_desktop_transactions():
                         tags_to_remove = current_tags_set - final_tags
 
                         if tags_to_add:
-                            tag_service.tag_transaction(txn.id, list(tags_to_add))
+                            operations.append({'op': 'add_tags', 'tags': list(tags_to_add)})
                             changes_made.append(f"added {len(tags_to_add)} tag(s)")
 
                         if tags_to_remove:
-                            tag_service.untag_transaction(txn.id, list(tags_to_remove))
+                            operations.append({'op': 'remove_tags', 'tags': list(tags_to_remove)})
                             changes_made.append(f"removed {len(tags_to_remove)} tag(s)")
 
+                        if operations:
+                            # One commit for all changes (same path as POST /transactions/bulk)
+                            tag_service.bulk_edit_transactions(operations, transaction_ids=[txn.id])
+
                         if changes_made:
                             invalidate_transaction_cache()
                             if tags_to_add or tags_to_remove:
@@ -0,0 +1,135 @@
+"""
+Tests for the async read routes.
+
+Tests that routes served from the aiosqlite session return what the
+synchronous services compute, without opening a sync session. Skipped
+without aiosqlite (and greenlet).
+"""
+
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from api.deps import get_async_db, get_db  # noqa: E402
+from api.routers import analytics, balances, transactions  # noqa: E402
+from api.routers.transactions import _txn_schema  # noqa: E402
+from api.schemas.analytics import TrendPoint  # noqa: E402
+from db.database import create_async_database_engine  # noqa: E402
+from db.models import Base, Transaction  # noqa: E402
+from services.analytics_service import AnalyticsService  # noqa: E402
+from tests.conftest import create_account, create_tag, create_transaction, tag_transaction  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "api.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    account = create_account(session)
+    for day in range(1, 6):
+        create_transaction(session, account, f"Merchant {day}", -10.0 * day, date(2026, 3, day), category="food")
+    tag_transaction(session, session.get(Transaction, 4), create_tag(session, "work"))
+    session.close()
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+def client(db_path):
+    async_engine = create_async_database_engine(db_path, pool_size=2)
+    AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    def no_sync_session():
+        raise AssertionError("async route opened a sync session")
+
+    async def async_session_per_request():
+        async with AsyncSession() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(analytics.router)
+    app.include_router(balances.router)
+    app.include_router(transactions.router)
+    app.dependency_overrides[get_db] = no_sync_session
+    app.dependency_overrides[get_async_db] = async_session_per_request
+    with patch("api.deps.is_auth_enabled", return_value=False), TestClient(app) as test_client:
+        yield test_client
+        test_client.portal.call(async_engine.dispose)
+
+
+def sync_service_result(db_path, fn):
+    engine = create_engine(f"sqlite:///{db_path}")
+    session = sessionmaker(bind=engine)()
+    try:
+        return fn(AnalyticsService(session))
+    finally:
+        session.close()
+        engine.dispose()
+
+
+class TestAsyncRoutes:
+    """Tests for routes running AnalyticsService on the async session."""
+
+    def test_transactions_page_matches_sync_service(self, client, db_path):
+        response = client.get("/transactions", params={"limit": 2, "offset": 1})
+
+        expected = sync_service_result(db_path, lambda analytics: [
+            _txn_schema(t).model_dump(mode="json") for t in analytics.get_transactions(limit=2, offset=1)
+        ])
+
+        body = response.json()
+        assert response.status_code == 200
+        assert (body["total"], body["page"], body["has_next"]) == (5, 1, True)
+        assert body["items"] == expected
+        assert body["items"][0]["tags"] == ["work"]
+
+    def test_transactions_filters_apply_to_total(self, client):
+        body = client.get("/transactions", params={"untagged_only": True}).json()
+
+        assert body["total"] == len(body["items"]) == 4
+
+    def test_trends_match_sync_service(self, client, db_path):
+        response = client.get("/analytics/trends", params={"months": 12, "include_current": True})
+
+        expected = sync_service_result(
+            db_path, lambda analytics: analytics.get_monthly_spending_trends(months=12, include_current=True)
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [TrendPoint(**d).model_dump(mode="json") for d in expected]
+
+    def test_stats_route(self, client):
+        response = client.get("/analytics/stats")
+
+        assert response.status_code == 200
+        assert response.json()["total_transactions"] == 5
+
+    def test_conditional_get_on_async_session(self, client):
+        for path in ("/analytics/stats", "/analytics/trends", "/balances/latest", "/transactions"):
+            etag = client.get(path).headers["ETag"]
+
+            assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+    def test_concurrent_requests_share_a_small_pool(self, client):
+        """More concurrent requests than pooled connections should all complete."""
+        async def burst():
+            transport = httpx.ASGITransport(app=client.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                return await asyncio.gather(*(http.get(path) for path in ["/analytics/stats", "/transactions"] * 5))
+
+        responses = client.portal.call(burst)
+
+        assert {r.status_code for r in responses} == {200}
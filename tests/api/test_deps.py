@@ -0,0 +1,100 @@
+"""
+Tests for api.deps module.
+
+Tests conditional GET: read routes answer If-None-Match with 304 until a
+writer bumps the data version.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api.deps import etag_matches, get_db
+from api.routers import analytics
+from db.models import Base
+from services.analytics_service import AnalyticsService
+from services.tag_service import TagService
+from tests.conftest import create_account, create_transaction
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # A file database, so the test client's worker threads see the same data
+    engine = create_engine(f"sqlite:///{tmp_path / 'api.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def client(session_factory):
+    def session_per_request():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(analytics.router)
+    app.dependency_overrides[get_db] = session_per_request
+    with patch("api.deps.is_auth_enabled", return_value=False):
+        yield TestClient(app)
+
+
+class TestConditionalGet:
+    """Tests for the ConditionalGet dependency."""
+
+    def test_unchanged_data_answers_304_without_service_work(self, client):
+        first = client.get("/analytics/categories")
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        with patch.object(AnalyticsService, "get_category_breakdown") as compute:
+            second = client.get("/analytics/categories", headers={"If-None-Match": etag})
+
+        compute.assert_not_called()
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
+    def test_query_parameters_change_etag(self, client):
+        march = client.get("/analytics/monthly", params={"year": 2026, "month": 3}).headers["ETag"]
+        april = client.get("/analytics/monthly", params={"year": 2026, "month": 4}).headers["ETag"]
+
+        assert march != april
+
+    def test_edit_changes_etag(self, client, session_factory):
+        etag = client.get("/analytics/tags").headers["ETag"]
+        db = session_factory()
+        transaction = create_transaction(db, create_account(db), "Shufersal", -50.0, date(2026, 3, 1))
+        TagService(session=db).tag_transaction(transaction.id, ["groceries"])
+        db.close()
+
+        response = client.get("/analytics/tags", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()[0]["tag"] == "groceries"
+
+    def test_orjson_route_keeps_etag(self, client):
+        first = client.get("/analytics/category-trends")
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        second = client.get("/analytics/category-trends", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+
+
+def test_etag_matches_lists_weak_and_wildcard():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
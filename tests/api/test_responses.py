@@ -0,0 +1,85 @@
+"""
+Tests for api.responses module.
+
+Tests that the orjson fast path produces the same JSON as the response
+models it bypasses, and that compression skips event streams.
+"""
+
+import json
+import math
+from datetime import date, datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from api.responses import CompressionMiddleware, ORJSONResponse
+from api.routers.transactions import _txn_row, _txn_schema
+from api.schemas.analytics import CategoryTrendsResponse
+from api.schemas.balances import PortfolioProgressionResponse
+from api.schemas.retirement import Milestone
+from tests.conftest import create_transaction
+
+
+def _render(content):
+    return json.loads(ORJSONResponse(content).body)
+
+
+class TestORJSONResponse:
+    """Tests for the unvalidated orjson response path."""
+
+    def test_transaction_row_matches_response_model(self, db_session, sample_account):
+        txn = create_transaction(db_session, sample_account, "שופרסל", -42.5, date(2026, 3, 1), category="food")
+
+        assert _render(_txn_row(txn)) == json.loads(_txn_schema(txn).model_dump_json())
+
+    def test_dates_nan_and_nested_models_encoded_like_pydantic(self):
+        content = {
+            "points": [{"date": date(2026, 3, 31), "series": "broker", "total_amount": 1000.5, "profit_loss": None}],
+            "series_names": ["broker"],
+        }
+        milestone = Milestone(age=45.5, date="2040-01", type="fire", label="FIRE")
+
+        assert _render(content) == json.loads(PortfolioProgressionResponse(**content).model_dump_json())
+        assert _render({"m": milestone, "at": datetime(2026, 3, 1, 8, 30)}) == {
+            "m": json.loads(milestone.model_dump_json()), "at": "2026-03-01T08:30:00"}
+        assert _render({"categories": {}, "totals": {"food": math.nan}}) == json.loads(
+            CategoryTrendsResponse(categories={}, totals={"food": math.nan}).model_dump_json())
+
+
+class TestCompressionMiddleware:
+    """Tests for gzip compression of API responses."""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware)
+
+        @app.get("/large")
+        def large():
+            return ORJSONResponse([{"description": "row", "amount": n} for n in range(500)])
+
+        @app.get("/small")
+        def small():
+            return ORJSONResponse({"status": "ok"})
+
+        @app.get("/stream")
+        def stream():
+            return StreamingResponse(iter(["event: ping\ndata: {}\n\n" * 100]), media_type="text/event-stream")
+
+        return TestClient(app)
+
+    def test_large_responses_gzipped(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert len(response.json()) == 500
+        assert response.num_bytes_downloaded < len(response.content) / 4
+
+    def test_small_responses_and_event_streams_not_gzipped(self, client):
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        stream = client.get("/stream", headers={"Accept-Encoding": "gzip", "Accept": "text/event-stream"})
+
+        assert "Content-Encoding" not in small.headers
+        assert "Content-Encoding" not in stream.headers
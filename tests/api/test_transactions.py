@@ -0,0 +1,131 @@
+"""
+Tests for the transactions router.
+
+Tests the streaming export and bulk edit endpoints; the async list is
+covered in test_async_routes.py.
+"""
+
+import gzip
+import json
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api.deps import get_db
+from api.responses import CompressionMiddleware
+from api.routers import transactions
+from db.models import Base
+from tests.conftest import create_account, create_transaction
+
+
+@pytest.fixture
+def client(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'api.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    session = Session()
+    account = create_account(session)
+    for n in range(1, 31):
+        create_transaction(session, account, f"Merchant {n}", -1.0 * n, date(2026, 3, 1 + n % 28), category="food")
+    session.close()
+
+    def session_per_request():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+    app.include_router(transactions.router)
+    app.dependency_overrides[get_db] = session_per_request
+    with patch("api.deps.is_auth_enabled", return_value=False):
+        yield TestClient(app)
+    engine.dispose()
+
+
+class TestExport:
+    """Tests for GET /transactions/export."""
+
+    def test_ndjson_stream(self, client):
+        response = client.get("/transactions/export", headers={"Accept-Encoding": "identity"})
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert len(rows) == 30
+        assert rows[0]["institution"] == "cal"
+
+    def test_filters_and_csv(self, client):
+        response = client.get("/transactions/export", params={"format": "csv", "search": "Merchant 1"})
+
+        lines = response.text.splitlines()
+        assert response.headers["content-disposition"] == 'attachment; filename="transactions.csv"'
+        assert lines[0].startswith("id,account_id,institution")
+        assert len(lines) == 1 + 11  # Merchant 1, 10-19
+
+    def test_gzipped_for_accepting_clients(self, client):
+        with client.stream("GET", "/transactions/export", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(gzip.decompress(raw).splitlines()) == 30
+
+    def test_conditional_get_headers(self, client):
+        first = client.get("/transactions/export")
+        etag = first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "private, no-cache"
+        assert first.headers["content-disposition"] == 'attachment; filename="transactions.ndjson"'
+
+        assert client.get("/transactions/export", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_unknown_format_rejected(self, client):
+        assert client.get("/transactions/export", params={"format": "xml"}).status_code == 422
+
+
+class TestBulkUpdate:
+    """Tests for POST /transactions/bulk."""
+
+    def test_filter_operations_return_counts(self, client):
+        response = client.post("/transactions/bulk", json={
+            "filter": {"search": "Merchant 2"},
+            "operations": [
+                {"op": "set_category", "value": "dining"},
+                {"op": "add_tags", "tags": ["work"]},
+            ],
+        })
+
+        assert response.status_code == 200
+        assert response.json() == {"matched": 11, "results": [
+            {"op": "set_category", "count": 11}, {"op": "add_tags", "count": 11}]}
+        exported = client.get("/transactions/export", params={"category": "dining"}).text.splitlines()
+        assert len(exported) == 11
+
+    def test_ids_and_filter_are_exclusive(self, client):
+        operations = [{"op": "set_memo", "value": "x"}]
+
+        assert client.post("/transactions/bulk", json={"operations": operations}).status_code == 422
+        assert client.post("/transactions/bulk", json={
+            "ids": [1], "filter": {}, "operations": operations}).status_code == 422
+        assert client.post("/transactions/bulk", json={
+            "ids": [1], "operations": [{"op": "delete"}]}).status_code == 422
+
+    def test_empty_filter_needs_all(self, client):
+        operations = [{"op": "set_memo", "value": "x"}]
+
+        assert client.post("/transactions/bulk", json={"filter": {}, "operations": operations}).status_code == 422
+        assert client.post("/transactions/bulk", json={
+            "filter": {"untagged_only": False}, "operations": operations}).status_code == 422
+
+        response = client.post("/transactions/bulk", json={"filter": {"all": True}, "operations": operations})
+
+        assert response.status_code == 200
+        assert response.json()["matched"] == 30
+
@@ -5,8 +5,9 @@ Tests interactions between services without CLI layer,
 focusing on service-to-service integration points.
 """
 
+import json
 import pytest
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 import tempfile
@@ -14,12 +15,15 @@ import tempfile
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from db.models import Base, Transaction, Account, SyncHistory, CategoryMapping, MerchantMapping
+from db.models import Base, Transaction, Account, SyncHistory, SyncWatermark, CategoryMapping, MerchantMapping
 from services.credit_card_service import CreditCardService
 from services.category_service import CategoryService
 from services.rules_service import RulesService
 from services.analytics_service import AnalyticsService
 from config.constants import Institution, AccountType
+from config.landing_store import LandingStore
+from cryptography.fernet import Fernet
+from scrapers.utils.payload_log import PayloadLog
 
 from tests.integration.conftest import (
     build_cal_transaction,
@@ -29,6 +33,7 @@ from tests.integration.conftest import (
     create_test_category_mapping,
 )
 from scrapers.credit_cards.cal_credit_card_client import TransactionStatus
+from scrapers.credit_cards.shared_models import CALScraperError, TransactionBatch
 
 
 @pytest.fixture
@@ -440,6 +445,300 @@ def test_multi_account_sync_creates_separate_accounts(service_db_session, credit
     assert "5678" in account_numbers
 
 
+# ==================== Incremental Sync Watermarks ====================
+
+def _days_ago(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).isoformat()
+
+
+@pytest.mark.integration
+def test_first_sync_is_full_then_incremental(service_db_session, credit_card_service):
+    """
+    A login without a watermark syncs fully; the next sync starts near the newest completed transaction.
+    """
+    assert credit_card_service.get_incremental_start(Institution.CAL, username="test", months_back=3) is None
+
+    with patch("services.credit_card_service.CALCreditCardScraper") as mock_cls:
+        scraper = MagicMock()
+        scraper.scrape.return_value = [
+            build_card_account(transactions=[
+                build_cal_transaction("OLD", 10.0, transaction_date=_days_ago(40)),
+                build_cal_transaction("NEW", 20.0, transaction_date=_days_ago(2)),
+            ])
+        ]
+        mock_cls.return_value = scraper
+
+        result = credit_card_service.sync_cal(username="test", password="test", months_back=3)
+
+    assert result.success
+    assert scraper.scrape.call_args.kwargs["start_date"] is None
+
+    watermark = service_db_session.query(SyncWatermark).one()
+    assert watermark.last_completed_date == date.today() - timedelta(days=2)
+    assert "test" not in watermark.login_key
+
+    start = credit_card_service.get_incremental_start(Institution.CAL, username="test", months_back=3)
+    assert start == date.today() - timedelta(days=2 + CreditCardService.WATERMARK_OVERLAP_DAYS)
+    # Other logins keep syncing fully
+    assert credit_card_service.get_incremental_start(Institution.CAL, username="other", months_back=3) is None
+
+
+@pytest.mark.integration
+def test_incremental_start_covers_oldest_pending(service_db_session, credit_card_service):
+    """
+    A transaction still pending at the last sync must be refetched to see it complete.
+    """
+    with patch("services.credit_card_service.CALCreditCardScraper") as mock_cls:
+        scraper = MagicMock()
+        scraper.scrape.return_value = [
+            build_card_account(transactions=[
+                build_cal_transaction("PENDING", 10.0, status=TransactionStatus.PENDING, transaction_date=_days_ago(30)),
+                build_cal_transaction("DONE", 20.0, transaction_date=_days_ago(1)),
+            ])
+        ]
+        mock_cls.return_value = scraper
+        credit_card_service.sync_cal(username="test", password="test")
+
+        since = credit_card_service.get_incremental_start(Institution.CAL, username="test", months_back=3)
+        assert since == date.today() - timedelta(days=30)
+
+        # The incremental window saw no completed transactions - the mark must not move back
+        scraper.scrape.return_value = [build_card_account(transactions=[])]
+        credit_card_service.sync_cal(username="test", password="test", since=since)
+
+    assert scraper.scrape.call_args.kwargs["start_date"] == datetime.combine(since, datetime.min.time())
+    watermark = service_db_session.query(SyncWatermark).one()
+    assert watermark.last_completed_date == date.today() - timedelta(days=1)
+    assert watermark.oldest_pending_date is None
+
+
+@pytest.mark.integration
+def test_stale_watermark_falls_back_to_full_range(service_db_session, credit_card_service):
+    """
+    A watermark older than months_back should not widen the fetch.
+    """
+    with patch("services.credit_card_service.CALCreditCardScraper") as mock_cls:
+        scraper = MagicMock()
+        scraper.scrape.return_value = [
+            build_card_account(transactions=[build_cal_transaction("OLD", 10.0, transaction_date=_days_ago(200))])
+        ]
+        mock_cls.return_value = scraper
+        credit_card_service.sync_cal(username="test", password="test", months_back=12)
+
+    assert credit_card_service.get_incremental_start(Institution.CAL, username="test", months_back=3) is None
+
+
+@pytest.mark.integration
+def test_failed_sync_keeps_previous_watermark(service_db_session, credit_card_service):
+    """
+    A failed sync must not create or advance the watermark.
+    """
+    with patch("services.credit_card_service.CALCreditCardScraper") as mock_cls:
+        scraper = MagicMock()
+        scraper.scrape.return_value = []
+        mock_cls.return_value = scraper
+
+        result = credit_card_service.sync_cal(username="test", password="test")
+
+    assert not result.success
+    assert service_db_session.query(SyncWatermark).count() == 0
+
+
+# ==================== Streamed Sync (chunked commits + resume) ====================
+
+def _month_start(months_ago: int) -> date:
+    year, month = date.today().year, date.today().month - months_ago
+    while month < 1:
+        year, month = year - 1, month + 12
+    return date(year, month, 1)
+
+
+def _month_batch(months_ago: int, description: str = None, error: Exception = None) -> TransactionBatch:
+    start = _month_start(months_ago)
+    transactions = []
+    if description:
+        transactions.append(build_cal_transaction(description, 10.0, transaction_date=f"{start.isoformat()}T00:00:00"))
+    accounts = [] if error else [build_card_account(transactions=transactions)]
+    return TransactionBatch(year=start.year, month=start.month, accounts=accounts, error=error)
+
+
+def _streamed_sync(service, scraper, **fetch_kwargs):
+    stream = service.open_stream(Institution.CAL, username="test")
+    outcome = service.fetch_cal("test", "test", on_batch=stream.save, **fetch_kwargs)
+    return stream.finish(outcome)
+
+
+@pytest.mark.integration
+def test_streamed_sync_keeps_committed_months_and_resumes(service_db_session, credit_card_service):
+    """
+    Months saved before a failure stay committed; the next sync starts after the checkpoint.
+    """
+    def interrupted(**kwargs):
+        yield _month_batch(3, "MONTH 3")
+        yield _month_batch(2, "MONTH 2")
+        raise CALScraperError("Session expired")
+
+    with patch("services.credit_card_service.CALCreditCardScraper") as mock_cls:
+        scraper = MagicMock()
+        scraper.scrape_batches.side_effect = interrupted
+        mock_cls.return_value = scraper
+
+        result = _streamed_sync(credit_card_service, scraper, months_back=6)
+
+        assert not result.success
+        assert result.error_message == "Session expired"
+        assert service_db_session.query(Transaction).count() == 2
+        record = service_db_session.query(SyncHistory).one()
+        assert record.status == "failed"
+        checkpoint = json.loads(record.sync_metadata)["checkpoint"]
+        assert checkpoint["completed_through"] == _month_start(2).strftime("%Y-%m")
+        assert checkpoint["batches"] == 2
+
+        since = credit_card_service.get_incremental_start(Institution.CAL, username="test", months_back=6)
+        assert since == _month_start(1)
+        assert credit_card_service.get_incremental_start(Institution.CAL, username="other", months_back=6) is None
+
+        scraper.scrape_batches.side_effect = lambda **kwargs: iter([_month_batch(1, "MONTH 1"), _month_batch(0)])
+        result = _streamed_sync(credit_card_service, scraper, months_back=6, since=since)
+
+    assert result.success
+    assert result.cards_synced == 1
+    assert scraper.scrape_batches.call_args.kwargs["start_date"] == datetime.combine(since, time.min)
+    assert service_db_session.query(Transaction).count() == 3
+    # Finished - later syncs follow the watermark again
+    watermark = service_db_session.query(SyncWatermark).one()
+    assert watermark.last_completed_date == _month_start(1)
+    assert credit_card_service.get_incremental_start(Institution.CAL, username="test", months_back=6) == (
+        _month_start(1) - timedelta(days=CreditCardService.WATERMARK_OVERLAP_DAYS)
+    )
+
+
+@pytest.mark.integration
+def test_streamed_sync_checkpoint_stops_at_failed_month(service_db_session, credit_card_service):
+    """
+    A month the scraper could not fetch is skipped, but the checkpoint does not pass it.
+    """
+    batches = [
+        _month_batch(2, "MONTH 2"),
+        _month_batch(1, error=CALScraperError("timeout")),
+        _month_batch(0, "MONTH 0"),
+    ]
+    with patch("services.credit_card_service.CALCreditCardScraper") as mock_cls:
+        scraper = MagicMock()
+        scraper.scrape_batches.return_value = iter(batches)
+        mock_cls.return_value = scraper
+
+        result = _streamed_sync(credit_card_service, scraper)
+
+    assert result.success
+    assert result.transactions_added == 2
+    assert result.months_failed == [_month_start(1).strftime("%Y-%m")]
+    # Rules run only on these (see RulesService.apply_rules_after_sync)
+    assert sorted(result.transaction_ids) == sorted(t.id for t in service_db_session.query(Transaction))
+    record = service_db_session.query(SyncHistory).one()
+    assert record.status == "partial"
+    metadata = json.loads(record.sync_metadata)
+    assert metadata["checkpoint"]["completed_through"] == _month_start(2).strftime("%Y-%m")
+    assert metadata["months_failed"] == [_month_start(1).strftime("%Y-%m")]
+    # The watermark does not pass the failed month - the next sync refetches it
+    assert service_db_session.query(SyncWatermark).count() == 0
+    assert credit_card_service.get_incremental_start(Institution.CAL, username="test", months_back=6) == _month_start(1)
+
+
+@pytest.mark.integration
+def test_sync_with_failed_month_is_partial(service_db_session, credit_card_service):
+    """
+    A non-streamed sync saves the months it got but keeps the watermark when one is missing.
+    """
+    card_accounts = [build_card_account(transactions=[build_cal_transaction("WOLT", 50.0, transaction_date=_days_ago(3))])]
+
+    with patch("services.credit_card_service.CALCreditCardScraper") as mock_cls:
+        scraper = MagicMock()
+        scraper.scrape.return_value = card_accounts
+        scraper.months_failed = [_month_start(1).strftime("%Y-%m")]
+        mock_cls.return_value = scraper
+
+        result = credit_card_service.sync_cal(username="test", password="test")
+
+    assert result.success
+    assert result.months_failed == [_month_start(1).strftime("%Y-%m")]
+    assert service_db_session.query(Transaction).count() == 1
+    record = service_db_session.query(SyncHistory).one()
+    assert record.status == "partial"
+    assert json.loads(record.sync_metadata)["months_failed"] == result.months_failed
+    assert service_db_session.query(SyncWatermark).count() == 0
+
+
+@pytest.mark.integration
+def test_streamed_sync_with_every_month_failed(service_db_session, credit_card_service):
+    with patch("services.credit_card_service.CALCreditCardScraper") as mock_cls:
+        scraper = MagicMock()
+        scraper.scrape_batches.return_value = iter([_month_batch(0, error=CALScraperError("blocked"))])
+        mock_cls.return_value = scraper
+
+        result = _streamed_sync(credit_card_service, scraper)
+
+    assert not result.success
+    assert result.error_message == "blocked"
+    assert service_db_session.query(SyncWatermark).count() == 0
+
+
+# ==================== Raw Payload Landing + Replay ====================
+
+@pytest.mark.integration
+def test_sync_lands_payloads_and_replay_resaves(service_db_session, credit_card_service, tmp_path):
+    """
+    A sync lands its scraper's payloads; replay converts them again and saves a new sync.
+    """
+    credit_card_service._landing_store = LandingStore(tmp_path, key=Fernet.generate_key())
+    start, end = datetime(2026, 1, 1), datetime(2026, 3, 1)
+    card_accounts = [build_card_account(transactions=[build_cal_transaction("WOLT", 50.0, transaction_date=_days_ago(3))])]
+
+    with patch("services.credit_card_service.CALCreditCardScraper") as mock_cls:
+        scraper = MagicMock()
+        scraper.payload_log = PayloadLog()
+        scraper.payload_log.record("POST https://api/pending", {"status": 200, "json": {"statusCode": 1}})
+        scraper.fetched_range = (start, end)
+        scraper.export_replay_state.return_value = {"cards": [{"cardUniqueId": "1"}]}
+        scraper.scrape.return_value = card_accounts
+        mock_cls.return_value = scraper
+
+        result = credit_card_service.sync_cal(username="test", password="test")
+
+        manifest = credit_card_service.landing_store.load(result.sync_history_id)
+        assert manifest["payloads"] == scraper.payload_log.entries
+        assert manifest["start_date"] == start.isoformat()
+
+        replay_scraper = MagicMock()
+        replay_scraper.fetch_transactions.return_value = card_accounts
+        mock_cls.return_value = replay_scraper
+
+        institution, outcome = credit_card_service.replay_fetch(result.sync_history_id)
+        replayed = credit_card_service.save_replay(institution, outcome)
+
+    replay_log, state = replay_scraper.prepare_replay.call_args.args
+    assert replay_log.replaying and replay_log.entries == manifest["payloads"]
+    assert state == {"cards": [{"cardUniqueId": "1"}]}
+    assert replay_scraper.fetch_transactions.call_args.kwargs == {"start_date": start, "end_date": end}
+
+    assert replayed.success
+    assert replayed.transactions_updated == 1
+    first, second = service_db_session.query(SyncHistory).order_by(SyncHistory.id).all()
+    assert json.loads(first.sync_metadata)["raw_payloads"] == 1
+    replay_metadata = json.loads(second.sync_metadata)
+    assert replay_metadata["replay_of"] == first.id
+    assert "raw_payloads" not in replay_metadata  # Replays are not landed again
+    assert service_db_session.query(Transaction).count() == 1
+
+
+@pytest.mark.integration
+def test_replay_without_landed_payloads(credit_card_service, tmp_path):
+    credit_card_service._landing_store = LandingStore(tmp_path, key=Fernet.generate_key())
+
+    with pytest.raises(ValueError, match="No landed payloads"):
+        credit_card_service.replay_fetch(123)
+
+
 # ==================== Effective Category Resolution ====================
 
 @pytest.mark.integration
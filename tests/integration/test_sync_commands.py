@@ -233,7 +233,7 @@ def test_sync_no_credentials_shows_error(cli_runner):
     """
     with patch("cli.commands.sync.check_database_exists", return_value=True):
         with patch("db.database.check_database_exists", return_value=True):
-            with patch("cli.commands.sync.select_accounts_to_sync") as mock_select:
+            with patch("services.sync_orchestrator.select_accounts_to_sync") as mock_select:
                 with patch("config.settings.select_accounts_to_sync") as mock_select2:
                     mock_select.side_effect = ValueError("No CAL accounts configured")
                     mock_select2.side_effect = ValueError("No CAL accounts configured")
@@ -0,0 +1,187 @@
+"""
+Minimal local IMAP4rev1 server for email retriever tests.
+
+Supports the subset EmailMFARetriever uses: LOGIN, SELECT, STATUS, NOOP,
+UID SEARCH (ALL / FROM+SINCE / UID n:*), UID FETCH of BODY.PEEK header
+fields and text, IDLE, CLOSE and LOGOUT. Messages can be delivered while a
+client is idling. Every command is recorded in `commands` for assertions.
+"""
+
+import email
+import email.utils
+import re
+import select
+import socketserver
+import threading
+from datetime import datetime
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import List, Optional
+
+
+def build_message(sender: str, body_html: str, date: Optional[datetime] = None, subject: str = "Code") -> bytes:
+    """Build a multipart MFA email as raw bytes."""
+    message = MIMEMultipart('alternative')
+    message['From'] = sender
+    message['To'] = "me@example.com"
+    message['Subject'] = subject
+    message['Date'] = email.utils.format_datetime((date or datetime.now()).astimezone())
+    message.attach(MIMEText("See HTML version", 'plain'))
+    message.attach(MIMEText(body_html, 'html'))
+    return message.as_bytes().replace(b'\r\n', b'\n').replace(b'\n', b'\r\n')
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def send(self, line: bytes):
+        self.wfile.write(line + b'\r\n')
+        self.wfile.flush()
+
+    def handle(self):
+        server: IMAPStandIn = self.server.stand_in
+        self.announced = 0
+        self.send(b'* OK IMAP4rev1 stand-in ready')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            line = line.rstrip(b'\r\n').decode()
+            tag, _, rest = line.partition(' ')
+            command, _, args = rest.partition(' ')
+            command = command.upper()
+            server.commands.append(rest)
+            if command not in ('CAPABILITY', 'LOGIN', 'SELECT', 'LOGOUT', 'IDLE'):
+                self._announce(server)
+
+            if command == 'CAPABILITY':
+                caps = 'IMAP4rev1 IDLE' if server.supports_idle else 'IMAP4rev1'
+                self.send(f'* CAPABILITY {caps}'.encode())
+                self.send(f'{tag} OK CAPABILITY completed'.encode())
+            elif command == 'LOGIN':
+                server.logins += 1
+                self.send(f'{tag} OK LOGIN completed'.encode())
+            elif command == 'SELECT':
+                self.announced = len(server.messages)
+                self.send(f'* {self.announced} EXISTS'.encode())
+                self.send(f'* OK [UIDNEXT {server.uid_next}] Predicted next UID'.encode())
+                self.send(f'{tag} OK [READ-WRITE] SELECT completed'.encode())
+            elif command == 'STATUS':
+                self.send(f'* STATUS INBOX (UIDNEXT {server.uid_next})'.encode())
+                self.send(f'{tag} OK STATUS completed'.encode())
+            elif command in ('NOOP', 'CLOSE'):
+                self.send(f'{tag} OK {command} completed'.encode())
+            elif command == 'LOGOUT':
+                self.send(b'* BYE logging out')
+                self.send(f'{tag} OK LOGOUT completed'.encode())
+                return
+            elif command == 'UID':
+                sub, _, sub_args = args.partition(' ')
+                if sub.upper() == 'SEARCH':
+                    uids = server.search(sub_args)
+                    self.send(('* SEARCH ' + ' '.join(str(u) for u in uids)).strip().encode())
+                else:
+                    self._fetch(server, sub_args)
+                self.send(f'{tag} OK UID completed'.encode())
+            elif command == 'IDLE':
+                self._idle(server, tag)
+            else:
+                self.send(f'{tag} BAD unknown command'.encode())
+
+    def _fetch(self, server, args):
+        uid_set, _, item = args.partition(' ')
+        wanted = {int(u) for u in uid_set.split(',')}
+        for seq, (uid, raw) in enumerate(server.messages, start=1):
+            if uid not in wanted:
+                continue
+            header, _, text = raw.partition(b'\r\n\r\n')
+            if 'HEADER.FIELDS' in item:
+                fields = re.search(r'HEADER\.FIELDS \(([^)]*)\)', item).group(1).split()
+                parsed = email.message_from_bytes(header + b'\r\n\r\n')
+                data = b''.join(
+                    f'{name}: {parsed[name]}\r\n'.encode() for name in fields if parsed[name] is not None
+                ) + b'\r\n'
+                name = f'BODY[HEADER.FIELDS ({" ".join(fields)})]'
+            else:
+                limit = re.search(r'<0\.(\d+)>', item)
+                data = text[:int(limit.group(1))] if limit else text
+                name = 'BODY[TEXT]<0>'
+            self.wfile.write(f'* {seq} FETCH (UID {uid} {name} {{{len(data)}}}\r\n'.encode() + data + b')\r\n')
+        self.wfile.flush()
+
+    def _announce(self, server):
+        """Send EXISTS for messages this session has not been told about yet."""
+        if len(server.messages) > self.announced:
+            self.announced = len(server.messages)
+            self.send(f'* {self.announced} EXISTS'.encode())
+
+    def _idle(self, server, tag):
+        self.send(b'+ idling')
+        while server.on_idle:
+            server.deliver(server.on_idle.pop(0))
+        while True:
+            self._announce(server)
+            readable, _, _ = select.select([self.connection], [], [], 0.02)
+            if readable:
+                self.rfile.readline()  # DONE
+                self.send(f'{tag} OK IDLE terminated'.encode())
+                return
+
+
+class IMAPStandIn:
+    """Threaded local IMAP server holding an in-memory INBOX."""
+
+    def __init__(self, supports_idle: bool = True):
+        self.supports_idle = supports_idle
+        self.messages: List[tuple] = []
+        self.uid_next = 1
+        self.logins = 0
+        self.commands: List[str] = []
+        # Messages delivered as soon as a client enters IDLE
+        self.on_idle: List[bytes] = []
+        self._server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self) -> 'IMAPStandIn':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def deliver(self, raw: bytes) -> int:
+        """Add a message to the INBOX and return its UID."""
+        uid = self.uid_next
+        self.uid_next += 1
+        self.messages.append((uid, raw))
+        return uid
+
+    def deliver_on_idle(self, raw: bytes):
+        """Deliver a message once the next IDLE command starts."""
+        self.on_idle.append(raw)
+
+    def search(self, criteria: str) -> List[int]:
+        match = re.match(r'UID (\d+):\*', criteria)
+        if match:
+            start = int(match.group(1))
+            uids = [uid for uid, _ in self.messages if uid >= start]
+            # Like real servers, "n:*" includes the last message even below n
+            return uids or [uid for uid, _ in self.messages[-1:]]
+        if criteria == 'ALL':
+            return [uid for uid, _ in self.messages]
+
+        sender = re.search(r'FROM "([^"]*)"', criteria).group(1).lower()
+        since = datetime.strptime(re.search(r'SINCE (\S+)', criteria).group(1), '%d-%b-%Y').date()
+        results = []
+        for uid, raw in self.messages:
+            parsed = email.message_from_bytes(raw)
+            sent = email.utils.parsedate_to_datetime(parsed['Date']).astimezone().date()
+            if sender in parsed['From'].lower() and sent >= since:
+                results.append(uid)
+        return results
+
+    def fetched_items(self) -> List[str]:
+        return [c for c in self.commands if c.upper().startswith('UID FETCH')]
@@ -0,0 +1,185 @@
+"""
+Tests for the warm Chrome driver pool.
+
+launch_chrome is patched to return MagicMock drivers, so these tests check
+pool bookkeeping and the CDP reset sequence without starting Chrome.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scrapers.base.driver_pool import DriverPool, driver_pool, get_active_pool
+from scrapers.base.selenium_driver import DriverConfig, SeleniumDriver
+
+
+def _make_driver():
+    driver = MagicMock()
+    driver.current_url = "https://digital.isracard.co.il/personalarea"
+    driver.window_handles = ["tab-1"]
+    driver.current_window_handle = "tab-2"
+    driver.execute_cdp_cmd.side_effect = lambda cmd, params: (
+        {'cookies': [{'domain': '.cal-online.co.il'}]} if cmd == 'Network.getAllCookies' else {}
+    )
+    return driver
+
+
+@pytest.fixture
+def launch():
+    """Patch launch_chrome to hand out fresh mock drivers."""
+    with patch("scrapers.base.driver_pool.launch_chrome", side_effect=lambda config: _make_driver()) as mock_launch:
+        yield mock_launch
+
+
+class TestDriverPool:
+    """Tests for DriverPool checkout/return semantics."""
+
+    def test_released_driver_reused(self, launch):
+        pool = DriverPool()
+        config = DriverConfig()
+
+        first = pool.acquire(config)
+        pool.release(first)
+        second = pool.acquire(config)
+
+        assert second is first
+        assert launch.call_count == 1
+        assert pool.reused == 1
+
+    def test_different_launch_options_not_shared(self, launch):
+        pool = DriverPool()
+
+        first = pool.acquire(DriverConfig())
+        pool.release(first)
+        second = pool.acquire(DriverConfig(enable_performance_logging=True))
+
+        assert second is not first
+        assert launch.call_count == 2
+
+    def test_implicit_wait_not_part_of_signature(self, launch):
+        pool = DriverPool()
+
+        first = pool.acquire(DriverConfig(implicit_wait=10))
+        pool.release(first)
+        second = pool.acquire(DriverConfig(implicit_wait=5))
+
+        assert second is first
+        second.implicitly_wait.assert_called_with(5)
+
+    def test_retired_after_max_uses(self, launch):
+        pool = DriverPool(max_uses=2)
+        config = DriverConfig()
+
+        driver = pool.acquire(config)
+        pool.release(driver)
+        assert pool.acquire(config) is driver
+        pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert pool.acquire(config) is not driver
+
+    def test_unhealthy_driver_replaced(self, launch):
+        pool = DriverPool()
+        config = DriverConfig()
+        dead = pool.acquire(config)
+        pool.release(dead)
+        type(dead).window_handles = property(lambda self: (_ for _ in ()).throw(RuntimeError("gone")))
+
+        replacement = pool.acquire(config)
+
+        assert replacement is not dead
+        dead.quit.assert_called_once()
+
+    def test_release_resets_context(self, launch):
+        pool = DriverPool()
+        driver = pool.acquire(DriverConfig())
+
+        pool.release(driver)
+
+        commands = [c.args[0] for c in driver.execute_cdp_cmd.call_args_list]
+        assert commands[0] == 'Network.getAllCookies'
+        assert 'Network.clearBrowserCookies' in commands
+        assert 'Network.clearBrowserCache' in commands
+        origins = {
+            c.args[1]['origin'] for c in driver.execute_cdp_cmd.call_args_list
+            if c.args[0] == 'Storage.clearDataForOrigin'
+        }
+        assert origins == {"https://cal-online.co.il", "https://digital.isracard.co.il"}
+        driver.switch_to.new_window.assert_called_once_with('tab')
+        driver.close.assert_called_once()
+        driver.switch_to.window.assert_called_with("tab-2")
+
+    def test_failed_reset_discards_driver(self, launch):
+        pool = DriverPool()
+        config = DriverConfig()
+        driver = pool.acquire(config)
+        driver.execute_cdp_cmd.side_effect = RuntimeError("cdp failed")
+
+        pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert pool.acquire(config) is not driver
+
+    def test_max_idle_cap(self, launch):
+        pool = DriverPool(max_idle=1)
+        config = DriverConfig()
+        first = pool.acquire(config)
+        second = pool.acquire(config)
+
+        pool.release(first)
+        pool.release(second)
+
+        first.quit.assert_not_called()
+        second.quit.assert_called_once()
+
+    def test_warm_prelaunches(self, launch):
+        pool = DriverPool(max_idle=2)
+        config = DriverConfig()
+
+        pool.warm_in_background(config, count=3).join()
+        pool.acquire(config)
+
+        assert launch.call_count == 2
+        assert pool.reused == 1
+
+    def test_close_quits_idle_browsers(self, launch):
+        pool = DriverPool()
+        config = DriverConfig()
+        idle = pool.acquire(config)
+        busy = pool.acquire(config)
+        pool.release(idle)
+
+        pool.close()
+
+        idle.quit.assert_called_once()
+        busy.quit.assert_not_called()
+        pool.release(busy)
+        busy.quit.assert_called_once()
+
+
+class TestSeleniumDriverWithPool:
+    """Tests for SeleniumDriver picking up the active pool."""
+
+    def test_setup_and_cleanup_use_active_pool(self, launch):
+        config = DriverConfig()
+
+        with driver_pool() as pool:
+            assert get_active_pool() is pool
+            with SeleniumDriver(config) as first:
+                pass
+            with SeleniumDriver(config) as second:
+                pass
+
+            assert second is first
+            first.quit.assert_not_called()
+
+        assert get_active_pool() is None
+        first.quit.assert_called_once()
+
+    def test_without_pool_launches_and_quits(self):
+        driver = _make_driver()
+        with patch("scrapers.base.selenium_driver.launch_chrome", return_value=driver):
+            with SeleniumDriver(DriverConfig()):
+                pass
+
+        driver.quit.assert_called_once()
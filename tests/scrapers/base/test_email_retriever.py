@@ -0,0 +1,146 @@
+"""
+Tests for push-based MFA code retrieval against a local IMAP stand-in.
+"""
+
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytest
+
+from scrapers.base.email_retriever import EmailConfig, EmailMFARetriever, MFAConfig
+from scrapers.base.imap_mailbox import ImapMailbox, close_shared_mailboxes
+from tests.scrapers.base.imap_stand_in import IMAPStandIn, build_message
+
+SENDER = "noreply@pension.example"
+
+
+class CodeRetriever(EmailMFARetriever):
+    """Extracts a 6-digit code from the HTML part."""
+
+    def extract_mfa_code(self, email_message) -> Optional[str]:
+        for part in email_message.walk():
+            if part.get_content_type() == "text/html":
+                match = re.search(self.mfa_config.code_pattern, part.get_payload(decode=True).decode())
+                if match:
+                    return match.group(0)
+        return None
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def _make(supports_idle=True):
+        server = IMAPStandIn(supports_idle=supports_idle).start()
+        servers.append(server)
+        return server
+
+    yield _make
+    close_shared_mailboxes()
+    for server in servers:
+        server.stop()
+
+
+def _retriever(server, max_wait=5, check_interval=1):
+    email_config = EmailConfig(
+        email_address="me@example.com", password="secret",
+        imap_server="127.0.0.1", imap_port=server.port, use_ssl=False
+    )
+    mfa_config = MFAConfig(sender_email=SENDER, max_wait_time=max_wait, check_interval=check_interval, email_delay=0)
+    return CodeRetriever(email_config, mfa_config)
+
+
+def _deliver_later(server, raw, delay=0.2):
+    timer = threading.Timer(delay, server.deliver, args=(raw,))
+    timer.start()
+    return timer
+
+
+class TestIdleRetrieval:
+    """Tests for the IMAP IDLE path."""
+
+    def test_code_delivered_during_idle(self, make_server):
+        server = make_server()
+        server.deliver(build_message(SENDER, "<h2>111111</h2>", date=datetime.now() - timedelta(hours=1)))
+        retriever = _retriever(server)
+
+        server.deliver_on_idle(build_message(SENDER, "<h2>654321</h2>"))
+        start = time.monotonic()
+        code = retriever.wait_for_mfa_code(since_time=datetime.now())
+
+        assert code == "654321"
+        assert time.monotonic() - start < 2
+        assert any(c.startswith("IDLE") for c in server.commands)
+
+    def test_existing_code_found_without_waiting(self, make_server):
+        server = make_server()
+        since = datetime.now()
+        server.deliver(build_message(SENDER, "<h2>222222</h2>"))
+
+        code = _retriever(server).wait_for_mfa_code(since_time=since)
+
+        assert code == "222222"
+        assert not any(c.startswith("IDLE") for c in server.commands)
+
+    def test_only_headers_and_text_fetched(self, make_server):
+        server = make_server()
+        server.deliver(build_message("news@shop.example", "<p>Sale 999999</p>"))
+        _deliver_later(server, build_message(SENDER, "<h2>333333</h2>"))
+
+        assert _retriever(server).wait_for_mfa_code(since_time=datetime.now()) == "333333"
+
+        fetches = server.fetched_items()
+        assert all("BODY.PEEK" in f and "RFC822" not in f for f in fetches)
+        text_fetches = [f for f in fetches if "BODY.PEEK[TEXT]" in f]
+        assert text_fetches == [f"UID FETCH 2 (BODY.PEEK[TEXT]<0.{ImapMailbox.MAX_BODY_BYTES}>)"]
+
+    def test_timeout_returns_none(self, make_server):
+        server = make_server()
+
+        assert _retriever(server, max_wait=0.3).wait_for_mfa_code(since_time=datetime.now()) is None
+
+
+class TestPollingFallback:
+    """Servers without IDLE are polled for new UIDs."""
+
+    def test_polls_new_uids(self, make_server):
+        server = make_server(supports_idle=False)
+        server.deliver(build_message(SENDER, "<h2>000000</h2>", date=datetime.now() - timedelta(days=2)))
+        retriever = _retriever(server, check_interval=0.1)
+
+        _deliver_later(server, build_message(SENDER, "<h2>444444</h2>"))
+        code = retriever.wait_for_mfa_code(since_time=datetime.now())
+
+        assert code == "444444"
+        assert not any(c.startswith("IDLE") for c in server.commands)
+        assert any(c.startswith("UID SEARCH UID 2:*") for c in server.commands)
+
+
+class TestSharedConnection:
+    """One authenticated connection per mailbox across retrievers."""
+
+    def test_single_login_across_accounts(self, make_server):
+        server = make_server()
+        first, second = _retriever(server), _retriever(server)
+
+        server.deliver(build_message(SENDER, "<h2>555555</h2>"))
+        assert first.wait_for_mfa_code(since_time=datetime.now() - timedelta(minutes=1)) == "555555"
+        first.disconnect()
+
+        _deliver_later(server, build_message(SENDER, "<h2>666666</h2>"))
+        assert second.wait_for_mfa_code(since_time=datetime.now()) == "666666"
+
+        assert server.logins == 1
+        assert first.connection is second.connection
+
+    def test_used_code_not_handed_out_again(self, make_server):
+        """A code consumed by one login is skipped even if still within the since window."""
+        server = make_server()
+        server.deliver(build_message(SENDER, "<h2>777777</h2>"))
+        since = datetime.now() - timedelta(minutes=1)
+
+        assert _retriever(server).wait_for_mfa_code(since_time=since) == "777777"
+        assert _retriever(server, max_wait=0.3).wait_for_mfa_code(since_time=since) is None
@@ -0,0 +1,146 @@
+"""
+Tests for routing MFA codes to concurrent logins sharing one mailbox.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from scrapers.base.email_retriever import EmailConfig, MFAConfig
+from scrapers.base.imap_mailbox import close_shared_mailboxes
+from scrapers.base.mfa_router import get_mfa_router
+from tests.scrapers.base.imap_stand_in import IMAPStandIn, build_message
+from tests.scrapers.base.test_email_retriever import CodeRetriever
+
+MIGDAL = "noreply@migdal.example"
+PHOENIX = "noreply@phoenix.example"
+
+
+@pytest.fixture
+def server():
+    server = IMAPStandIn().start()
+    yield server
+    close_shared_mailboxes()
+    server.stop()
+
+
+def _retriever(server, sender, max_wait=5):
+    email_config = EmailConfig(
+        email_address="me@example.com", password="secret",
+        imap_server="127.0.0.1", imap_port=server.port, use_ssl=False
+    )
+    mfa_config = MFAConfig(sender_email=sender, max_wait_time=max_wait, check_interval=1, email_delay=0)
+    return CodeRetriever(email_config, mfa_config)
+
+
+def _start_wait(retriever, results, key, **kwargs):
+    thread = threading.Thread(target=lambda: results.__setitem__(key, retriever.wait_for_mfa_code(**kwargs)))
+    thread.start()
+    return thread
+
+
+def _wait_for_waiters(retriever, count):
+    router = get_mfa_router(retriever.email_config)
+    deadline = time.monotonic() + 2
+    while len(router._waiters) < count:
+        assert time.monotonic() < deadline, "logins did not start waiting"
+        time.sleep(0.01)
+
+
+class TestConcurrentLogins:
+    """Several logins waiting on one mailbox."""
+
+    def test_each_institution_gets_its_own_code(self, server):
+        migdal, phoenix = _retriever(server, MIGDAL), _retriever(server, PHOENIX)
+        results = {}
+        now = datetime.now()
+
+        threads = [
+            _start_wait(migdal, results, "migdal", since_time=now),
+            _start_wait(phoenix, results, "phoenix", since_time=now),
+        ]
+        _wait_for_waiters(migdal, 2)
+        server.deliver(build_message(PHOENIX, "<h2>222222</h2>"))
+        server.deliver(build_message(MIGDAL, "<h2>111111</h2>"))
+        for thread in threads:
+            thread.join()
+
+        assert results == {"migdal": "111111", "phoenix": "222222"}
+        assert server.logins == 1
+
+    def test_same_sender_codes_follow_request_order(self, server):
+        first, second = _retriever(server, MIGDAL), _retriever(server, MIGDAL)
+        results = {}
+        now = datetime.now()
+
+        threads = [_start_wait(first, results, "first", since_time=now - timedelta(seconds=5))]
+        _wait_for_waiters(first, 1)
+        threads.append(_start_wait(second, results, "second", since_time=now))
+        _wait_for_waiters(first, 2)
+        server.deliver(build_message(MIGDAL, "<h2>111111</h2>"))
+        server.deliver(build_message(MIGDAL, "<h2>222222</h2>"))
+        for thread in threads:
+            thread.join()
+
+        assert results == {"first": "111111", "second": "222222"}
+
+    def test_id_hint_overrides_arrival_order(self, server):
+        first, second = _retriever(server, MIGDAL), _retriever(server, MIGDAL)
+        results = {}
+        now = datetime.now()
+
+        threads = [
+            _start_wait(first, results, "first", since_time=now - timedelta(seconds=5), id_hints=["1234"]),
+            _start_wait(second, results, "second", since_time=now, id_hints=["5678"]),
+        ]
+        _wait_for_waiters(first, 2)
+        # The second login's code arrives first
+        server.deliver(build_message(MIGDAL, "<p>ID ***5678</p><h2>222222</h2>"))
+        server.deliver(build_message(MIGDAL, "<p>ID ***1234</p><h2>111111</h2>"))
+        for thread in threads:
+            thread.join()
+
+        assert results == {"first": "111111", "second": "222222"}
+
+    def test_id_hint_not_matched_inside_code(self, server):
+        retriever = _retriever(server, MIGDAL)
+        router = get_mfa_router(retriever.email_config)
+        results = {}
+        now = datetime.now()
+
+        threads = [
+            _start_wait(retriever, results, "first", since_time=now - timedelta(seconds=5), id_hints=["9999"]),
+            _start_wait(retriever, results, "second", since_time=now, id_hints=["2345"]),
+        ]
+        _wait_for_waiters(retriever, 2)
+        server.deliver(build_message(MIGDAL, "<h2>123456</h2>"))
+        server.deliver(build_message(MIGDAL, "<h2>654321</h2>"))
+        for thread in threads:
+            thread.join()
+
+        assert results == {"first": "123456", "second": "654321"}
+        assert router.mailbox.consumed_uids == {1, 2}
+
+
+class TestCatchUp:
+    """Mail that arrived before a login started waiting."""
+
+    def test_newest_code_used_when_more_codes_than_logins(self, server):
+        since = datetime.now() - timedelta(seconds=30)
+        server.deliver(build_message(MIGDAL, "<h2>111111</h2>"))
+        server.deliver(build_message(MIGDAL, "<h2>222222</h2>"))
+
+        assert _retriever(server, MIGDAL).wait_for_mfa_code(since_time=since) == "222222"
+
+    def test_watcher_stops_when_no_login_waits(self, server):
+        retriever = _retriever(server, MIGDAL, max_wait=0.2)
+
+        assert retriever.wait_for_mfa_code(since_time=datetime.now()) is None
+
+        router = get_mfa_router(retriever.email_config)
+        deadline = time.monotonic() + 2
+        while router._watcher is not None:
+            assert time.monotonic() < deadline, "watcher still running"
+            time.sleep(0.01)
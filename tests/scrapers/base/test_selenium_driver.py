@@ -0,0 +1,102 @@
+"""
+Tests for DriverConfig profiles and Chrome option building.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scrapers.base.driver_pool import DriverPool
+from scrapers.base.selenium_driver import (
+    BLOCKABLE_RESOURCES,
+    DriverConfig,
+    apply_tab_settings,
+    build_chrome_options,
+)
+
+
+class TestLightweightProfile:
+    """Tests for the resource-blocking profile."""
+
+    def test_default_config_blocks_nothing(self):
+        config = DriverConfig()
+
+        assert config.blocked_url_patterns() == []
+        options = build_chrome_options(config)
+        assert options.page_load_strategy == 'normal'
+        assert 'prefs' not in options.experimental_options
+
+    def test_lightweight_blocks_all_groups(self):
+        config = DriverConfig.lightweight()
+
+        patterns = config.blocked_url_patterns()
+
+        for group_patterns in BLOCKABLE_RESOURCES.values():
+            assert set(group_patterns) <= set(patterns)
+        assert config.page_load_strategy == 'eager'
+
+    def test_lightweight_chrome_options(self):
+        options = build_chrome_options(DriverConfig.lightweight(js_heap_mb=256))
+
+        assert options.page_load_strategy == 'eager'
+        assert '--js-flags=--max-old-space-size=256' in options.arguments
+        assert '--lang=he-IL' in options.arguments
+        assert 'prefs' not in options.experimental_options
+
+    @pytest.mark.parametrize("allowed, kept", [
+        pytest.param(['images'], '*.png', id="group"),
+        pytest.param(['*.svg'], '*.svg', id="single_pattern"),
+        pytest.param(['trackers'], '*google-analytics.com*', id="trackers"),
+    ])
+    def test_allow_list(self, allowed, kept):
+        config = DriverConfig.lightweight(allowed_resources=allowed)
+
+        patterns = config.blocked_url_patterns()
+
+        assert kept not in patterns
+        assert '*.woff2' in patterns
+
+    def test_extra_blocked_urls(self):
+        config = DriverConfig(blocked_urls=['*chat-widget*'])
+
+        assert config.blocked_url_patterns() == ['*chat-widget*']
+
+    def test_launch_signature_tracks_startup_options(self):
+        base = DriverConfig.lightweight()
+
+        assert base.launch_signature() == DriverConfig.lightweight(allowed_resources=['images']).launch_signature()
+        assert base.launch_signature() == DriverConfig.lightweight(user_agent='Other/1.0').launch_signature()
+        assert base.launch_signature() != DriverConfig.lightweight(page_load_strategy='normal').launch_signature()
+        assert base.launch_signature() != DriverConfig.lightweight(headless=False).launch_signature()
+
+
+class TestNetworkBlocking:
+    """Tests for applying blocked URLs over CDP."""
+
+    def test_apply_sets_user_agent_and_blocked_urls(self):
+        driver = MagicMock()
+        config = DriverConfig.lightweight(user_agent='Other/1.0')
+
+        apply_tab_settings(driver, config)
+
+        driver.execute_cdp_cmd.assert_any_call('Network.enable', {})
+        driver.execute_cdp_cmd.assert_any_call('Network.setUserAgentOverride', {'userAgent': 'Other/1.0'})
+        driver.execute_cdp_cmd.assert_any_call(
+            'Network.setBlockedURLs', {'urls': config.blocked_url_patterns()}
+        )
+
+    def test_pooled_checkout_reapplies_patterns(self):
+        """A browser shared by configs differing in allow-list and user agent gets each config's settings."""
+        with patch("scrapers.base.driver_pool.launch_chrome", side_effect=lambda config: MagicMock()):
+            pool = DriverPool()
+            driver = pool.acquire(DriverConfig.lightweight())
+            pool.release(driver)
+            driver.execute_cdp_cmd.reset_mock()
+
+            config = DriverConfig.lightweight(allowed_resources=['images'], user_agent='Other/1.0')
+            assert pool.acquire(config) is driver
+
+        driver.execute_cdp_cmd.assert_any_call('Network.setUserAgentOverride', {'userAgent': 'Other/1.0'})
+        driver.execute_cdp_cmd.assert_any_call(
+            'Network.setBlockedURLs', {'urls': config.blocked_url_patterns()}
+        )
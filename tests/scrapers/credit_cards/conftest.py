@@ -0,0 +1,72 @@
+"""
+Shared fixtures for credit card scraper tests.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubAPIServer(ThreadingHTTPServer):
+    """Local API stand-in that records client ports and can fail on demand."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubAPIHandler)
+        self.client_ports = set()
+        self.requests_seen = 0
+        self.fail_next = 0  # Number of upcoming requests answered with 503
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/api"
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Allow keep-alive
+    disable_nagle_algorithm = True  # Avoid delayed-ACK stalls on reused connections
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
+        server = self.server
+        with server.lock:
+            server.client_ports.add(self.client_address[1])
+            server.requests_seen += 1
+            fail = server.fail_next > 0
+            if fail:
+                server.fail_next -= 1
+
+        status = 503 if fail else 200
+        body = json.dumps({
+            'statusCode': 1,
+            'authorization': self.headers.get('Authorization'),
+            'cookie': self.headers.get('Cookie'),
+        }).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = StubAPIServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -275,21 +275,31 @@ class TestScraperDriverConfig:
         assert config.headless is False
         assert config.enable_performance_logging is True
 
-    def test_max_uses_default_config(self):
-        """Max scraper uses default driver config (no special settings)."""
+    def test_card_scrapers_share_launch_signature(self):
+        """Per-scraper settings stay per-checkout, so pooled browsers are shared."""
+        from scrapers.base.selenium_driver import DriverConfig
+        from scrapers.credit_cards.cal_credit_card_client import (
+            CALCreditCardScraper, CALCredentials
+        )
+        from scrapers.credit_cards.isracard_credit_card_client import (
+            IsracardCreditCardScraper, IsracardCredentials
+        )
         from scrapers.credit_cards.max_credit_card_client import (
             MaxCreditCardScraper, MaxCredentials
         )
 
-        scraper = MaxCreditCardScraper(
-            MaxCredentials(username="test", password="test"),
-            headless=True
-        )
-        config = scraper._create_driver_config()
-
-        assert config.headless is True
-        # Max doesn't need performance logging
-        assert config.enable_performance_logging is False
+        scrapers = [
+            CALCreditCardScraper(CALCredentials(username="test", password="test")),
+            MaxCreditCardScraper(MaxCredentials(username="test", password="test")),
+            IsracardCreditCardScraper(
+                IsracardCredentials(user_id="123", password="test", card_6_digits="123456"),
+                base_url="https://digital.isracard.co.il",
+                company_code="11"
+            ),
+        ]
+        signatures = {scraper._create_driver_config().launch_signature() for scraper in scrapers}
+
+        assert signatures == {DriverConfig.lightweight().launch_signature()}
 
     def test_isracard_sets_hebrew_language(self):
         """Isracard scraper sets Hebrew language for proper rendering."""
@@ -0,0 +1,273 @@
+"""
+Tests for concurrent (card, month) fetching in credit card scrapers.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from scrapers.utils.concurrent_fetch import AdaptiveRateLimiter, RateLimiter, fetch_concurrently
+
+
+# ==================== fetch_concurrently Tests ====================
+
+class TestFetchConcurrently:
+    """Test the bounded thread-pool fetch stage."""
+
+    def test_results_in_input_order(self):
+        """Results are reassembled in key order even when completion order differs."""
+        def fetch(key):
+            time.sleep((10 - key) * 0.002)  # Later keys finish first
+            return key * 10
+
+        results = fetch_concurrently(fetch, list(range(10)), max_workers=5)
+
+        assert [r.key for r in results] == list(range(10))
+        assert [r.value for r in results] == [k * 10 for k in range(10)]
+
+    def test_failure_isolated_to_single_key(self):
+        """One failing key is captured without affecting the others."""
+        def fetch(key):
+            if key == 3:
+                raise ValueError("boom")
+            return key
+
+        results = fetch_concurrently(fetch, list(range(6)), max_workers=3)
+
+        assert [r.ok for r in results] == [True, True, True, False, True, True]
+        assert isinstance(results[3].error, ValueError)
+        assert results[5].value == 5
+
+    def test_concurrency_bounded_by_max_workers(self):
+        """No more than max_workers calls run at once."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fetch(key):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return key
+
+        fetch_concurrently(fetch, list(range(20)), max_workers=4)
+
+        assert 1 < peak <= 4
+
+    def test_faster_than_sequential(self):
+        """54 round-trips are bounded by the concurrency limit, not run one by one."""
+        def fetch(key):
+            time.sleep(0.01)
+            return key
+
+        start = time.monotonic()
+        fetch_concurrently(fetch, list(range(54)), max_workers=6)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 54 * 0.01 / 2
+
+    def test_empty_keys(self):
+        assert fetch_concurrently(lambda k: k, []) == []
+
+
+class TestRateLimiter:
+    """Test request pacing."""
+
+    def test_spaces_calls(self):
+        """Calls are spaced at least 1/rate apart across threads."""
+        limiter = RateLimiter(50.0)  # 20ms interval
+        start = time.monotonic()
+
+        fetch_concurrently(lambda k: limiter.acquire(), list(range(6)), max_workers=3)
+
+        assert time.monotonic() - start >= 5 * 0.02 * 0.9
+
+    @pytest.mark.parametrize("rate", [None, 0])
+    def test_disabled(self, rate):
+        """None or zero rate disables limiting."""
+        limiter = RateLimiter(rate)
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+
+# ==================== Scraper Tests ====================
+
+def _completed_month(card_id, month, year):
+    """Fake CAL completed-transactions response with one transaction."""
+    return {
+        'statusCode': 1,
+        'result': {'bankAccounts': [{'debitDates': [{'transactions': [{
+            'trnIntId': f"{card_id}-{year}-{month}",
+            'trnPurchaseDate': f"{year}-{month:02d}-01T00:00:00",
+            'debCrdDate': f"{year}-{month:02d}-01T00:00:00",
+            'trnAmt': 10.0,
+            'amtBeforeConvAndIndex': 10.0,
+            'trnCurrencySymbol': 'ILS',
+            'debCrdCurrencySymbol': 'ILS',
+            'merchantName': 'Store',
+            'trnTypeCode': '5',
+            'numOfPayments': 0,
+            'curPaymentNum': 0,
+        }]}]}]},
+    }
+
+
+class TestCALConcurrentFetch:
+    """Test CAL fetch_transactions over the concurrent fetch stage."""
+
+    def _create_scraper(self, **kwargs):
+        from scrapers.credit_cards.cal_credit_card_client import (
+            CALCreditCardScraper, CALCredentials
+        )
+        kwargs.setdefault('rate_limit', 0)  # No pacing in tests
+        scraper = CALCreditCardScraper(CALCredentials(username="test", password="test"), **kwargs)
+        scraper.authorization_token = "CALAuthScheme token"
+        scraper.cards = [
+            {'cardUniqueId': 'card-a', 'last4Digits': '1111'},
+            {'cardUniqueId': 'card-b', 'last4Digits': '2222'},
+        ]
+        scraper.fetch_pending_transactions = MagicMock(return_value=None)
+        return scraper
+
+    def test_concurrency_configurable(self):
+        scraper = self._create_scraper(max_concurrency=7, rate_limit=2.0)
+        assert scraper.max_concurrency == 7
+        assert scraper.rate_limiter.interval == 0.5
+
+    def test_fetches_every_card_month_pair(self):
+        """Each card gets its own months, newest first, like the sequential loop."""
+        scraper = self._create_scraper()
+        scraper.fetch_completed_transactions = MagicMock(side_effect=_completed_month)
+
+        accounts = scraper.fetch_transactions(
+            start_date=_month_start(3),
+            months_forward=0
+        )
+
+        assert [a.card_unique_id for a in accounts] == ['card-a', 'card-b']
+        calls = scraper.fetch_completed_transactions.call_args_list
+        assert len(calls) == 2 * 4
+        for account in accounts:
+            ids = [t.identifier for t in account.transactions]
+            assert all(i.startswith(account.card_unique_id) for i in ids)
+            assert len(ids) == 4
+
+    def test_failed_month_skipped(self):
+        """A failing month is skipped while the rest of the backfill completes."""
+        from scrapers.credit_cards.cal_credit_card_client import CALAPIError
+
+        failing_month = datetime.now().month
+
+        def fetch(card_id, month, year):
+            if card_id == 'card-a' and month == failing_month:
+                raise CALAPIError("timeout")
+            return _completed_month(card_id, month, year)
+
+        scraper = self._create_scraper()
+        scraper.fetch_completed_transactions = MagicMock(side_effect=fetch)
+
+        accounts = scraper.fetch_transactions(
+            start_date=_month_start(2),
+            months_forward=0
+        )
+
+        assert len(accounts[0].transactions) == 2
+        assert len(accounts[1].transactions) == 3
+        assert scraper.months_failed == [_month_start(0).strftime("%Y-%m")]
+
+    def test_failed_pending_fetch_recorded_in_batch(self):
+        """A failed pending fetch is reported as the last month's error, not dropped."""
+        from scrapers.credit_cards.cal_credit_card_client import CALAPIError
+
+        scraper = self._create_scraper()
+        scraper.fetch_completed_transactions = MagicMock(side_effect=_completed_month)
+        scraper.fetch_pending_transactions = MagicMock(side_effect=CALAPIError("pending down"))
+
+        batches = list(scraper.iter_transaction_batches(start_date=_month_start(1), months_forward=0))
+
+        assert batches[0].error is None
+        assert isinstance(batches[-1].error, CALAPIError)
+        assert all(len(a.transactions) == 1 for a in batches[-1].accounts)
+
+    def test_all_months_failed_raises(self):
+        from scrapers.credit_cards.cal_credit_card_client import CALAPIError
+
+        scraper = self._create_scraper()
+        scraper.fetch_completed_transactions = MagicMock(side_effect=CALAPIError("down"))
+
+        with pytest.raises(CALAPIError):
+            scraper.fetch_transactions(months_back=2, months_forward=0)
+
+
+class TestMaxConcurrentFetch:
+    """Test Max fetch_transactions over the concurrent fetch stage."""
+
+    def test_merges_months_in_order(self):
+        from scrapers.credit_cards.max_credit_card_client import (
+            MaxCreditCardScraper, MaxCredentials
+        )
+        from scrapers.credit_cards.shared_models import Transaction
+
+        def fetch(month, year):
+            txn = MagicMock(spec=Transaction)
+            txn.date = f"{year}-{month:02d}-01"
+            return {'1234': [txn]}
+
+        scraper = MaxCreditCardScraper(MaxCredentials(username="test", password="test"), rate_limit=0)
+        scraper.load_categories = MagicMock()
+        scraper.fetch_transactions_for_month = MagicMock(side_effect=fetch)
+
+        accounts = scraper.fetch_transactions(
+            start_date=_month_start(5),
+            months_forward=0
+        )
+
+        assert len(accounts) == 1
+        dates = [t.date for t in accounts[0].transactions]
+        assert len(dates) == 6
+        assert dates == sorted(dates, reverse=True)
+
+
+def _month_start(months_back):
+    """Midnight on the 1st of the month months_back months before the current one."""
+    month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    for _ in range(months_back):
+        month_start = (month_start - timedelta(days=1)).replace(day=1)
+    return month_start
+
+
+class TestAdaptiveRateLimiter:
+    """Test back-off-on-throttle pacing."""
+
+    def test_no_delay_until_throttled(self):
+        limiter = AdaptiveRateLimiter()
+        assert limiter.delay == 0.0
+
+    def test_backoff_doubles_up_to_max(self):
+        limiter = AdaptiveRateLimiter(initial_backoff=1.0, max_backoff=3.0)
+
+        delays = []
+        for _ in range(4):
+            limiter.backoff()
+            delays.append(limiter.delay)
+
+        assert delays == [1.0, 2.0, 3.0, 3.0]
+
+    def test_success_recovers_to_min_interval(self):
+        limiter = AdaptiveRateLimiter(min_interval=0.1, initial_backoff=1.0)
+        limiter.backoff()
+        limiter.backoff()  # 2.0
+
+        limiter.record_success()
+        assert limiter.delay == 1.0
+        limiter.record_success()
+        assert limiter.delay == 0.1
@@ -0,0 +1,167 @@
+"""
+Tests for pooled HTTP sessions used by credit card scrapers.
+
+Runs against a local stub server (conftest.stub_server) to verify
+keep-alive connection reuse and transport-level retries.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from scrapers.utils.http_session import create_http_session
+
+
+# ==================== create_http_session Tests ====================
+
+class TestCreateHttpSession:
+    """Test session construction and transport behavior."""
+
+    def test_adapter_pool_and_retry_configured(self):
+        """Mounted adapter uses the requested pool size and retry policy."""
+        session = create_http_session(pool_maxsize=7, max_retries=2, backoff_factor=0)
+
+        adapter = session.get_adapter('https://api.example.com')
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == 2
+        assert 503 in adapter.max_retries.status_forcelist
+        assert 'POST' in adapter.max_retries.allowed_methods
+        session.close()
+
+    def test_seeds_headers_and_cookies(self, stub_server):
+        """Default headers and cookies are sent with every request."""
+        session = create_http_session(
+            headers={'Authorization': 'Bearer abc'},
+            cookies={'sid': 'xyz'},
+        )
+
+        data = session.get(stub_server.url, timeout=5).json()
+
+        assert data['authorization'] == 'Bearer abc'
+        assert data['cookie'] == 'sid=xyz'
+        session.close()
+
+    def test_reuses_connection_across_requests(self, stub_server):
+        """Sequential requests go over a single keep-alive connection."""
+        session = create_http_session()
+
+        for _ in range(10):
+            session.post(stub_server.url, json={'month': '1'}, timeout=5).raise_for_status()
+
+        assert stub_server.requests_seen == 10
+        assert len(stub_server.client_ports) == 1
+        session.close()
+
+    def test_retries_server_errors(self, stub_server):
+        """Transient 5xx responses are retried transparently."""
+        stub_server.fail_next = 2
+        session = create_http_session(max_retries=3, backoff_factor=0)
+
+        response = session.post(stub_server.url, json={}, timeout=5)
+
+        assert response.status_code == 200
+        assert stub_server.requests_seen == 3
+        session.close()
+
+    def test_returns_last_response_when_retries_exhausted(self, stub_server):
+        """After the last retry the error response is returned for raise_for_status()."""
+        stub_server.fail_next = 5
+        session = create_http_session(max_retries=1, backoff_factor=0)
+
+        response = session.get(stub_server.url, timeout=5)
+
+        assert response.status_code == 503
+        with pytest.raises(requests.HTTPError):
+            response.raise_for_status()
+        session.close()
+
+
+# ==================== Scraper Integration Tests ====================
+
+class TestScraperHttpSession:
+    """Test scraper-scoped session lifecycle."""
+
+    def test_cal_session_carries_auth_headers(self):
+        """CAL session is created with the authorization token as a default header."""
+        from scrapers.credit_cards.cal_credit_card_client import (
+            CALCreditCardScraper, CALCredentials
+        )
+
+        scraper = CALCreditCardScraper(CALCredentials(username="test", password="test"))
+        scraper.authorization_token = "CALAuthScheme token"
+
+        assert scraper.http_session.headers['Authorization'] == "CALAuthScheme token"
+        assert scraper.http_session.headers['X-Site-Id'] == scraper.X_SITE_ID
+
+    def test_max_session_seeded_from_browser_cookies(self):
+        """Max session is created with the Selenium cookies."""
+        from scrapers.credit_cards.max_credit_card_client import (
+            MaxCreditCardScraper, MaxCredentials
+        )
+
+        scraper = MaxCreditCardScraper(MaxCredentials(username="test", password="test"))
+        scraper.driver = MagicMock()
+        scraper.driver.get_cookies.return_value = [{'name': 'session', 'value': 'abc'}]
+
+        assert scraper.http_session.cookies.get('session') == 'abc'
+
+    def test_session_created_once_and_closed_on_cleanup(self):
+        """The same session is reused until cleanup() closes it."""
+        from scrapers.credit_cards.cal_credit_card_client import (
+            CALCreditCardScraper, CALCredentials
+        )
+
+        scraper = CALCreditCardScraper(CALCredentials(username="test", password="test"))
+        scraper.authorization_token = "CALAuthScheme token"
+
+        session = scraper.http_session
+        assert scraper.http_session is session
+
+        scraper.cleanup()
+
+        assert scraper._http_session is None
+        assert scraper.http_session is not session
+
+    def test_cal_fetch_uses_pooled_session(self, stub_server):
+        """CAL API calls go through the scraper's session."""
+        from scrapers.credit_cards.cal_credit_card_client import (
+            CALCreditCardScraper, CALCredentials
+        )
+
+        scraper = CALCreditCardScraper(CALCredentials(username="test", password="test"))
+        scraper.authorization_token = "CALAuthScheme token"
+        scraper.TRANSACTIONS_ENDPOINT = stub_server.url
+
+        for month in range(1, 4):
+            data = scraper.fetch_completed_transactions("card-1", month, 2024)
+            assert data['authorization'] == "CALAuthScheme token"
+
+        assert len(stub_server.client_ports) == 1
+        scraper.cleanup()
+
+    def test_concurrent_first_use_creates_one_session(self):
+        """Fetch workers racing for the first session all get the same one."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from scrapers.credit_cards.cal_credit_card_client import (
+            CALCreditCardScraper, CALCredentials
+        )
+
+        scraper = CALCreditCardScraper(CALCredentials(username="test", password="test"))
+        scraper.authorization_token = "CALAuthScheme token"
+        created = []
+
+        def slow_create():
+            time.sleep(0.05)
+            created.append(create_http_session())
+            return created[-1]
+
+        scraper._create_http_session = slow_create
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            sessions = list(pool.map(lambda _: scraper.http_session, range(4)))
+
+        assert len(created) == 1
+        assert all(session is created[0] for session in sessions)
+        scraper.cleanup()
@@ -0,0 +1,250 @@
+"""
+Tests for Isracard batched in-page fetching.
+
+The WebDriver is mocked: execute_async_script receives the URL list and
+returns canned API responses, so these tests count browser round-trips.
+"""
+
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from scrapers.credit_cards.isracard_credit_card_client import (
+    IsracardCreditCardScraper,
+    IsracardCredentials,
+)
+from scrapers.credit_cards.shared_models import IsracardAPIError
+from scrapers.utils.concurrent_fetch import AdaptiveRateLimiter
+
+
+# ==================== Test Fixtures ====================
+
+def _dashboard_response(year, month):
+    return {
+        'Header': {'Status': '1'},
+        'DashboardMonthBean': {'cardsCharges': [
+            {'cardIndex': '0', 'cardNumber': '1234', 'billingDate': f"10/{month:02d}/{year}"},
+        ]},
+    }
+
+
+def _transactions_response(year, month):
+    return {
+        'Header': {'Status': '1'},
+        'CardsTransactionsListBean': {'Index0': {'CurrentCardTransactions': [{
+            'txnIsrael': [{
+                'fullPurchaseDate': f"05/{month:02d}/{year}",
+                'dealSum': '100',
+                'paymentSum': '100',
+                'voucherNumberRatz': f"{year}{month:02d}",
+                'fullSupplierNameHeb': 'Store',
+                'moreInfo': '',
+            }],
+        }]}},
+    }
+
+
+def _category_response():
+    return {'PirteyIska_204Bean': {'sector': ' Food '}}
+
+
+class FakeBrowser:
+    """Answers batched fetch scripts based on each URL's reqName."""
+
+    def __init__(self, throttle_first: int = 0):
+        self.calls = []
+        self.throttle_first = throttle_first
+
+    def execute_async_script(self, script, urls, concurrency, throttle_statuses, timeout_ms):
+        self.calls.append(list(urls))
+        responses = []
+        for url in urls:
+            if self.throttle_first > 0:
+                self.throttle_first -= 1
+                responses.append({'_error': 'Throttled', '_status': 429})
+                continue
+            query = {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+            if query['reqName'] == 'DashboardMonth':
+                year, month, _ = query['billingDate'].split('-')
+                responses.append(_dashboard_response(int(year), int(month)))
+            elif query['reqName'] == 'CardsTransactionsList':
+                responses.append(_transactions_response(int(query['year']), int(query['month'])))
+            else:
+                responses.append(_category_response())
+        return responses
+
+
+def _create_scraper(browser, fetch_categories=False):
+    scraper = IsracardCreditCardScraper(
+        IsracardCredentials(user_id="1", password="p", card_6_digits="123456"),
+        base_url="https://digital.isracard.co.il",
+        company_code="11",
+        fetch_categories=fetch_categories,
+    )
+    scraper.driver = browser
+    scraper.rate_limiter = AdaptiveRateLimiter(initial_backoff=0.001, max_backoff=0.01)
+    return scraper
+
+
+# ==================== Batch Tests ====================
+
+class TestIsracardBatchFetch:
+    """Test fetch_transactions over batched in-page requests."""
+
+    def test_backfill_in_two_round_trips(self):
+        """All months' cards and transactions come back in one round-trip each."""
+        browser = FakeBrowser()
+        scraper = _create_scraper(browser)
+
+        accounts = scraper.fetch_transactions(months_back=11, months_forward=0)
+
+        assert len(browser.calls) == 2
+        assert len(accounts) == 1
+        months = len(browser.calls[0])
+        assert len(accounts[0].transactions) >= months - 1
+        dates = [t.date for t in accounts[0].transactions]
+        assert dates == sorted(dates, reverse=True)
+
+    def test_categories_fetched_in_batch(self):
+        """Category lookups add a single extra round-trip and update transactions."""
+        browser = FakeBrowser()
+        scraper = _create_scraper(browser, fetch_categories=True)
+
+        accounts = scraper.fetch_transactions(months_back=2, months_forward=0)
+
+        assert len(browser.calls) == 3
+        assert all(t.category == 'Food' for t in accounts[0].transactions)
+
+    def test_throttled_requests_retried_with_backoff(self):
+        """Throttled URLs are retried after the limiter backs off."""
+        browser = FakeBrowser(throttle_first=2)
+        scraper = _create_scraper(browser)
+        urls = [
+            scraper.build_url(scraper.services_url, scraper.accounts_params(2024, month))
+            for month in (1, 2, 3)
+        ]
+
+        results = scraper.api_request_batch(urls)
+
+        assert all(r is not None for r in results)
+        assert len(browser.calls) == 2
+        assert len(browser.calls[1]) == 2  # Only the throttled ones retried
+
+    def test_failed_url_isolated(self):
+        """A non-throttle error returns None for that URL only."""
+        browser = MagicMock()
+        browser.execute_async_script.return_value = [
+            {'_error': 'Invalid JSON', '_status': 500, '_text': '<html>'},
+            {'Header': {'Status': '1'}},
+        ]
+        scraper = _create_scraper(browser)
+
+        results = scraper.api_request_batch(['u1', 'u2'])
+
+        assert results == [None, {'Header': {'Status': '1'}}]
+
+    def test_failed_script_call_isolated_to_its_chunk(self):
+        """A script timeout loses only that call's URLs; the fetch carries on."""
+        browser = MagicMock()
+        browser.execute_async_script.side_effect = [
+            TimeoutException("script timeout"),
+            [{'ok': 3}, {'ok': 4}],
+        ]
+        scraper = _create_scraper(browser)
+        scraper.BATCH_MAX_URLS = 2
+
+        results = scraper.api_request_batch(['u1', 'u2', 'u3', 'u4'])
+
+        assert results == [None, None, {'ok': 3}, {'ok': 4}]
+
+    def test_chunks_fit_script_timeout(self):
+        """Each call gets only as many URLs as can time out within the script timeout."""
+        browser = MagicMock()
+        browser.execute_async_script.side_effect = lambda script, urls, *args: [{} for _ in urls]
+        scraper = _create_scraper(browser)
+        scraper.SCRIPT_TIMEOUT, scraper.FETCH_TIMEOUT = 25, 10
+
+        scraper.api_request_batch([f"u{i}" for i in range(10)], concurrency=4)
+
+        sizes = [len(call.args[1]) for call in browser.execute_async_script.call_args_list]
+        assert sizes == [8, 2]
+        assert browser.execute_async_script.call_args.args[4] == 10000
+
+    def test_category_failures_not_fatal(self):
+        """Transactions are still returned when every category lookup fails."""
+        browser = FakeBrowser()
+        answer = browser.execute_async_script
+
+        def execute(script, urls, *args):
+            if 'PirteyIska' in urls[0]:
+                raise RuntimeError("hung fetch")
+            return answer(script, urls, *args)
+
+        browser.execute_async_script = execute
+        scraper = _create_scraper(browser, fetch_categories=True)
+
+        accounts = scraper.fetch_transactions(months_back=2, months_forward=0)
+
+        assert accounts[0].transactions
+        assert all(t.category is None for t in accounts[0].transactions)
+
+    def test_large_batches_split_by_max_urls(self):
+        """URL lists beyond BATCH_MAX_URLS are split across script calls."""
+        browser = MagicMock()
+        browser.execute_async_script.side_effect = lambda script, urls, *args: [{} for _ in urls]
+        scraper = _create_scraper(browser)
+        scraper.BATCH_MAX_URLS = 10
+
+        results = scraper.api_request_batch([f"u{i}" for i in range(25)])
+
+        assert len(results) == 25
+        assert browser.execute_async_script.call_count == 3
+
+    def test_streamed_months_oldest_first_per_round(self):
+        """Batches come one per month, oldest first, fetching months_per_fetch months per round."""
+        browser = FakeBrowser()
+        scraper = _create_scraper(browser)
+
+        batches = list(scraper.iter_transaction_batches(months_back=5, months_forward=0, months_per_fetch=2))
+
+        months = [(batch.year, batch.month) for batch in batches]
+        assert months == sorted(months)
+        assert len(browser.calls) == 2 * len(range(0, len(months), 2))
+        assert all(len(call) <= 2 for call in browser.calls)
+        assert all(batch.error is None and len(batch.accounts) == 1 for batch in batches)
+
+    def test_failed_month_yielded_with_error(self):
+        browser = FakeBrowser()
+        browser.execute_async_script = MagicMock(side_effect=lambda script, urls, *args: [
+            {'_error': 'fetch failed', '_type': 'fetch_error'} if index == 0 else _dashboard_response(2024, 1)
+            for index, _ in enumerate(urls)
+        ])
+        scraper = _create_scraper(browser)
+
+        first, *rest = scraper.iter_transaction_batches(months_back=2, months_forward=0)
+
+        assert isinstance(first.error, IsracardAPIError)
+        assert first.accounts == []
+
+    def test_all_months_failing_raises(self):
+        browser = MagicMock()
+        browser.execute_async_script.side_effect = lambda script, urls, *args: [
+            {'_error': 'fetch failed', '_type': 'fetch_error'} for _ in urls
+        ]
+        scraper = _create_scraper(browser)
+
+        with pytest.raises(IsracardAPIError):
+            scraper.fetch_transactions(months_back=2, months_forward=0)
+
+
+@pytest.mark.parametrize("result, expected", [
+    pytest.param({'_error': 'Throttled', '_status': 429}, True, id="http_429"),
+    pytest.param({'_error': 'Invalid JSON', '_status': 200, '_text': 'Block Automation'}, True, id="block_page"),
+    pytest.param({'_error': 'Invalid JSON', '_status': 500, '_text': '<html>'}, False, id="server_error"),
+    pytest.param({'Header': {'Status': '1'}}, False, id="success"),
+])
+def test_is_throttled(result, expected):
+    scraper = _create_scraper(MagicMock())
+    assert scraper.is_throttled(result) is expected
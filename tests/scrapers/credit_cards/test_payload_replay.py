@@ -0,0 +1,134 @@
+"""
+Tests for raw payload recording, landing and offline replay.
+
+Recordings made against a stub server (requests scrapers) or a fake
+browser (Isracard) must replay to the same results with neither available.
+"""
+
+import os
+import time
+
+import pytest
+import requests
+from cryptography.fernet import Fernet
+
+from config.landing_store import LandingStore
+from scrapers.utils.http_session import create_http_session
+from scrapers.utils.payload_log import PayloadLog, PayloadNotRecorded
+from tests.scrapers.credit_cards.test_isracard_batch import FakeBrowser, _create_scraper
+
+
+# ==================== PayloadLog Tests ====================
+
+class TestPayloadLog:
+    """Test recording a requests session and serving it back."""
+
+    def test_replays_recorded_responses_without_network(self, stub_server):
+        recording = PayloadLog()
+        session = create_http_session(headers={'Authorization': 'token'})
+        recording.attach(session)
+        live = session.post(stub_server.url, json={'month': '1'}, timeout=5).json()
+        session.close()
+        stub_server.shutdown()
+
+        replay = PayloadLog(replay=recording.entries)
+        session = create_http_session()
+        replay.attach(session)
+        response = session.post(stub_server.url, json={'month': '1'}, timeout=5)
+
+        assert response.status_code == 200
+        assert response.json() == live
+        assert stub_server.requests_seen == 1
+
+    def test_unrecorded_request_raises(self, stub_server):
+        recording = PayloadLog()
+        session = create_http_session()
+        recording.attach(session)
+        session.post(stub_server.url, json={'month': '1'}, timeout=5)
+
+        replay = PayloadLog(replay=recording.entries)
+        session = create_http_session()
+        replay.attach(session)
+
+        with pytest.raises(requests.ConnectionError):
+            session.post(stub_server.url, json={'month': '2'}, timeout=5)
+        with pytest.raises(PayloadNotRecorded):
+            session.get(stub_server.url, timeout=5)
+
+    def test_request_key_ignores_json_key_order(self):
+        assert PayloadLog.request_key('post', 'u', {'b': 1, 'a': 2}) == PayloadLog.request_key('POST', 'u', {'a': 2, 'b': 1})
+
+
+# ==================== LandingStore Tests ====================
+
+@pytest.fixture
+def landing_store(tmp_path):
+    """LandingStore in a temp dir with a throwaway key."""
+    return LandingStore(tmp_path / 'landing', key=Fernet.generate_key())
+
+
+class TestLandingStore:
+    """Test the encrypted, content-addressed payload store."""
+
+    def test_round_trip_and_dedup(self, landing_store):
+        entries = {'GET a': {'json': {'merchant': 'WOLT'}}, 'GET b': {'json': {'merchant': 'WOLT'}}}
+
+        first = landing_store.save(1, 'cal', entries, start_date='2026-01-01')
+        second = landing_store.save(2, 'cal', entries)
+
+        assert first == {'payloads': 2, 'new': 1, 'bytes': first['bytes']}
+        assert second['new'] == 0
+        assert len(list((landing_store.root / 'objects').rglob('*.enc'))) == 1
+
+        manifest = landing_store.load(1)
+        assert manifest['institution'] == 'cal'
+        assert manifest['start_date'] == '2026-01-01'
+        assert manifest['payloads'] == entries
+
+    def test_files_are_encrypted_and_private(self, landing_store):
+        landing_store.save(1, 'cal', {'GET a': {'json': {'merchant': 'WOLT'}}}, start_date='2026-01-01')
+
+        files = [path for path in landing_store.root.rglob('*') if path.is_file()]
+        assert len(files) == 2
+        for path in files:
+            assert b'WOLT' not in path.read_bytes() and b'2026-01-01' not in path.read_bytes()
+            assert path.stat().st_mode & 0o777 == 0o600
+        assert landing_store.root.stat().st_mode & 0o777 == 0o700
+
+    def test_prune_drops_expired_syncs_and_their_payloads(self, landing_store):
+        landing_store.save(1, 'cal', {'GET old': {'json': 1}, 'GET shared': {'json': 2}})
+        landing_store.save(2, 'cal', {'GET shared': {'json': 2}})
+        expired = time.time() - (landing_store.retention_days + 1) * 86400
+        for path in landing_store.root.rglob('*.enc'):
+            os.utime(path, (expired, expired))
+        os.utime(landing_store.root / 'syncs' / '2.enc')
+
+        assert landing_store.prune() == {'syncs': 1, 'objects': 1}
+        assert landing_store.load(1) is None
+        assert landing_store.load(2)['payloads'] == {'GET shared': {'json': 2}}
+
+    def test_missing_sync_returns_none(self, landing_store):
+        assert landing_store.load(99) is None
+
+
+# ==================== Isracard Replay Tests ====================
+
+def test_isracard_replay_matches_live_fetch(landing_store):
+    """In-page API calls are recorded and replayed without a browser."""
+    live_scraper = _create_scraper(FakeBrowser(), fetch_categories=True)
+    live = live_scraper.fetch_transactions(months_back=2, months_forward=0)
+    start_date, end_date = live_scraper.fetched_range
+
+    landing_store.save(
+        7, 'isracard', live_scraper.payload_log.entries,
+        start_date=start_date.isoformat(), end_date=end_date.isoformat(),
+        state=live_scraper.export_replay_state()
+    )
+    manifest = landing_store.load(7)
+
+    replay_scraper = _create_scraper(None)
+    replay_scraper.prepare_replay(PayloadLog(replay=manifest['payloads']), manifest['state'])
+    replayed = replay_scraper.fetch_transactions(start_date=start_date, end_date=end_date)
+
+    assert replay_scraper.fetch_categories is True
+    assert replayed[0].transactions == live[0].transactions
@@ -0,0 +1,151 @@
+"""
+Tests for cached login session reuse in credit card scrapers.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from scrapers.credit_cards.cal_credit_card_client import CALCreditCardScraper, CALCredentials
+from scrapers.credit_cards.max_credit_card_client import MaxCreditCardScraper, MaxCredentials
+
+
+def _response(status_code=200, json_data=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = json_data
+    return response
+
+
+CAL_STATE = {
+    'authorization_token': 'CALAuthScheme cached',
+    'cards': [{'cardUniqueId': 'card-1', 'last4Digits': '1111'}],
+}
+
+
+# ==================== login_or_restore Tests ====================
+
+
+class TestLoginOrRestore:
+    """Test the shared login-or-restore step."""
+
+    def _create_scraper(self):
+        scraper = CALCreditCardScraper(CALCredentials(username="test", password="test"))
+        scraper.login = MagicMock()
+        return scraper
+
+    def test_valid_session_skips_login(self):
+        scraper = self._create_scraper()
+        scraper.restore_session = MagicMock(return_value=True)
+
+        scraper.login_or_restore(CAL_STATE)
+
+        scraper.login.assert_not_called()
+        assert scraper.session_restored is True
+        assert scraper.session_state == CAL_STATE
+
+    def test_invalid_session_falls_back_to_login(self):
+        scraper = self._create_scraper()
+        scraper.restore_session = MagicMock(return_value=False)
+
+        def login():
+            scraper.authorization_token = 'CALAuthScheme fresh'
+            scraper.cards = CAL_STATE['cards']
+        scraper.login.side_effect = login
+
+        scraper.login_or_restore(CAL_STATE)
+
+        scraper.login.assert_called_once()
+        assert scraper.session_restored is False
+        assert scraper.session_state['authorization_token'] == 'CALAuthScheme fresh'
+
+    def test_no_cached_session_logs_in(self):
+        scraper = self._create_scraper()
+        scraper.restore_session = MagicMock()
+
+        scraper.login_or_restore(None)
+
+        scraper.restore_session.assert_not_called()
+        scraper.login.assert_called_once()
+
+
+# ==================== CAL Tests ====================
+
+
+class TestCALSessionReuse:
+    """Test CAL token/card restore and validation."""
+
+    def _create_scraper(self, response):
+        scraper = CALCreditCardScraper(CALCredentials(username="test", password="test"))
+        scraper._http_session = MagicMock()
+        if isinstance(response, Exception):
+            scraper._http_session.post.side_effect = response
+        else:
+            scraper._http_session.post.return_value = response
+        return scraper
+
+    @pytest.mark.parametrize("status_code", [1, 96])
+    def test_restore_valid(self, status_code):
+        scraper = self._create_scraper(_response(json_data={'statusCode': status_code}))
+
+        assert scraper.restore_session(CAL_STATE) is True
+        assert scraper.authorization_token == 'CALAuthScheme cached'
+        assert scraper.cards == CAL_STATE['cards']
+        scraper._http_session.post.assert_called_once()
+
+    @pytest.mark.parametrize("response", [
+        pytest.param(_response(status_code=401), id="unauthorized"),
+        pytest.param(_response(json_data={'statusCode': 2}), id="api_error"),
+        pytest.param(requests.ConnectionError("reset"), id="connection_error"),
+    ])
+    def test_restore_invalid_resets_state(self, response):
+        scraper = self._create_scraper(response)
+
+        assert scraper.restore_session(CAL_STATE) is False
+        assert scraper.authorization_token is None
+        assert scraper.cards == []
+        assert scraper._http_session is None
+
+    def test_export_round_trip(self):
+        scraper = CALCreditCardScraper(CALCredentials(username="test", password="test"))
+        assert scraper.export_session() is None
+
+        scraper.authorization_token = CAL_STATE['authorization_token']
+        scraper.cards = CAL_STATE['cards']
+
+        assert scraper.export_session() == CAL_STATE
+
+
+# ==================== Max Tests ====================
+
+
+class TestMaxSessionReuse:
+    """Test Max cookie restore and validation."""
+
+    def test_restore_seeds_http_session_without_browser(self):
+        scraper = MaxCreditCardScraper(MaxCredentials(username="test", password="test"))
+        scraper.validate_session = MagicMock(return_value=True)
+
+        assert scraper.restore_session({'cookies': {'session': 'abc'}}) is True
+        assert scraper.driver is None
+        assert scraper.http_session.cookies.get('session') == 'abc'
+
+    @pytest.mark.parametrize("response, expected", [
+        pytest.param(_response(json_data={'result': {'transactions': []}}), True, id="valid"),
+        pytest.param(_response(json_data={'result': None}), False, id="no_result"),
+        pytest.param(_response(status_code=401), False, id="unauthorized"),
+    ])
+    def test_validate_session(self, response, expected):
+        scraper = MaxCreditCardScraper(MaxCredentials(username="test", password="test"))
+        scraper._http_session = MagicMock()
+        scraper._http_session.get.return_value = response
+
+        assert scraper.validate_session() is expected
+
+    def test_invalid_restore_clears_cookies(self):
+        scraper = MaxCreditCardScraper(MaxCredentials(username="test", password="test"))
+        scraper.validate_session = MagicMock(return_value=False)
+
+        assert scraper.restore_session({'cookies': {'session': 'abc'}}) is False
+        assert scraper._session_cookies is None
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 
 from scrapers.credit_cards.shared_helpers import (
     iterate_months,
+    month_chunks,
     calculate_date_range,
     filter_transactions_by_date,
     extract_installments,
@@ -97,6 +98,20 @@ class TestIterateMonths:
         assert months[0] == (2024, 6)
 
 
+# ==================== month_chunks Tests ====================
+
+class TestMonthChunks:
+    """Test month_chunks helper function."""
+
+    def test_groups_oldest_first(self):
+        months = month_chunks(date(2024, 1, 1), date(2024, 5, 10), 2)
+
+        assert months == [[(2024, 1), (2024, 2)], [(2024, 3), (2024, 4)], [(2024, 5)]]
+
+    def test_single_group_by_default(self):
+        assert month_chunks(date(2024, 11, 1), date(2025, 1, 10)) == [[(2024, 11), (2024, 12), (2025, 1)]]
+
+
 # ==================== calculate_date_range Tests ====================
 
 class TestCalculateDateRange:
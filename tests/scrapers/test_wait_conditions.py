@@ -0,0 +1,254 @@
+"""
+Tests for event-driven SmartWait conditions, login step timing and sync
+phase metrics.
+
+The WebDriver is mocked: storage reads go through execute_script and
+DevTools events through get_log('performance').
+"""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+
+from scrapers.credit_cards.cal_credit_card_client import CALCreditCardScraper, CALCredentials
+from scrapers.utils.step_timer import StepTimer
+from scrapers.utils.sync_metrics import SyncMetrics
+from scrapers.utils.wait_conditions import SmartWait
+
+
+def _perf_entry(method, url, **params):
+    key = 'response' if method == 'Network.responseReceived' else 'request'
+    params[key] = {'url': url, **params.get(key, {})}
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+class FakePerformanceLog:
+    """Returns queued batches of performance log entries, draining like Chrome does."""
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+
+    def __call__(self, log_type):
+        assert log_type == 'performance'
+        return self.batches.pop(0) if self.batches else []
+
+
+def _make_wait(driver=None, timeout=1):
+    wait = SmartWait(driver or MagicMock(), default_timeout=timeout)
+    wait.POLL_INTERVAL = 0.001
+    return wait
+
+
+# ==================== until_any Tests ====================
+
+
+class TestUntilAny:
+    """Tests for waiting on several named outcomes."""
+
+    def test_returns_first_condition_met(self):
+        calls = {'n': 0}
+
+        def eventually(driver):
+            calls['n'] += 1
+            return calls['n'] >= 3
+
+        outcome = _make_wait().until_any({'never': lambda d: False, 'later': eventually})
+
+        assert outcome == 'later'
+
+    def test_raising_condition_treated_as_not_met(self):
+        def broken(driver):
+            raise RuntimeError("stale element")
+
+        outcome = _make_wait().until_any({'broken': broken, 'ok': lambda d: True})
+
+        assert outcome == 'ok'
+
+    def test_timeout_returns_none(self):
+        assert _make_wait().until_any({'never': lambda d: False}, timeout=0.01) is None
+
+    def test_removed_element_counts_as_hidden(self):
+        """A dismissed popup removed from the DOM ends the wait instead of running out the timeout."""
+        element = MagicMock(spec=WebElement)
+        element.is_displayed.side_effect = StaleElementReferenceException()
+
+        started = time.perf_counter()
+        outcome = _make_wait().until_any({'hidden': EC.invisibility_of_element(element)}, timeout=1)
+
+        assert outcome == 'hidden'
+        assert time.perf_counter() - started < 0.5
+
+
+# ==================== Storage / Network Tests ====================
+
+
+class TestUntilStorageItem:
+    """Tests for waiting on web storage values."""
+
+    def test_nested_json_value(self):
+        driver = MagicMock()
+        driver.execute_script.side_effect = [
+            None,
+            json.dumps({'auth': {'calConnectToken': ''}}),
+            json.dumps({'auth': {'calConnectToken': 'abc'}}),
+        ]
+
+        value = _make_wait(driver).until_storage_item('auth-module', path=('auth', 'calConnectToken'))
+
+        assert value == 'abc'
+        assert driver.execute_script.call_count == 3
+
+    def test_timeout_raises(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = None
+
+        with pytest.raises(TimeoutException):
+            _make_wait(driver).until_storage_item('init', timeout=0.01)
+
+
+class TestUntilNetworkEvent:
+    """Tests for waiting on DevTools network events."""
+
+    def test_matches_event_from_later_log_batch(self):
+        driver = MagicMock()
+        driver.get_log.side_effect = FakePerformanceLog(
+            [_perf_entry('Network.responseReceived', 'https://site/other')],
+            [_perf_entry('Network.responseReceived', 'https://site/api/login', requestId='7')],
+        )
+
+        params = _make_wait(driver).until_network_event('/api/login')
+
+        assert params['requestId'] == '7'
+
+    def test_drained_events_reused_by_later_waits(self):
+        driver = MagicMock()
+        driver.get_log.side_effect = FakePerformanceLog([
+            _perf_entry('Network.requestWillBeSent', 'https://site/sso', request={'headers': {'Authorization': 'X'}}),
+            _perf_entry('Network.responseReceived', 'https://site/ready'),
+        ])
+        wait = _make_wait(driver)
+
+        wait.until_network_event('/ready')
+        params = wait.until_network_event('/sso', method='Network.requestWillBeSent', timeout=0.01)
+
+        assert params['request']['headers'] == {'Authorization': 'X'}
+
+    def test_timeout_raises(self):
+        driver = MagicMock()
+        driver.get_log.side_effect = FakePerformanceLog()
+
+        with pytest.raises(TimeoutException):
+            _make_wait(driver).until_network_event('/api/login', timeout=0.01)
+
+
+class TestUntilNetworkIdle:
+    """Tests for the resource-timing based idle wait."""
+
+    def test_idle_once_resource_count_stable(self):
+        driver = MagicMock()
+        driver.execute_script.side_effect = [['loading', 3], ['complete', 5]] + [['complete', 5]] * 100
+
+        assert _make_wait(driver).until_network_idle(idle_time=0.005) is True
+
+    def test_busy_page_times_out(self):
+        driver = MagicMock()
+        counter = iter(range(10_000))
+        driver.execute_script.side_effect = lambda script: ['complete', next(counter)]
+
+        assert _make_wait(driver).until_network_idle(idle_time=0.5, timeout=0.05) is False
+
+
+# ==================== Login Integration ====================
+
+
+class TestCALTokenExtraction:
+    """CAL falls back to the SSO request header drained during the login wait."""
+
+    def test_token_from_network_event(self):
+        scraper = CALCreditCardScraper(CALCredentials(username="test", password="test"))
+        scraper.driver = MagicMock()
+        scraper.driver.execute_script.return_value = None  # No token in session storage
+        scraper.driver.get_log.side_effect = FakePerformanceLog([
+            _perf_entry(
+                'Network.requestWillBeSent', scraper.SSO_AUTH_ENDPOINT,
+                request={'headers': {'authorization': 'CALAuthScheme net'}}
+            ),
+        ])
+        wait = _make_wait(scraper.driver)
+
+        assert scraper._sso_request_seen(wait) is True
+        scraper.extract_authorization_token(wait)
+
+        assert scraper.authorization_token == 'CALAuthScheme net'
+
+
+class TestStepTimer:
+    """Tests for per-step login timing."""
+
+    def test_steps_recorded_in_order_and_summed(self):
+        timer = StepTimer()
+        with timer.step("navigate"):
+            pass
+        with timer.step("submit"):
+            pass
+        with timer.step("navigate"):
+            pass
+
+        assert list(timer.as_dict()) == ["navigate", "submit"]
+        assert len(timer.steps) == 3
+        assert timer.total >= 0
+
+    def test_failed_step_still_recorded(self):
+        timer = StepTimer()
+
+        with pytest.raises(ValueError):
+            with timer.step("submit"):
+                raise ValueError("bad password")
+
+        assert [name for name, _ in timer.steps] == ["submit"]
+
+
+class TestSyncMetrics:
+    """Tests for per-phase sync timings and counters."""
+
+    def test_nested_phase_not_counted_in_outer(self):
+        metrics = SyncMetrics()
+        with metrics.phase("fetch"):
+            with metrics.phase("convert"):
+                time.sleep(0.05)
+        metrics.count("rows_converted", 3)
+        metrics.count("rows_converted", 2)
+
+        data = metrics.as_dict()
+        assert data["phases"]["convert"] >= 0.05
+        assert data["phases"]["fetch"] < 0.05
+        assert data["counters"] == {"rows_converted": 5}
+
+    def test_merge_and_round_trip(self):
+        stored = SyncMetrics.from_dict({"phases": {"persist": 1.0}, "counters": {"queries": 4}})
+        rules = SyncMetrics()
+        rules.add_time("rules", 0.5)
+        rules.add_time("persist", 0.25)
+        rules.count("queries")
+
+        stored.merge(rules)
+
+        assert stored.as_dict() == {"phases": {"persist": 1.25, "rules": 0.5}, "counters": {"queries": 5}}
+
+    def test_attach_counts_responses(self):
+        session = MagicMock()
+        session.hooks = {"response": []}
+        metrics = SyncMetrics()
+        metrics.attach(session)
+
+        response = MagicMock(content=b"x" * 10)
+        for hook in session.hooks["response"]:
+            hook(response)
+            hook(response)
+
+        assert metrics.as_dict()["counters"] == {"requests": 2, "bytes_received": 20}
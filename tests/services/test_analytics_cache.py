@@ -0,0 +1,163 @@
+"""
+Tests for analytics_cache module.
+
+Tests that AnalyticsService results are reused until a writer bumps the
+data version, and that the shared directory store serves other processes.
+"""
+
+import asyncio
+import threading
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from config.constants import DataVersionKey
+from db.data_versions import get_data_version
+from db.models import Base
+from services.analytics_cache import AnalyticsCache, DirectoryStore, LRUCache, get_analytics_cache, get_or_compute_async
+from services.analytics_service import AnalyticsService
+from services.base_service import BaseSyncService
+from services.tag_service import TagService
+from tests.conftest import create_transaction
+
+
+@pytest.fixture
+def analytics(db_session):
+    return AnalyticsService(session=db_session)
+
+
+@pytest.fixture
+def transaction(db_session, sample_account):
+    return create_transaction(db_session, sample_account, "Shufersal", -100.0, date(2026, 3, 5), category="food")
+
+
+class TestCachedResults:
+    """Tests for caching AnalyticsService read methods."""
+
+    def test_repeated_call_served_from_cache(self, db_session, analytics, transaction):
+        """A second identical call should not recompute, and callers get their own copy."""
+        first = analytics.get_category_breakdown()
+        first["food"]["count"] = 99  # Caller mutations must not leak into the cache
+
+        second = analytics.get_category_breakdown()
+
+        assert second["food"]["count"] == 1
+        cache = get_analytics_cache(db_session)
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_arguments_are_part_of_the_key(self, analytics, transaction):
+        """Different arguments (also given positionally) should be cached separately."""
+        assert analytics.get_monthly_summary(2026, 3)["transaction_count"] == 1
+        assert analytics.get_monthly_summary(year=2026, month=4)["transaction_count"] == 0
+        assert analytics.get_monthly_summary(2026, month=3)["transaction_count"] == 1
+
+    def test_tag_write_invalidates(self, db_session, analytics, transaction):
+        """Tagging through TagService should be visible on the next call."""
+        assert "groceries" not in analytics.get_tag_breakdown()
+
+        TagService(session=db_session).tag_transaction(transaction.id, ["groceries"])
+
+        assert analytics.get_tag_breakdown()["groceries"]["count"] == 1
+
+    def test_sync_bumps_data_version(self, db_session, analytics, transaction):
+        """A successful sync transaction should invalidate cached results."""
+        version = get_data_version(db_session, DataVersionKey.DATA)
+
+        with BaseSyncService(db_session).sync_transaction("credit_card", "cal"):
+            pass
+
+        assert get_data_version(db_session, DataVersionKey.DATA) == version + 1
+        assert analytics.get_overall_stats()["last_sync"] is not None
+
+    def test_unflushed_changes_not_cached(self, db_session, analytics, transaction):
+        """Reads from a session with pending changes should bypass the cache."""
+        transaction.user_category = "dining"
+
+        assert "dining" in analytics.get_category_breakdown()
+        db_session.rollback()
+
+        assert "dining" not in analytics.get_category_breakdown()
+
+
+class TestStores:
+    """Tests for the in-memory LRU and the shared directory store."""
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+        cache.set("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert len(cache) == 2
+
+    def test_directory_store_prunes_older_versions(self, tmp_path):
+        store = DirectoryStore(tmp_path)
+        store.set(1, "abc", b"old")
+        store.set(2, "abc", b"new")
+
+        assert store.get(1, "abc") is None
+        assert store.get(2, "abc") == b"new"
+
+    def test_directory_store_keeps_newer_versions(self, tmp_path):
+        """A worker still at an older version must not delete other workers' newer entries."""
+        fresh, lagging = DirectoryStore(tmp_path), DirectoryStore(tmp_path)
+        fresh.set(3, "abc", b"newer")
+        lagging.set(2, "def", b"older")
+
+        assert fresh.get(3, "abc") == b"newer"
+        assert lagging.get(2, "def") == b"older"
+
+    def test_shared_store_serves_other_processes(self, tmp_path):
+        """A worker with an empty memory cache should reuse a result another worker stored."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'shared.db'}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        store = DirectoryStore(tmp_path / "cache")
+        database = str(engine.url)
+
+        worker_a = AnalyticsCache(database, maxsize=16, store=store)
+        worker_b = AnalyticsCache(database, maxsize=16, store=store)
+        try:
+            with patch("services.analytics_cache.get_analytics_cache", return_value=worker_a):
+                expected = AnalyticsService(session=Session()).get_overall_stats()
+            with patch("services.analytics_cache.get_analytics_cache", return_value=worker_b):
+                assert AnalyticsService(session=Session()).get_overall_stats() == expected
+        finally:
+            engine.dispose()
+
+        assert (worker_a.misses, worker_b.hits) == (1, 1)
+
+    def test_async_store_io_runs_off_the_loop(self, tmp_path):
+        """Async callers should read and write the directory store in a worker thread."""
+        store = DirectoryStore(tmp_path / "cache")
+        cache = AnalyticsCache("sqlite://", maxsize=16, store=store)
+        store_threads = []
+        for name in ("get", "set"):
+            method = getattr(store, name)
+
+            def record(*args, method=method):
+                store_threads.append(threading.get_ident())
+                return method(*args)
+            setattr(store, name, record)
+
+        async def compute():
+            return {"total": 1}
+
+        async def fetch_twice():
+            first = await get_or_compute_async(cache, ("stats",), 1, compute)
+            cache.memory = LRUCache(16)
+            second = await get_or_compute_async(cache, ("stats",), 1, compute)
+            return first, second, threading.get_ident()
+
+        first, second, loop_thread = asyncio.run(fetch_twice())
+
+        assert first == second == {"total": 1}
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert len(store_threads) == 3
+        assert loop_thread not in store_threads
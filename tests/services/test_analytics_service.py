@@ -357,6 +357,91 @@ def test_get_category_breakdown_date_range(db_session, analytics_service, sample
     assert "old" not in breakdown
 
 
+# ==================== SQL aggregation regression ====================
+
+def _python_monthly_summary(session, year, month):
+    """Monthly summary as computed before aggregation moved to SQL (per-row ORM loop)."""
+    summary = {"transaction_count": 0, "total_amount": 0, "total_charged": 0,
+               "by_status": {}, "by_type": {}, "by_account": {}}
+    for txn in session.query(Transaction).all():
+        if (txn.transaction_date.year, txn.transaction_date.month) != (year, month):
+            continue
+        summary["transaction_count"] += 1
+        summary["total_amount"] += abs(txn.original_amount or 0)
+        if txn.charged_amount:
+            summary["total_charged"] += abs(txn.charged_amount)
+        for key, value in (("by_status", txn.status or "unknown"), ("by_type", txn.transaction_type or "unknown"),
+                           ("by_account", f"{txn.account.institution} ({txn.account.account_type})")):
+            summary[key][value] = summary[key].get(value, 0) + 1
+    return summary
+
+
+def _python_category_breakdown(session, from_date, to_date):
+    """Category breakdown as computed before aggregation moved to SQL (per-row ORM loop)."""
+    categories = {}
+    for txn in session.query(Transaction).all():
+        if (from_date and txn.transaction_date < from_date) or (to_date and txn.transaction_date > to_date):
+            continue
+        entry = categories.setdefault(txn.effective_category or "Uncategorized", {"count": 0, "total_amount": 0})
+        entry["count"] += 1
+        entry["total_amount"] += abs(txn.charged_amount if txn.charged_amount is not None else txn.original_amount)
+    for entry in categories.values():
+        entry["avg_amount"] = entry["total_amount"] / entry["count"]
+    return categories
+
+
+@pytest.fixture
+def mixed_transactions(db_session, sample_account):
+    """Transactions across two accounts and a month boundary, with missing and empty fields."""
+    other = create_account(db_session, account_type="broker", institution="excellence", account_number="9")
+    rows = [
+        (sample_account, date(2026, 2, 28), -120.5, None, "food", None, None, "completed", "normal"),
+        (sample_account, date(2026, 3, 1), -80.25, -40.1, "food", None, None, "completed", "installments"),
+        (sample_account, date(2026, 3, 15), 200.0, 0.0, None, "groceries", "bills", "pending", None),
+        (sample_account, date(2026, 3, 31), -15.75, None, "", "", "סופרמרקט", None, "credit"),
+        (other, date(2026, 3, 20), -999.99, -999.99, None, None, None, "", "normal"),
+        (other, date(2026, 4, 1), -5.0, -5.0, None, "groceries", None, "completed", "normal"),
+    ]
+    for account, day, original, charged, user_category, category, raw_category, status, txn_type in rows:
+        db_session.add(Transaction(
+            account_id=account.id, transaction_date=day, description="T", original_amount=original,
+            original_currency="ILS", charged_amount=charged, status=status, transaction_type=txn_type,
+            user_category=user_category, category=category, raw_category=raw_category,
+        ))
+    db_session.commit()
+
+
+@pytest.mark.parametrize("year,month", [(2026, 2), (2026, 3), (2026, 4), (2026, 5)])
+def test_monthly_summary_matches_per_row_computation(db_session, analytics_service, mixed_transactions, year, month):
+    """SQL aggregation should give the same summary as summing each transaction."""
+    expected = _python_monthly_summary(db_session, year, month)
+
+    summary = analytics_service.get_monthly_summary(year, month)
+
+    assert (summary["year"], summary["month"]) == (year, month)
+    assert summary["transaction_count"] == expected["transaction_count"]
+    assert summary["total_amount"] == pytest.approx(expected["total_amount"])
+    assert summary["total_charged"] == pytest.approx(expected["total_charged"])
+    for key in ("by_status", "by_type", "by_account"):
+        assert summary[key] == expected[key]
+
+
+@pytest.mark.parametrize("from_date,to_date", [
+    (None, None),
+    (date(2026, 3, 1), date(2026, 3, 31)),
+    (date(2026, 3, 16), None),
+])
+def test_category_breakdown_matches_per_row_computation(db_session, analytics_service, mixed_transactions, from_date, to_date):
+    """SQL aggregation should give the same categories, counts and amounts as each transaction's effective values."""
+    expected = _python_category_breakdown(db_session, from_date, to_date)
+
+    breakdown = analytics_service.get_category_breakdown(from_date=from_date, to_date=to_date)
+
+    assert set(breakdown) == set(expected)
+    for category, values in expected.items():
+        assert breakdown[category] == pytest.approx(values)
+
+
 # ==================== Tag Breakdown ====================
 
 def test_get_tag_breakdown(db_session, analytics_service, sample_account):
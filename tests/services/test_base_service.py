@@ -367,6 +367,116 @@ class TestBaseSyncService:
         assert balances[1].total_amount == 200
         assert balances[2].total_amount == 100
 
+    def test_record_login_steps_stored_in_metadata(self, db_session):
+        """Login step timings should be merged into sync_metadata."""
+        import json
+        from services.base_service import BaseSyncService
+        from scrapers.utils.step_timer import StepTimer
+
+        service = BaseSyncService(db_session)
+        scraper = MagicMock()
+        scraper.login_timer = StepTimer()
+        scraper.login_timer.steps = [("navigate", 1.5), ("submit", 0.25)]
+
+        with service.sync_transaction("credit_card", "cal") as sync_record:
+            service.record_sync_metadata(sync_record, months=3)
+            service.record_login_steps(sync_record, scraper)
+
+        metadata = json.loads(sync_record.sync_metadata)
+        assert metadata == {"months": 3, "login_steps": {"navigate": 1.5, "submit": 0.25}}
+
+    def test_record_login_steps_ignores_missing_timer(self, db_session):
+        """Scrapers without a StepTimer (e.g. mocks) should leave metadata empty."""
+        from services.base_service import BaseSyncService
+
+        service = BaseSyncService(db_session)
+
+        with service.sync_transaction("credit_card", "cal") as sync_record:
+            service.record_login_steps(sync_record, MagicMock())
+
+        assert sync_record.sync_metadata is None
+
+    def test_sync_metrics_recorded_with_persist_phase(self, db_session):
+        """A scraper's metrics should be stored with the save's time and query count."""
+        import json
+        from services.base_service import BaseSyncService
+        from scrapers.utils.sync_metrics import SyncMetrics
+
+        service = BaseSyncService(db_session)
+        scraper = MagicMock()
+        scraper.metrics = SyncMetrics()
+        scraper.metrics.add_time("login", 2.0)
+        scraper.metrics.count("requests", 3)
+
+        with service.sync_transaction("credit_card", "cal", scraper=scraper) as sync_record:
+            with service.phase("tagging"):
+                service.get_balances_by_type("broker")
+
+        metrics = json.loads(sync_record.sync_metadata)["metrics"]
+        assert list(metrics["phases"]) == ["login", "tagging", "persist"]
+        assert metrics["counters"]["requests"] == 3
+        assert metrics["counters"]["queries"] >= 1
+        assert service.metrics is None
+
+    def test_sync_metrics_kept_on_failed_sync_and_added_to(self, db_session):
+        """Metrics should survive a failed save, and later phases (rules) add to them."""
+        from services.base_service import BaseSyncService
+        from scrapers.utils.sync_metrics import SyncMetrics
+        from db.models import SyncHistory
+
+        service = BaseSyncService(db_session)
+        scraper = MagicMock()
+        scraper.metrics = SyncMetrics()
+        scraper.metrics.add_time("fetch", 4.0)
+
+        with pytest.raises(RuntimeError):
+            with service.sync_transaction("credit_card", "cal", scraper=scraper):
+                raise RuntimeError("no cards")
+
+        failed = db_session.query(SyncHistory).filter_by(status="failed").one()
+        rules = SyncMetrics()
+        rules.add_time("rules", 0.5)
+        service.add_sync_metrics(failed.id, rules)
+
+        assert failed.metrics["phases"]["fetch"] == 4.0
+        assert failed.metrics["phases"]["rules"] == 0.5
+        assert "persist" in failed.metrics["phases"]
+
+    def test_metadata_kept_on_failed_sync(self, db_session):
+        """Metadata recorded before a failure should be saved with the failed record."""
+        import json
+        from services.base_service import BaseSyncService
+        from db.models import SyncHistory
+
+        service = BaseSyncService(db_session)
+
+        with pytest.raises(RuntimeError):
+            with service.sync_transaction("credit_card", "cal") as sync_record:
+                service.record_sync_metadata(sync_record, login_steps={"submit": 5.0})
+                raise RuntimeError("login failed")
+
+        failed = db_session.query(SyncHistory).filter_by(status="failed").one()
+        assert json.loads(failed.sync_metadata) == {"login_steps": {"submit": 5.0}}
+
+    def test_started_at_kept_for_prefetched_sync(self, db_session):
+        """A scrape that ran (and failed) on a worker thread keeps its own start time."""
+        from datetime import datetime
+        from services.base_service import ScrapeOutcome
+        from services.pension_service import PensionService
+        from db.models import SyncHistory
+
+        started_at = datetime(2026, 1, 1, 8, 0)
+        outcome = ScrapeOutcome(error=Exception("Failed to login to Migdal"), started_at=started_at)
+
+        result = PensionService(db_session).sync_migdal(
+            "123456789", "me@example.com", "secret", prefetched=outcome
+        )
+
+        assert result.success is False
+        assert result.error_message == "Failed to login to Migdal"
+        failed = db_session.query(SyncHistory).filter_by(status="failed").one()
+        assert failed.started_at == started_at
+
 
 # ==================== SessionMixin Tests ====================
 
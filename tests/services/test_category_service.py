@@ -90,6 +90,51 @@ def test_normalize_category_cached_stores_none(category_service):
     assert cache[("cal", "missing")] is None
 
 
+# ==================== mapping snapshot ====================
+
+def test_mapping_snapshot_reused_until_version_changes(db_session, category_service, sample_mapping):
+    """Should return the same snapshot object while the version is unchanged."""
+    first = category_service.get_mapping_snapshot()
+    second = CategoryService(session=db_session).get_mapping_snapshot()
+
+    assert first is second
+    assert first.get("CAL", "סופרמרקט") == "groceries"
+
+
+@pytest.mark.parametrize("mutate", [
+    pytest.param(lambda svc: svc.add_mapping("cal", "מסעדות", "restaurants"), id="add_mapping"),
+    pytest.param(lambda svc: svc.remove_mapping("cal", "סופרמרקט"), id="remove_mapping"),
+    pytest.param(lambda svc: svc.rename_unified_category("groceries", "food"), id="rename"),
+    pytest.param(lambda svc: svc.merge_unified_categories(["groceries"], "food"), id="merge"),
+    pytest.param(
+        lambda svc: svc.import_mappings([{"provider": "max", "raw_category": "x", "unified_category": "y"}]),
+        id="import_mappings"
+    ),
+])
+def test_mapping_mutations_bump_version(db_session, category_service, sample_mapping, mutate):
+    """Every mapping write should bump the version and invalidate the snapshot."""
+    before = category_service.get_mapping_snapshot()
+
+    mutate(category_service)
+    after = category_service.get_mapping_snapshot()
+
+    assert after.version == before.version + 1
+    assert after is not before
+
+
+def test_mapping_snapshot_sees_writes_from_other_session(db_engine, db_session, category_service, sample_mapping):
+    """A write committed by another service instance should be picked up on next lookup."""
+    from sqlalchemy.orm import sessionmaker
+
+    assert category_service.normalize_category("cal", "סופרמרקט") == "groceries"
+
+    other_session = sessionmaker(bind=db_engine)()
+    CategoryService(session=other_session).add_mapping("cal", "סופרמרקט", "food")
+    other_session.close()
+
+    assert category_service.normalize_category("cal", "סופרמרקט") == "food"
+
+
 # ==================== add_mapping ====================
 
 @pytest.mark.parametrize("provider,raw,unified", [
@@ -277,6 +277,47 @@ def test_apply_rules_no_rules_defined(rules_service):
     assert result["message"] == "No rules defined"
 
 
+# ==================== apply_rules_after_sync ====================
+
+def test_apply_rules_after_sync_only_processes_synced_transactions(db_session, rules_service, sample_account):
+    """Once rules were applied, a sync's rules run should skip the rest of history."""
+    rules_service.add_rule(pattern="wolt", category="food")
+    before = create_transaction(db_session, sample_account, description="WOLT BEFORE")
+    rules_service.apply_rules_after_sync([])  # First run: every rule is new
+    db_session.refresh(before)
+    assert before.user_category == "food"
+
+    untouched = create_transaction(db_session, sample_account, description="WOLT UNTOUCHED")
+    synced = create_transaction(db_session, sample_account, description="WOLT SYNCED")
+
+    result = rules_service.apply_rules_after_sync([synced.id, synced.id])
+
+    assert result["processed"] == 1
+    db_session.refresh(synced)
+    db_session.refresh(untouched)
+    assert synced.user_category == "food"
+    assert untouched.user_category is None
+
+
+def test_apply_rules_after_sync_runs_edited_rules_over_history(db_session, rules_service, sample_account, temp_rules_file):
+    """After the rules file changed, only the new rules should be applied to older transactions."""
+    rules_service.add_rule(pattern="wolt", category="food")
+    rules_service.apply_rules_after_sync([])
+    wolt = create_transaction(db_session, sample_account, description="WOLT LATER")
+    netflix = create_transaction(db_session, sample_account, description="NETFLIX")
+
+    edited = RulesService(rules_file=temp_rules_file, session=db_session)
+    edited.add_rule(pattern="netflix", category="entertainment")
+    result = edited.apply_rules_after_sync([])
+
+    assert result["modified"] == 1
+    db_session.refresh(wolt)
+    db_session.refresh(netflix)
+    assert netflix.user_category == "entertainment"
+    assert wolt.user_category is None  # Unchanged rule - not re-run over history
+    assert edited.apply_rules_after_sync([])["processed"] == 0  # Hash stored - nothing to redo
+
+
 # ==================== File operations ====================
 
 def test_load_rules_from_file(temp_rules_file):
@@ -0,0 +1,162 @@
+"""
+Tests for the encrypted login session cache and its use in CreditCardService.
+"""
+
+import multiprocessing
+import os
+import stat
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from config.constants import Institution
+from config.session_cache import SessionCache
+
+
+@pytest.fixture
+def session_cache(tmp_path):
+    """SessionCache writing to a temp file with a throwaway key."""
+    key = Fernet.generate_key()
+    with patch("config.session_cache.get_encryption_key", return_value=key):
+        yield SessionCache(tmp_path / "sessions.enc")
+
+
+# ==================== SessionCache Tests ====================
+
+
+class TestSessionCache:
+    """Tests for SessionCache storage semantics."""
+
+    def test_put_and_get_round_trip(self, session_cache):
+        state = {'authorization_token': 'CALAuthScheme abc', 'cards': [{'cardUniqueId': '1'}]}
+
+        session_cache.put("cal:key", state, timedelta(minutes=30))
+
+        assert session_cache.get("cal:key") == state
+
+    def test_file_is_encrypted(self, session_cache):
+        session_cache.put("cal:key", {'authorization_token': 'secret-token'}, timedelta(minutes=30))
+
+        raw = session_cache.path.read_bytes()
+
+        assert b'secret-token' not in raw
+        assert session_cache.path.stat().st_mode & 0o777 == 0o600
+
+    def test_expired_entry_dropped(self, session_cache):
+        session_cache.put("cal:key", {'token': 'x'}, timedelta(minutes=30))
+
+        with patch("config.session_cache.datetime") as mock_dt:
+            mock_dt.utcnow.return_value = datetime.utcnow() + timedelta(hours=1)
+            mock_dt.fromisoformat = datetime.fromisoformat
+            assert session_cache.get("cal:key") is None
+
+        assert session_cache.get("cal:key") is None
+
+    def test_invalidate(self, session_cache):
+        session_cache.put("cal:key", {'token': 'x'}, timedelta(minutes=30))
+        session_cache.put("max:key", {'cookies': {}}, timedelta(minutes=30))
+
+        session_cache.invalidate("cal:key")
+
+        assert session_cache.get("cal:key") is None
+        assert session_cache.get("max:key") == {'cookies': {}}
+
+    def test_missing_file_returns_none(self, session_cache):
+        assert session_cache.get("cal:key") is None
+
+    def test_unreadable_file_ignored(self, session_cache):
+        session_cache.path.write_bytes(b"not a fernet token")
+
+        assert session_cache.get("cal:key") is None
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+    def test_concurrent_writers_keep_every_entry(self, session_cache):
+        """Processes and threads writing at once must not drop each other's entries."""
+        def put_many(prefix):
+            for n in range(10):
+                session_cache.put(f"{prefix}:{n}", {'n': n}, timedelta(minutes=30))
+
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=put_many, args=(f"proc{i}",)) for i in range(3)]
+        threads = [threading.Thread(target=put_many, args=(f"thread{i}",)) for i in range(2)]
+        for worker in processes + threads:
+            worker.start()
+        for worker in processes + threads:
+            worker.join()
+
+        assert all(p.exitcode == 0 for p in processes)
+        for prefix in ["proc0", "proc1", "proc2", "thread0", "thread1"]:
+            assert [session_cache.get(f"{prefix}:{n}") for n in range(10)] == [{'n': n} for n in range(10)]
+        assert stat.S_IMODE(session_cache.path.stat().st_mode) == 0o600
+
+    def test_make_key_hides_username(self):
+        key = SessionCache.make_key(Institution.CAL, "my_user")
+
+        assert key.startswith("cal:")
+        assert "my_user" not in key
+        assert key == SessionCache.make_key(Institution.CAL, "my_user")
+        assert key != SessionCache.make_key(Institution.MAX, "my_user")
+
+
+# ==================== CreditCardService Integration ====================
+
+
+def _make_scraper(restored, state, ttl=timedelta(minutes=30)):
+    scraper = MagicMock()
+    scraper.scrape.return_value = ["account"]
+    scraper.session_restored = restored
+    scraper.session_state = state
+    scraper.SESSION_TTL = ttl
+    return scraper
+
+
+class TestScrapeWithCachedSession:
+    """Tests for CreditCardService._scrape_with_cached_session."""
+
+    @pytest.fixture
+    def service(self, db_session, session_cache):
+        from services.credit_card_service import CreditCardService
+
+        service = CreditCardService(db_session)
+        service._session_cache = session_cache
+        return service
+
+    def test_fresh_login_cached(self, service, session_cache):
+        scraper = _make_scraper(restored=False, state={'token': 'new'})
+
+        result = service._scrape_with_cached_session(scraper, Institution.CAL, "user", 3, 1)
+
+        assert result == ["account"]
+        assert scraper.scrape.call_args.kwargs['session_state'] is None
+        assert session_cache.get(SessionCache.make_key(Institution.CAL, "user")) == {'token': 'new'}
+
+    def test_cached_session_passed_to_scraper(self, service, session_cache):
+        key = SessionCache.make_key(Institution.CAL, "user")
+        session_cache.put(key, {'token': 'cached'}, timedelta(minutes=30))
+        scraper = _make_scraper(restored=True, state={'token': 'cached'})
+
+        service._scrape_with_cached_session(scraper, Institution.CAL, "user", 3, 1)
+
+        assert scraper.scrape.call_args.kwargs['session_state'] == {'token': 'cached'}
+        assert session_cache.get(key) == {'token': 'cached'}
+
+    def test_rejected_session_replaced_by_new_login(self, service, session_cache):
+        key = SessionCache.make_key(Institution.CAL, "user")
+        session_cache.put(key, {'token': 'stale'}, timedelta(minutes=30))
+        scraper = _make_scraper(restored=False, state={'token': 'fresh'})
+
+        service._scrape_with_cached_session(scraper, Institution.CAL, "user", 3, 1)
+
+        assert session_cache.get(key) == {'token': 'fresh'}
+
+    def test_rejected_session_dropped_when_not_exportable(self, service, session_cache):
+        key = SessionCache.make_key(Institution.CAL, "user")
+        session_cache.put(key, {'token': 'stale'}, timedelta(minutes=30))
+        scraper = _make_scraper(restored=False, state=None)
+
+        service._scrape_with_cached_session(scraper, Institution.CAL, "user", 3, 1)
+
+        assert session_cache.get(key) is None
@@ -0,0 +1,228 @@
+"""
+Tests for sync_job_runner module.
+
+Tests that API sync jobs run in-process with persisted, structured progress
+events, a per-institution limit and cancellation, and that stream
+subscribers are pushed events as they are recorded.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from config.constants import SyncJobStatus, SyncType
+from db.database import create_database_engine
+from db.models import Base, SyncJobRecord
+from scrapers.credit_cards.shared_models import TransactionBatch
+from services.base_service import BaseSyncService, ScrapeOutcome, StreamingSyncMixin
+from services.sync_job_runner import JobChannel, JobSubscription, SyncJobRunner
+from services.sync_orchestrator import SYNC_SERVICES, SyncJob
+from tests.services.test_sync_orchestrator import FakeStream
+
+
+class GatedCardService(StreamingSyncMixin, BaseSyncService):
+    """Streaming service sending empty months, optionally waiting on a gate before one of them."""
+
+    def fetch_gated(self, months=2, gate=None, gate_before=0, on_batch=None):
+        for index in range(months):
+            if gate is not None and index == gate_before:
+                assert gate.wait(5), "gate never opened"
+            on_batch(TransactionBatch(2026, index + 1, accounts=[]))
+        return ScrapeOutcome()
+
+    # Same scrape under more institution names, for jobs that may run at once
+    fetch_gated_b = fetch_gated_c = fetch_gated
+
+    def open_stream(self, institution, started_at=None, **job_kwargs):
+        return FakeStream(institution)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # A file database set up like the app's, so worker threads and the test see the same data
+    engine = create_database_engine(tmp_path / 'jobs.db')
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def job_kwargs():
+    """kwargs of the single account every job builds (set by each test)"""
+    kwargs = {}
+    with patch.dict(SYNC_SERVICES, {"gated": (SyncType.CREDIT_CARD, GatedCardService)}), \
+            patch("services.sync_job_runner.build_sync_jobs",
+                  side_effect=lambda institution, *args, **kw: ([SyncJob(institution, "Gated account 0", dict(kwargs))], [])):
+        yield kwargs
+
+
+@pytest.fixture
+def runner(session_factory):
+    runner = SyncJobRunner(session_factory, max_workers=3, per_institution=1)
+    yield runner
+    runner.shutdown()
+
+
+def _wait_for_status(runner, job_id, *statuses):
+    deadline = time.monotonic() + 5
+    while runner.get_job(job_id)["status"] not in statuses:
+        assert time.monotonic() < deadline, f"job stayed {runner.get_job(job_id)['status']}"
+        time.sleep(0.01)
+
+
+def _phases(runner, job_id):
+    return [event["data"]["data"].get("phase") for event in runner.events_after(job_id)]
+
+
+class TestSyncJobRunner:
+    """Tests for SyncJobRunner."""
+
+    def test_job_records_structured_events(self, runner, job_kwargs):
+        """Each saved month and account should be an event, ending with success."""
+        job_kwargs.update(months=2)
+
+        job_id = runner.submit("gated")
+        _wait_for_status(runner, job_id, SyncJobStatus.SUCCESS)
+
+        events = runner.events_after(job_id)
+        assert _phases(runner, job_id) == ["queued", "scraping", "month", "month", "saved", None]
+        assert events[2]["data"]["data"] == {"phase": "month", "card": "Gated account 0", "month": "2026-01",
+                                             "cards": 0, "transactions": 0}
+        assert events[-1]["type"] == "success"
+        # Reconnecting clients resume after the last event they saw
+        assert runner.events_after(job_id, events[2]["id"]) == events[3:]
+
+    def test_institution_limit_queues_and_pending_cancel(self, runner, job_kwargs):
+        """A second job of a busy institution should wait, and can be cancelled while it does."""
+        gate = threading.Event()
+        job_kwargs.update(gate=gate)
+
+        first = runner.submit("gated")
+        second = runner.submit("gated")
+        third = runner.submit("gated")
+        _wait_for_status(runner, first, SyncJobStatus.RUNNING)
+        assert runner.get_job(second)["status"] == SyncJobStatus.PENDING
+
+        assert runner.cancel(third) == SyncJobStatus.CANCELLED
+        gate.set()
+        _wait_for_status(runner, second, SyncJobStatus.SUCCESS)
+
+        assert runner.get_job(first)["status"] == SyncJobStatus.SUCCESS
+        assert runner.get_job(third)["status"] == SyncJobStatus.CANCELLED
+        assert _phases(runner, third) == ["queued", None]
+
+    def test_cancel_running_job_stops_at_next_month(self, runner, job_kwargs):
+        """A running streamed job should keep its saved months and stop before the next."""
+        gate = threading.Event()
+        job_kwargs.update(months=3, gate=gate, gate_before=1)
+
+        job_id = runner.submit("gated")
+        deadline = time.monotonic() + 5
+        while "month" not in _phases(runner, job_id):
+            assert time.monotonic() < deadline, "first month never saved"
+            time.sleep(0.01)
+
+        assert runner.cancel(job_id) == SyncJobStatus.RUNNING
+        gate.set()
+        _wait_for_status(runner, job_id, SyncJobStatus.CANCELLED)
+
+        assert _phases(runner, job_id).count("month") == 1
+        assert runner.events_after(job_id)[-1]["type"] == "error"
+
+    def test_concurrent_jobs_all_commit(self, runner, job_kwargs, session_factory):
+        """Jobs of different institutions should write events at the same time without lock errors."""
+        job_kwargs.update(months=40)
+
+        with patch.dict(SYNC_SERVICES, {name: (SyncType.CREDIT_CARD, GatedCardService) for name in ("gated_b", "gated_c")}):
+            job_ids = [runner.submit(name) for name in ("gated", "gated_b", "gated_c")]
+            for job_id in job_ids:
+                _wait_for_status(runner, job_id, SyncJobStatus.SUCCESS, SyncJobStatus.FAILED)
+
+        assert [runner.get_job(job_id)["status"] for job_id in job_ids] == [SyncJobStatus.SUCCESS] * 3
+        assert all(_phases(runner, job_id).count("month") == 40 for job_id in job_ids)
+        with session_factory() as db:
+            assert db.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+
+    def test_jobs_of_stopped_process_failed_on_start(self, session_factory):
+        """Jobs left running by a previous process should not stay running forever."""
+        db = session_factory()
+        db.add(SyncJobRecord(id="orphan", institution="cal", status=SyncJobStatus.RUNNING, worker_pid=os.getpid()))
+        db.commit()
+        db.close()
+
+        runner = SyncJobRunner(session_factory)
+        try:
+            job = runner.get_job("orphan")
+        finally:
+            runner.shutdown()
+
+        assert job["status"] == SyncJobStatus.FAILED
+        assert "Interrupted" in job["error_message"]
+
+
+class TestJobChannel:
+    """Tests for pushing job events to stream subscribers."""
+
+    def test_subscriber_woken_by_publish_from_worker_thread(self):
+        """A subscriber should get an event as soon as another thread publishes it, and end on close."""
+        async def follow():
+            channel = JobChannel()
+            subscription = JobSubscription(channel, 0, backfill=lambda last_id: pytest.fail("no backfill expected"))
+            threading.Timer(0.05, channel.publish, [{"id": 7, "type": "progress", "data": {}}]).start()
+            started = time.monotonic()
+            first = await subscription.next_events(timeout=5)
+            latency = time.monotonic() - started
+            threading.Timer(0.05, channel.close).start()
+            rest = await subscription.next_events(timeout=5)
+            subscription.close()
+            return first, latency, rest, channel._subscribers
+
+        first, latency, rest, subscribers = asyncio.run(follow())
+
+        assert first == [{"id": 7, "type": "progress", "data": {}}]
+        assert latency < 1
+        assert rest is None
+        assert not subscribers
+
+    def test_events_dropped_from_buffer_are_backfilled(self):
+        """Resuming from before the ring buffer should read the gap from the database."""
+        stored = [{"id": n, "type": "progress", "data": {}} for n in (1, 2, 3, 4)]
+        channel = JobChannel(capacity=2)
+        for event in stored:
+            channel.publish(event)
+
+        async def resume(after_id):
+            subscription = JobSubscription(channel, after_id, backfill=lambda last_id: [e for e in stored if e["id"] > last_id])
+            return await subscription.next_events(timeout=0)
+
+        assert [e["id"] for e in asyncio.run(resume(1))] == [2, 3, 4]
+        assert [e["id"] for e in asyncio.run(resume(3))] == [4]
+        assert channel.read_after(3)[1] is False  # Still buffered - no database read
+
+    def test_live_job_streams_every_event_once(self, runner, job_kwargs):
+        """A subscriber joining a running job should get its history and then each new event."""
+        gate = threading.Event()
+        job_kwargs.update(months=3, gate=gate)
+        job_id = runner.submit("gated")
+        _wait_for_status(runner, job_id, SyncJobStatus.RUNNING)
+
+        async def follow():
+            subscription = runner.subscribe(job_id)
+            gate.set()
+            received = []
+            while (events := await subscription.next_events(timeout=5)) is not None:
+                received.extend(events)
+            subscription.close()
+            return received
+
+        received = asyncio.run(follow())
+
+        assert received == runner.events_after(job_id)
+        assert [e["data"]["data"].get("phase") for e in received].count("month") == 3
+        assert runner.subscribe(job_id) is None  # Finished - streams read the database
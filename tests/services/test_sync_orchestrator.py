@@ -0,0 +1,206 @@
+"""
+Tests for sync_orchestrator module.
+
+Tests that scrapes run in parallel while the calling thread saves every result.
+"""
+
+import threading
+import time
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from config.constants import Institution, SyncStatus, SyncType
+from db.models import SyncHistory
+from services.base_service import BaseSyncService, ScrapeOutcome, StreamingSyncMixin, SyncResult
+from services.sync_orchestrator import SYNC_SERVICES, SyncJob, SyncOrchestrator, browsers_to_warm
+
+
+class FakeService(BaseSyncService):
+    """Service whose scrape waits for an event, recording which thread did what."""
+
+    scrape_threads = {}
+    save_threads = {}
+    scraped_since = {}
+
+    def fetch_fake(self, name, release=None, fail=False, since=None):
+        self.scrape_threads[name] = threading.get_ident()
+        self.scraped_since[name] = since
+        if release is not None:
+            assert release.wait(5), "scrape never released"
+        if fail:
+            return ScrapeOutcome(error=Exception(f"Failed to login to {name}"))
+        return ScrapeOutcome(data=name, started_at=datetime(2026, 1, 1, 8, 0))
+
+    def sync_fake(self, name, release=None, fail=False, since=None, prefetched=None):
+        self.save_threads[name] = threading.get_ident()
+        result = SyncResult()
+        try:
+            with self.sync_transaction(SyncType.BROKER, name, started_at=prefetched.started_at):
+                prefetched.unwrap()
+            result.success = True
+        except Exception as e:
+            result.error_message = str(e)
+        return result
+
+
+class FakeStream:
+    """Stream recording what the writer saved, and on which thread."""
+
+    def __init__(self, name):
+        self.name = name
+        self.saved = []
+        self.threads = set()
+
+    def save(self, batch):
+        self.threads.add(threading.get_ident())
+        self.saved.append(batch)
+
+    def finish(self, outcome):
+        self.threads.add(threading.get_ident())
+        return SyncResult(success=outcome.error is None, error_message=str(outcome.error) if outcome.error else None)
+
+
+class FakeStreamingService(StreamingSyncMixin, BaseSyncService):
+    """Service whose scrape streams numbered batches, waiting for the writer to see each one."""
+
+    streams = {}
+
+    def fetch_stream(self, name, batches=3, on_batch=None):
+        for number in range(batches):
+            on_batch(number)
+            # The writer saves batches while the scrape is still running
+            deadline = time.monotonic() + 5
+            while name not in self.streams or len(self.streams[name].saved) <= number:
+                assert time.monotonic() < deadline, "batch never saved"
+                time.sleep(0.01)
+        return ScrapeOutcome(data=None)
+
+    def open_stream(self, institution, name=None, started_at=None, **job_kwargs):
+        self.streams[name] = FakeStream(name)
+        return self.streams[name]
+
+
+@pytest.fixture
+def fake_service():
+    FakeService.scrape_threads.clear()
+    FakeService.save_threads.clear()
+    FakeService.scraped_since.clear()
+    FakeStreamingService.streams.clear()
+    with patch.dict(SYNC_SERVICES, {
+        "fake": (SyncType.BROKER, FakeService),
+        "stream": (SyncType.CREDIT_CARD, FakeStreamingService),
+    }):
+        yield FakeService
+
+
+class TestSyncOrchestrator:
+    """Tests for SyncOrchestrator."""
+
+    def test_saves_on_calling_thread_in_completion_order(self, db_session, fake_service):
+        """A slow scrape should not hold back saving the ones that finished."""
+        release_slow = threading.Event()
+        jobs = [
+            SyncJob("fake", "Slow", {"name": "slow", "release": release_slow}),
+            SyncJob("fake", "Fast", {"name": "fast"}),
+        ]
+        orchestrator = SyncOrchestrator(db_session, max_workers=2)
+
+        saved = orchestrator.run(jobs)
+        first_job, first_result = next(saved)
+        assert first_job.title == "Fast"
+        assert first_result.success is True
+        assert [job.title for job in orchestrator.pending] == ["Slow"]
+
+        release_slow.set()
+        rest = list(saved)
+
+        assert [job.title for job, _ in rest] == ["Slow"]
+        assert orchestrator.pending == []
+        caller = threading.get_ident()
+        assert set(fake_service.save_threads.values()) == {caller}
+        assert caller not in fake_service.scrape_threads.values()
+
+    def test_failed_scrape_recorded_as_failed_sync(self, db_session, fake_service):
+        """Each job should get its own SyncHistory, with the scrape's start time."""
+        jobs = [
+            SyncJob("fake", "Good", {"name": "good"}),
+            SyncJob("fake", "Bad", {"name": "bad", "fail": True}),
+        ]
+
+        results = dict((job.title, result) for job, result in SyncOrchestrator(db_session).run(jobs))
+
+        assert results["Good"].success is True
+        assert results["Bad"].error_message == "Failed to login to bad"
+        history = {h.institution: h for h in db_session.query(SyncHistory).all()}
+        assert history["good"].status == SyncStatus.SUCCESS
+        assert history["good"].started_at == datetime(2026, 1, 1, 8, 0)
+        assert history["bad"].status == SyncStatus.FAILED
+
+    def test_unexpected_scrape_error_is_saved_as_failure(self, db_session, fake_service):
+        """An exception escaping fetch_* should still reach the writer."""
+        job = SyncJob("fake", "Broken", {"name": "broken"})
+
+        with patch.object(FakeService, "fetch_fake", side_effect=RuntimeError("driver crashed")):
+            [(_, result)] = list(SyncOrchestrator(db_session).run([job]))
+
+        assert result.success is False
+        assert result.error_message == "driver crashed"
+
+    @pytest.mark.parametrize("full, expected", [(False, date(2026, 3, 1)), (True, None)])
+    def test_watermark_narrows_job_unless_full(self, db_session, fake_service, full, expected):
+        """Jobs should get their incremental start date unless a full sync is requested."""
+        job = SyncJob("fake", "Card", {"name": "card"})
+
+        with patch.object(FakeService, "get_incremental_start", return_value=date(2026, 3, 1)):
+            list(SyncOrchestrator(db_session, full=full).run([job]))
+
+        assert job.kwargs.get("since") == expected
+        assert fake_service.scraped_since["card"] == expected
+
+    def test_streamed_batches_saved_while_scraping(self, db_session, fake_service):
+        """Batches should reach the writer (calling thread) before their scrape ends."""
+        jobs = [
+            SyncJob("stream", "Card A", {"name": "a"}),
+            SyncJob("stream", "Card B", {"name": "b", "batches": 2}),
+            SyncJob("fake", "Broker", {"name": "broker"}),
+        ]
+
+        results = dict((job.title, result) for job, result in SyncOrchestrator(db_session, max_workers=3).run(jobs))
+
+        assert all(result.success for result in results.values())
+        streams = FakeStreamingService.streams
+        assert streams["a"].saved == [0, 1, 2]
+        assert streams["b"].saved == [0, 1]
+        assert streams["a"].threads | streams["b"].threads == {threading.get_ident()}
+
+
+class TestBrowsersToWarm:
+    """Tests for choosing which browsers to pre-launch."""
+
+    def test_first_wave_grouped_by_launch_signature(self):
+        """Card and broker jobs share one profile; pension jobs get their own."""
+        jobs = [
+            SyncJob(Institution.CAL, "CAL", {"headless": True}),
+            SyncJob(Institution.MIGDAL, "Migdal", {"headless": True}),
+            SyncJob(Institution.EXCELLENCE, "Excellence", {"headless": True}),
+            SyncJob(Institution.MAX, "Max", {"headless": True}),
+        ]
+
+        warm = browsers_to_warm(jobs, max_parallel=3)
+
+        assert [(config.launch_signature(), count) for config, count in warm] == [
+            (jobs[0].driver_config().launch_signature(), 2),
+            (jobs[1].driver_config().launch_signature(), 1),
+        ]
+        assert warm[0][0].block_resources is True
+        assert warm[1][0].block_resources is False
+
+    def test_count_capped_by_job_count(self):
+        jobs = [SyncJob(Institution.ISRACARD, "Isracard", {"headless": False})]
+
+        [(config, count)] = browsers_to_warm(jobs, max_parallel=5)
+
+        assert count == 1
+        assert config.headless is False
@@ -0,0 +1,109 @@
+"""
+Tests for tag_service module.
+
+Tests set-based bulk editing of transactions (categories, memos and tags).
+"""
+
+from datetime import date
+
+import pytest
+
+from db.models import Tag, TransactionTag
+from services.tag_service import TagService
+from tests.conftest import create_transaction
+
+
+@pytest.fixture
+def tag_service(db_session):
+    return TagService(session=db_session)
+
+
+@pytest.fixture
+def transactions(db_session, sample_account):
+    return [
+        create_transaction(db_session, sample_account, f"Wolt order {n}" if n < 3 else f"Shufersal {n}",
+                           -10.0 * n, date(2026, 3, n), category="food")
+        for n in range(1, 6)
+    ]
+
+
+def _tags(db_session, transaction):
+    db_session.refresh(transaction)
+    return sorted(transaction.tags)
+
+
+class TestBulkEditTransactions:
+    """Tests for TagService.bulk_edit_transactions."""
+
+    def test_operations_by_ids(self, db_session, tag_service, transactions):
+        ids = [t.id for t in transactions[:3]]
+        tag_service.tag_transaction(ids[0], ["delivery"])
+
+        result = tag_service.bulk_edit_transactions(
+            [
+                {"op": "set_category", "value": "dining"},
+                {"op": "set_memo", "value": "team lunch"},
+                {"op": "add_tags", "tags": ["delivery", "Work"]},
+            ],
+            transaction_ids=ids,
+        )
+
+        assert result == {"matched": 3, "counts": [3, 3, 3]}
+        for txn in transactions[:3]:
+            db_session.refresh(txn)
+            assert (txn.user_category, txn.memo) == ("dining", "team lunch")
+            assert _tags(db_session, txn) == ["Work", "delivery"]
+        assert transactions[3].user_category is None
+        assert db_session.query(TransactionTag).count() == 6
+
+    def test_counts_only_changed_transactions(self, db_session, tag_service, transactions):
+        ids = [t.id for t in transactions]
+        tag_service.tag_transaction(ids[0], ["delivery"])
+        tag_service.update_transaction(ids[1], user_category="dining")
+
+        result = tag_service.bulk_edit_transactions(
+            [
+                {"op": "set_category", "value": "dining"},
+                {"op": "add_tags", "tags": ["delivery"]},
+                {"op": "remove_tags", "tags": ["delivery", "missing"]},
+                {"op": "set_category", "value": ""},
+            ],
+            transaction_ids=ids,
+        )
+
+        assert result == {"matched": 5, "counts": [4, 4, 5, 5]}
+        assert db_session.query(TransactionTag).count() == 0
+
+    def test_filter_targets_are_resolved_before_operations(self, db_session, tag_service, transactions):
+        """Changing the filtered field must not change what later operations apply to."""
+        result = tag_service.bulk_edit_transactions(
+            [{"op": "set_category", "value": "delivery"}, {"op": "add_tags", "tags": ["wolt"]}],
+            filters={"search": "wolt", "category": "food"},
+        )
+
+        assert result == {"matched": 2, "counts": [2, 2]}
+        assert [_tags(db_session, t) for t in transactions] == [["wolt"], ["wolt"], [], [], []]
+
+    def test_failure_rolls_back_everything(self, db_session, tag_service, transactions):
+        with pytest.raises(ValueError, match="Unknown bulk operation"):
+            tag_service.bulk_edit_transactions(
+                [{"op": "set_memo", "value": "x"}, {"op": "delete"}], transaction_ids=[transactions[0].id]
+            )
+        with pytest.raises(ValueError, match="either transaction_ids or filters"):
+            tag_service.bulk_edit_transactions([{"op": "set_memo", "value": "x"}])
+
+        db_session.refresh(transactions[0])
+        assert transactions[0].memo is None
+
+    def test_large_selection_spans_chunks(self, db_session, tag_service, transactions, monkeypatch):
+        monkeypatch.setattr("services.tag_service.BULK_EDIT_CHUNK", 2)
+
+        result = tag_service.bulk_edit_transactions([{"op": "add_tags", "tags": ["all"]}], filters={})
+
+        assert result == {"matched": 5, "counts": [5]}
+        assert db_session.query(Tag).filter(Tag.name == "all").one().transaction_tags[0].created_at is not None
+
+    def test_bulk_tag_by_merchant_uses_bulk_edit(self, db_session, tag_service, transactions):
+        assert tag_service.bulk_tag_by_merchant("wolt", ["delivery"]) == 2
+        assert tag_service.bulk_tag_by_merchant("wolt", ["delivery"]) == 0
+        assert tag_service.bulk_tag_by_category("FOOD", ["groceries"]) == 5
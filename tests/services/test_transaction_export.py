@@ -0,0 +1,94 @@
+"""
+Tests for transaction_export module.
+
+Tests the streaming row query and the incremental CSV/NDJSON/JSON writers
+against the list-based CLI export.
+"""
+
+import csv
+import gzip
+import io
+import json
+from datetime import date
+
+import pytest
+
+from cli.commands.export import export_transactions_csv
+from services.analytics_service import TRANSACTION_EXPORT_FIELDS, AnalyticsService
+from services.transaction_export import export_chunks, write_export
+from tests.conftest import create_transaction
+
+
+@pytest.fixture
+def analytics(db_session):
+    return AnalyticsService(session=db_session)
+
+
+@pytest.fixture
+def transactions(db_session, sample_account):
+    return [
+        create_transaction(db_session, sample_account, f"Merchant {n}", -10.0 * n, date(2026, 3, n),
+                           raw_category="מזון", user_category="groceries" if n == 2 else None)
+        for n in range(1, 6)
+    ]
+
+
+class TestIterTransactionRows:
+    """Tests for AnalyticsService.iter_transaction_rows."""
+
+    def test_rows_match_get_transactions(self, analytics, transactions):
+        rows = list(analytics.iter_transaction_rows(batch_size=2))
+        expected = analytics.get_transactions()
+
+        assert [row["id"] for row in rows] == [t.id for t in expected]
+        assert list(rows[0]) == TRANSACTION_EXPORT_FIELDS
+        by_id = {row["id"]: row for row in rows}
+        assert by_id[transactions[1].id]["effective_category"] == "groceries"
+        assert by_id[transactions[0].id]["institution"] == "cal"
+
+    def test_filters_apply(self, analytics, transactions):
+        rows = analytics.iter_transaction_rows(from_date=date(2026, 3, 2), to_date=date(2026, 3, 3))
+
+        assert sorted(row["description"] for row in rows) == ["Merchant 2", "Merchant 3"]
+
+
+class TestWriters:
+    """Tests for the incremental export writers."""
+
+    def test_csv_matches_list_export(self, analytics, transactions, tmp_path, monkeypatch):
+        monkeypatch.setattr("services.transaction_export.CHUNK_ROWS", 2)
+        list_path = tmp_path / "list.csv"
+        export_transactions_csv(analytics.get_transactions(), list_path)
+
+        streamed = b"".join(export_chunks(analytics.iter_transaction_rows(), "csv")).decode()
+        expected = list(csv.DictReader(list_path.open(encoding="utf-8")))
+
+        rows = list(csv.DictReader(io.StringIO(streamed)))
+        assert [row["id"] for row in rows] == [row["id"] for row in expected]
+        assert rows[0]["raw_category"] == "מזון"
+        assert rows[0]["transaction_date"] == expected[0]["transaction_date"]
+
+    @pytest.mark.parametrize("chunk_rows", [2, 500])
+    def test_ndjson_and_json_decode_to_same_rows(self, analytics, transactions, monkeypatch, chunk_rows):
+        monkeypatch.setattr("services.transaction_export.CHUNK_ROWS", chunk_rows)
+
+        ndjson = b"".join(export_chunks(analytics.iter_transaction_rows(), "ndjson"))
+        array = b"".join(export_chunks(analytics.iter_transaction_rows(), "json"))
+
+        assert [json.loads(line) for line in ndjson.splitlines()] == json.loads(array)
+        assert json.loads(array)[0]["transaction_date"] == "2026-03-05"
+
+    def test_empty_json_is_an_empty_array(self):
+        assert json.loads(b"".join(export_chunks(iter([]), "json"))) == []
+
+    def test_gz_output_is_compressed(self, analytics, transactions, tmp_path):
+        path = tmp_path / "transactions.ndjson.gz"
+
+        count = write_export(analytics.iter_transaction_rows(), path, "ndjson")
+
+        assert count == 5
+        assert len(gzip.decompress(path.read_bytes()).splitlines()) == 5
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="Unknown export format"):
+            export_chunks(iter([]), "xml")
@@ -0,0 +1,51 @@
+"""
+Tests for the Streamlit data caches.
+
+Tests that cached results are keyed by the data version, so edits show up
+on the next render instead of after a TTL.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from db.models import Base
+from services.tag_service import TagService
+from streamlit_app.utils.cache import data_version
+from streamlit_app.utils.session import get_all_tags
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ui.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    get_all_tags.clear()
+    with patch("db.database.get_session", side_effect=lambda *args: Session()):
+        yield Session
+    get_all_tags.clear()
+    engine.dispose()
+
+
+class TestDataVersionCache:
+    """Tests for caches keyed by data_version()."""
+
+    def test_edit_shows_up_on_next_read(self, session_factory):
+        assert get_all_tags(data_version()) == []
+
+        session = session_factory()
+        TagService(session=session).get_or_create_tag("groceries")
+        session.close()
+
+        assert get_all_tags(data_version()) == ["groceries"]
+
+    def test_unchanged_data_served_from_cache(self, session_factory):
+        version = data_version()
+        first = get_all_tags(version)
+
+        with patch("sqlalchemy.orm.Session.query") as query:
+            assert get_all_tags(version) == first
+
+        query.assert_not_called()
@@ -49,8 +49,8 @@ export function createSyncStream(
 
   // Handle both server-sent "error" events and native connection errors.
   // Native errors (connection drop) have no .data — let EventSource reconnect
-  // to the same endpoint; the server will replay cached lines instead of
-  // starting a duplicate subprocess.
+  // to the same endpoint; it sends Last-Event-ID and the server resumes
+  // after the last event received.
   es.addEventListener('error', (e) => {
     const me = e as MessageEvent
     if (me.data) {
@@ -1,7 +1,13 @@
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
 import { apiClient } from './client'
 import type { PaginatedResponse } from '@/types/common'
-import type { Transaction, TransactionFilters, TransactionUpdate } from '@/types/transaction'
+import type {
+  BulkUpdateRequest,
+  BulkUpdateResponse,
+  Transaction,
+  TransactionFilters,
+  TransactionUpdate,
+} from '@/types/transaction'
 
 export const txnKeys = {
   all: ['transactions'] as const,
@@ -37,3 +43,16 @@ export function useUpdateTransaction() {
     },
   })
 }
+
+/** Edit many transactions (by ids or filter) in one request and one DB transaction */
+export function useBulkUpdateTransactions() {
+  const qc = useQueryClient()
+  return useMutation({
+    mutationFn: (body: BulkUpdateRequest) =>
+      apiClient.post<BulkUpdateResponse>('/transactions/bulk', body).then((r) => r.data),
+    onSuccess: () => {
+      qc.invalidateQueries({ queryKey: txnKeys.all })
+      qc.invalidateQueries({ queryKey: ['tags'] })
+    },
+  })
+}
@@ -40,3 +40,18 @@ export interface TransactionFilters {
   limit?: number
   offset?: number
 }
+
+export type BulkOperation =
+  | { op: 'set_category' | 'set_memo'; value: string | null }
+  | { op: 'add_tags' | 'remove_tags'; tags: string[] }
+
+export interface BulkUpdateRequest {
+  ids?: number[]
+  filter?: Omit<TransactionFilters, 'limit' | 'offset'>
+  operations: BulkOperation[]
+}
+
+export interface BulkUpdateResponse {
+  matched: number
+  results: { op: BulkOperation['op']; count: number }[]
+}